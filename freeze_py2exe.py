@@ -85,9 +85,16 @@ BUILD_DATA_FILES = [
     ("mediaservice", QT_MEDIASERVICE),
 ]
 
+# Widgets & modules are imported on demand, include explicitly
+INCLUDE_PACKAGES = [
+    "tinypedal.module",
+    "tinypedal.widget",
+]
+
 BUILD_OPTIONS = {
     "dist_dir": f"{DIST_FOLDER}/{APP_NAME}",
     "excludes": EXCLUDE_MODULES,
+    "packages": INCLUDE_PACKAGES,
     "optimize": 2,
     "compressed": 1,
     # "dll_excludes": ["libcrypto-1_1.dll", "libcrypto-3.dll"],
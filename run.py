@@ -45,6 +45,11 @@ def override_module(original: str, override: str):
 
 
 if __name__ == "__main__":
+    # Support data engine process in frozen executable
+    from multiprocessing import freeze_support
+
+    freeze_support()
+
     os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
 
     # Load command line arguments
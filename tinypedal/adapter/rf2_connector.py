@@ -25,8 +25,11 @@ from __future__ import annotations
 import ctypes
 import logging
 import threading
-from time import monotonic, sleep
-from typing import TYPE_CHECKING, Sequence
+from sys import getrefcount
+from operator import attrgetter
+from time import monotonic, perf_counter, sleep
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Mapping, NamedTuple, Sequence
 
 if __name__ == "__main__":  # local import check
     import sys
@@ -46,6 +49,8 @@ from pyRfactor2SharedMemory.rF2MMap import (
 
 logger = logging.getLogger(__name__)
 
+MAX_COPY_RETRY = 3  # max retries for version-checked partial copy
+
 
 def copy_struct(struct_data):
     """Allow to copy ctypes struct data with __slots__"""
@@ -57,6 +62,39 @@ def copy_struct(struct_data):
     )
 
 
+class SyncFrame(NamedTuple):
+    """Synced data frame, published by sync thread
+
+    Frame data is owned by frame and never modified after published
+    (see MMapVehicleControl.snapshot), so pinned frame stays unchanged.
+
+    Attributes:
+        frame_id: Frame ID, increased whenever scoring, telemetry or player index updated.
+        scor: Scoring data.
+        tele: Telemetry data.
+        tele_indexes: Telemetry mID:index reference mapping of telemetry data.
+        player_scor_index: Local player scoring index.
+        player_scor: Local player scoring data.
+        player_tele: Local player telemetry data.
+        timestamp: Frame publish time (perf_counter seconds).
+    """
+
+    frame_id: int
+    scor: rF2data.rF2Scoring
+    tele: rF2data.rF2Telemetry
+    tele_indexes: Mapping[int, int]
+    player_scor_index: int
+    player_scor: rF2data.rF2VehicleScoring
+    player_tele: rF2data.rF2VehicleTelemetry
+    timestamp: float
+
+
+class FramePin(threading.local):
+    """Thread local pinned data frame"""
+
+    frame: SyncFrame | None = None
+
+
 def local_scoring_index(scor_veh: Sequence[rF2data.rF2VehicleScoring]) -> int:
     """Find local player scoring index
 
@@ -69,6 +107,183 @@ def local_scoring_index(scor_veh: Sequence[rF2data.rF2VehicleScoring]) -> int:
     return INVALID_INDEX
 
 
+class MMapVehicleControl:
+    """Mmap control with version-checked partial copy access
+
+    Wraps MMapControl for mmap data that contains mVehicles array.
+
+    Access mode:
+        0 = copy access, copy full data from mmap.
+        1 = direct access, read data from mmap directly.
+        2 = partial copy access, copy header and active vehicles data only,
+            use update version number to detect torn read and retry.
+
+    Copy access creates new data copy for each update,
+    which is never modified afterwards.
+    Partial copy access alternates between two preallocated buffers,
+    back buffer is reused only if no longer referenced (by pinned frame),
+    otherwise new buffer is allocated, so published data is never modified.
+
+    Attributes:
+        data: mmap data, or local copy of mmap data.
+        copied_bytes: Last partial copied data size in bytes.
+        torn_reads: Total number of torn read (retried copy).
+    """
+
+    __slots__ = (
+        "_mmap",
+        "_buffer_data",
+        "_num_vehicles",
+        "_header_size",
+        "_vehicle_size",
+        "_access_mode",
+        "_back_data",
+        "_back_size",
+        "_data_size",
+        "data",
+        "copied_bytes",
+        "torn_reads",
+    )
+
+    def __init__(
+        self,
+        mmap_name: str,
+        buffer_data: type,
+        vehicle_data: type,
+        num_vehicles: Callable,
+    ) -> None:
+        """
+        Args:
+            mmap_name: mmap file name.
+            buffer_data: mmap buffer data struct type.
+            vehicle_data: mVehicles array element struct type.
+            num_vehicles: function to get number of vehicles from buffer data.
+        """
+        self._mmap = MMapControl(mmap_name, buffer_data)
+        self._buffer_data = buffer_data
+        self._num_vehicles = num_vehicles
+        self._header_size = buffer_data.mVehicles.offset
+        self._vehicle_size = ctypes.sizeof(vehicle_data)
+        self._access_mode = 0
+        self._back_data = None
+        self._back_size = 0
+        self._data_size = 0
+        self.data = None
+        self.copied_bytes = 0
+        self.torn_reads = 0
+
+    def create(self, access_mode: int = 0, rf2_pid: str = "") -> None:
+        """Create mmap instance
+
+        Args:
+            access_mode: 0 = copy access, 1 = direct access, 2 = partial copy access.
+            rf2_pid: rF2 Process ID for accessing server data.
+        """
+        self._access_mode = access_mode
+        if access_mode == 2:
+            self._mmap.create(1, rf2_pid)
+            self.data = None
+            self._back_data = None
+            self._back_size = self._data_size = 0
+            self.copy_partial(True)
+        else:
+            self._mmap.create(access_mode, rf2_pid)
+            self.data = self._mmap.data
+
+    def close(self) -> None:
+        """Close mmap instance"""
+        self._mmap.close()
+        if self._access_mode != 2:
+            self.data = self._mmap.data
+
+    def update(self) -> None:
+        """Update mmap data"""
+        if self._access_mode == 2:
+            self.copy_partial()
+        else:
+            self._mmap.update()
+            self.data = self._mmap.data
+
+    def snapshot(self):
+        """Data that is not modified afterwards, for synced data frame
+
+        Copy & partial copy access data is already a separated copy.
+        Direct access data is live mmap memory, copy header and active vehicles data.
+        """
+        if self._access_mode != 1:
+            return self.data
+        data = self._buffer_data()
+        self.__copy_into(data, 0)
+        return data
+
+    def copy_partial(self, skip_check: bool = False) -> bool:
+        """Copy header and active vehicles data from mmap into back buffer, then swap
+
+        Copy is accepted only if update begin & end version number matches,
+        and version number not changed during copying.
+        Copy is skipped if update version number not changed since last accepted copy.
+
+        Args:
+            skip_check: whether to skip version check and accept copy.
+
+        Returns:
+            True, if copy accepted (or not changed).
+        """
+        source = self._mmap.data
+        if (
+            not skip_check and self.data is not None
+            and source.mVersionUpdateBegin == source.mVersionUpdateEnd
+            == self.data.mVersionUpdateEnd
+        ):
+            return True  # not changed, keep last copy
+        back_data = self._back_data
+        # Reference count: _back_data, back_data, getrefcount argument
+        if back_data is None or getrefcount(back_data) > 3:
+            back_data = self._buffer_data()  # still referenced, allocate new buffer
+            self._back_size = 0
+        if not self.__copy_into(back_data, self._back_size) and not skip_check:
+            self._back_data = back_data
+            self._back_size = self.copied_bytes
+            return False  # keep last valid copy
+        self._back_data = self.data
+        self._back_size = self._data_size
+        self.data = back_data
+        self._data_size = self.copied_bytes
+        return True
+
+    def __copy_into(self, target, target_size: int) -> bool:
+        """Copy header and active vehicles data from mmap into target
+
+        Args:
+            target: target buffer data.
+            target_size: size of data previously copied into target,
+                stale vehicles data beyond new copy size is cleared.
+
+        Returns:
+            True, if copy is not torn.
+        """
+        source = self._mmap.data
+        source_addr = ctypes.addressof(source)
+        target_addr = ctypes.addressof(target)
+        for _ in range(MAX_COPY_RETRY):
+            version = source.mVersionUpdateBegin
+            num_vehicles = min(max(self._num_vehicles(source), 0), MAX_VEHICLES)
+            copy_size = self._header_size + self._vehicle_size * num_vehicles
+            ctypes.memmove(target_addr, source_addr, copy_size)
+            if target_size > copy_size:
+                ctypes.memset(target_addr + copy_size, 0, target_size - copy_size)
+                target_size = copy_size
+            if (
+                version == target.mVersionUpdateBegin == target.mVersionUpdateEnd
+                == source.mVersionUpdateBegin
+            ):
+                self.copied_bytes = copy_size
+                return True
+            self.torn_reads += 1
+        self.copied_bytes = copy_size
+        return False
+
+
 class MMapDataSet:
     """Create mmap data set"""
 
@@ -80,8 +295,18 @@ class MMapDataSet:
     )
 
     def __init__(self) -> None:
-        self.scor = MMapControl(rFactor2Constants.MM_SCORING_FILE_NAME, rF2data.rF2Scoring)
-        self.tele = MMapControl(rFactor2Constants.MM_TELEMETRY_FILE_NAME, rF2data.rF2Telemetry)
+        self.scor = MMapVehicleControl(
+            rFactor2Constants.MM_SCORING_FILE_NAME,
+            rF2data.rF2Scoring,
+            rF2data.rF2VehicleScoring,
+            attrgetter("mScoringInfo.mNumVehicles"),
+        )
+        self.tele = MMapVehicleControl(
+            rFactor2Constants.MM_TELEMETRY_FILE_NAME,
+            rF2data.rF2Telemetry,
+            rF2data.rF2VehicleTelemetry,
+            attrgetter("mNumVehicles"),
+        )
         self.ext = MMapControl(rFactor2Constants.MM_EXTENDED_FILE_NAME, rF2data.rF2Extended)
         self.ffb = MMapControl(rFactor2Constants.MM_FORCE_FEEDBACK_FILE_NAME, rF2data.rF2ForceFeedback)
 
@@ -92,7 +317,7 @@ class MMapDataSet:
         """Create mmap instance
 
         Args:
-            access_mode: 0 = copy access, 1 = direct access.
+            access_mode: 0 = copy access, 1 = direct access, 2 = partial copy access.
             rf2_pid: rF2 Process ID for accessing server data.
         """
         self.scor.create(access_mode, rf2_pid)
@@ -123,6 +348,7 @@ class SyncData:
         player_scor_index: Local player scoring index.
         player_scor: Local player scoring data.
         player_tele: Local player telemetry data.
+        frame: Last published synced data frame.
     """
 
     __slots__ = (
@@ -130,6 +356,9 @@ class SyncData:
         "_update_thread",
         "_event",
         "_tele_indexes",
+        "_tele_version",
+        "_frame_version",
+        "frame",
         "paused",
         "override_player_index",
         "player_scor_index",
@@ -142,7 +371,10 @@ class SyncData:
         self._updating = False
         self._update_thread = None
         self._event = threading.Event()
-        self._tele_indexes = {_index: _index for _index in range(128)}
+        self._tele_indexes = MappingProxyType({_index: _index for _index in range(128)})
+        self._tele_version = None
+        self._frame_version = None
+        self.frame = SyncFrame(0, None, None, self._tele_indexes, INVALID_INDEX, None, None, perf_counter())
 
         self.paused = False
         self.override_player_index = False
@@ -172,41 +404,110 @@ class SyncData:
         self.player_tele = self.dataset.tele.data.mVehicles[self.sync_tele_index(self.player_scor_index)]
         return True  # found index, synced
 
+    def __publish_frame(self, forced: bool = False) -> None:
+        """Publish synced data frame if updated
+
+        Frame is published as a whole (immutable tuple), and swapped atomically,
+        so reader always gets scoring, telemetry and player data from same frame.
+        Frame data is a snapshot that is never modified afterwards.
+
+        Args:
+            forced: whether to publish frame regardless of update state.
+        """
+        frame_version = (
+            self.dataset.scor.data.mVersionUpdateEnd,
+            self.dataset.tele.data.mVersionUpdateEnd,
+            self.player_scor_index,
+        )
+        if forced or self._frame_version != frame_version:
+            self._frame_version = frame_version
+            self.frame = self.__create_frame(
+                self.dataset.scor.snapshot(), self.dataset.tele.snapshot())
+
+    def __create_frame(
+        self, scor_data: rF2data.rF2Scoring, tele_data: rF2data.rF2Telemetry
+    ) -> SyncFrame:
+        """Create synced data frame, player data & telemetry index are read from frame data"""
+        if tele_data is self.dataset.tele.data:
+            tele_indexes = self._tele_indexes
+        else:  # snapshot of direct access data, or final copy
+            tele_indexes = self.__create_tele_indexes(tele_data)
+        scor_idx = self.player_scor_index
+        if scor_idx == INVALID_INDEX:
+            tele_idx = INVALID_INDEX
+        else:
+            tele_idx = self.sync_tele_index(scor_idx, scor_data, tele_indexes)
+        return SyncFrame(
+            self.frame.frame_id + 1,
+            scor_data,
+            tele_data,
+            tele_indexes,
+            scor_idx,
+            scor_data.mVehicles[scor_idx],
+            tele_data.mVehicles[tele_idx],
+            perf_counter(),
+        )
+
     @staticmethod
-    def __update_tele_indexes(tele_data: rF2data.rF2Telemetry, tele_indexes: dict) -> None:
-        """Update telemetry player index dictionary for quick reference
+    def __create_tele_indexes(tele_data: rF2data.rF2Telemetry) -> Mapping[int, int]:
+        """Create telemetry player index mapping for quick reference
 
         Telemetry index can be different from scoring index.
         Use mID matching to match telemetry index.
 
         Args:
             tele_data: Telemetry data.
-            tele_indexes: Telemetry mID:index reference dictionary.
+
+        Returns:
+            Telemetry mID:index reference mapping (read-only).
         """
-        for tele_idx, veh_info in zip(range(tele_data.mNumVehicles), tele_data.mVehicles):
-            tele_indexes[veh_info.mID] = tele_idx
+        return MappingProxyType({
+            veh_info.mID: tele_idx
+            for tele_idx, veh_info in zip(range(tele_data.mNumVehicles), tele_data.mVehicles)
+        })
 
-    def sync_tele_index(self, scor_idx: int) -> int:
+    def __update_tele_indexes(self) -> None:
+        """Update telemetry index mapping if telemetry data updated
+
+        New mapping is created for each update, mapping in published frame is never modified.
+        """
+        tele_data = self.dataset.tele.data
+        tele_version = tele_data.mVersionUpdateEnd, tele_data.mNumVehicles
+        if self._tele_version != tele_version:
+            self._tele_version = tele_version
+            self._tele_indexes = self.__create_tele_indexes(tele_data)
+
+    def sync_tele_index(
+        self,
+        scor_idx: int,
+        scor_data: rF2data.rF2Scoring | None = None,
+        tele_indexes: Mapping[int, int] | None = None,
+    ) -> int:
         """Sync telemetry index
 
         Use scoring index to find scoring mID,
-        then match with telemetry mID in reference dictionary
+        then match with telemetry mID in reference mapping
         to find telemetry index.
 
         Args:
             scor_idx: Player scoring index.
+            scor_data: Scoring data, None for latest mmap scoring data.
+            tele_indexes: Telemetry mID:index reference mapping, None for latest mapping.
 
         Returns:
             Player telemetry index.
         """
-        return self._tele_indexes.get(
-            self.dataset.scor.data.mVehicles[scor_idx].mID, INVALID_INDEX)
+        if scor_data is None:
+            scor_data = self.dataset.scor.data
+        if tele_indexes is None:
+            tele_indexes = self._tele_indexes
+        return tele_indexes.get(scor_data.mVehicles[scor_idx].mID, INVALID_INDEX)
 
     def start(self, access_mode: int, rf2_pid: str) -> None:
         """Update & sync mmap data copy in separate thread
 
         Args:
-            access_mode: 0 = copy access, 1 = direct access.
+            access_mode: 0 = copy access, 1 = direct access, 2 = partial copy access.
             rf2_pid: rF2 Process ID for accessing server data.
         """
         if self._updating:
@@ -215,10 +516,12 @@ class SyncData:
             self._updating = True
             # Initialize mmap data
             self.dataset.create_mmap(access_mode, rf2_pid)
-            self.__update_tele_indexes(self.dataset.tele.data, self._tele_indexes)
+            self._tele_version = None
+            self.__update_tele_indexes()
             if not self.__sync_player_data():
                 self.player_scor = self.dataset.scor.data.mVehicles[INVALID_INDEX]
                 self.player_tele = self.dataset.tele.data.mVehicles[INVALID_INDEX]
+            self.__publish_frame(True)
             # Setup updating thread
             self._event.clear()
             self._update_thread = threading.Thread(target=self.__update, daemon=True)
@@ -236,6 +539,10 @@ class SyncData:
             # Make final copy before close, otherwise mmap won't close if using direct access
             self.player_scor = copy_struct(self.player_scor)
             self.player_tele = copy_struct(self.player_tele)
+            self.frame = self.__create_frame(
+                copy_struct(self.dataset.scor.data),
+                copy_struct(self.dataset.tele.data),
+            )
             self.dataset.close_mmap()
         else:
             logger.warning("sharedmemory: UPDATING: already stopped")
@@ -253,7 +560,7 @@ class SyncData:
 
         while not _event_wait(update_delay):
             self.dataset.update_mmap()
-            self.__update_tele_indexes(self.dataset.tele.data, self._tele_indexes)
+            self.__update_tele_indexes()
             # Update player data & index
             if not data_freezed:
                 # Get player data
@@ -271,6 +578,8 @@ class SyncData:
                         self.paused = True
                         logger.info("sharedmemory: UPDATING: player data paused")
 
+            self.__publish_frame()
+
             version_update = self.dataset.scor.data.mVersionUpdateEnd
             if last_version_update != version_update:
                 last_version_update = version_update
@@ -300,25 +609,29 @@ class SyncData:
 
 
 class RF2Info:
-    """RF2 shared memory data output"""
+    """RF2 shared memory data output
+
+    Scoring & telemetry data are read from synced data frame.
+    Call pinFrame() to pin latest frame for reading in current thread,
+    which ensures all data read in same thread are from same frame,
+    until next pinFrame() or unpinFrame() call.
+    """
 
     __slots__ = (
         "_sync",
+        "_pin",
         "_access_mode",
         "_rf2_pid",
-        "_scor",
-        "_tele",
         "_ext",
         "_ffb",
     )
 
     def __init__(self) -> None:
         self._sync = SyncData()
+        self._pin = FramePin()
         self._access_mode = 0
         self._rf2_pid = ""
         # Assign mmap instance
-        self._scor = self._sync.dataset.scor
-        self._tele = self._sync.dataset.tele
         self._ext = self._sync.dataset.ext
         self._ffb = self._sync.dataset.ffb
 
@@ -341,7 +654,7 @@ class RF2Info:
         """Set rF2 mmap access mode
 
         Args:
-            mode: 0 = copy access, 1 = direct access
+            mode: 0 = copy access, 1 = direct access, 2 = partial copy access
         """
         self._access_mode = mode
 
@@ -353,10 +666,38 @@ class RF2Info:
         """Manual override player index"""
         self._sync.player_scor_index = min(max(index, INVALID_INDEX), MAX_VEHICLES - 1)
 
+    def pinFrame(self) -> int:
+        """Pin latest synced data frame for reading in current thread
+
+        Returns:
+            Pinned frame ID.
+        """
+        frame = self._pin.frame = self._sync.frame
+        return frame.frame_id
+
+    def unpinFrame(self) -> None:
+        """Unpin synced data frame in current thread, read latest frame"""
+        self._pin.frame = None
+
+    @property
+    def frame(self) -> SyncFrame:
+        """Pinned synced data frame in current thread, or latest frame"""
+        return self._pin.frame or self._sync.frame
+
+    @property
+    def frameId(self) -> int:
+        """Synced data frame ID"""
+        return self.frame.frame_id
+
+    @property
+    def frameTime(self) -> float:
+        """Synced data frame publish time (perf_counter seconds)"""
+        return self.frame.timestamp
+
     @property
     def rf2ScorInfo(self) -> rF2data.rF2ScoringInfo:
         """rF2 scoring info data"""
-        return self._scor.data.mScoringInfo
+        return self.frame.scor.mScoringInfo
 
     def rf2ScorVeh(self, index: int | None = None) -> rF2data.rF2VehicleScoring:
         """rF2 scoring vehicle data
@@ -367,8 +708,8 @@ class RF2Info:
             index: None for local player.
         """
         if index is None:
-            return self._sync.player_scor
-        return self._scor.data.mVehicles[index]
+            return self.frame.player_scor
+        return self.frame.scor.mVehicles[index]
 
     def rf2TeleVeh(self, index: int | None = None) -> rF2data.rF2VehicleTelemetry:
         """rF2 telemetry vehicle data
@@ -378,9 +719,10 @@ class RF2Info:
         Args:
             index: None for local player.
         """
+        frame = self.frame
         if index is None:
-            return self._sync.player_tele
-        return self._tele.data.mVehicles[self._sync.sync_tele_index(index)]
+            return frame.player_tele
+        return frame.tele.mVehicles[self._sync.sync_tele_index(index, frame.scor, frame.tele_indexes)]
 
     @property
     def rf2Ext(self) -> rF2data.rF2Extended:
@@ -395,18 +737,19 @@ class RF2Info:
     @property
     def playerIndex(self) -> int:
         """rF2 local player's scoring index"""
-        return self._sync.player_scor_index
+        return self.frame.player_scor_index
 
     def isPlayer(self, index: int) -> bool:
         """Check whether index is player"""
+        frame = self.frame
         if self._sync.override_player_index:
-            return self._sync.player_scor_index == index
-        return self._scor.data.mVehicles[index].mIsPlayer
+            return frame.player_scor_index == index
+        return frame.scor.mVehicles[index].mIsPlayer
 
     @property
     def isPaused(self) -> bool:
         """Check whether data stopped updating"""
-        return self._sync.paused or self._sync.player_scor_index < 0
+        return self._sync.paused or self.frame.player_scor_index < 0
 
 
 def test_api():
@@ -448,5 +791,49 @@ def test_api():
     info.stop()
 
 
+def test_copy(loops: int = 1000):
+    """Copy access benchmark, full copy vs partial copy
+
+    Compare bytes copied & time cost per update (sync thread)
+    at different field sizes, without requiring a running game.
+    """
+    SEPARATOR = "=" * 50
+    print("Test Copy - Start")
+    for buffer_data, vehicle_data, set_num in (
+        (rF2data.rF2Scoring, rF2data.rF2VehicleScoring, "mScoringInfo"),
+        (rF2data.rF2Telemetry, rF2data.rF2VehicleTelemetry, ""),
+    ):
+        print(SEPARATOR)
+        print(f"{buffer_data.__name__}: {ctypes.sizeof(buffer_data)} bytes")
+        source = buffer_data()
+        header_size = buffer_data.mVehicles.offset
+        vehicle_size = ctypes.sizeof(vehicle_data)
+        for num_vehicles in (1, 10, 20, 40, 80, MAX_VEHICLES):
+            if set_num:
+                getattr(source, set_num).mNumVehicles = num_vehicles
+            else:
+                source.mNumVehicles = num_vehicles
+            # Full copy
+            start_time = perf_counter()
+            for _ in range(loops):
+                buffer_data.from_buffer_copy(source)
+            full_time = (perf_counter() - start_time) / loops
+            # Partial copy (into new data copy)
+            copy_size = header_size + vehicle_size * num_vehicles
+            start_time = perf_counter()
+            for _ in range(loops):
+                new_data = buffer_data()
+                ctypes.memmove(ctypes.addressof(new_data), ctypes.addressof(source), copy_size)
+            partial_time = (perf_counter() - start_time) / loops
+            print(
+                f"vehicles {num_vehicles:>3}: "
+                f"full {ctypes.sizeof(buffer_data):>8} bytes {full_time * 1e6:>8.2f} us, "
+                f"partial {copy_size:>8} bytes {partial_time * 1e6:>8.2f} us"
+            )
+    print(SEPARATOR)
+    print("Test Copy - End")
+
+
 if __name__ == "__main__":
+    test_copy()
     test_api()
@@ -39,6 +39,45 @@ from ..validator import bytes_to_str as tostr
 from ..validator import infnan_to_zero as rmnan
 from . import rf2_connector
 
+MAX_INTERNED = 4096  # max number of entries per interned table
+
+
+class StringTable(dict):
+    """Interned string table
+
+    Decode raw bytes (fixed-size char array field) only once on first access,
+    and return same cached string object afterwards.
+    Clear table on character encoding change.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, raw: bytes) -> str:
+        if len(self) >= MAX_INTERNED:
+            self.clear()
+        string = self[raw] = tostr(raw)
+        return string
+
+
+class IdTable(dict):
+    """Interned id table
+
+    Assign small integer id to raw bytes (fixed-size char array field) on first access,
+    which can be used for fast sorting & grouping.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, raw: bytes) -> int:
+        if len(self) >= MAX_INTERNED:
+            self.clear()
+        new_id = self[raw] = len(self)
+        return new_id
+
+
+strings = StringTable()
+class_ids = IdTable()
+
 
 class DataAdapter:
     """Read & sort data into groups
@@ -72,6 +111,18 @@ class Check(DataAdapter):
             or self.info.rf2TeleVeh().mIgnitionStarter > 0
         )
 
+    def frame_id(self) -> int:
+        """Synced data frame ID"""
+        return self.info.frameId
+
+    def frame_time(self) -> float:
+        """Synced data frame publish time (perf_counter seconds)"""
+        return self.info.frameTime
+
+    def pin_frame(self) -> int:
+        """Pin latest synced data frame for reading in current thread, output frame ID"""
+        return self.info.pinFrame()
+
     def api_version(self) -> str:
         """Identify API version"""
         return tostr(self.info.rf2Ext.mVersion)
@@ -567,16 +618,16 @@ class Tyre(DataAdapter):
 
     def compound_name_front(self, index: int | None = None) -> str:
         """Tyre compound name (front)"""
-        return tostr(self.info.rf2TeleVeh(index).mFrontTireCompoundName)
+        return strings[self.info.rf2TeleVeh(index).mFrontTireCompoundName]
 
     def compound_name_rear(self, index: int | None = None) -> str:
         """Tyre compound name (rear)"""
-        return tostr(self.info.rf2TeleVeh(index).mRearTireCompoundName)
+        return strings[self.info.rf2TeleVeh(index).mRearTireCompoundName]
 
     def compound_name(self, index: int | None = None) -> tuple[str, str]:
         """Tyre compound name set (front, rear)"""
         tele_veh = self.info.rf2TeleVeh(index)
-        return tostr(tele_veh.mFrontTireCompoundName), tostr(tele_veh.mRearTireCompoundName)
+        return strings[tele_veh.mFrontTireCompoundName], strings[tele_veh.mRearTireCompoundName]
 
     def surface_temperature_avg(self, index: int | None = None) -> tuple[float, ...]:
         """Tyre surface temperature set (Celsius) average"""
@@ -698,15 +749,19 @@ class Vehicle(DataAdapter):
 
     def driver_name(self, index: int | None = None) -> str:
         """Driver name"""
-        return tostr(self.info.rf2ScorVeh(index).mDriverName)
+        return strings[self.info.rf2ScorVeh(index).mDriverName]
 
     def vehicle_name(self, index: int | None = None) -> str:
         """Vehicle name"""
-        return tostr(self.info.rf2ScorVeh(index).mVehicleName)
+        return strings[self.info.rf2ScorVeh(index).mVehicleName]
 
     def class_name(self, index: int | None = None) -> str:
         """Vehicle class name"""
-        return tostr(self.info.rf2ScorVeh(index).mVehicleClass)
+        return strings[self.info.rf2ScorVeh(index).mVehicleClass]
+
+    def class_id(self, index: int | None = None) -> int:
+        """Vehicle class id (interned, for sorting & grouping)"""
+        return class_ids[self.info.rf2ScorVeh(index).mVehicleClass]
 
     def same_class(self, index: int | None = None) -> bool:
         """Is same vehicle class"""
@@ -113,6 +113,7 @@ class SimRF2(Connector):
         self.info.setPlayerOverride(config[2])
         self.info.setPlayerIndex(config[3])
         rf2_data.tostr = partial(bytes_to_str, char_encoding=config[4])
+        rf2_data.strings.clear()
 
 
 class SimLMU(Connector):
@@ -139,6 +140,7 @@ class SimLMU(Connector):
         self.info.setPlayerOverride(config[2])
         self.info.setPlayerIndex(config[3])
         rf2_data.tostr = partial(bytes_to_str, char_encoding=config[4])
+        rf2_data.strings.clear()
 
 
 # Add new API to API_PACK
@@ -559,15 +559,6 @@ def svg_view_box(coords: Sequence[CoordXY], margin: int = 0) -> str:
     return f"{x1:.4f} {y1:.4f} {x2:.4f} {y2:.4f}"
 
 
-def skip_map_nodes(total: int, limit: int, detail_level: int) -> int:
-    """Skip map nodes"""
-    if detail_level <= 0:
-        skip_node = 0
-    else:
-        skip_node = total // limit + (detail_level - 1)
-    return skip_node
-
-
 def line_intersect_coords(
     coord_a: CoordXY, coord_b: CoordXY, rad: float, length: float):
     """Create intersect line coordinates from 2 coordinates
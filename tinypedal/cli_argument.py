@@ -52,6 +52,12 @@ def get_cli_argument() -> argparse.Namespace:
             " 1 - single instance (default);"
         ),
     )
+    parse.add_argument(
+        "-i",
+        "--import-time",
+        action="store_true",
+        help="log import time (ms) of each loaded widget and module after startup",
+    )
     # Disallow version override if run as compiled exe
     if "tinypedal.exe" not in sys.executable:
         parse.add_argument(
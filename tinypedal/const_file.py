@@ -73,6 +73,7 @@ class FileExt:
     TPTN = ".tptn"
     STATS = ".stats"
     LOCK = ".lock"
+    CACHE = ".cache"
 
 
 class FileFilter:
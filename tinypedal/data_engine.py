@@ -0,0 +1,432 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Out-of-process data engine
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+from importlib import import_module
+from queue import Empty
+
+from .module_info import minfo
+from .setting import cfg
+from .shared_block import BlockLayout, SeqlockBlock, section_fields
+
+# Modules that can run in engine process, value = minfo sections written by module
+ENGINE_MODULES = {
+    "module_force": ("force",),
+    "module_hybrid": ("hybrid",),
+    "module_relative": ("relative",),
+    "module_sectors": ("sectors",),
+    "module_stats": ("stats",),
+    "module_vehicles": ("vehicles",),
+}
+# Section attributes written by in-process modules, excluded from shared block
+EXCLUDED_FIELDS = {
+    "hybrid": ("fuelEnergyRatio", "fuelEnergyBias"),
+    "vehicles": ("dataSet",),
+}
+# Section attributes that hold mixed value types (float or int laps), kept as data field
+DATA_FIELDS = {
+    "vehicles": (
+        "gapBehindNext",
+        "gapBehindNextInClass",
+        "gapBehindLeader",
+        "gapBehindLeaderInClass",
+    ),
+}
+# Section attributes written by in-process modules, read by engine modules
+ENGINE_INPUTS = {
+    "energy": ("expectedConsumption",),
+    "restapi": ("stintVirtualEnergy",),
+}
+# Preset types copied to engine process
+ENGINE_PRESETS = ("config", "setting", "brakes", "brands", "classes", "compounds", "heatmap", "tracks")
+DATA_FIELD_SIZE = 32768  # max data size (bytes) of each data field
+ENGINE_STOP_TIMEOUT = 5  # seconds
+
+logger = logging.getLogger(__name__)
+
+
+def create_engine_layout() -> BlockLayout:
+    """Create shared block layout from default values of engine minfo sections"""
+    fields = []
+    for sections in ENGINE_MODULES.values():
+        for section in sections:
+            info = type(getattr(minfo, section))()
+            fields.extend(section_fields(
+                section, info, EXCLUDED_FIELDS.get(section, ()), DATA_FIELD_SIZE,
+                DATA_FIELDS.get(section, ())))
+    return BlockLayout(fields)
+
+
+def create_input_layout() -> BlockLayout:
+    """Create shared block layout from default values of engine input attributes"""
+    fields = []
+    for section, names in ENGINE_INPUTS.items():
+        info = type(getattr(minfo, section))()
+        fields.extend(
+            field for field in section_fields(section, info, data_size=DATA_FIELD_SIZE)
+            if field.name in names)
+    return BlockLayout(fields)
+
+
+def export_config() -> dict:
+    """Export loaded setting to engine process"""
+    return {
+        "version_update": cfg.version_update,
+        "setting_filename": cfg.filename.setting,
+        "path": {name: getattr(cfg.path, name) for name in cfg.path.__slots__},
+        "user": {name: getattr(cfg.user, name) for name in ENGINE_PRESETS},
+    }
+
+
+def import_config(config: dict):
+    """Import loaded setting from main process, without reloading setting files"""
+    for name, value in config["path"].items():
+        setattr(cfg.path, name, value)
+    for name, value in config["user"].items():
+        setattr(cfg.user, name, value)
+    cfg.filename.setting = config["setting_filename"]
+    cfg.application = cfg.user.config["application"]
+    cfg.compatibility = cfg.user.config["compatibility"]
+    cfg.primary_preset = cfg.user.config["primary_preset"]
+    cfg.overlay = cfg.user.setting["overlay"]
+    cfg.shared_memory_api = cfg.user.setting["shared_memory_api"]
+    cfg.units = cfg.user.setting["units"]
+    cfg.version_update = config["version_update"]
+
+
+class RemoteModule:
+    """Remote data module proxy
+
+    Same control interface as DataModule, but runs module in engine process.
+    """
+
+    __slots__ = (
+        "_engine",
+        "module_name",
+        "closed",
+    )
+
+    def __init__(self, engine: DataEngine, module_name: str):
+        self._engine = engine
+        self.module_name = module_name
+        self.closed = True
+
+    def start(self):
+        """Start module in engine process"""
+        if self.closed:
+            self.closed = False
+            self._engine.start_module(self.module_name)
+
+    def stop(self):
+        """Stop module in engine process"""
+        self._engine.close_module(self.module_name)
+        self.closed = True
+
+
+class DataEngine:
+    """Out-of-process data engine
+
+    Run selected data modules in a worker process, which publishes module outputs
+    to a shared memory block (seqlock), and mirror outputs into local minfo.
+    Inputs written by in-process modules are mirrored to worker process
+    through a second shared memory block. Worker process is started with first module,
+    and stopped with last module.
+
+    Worker process uses loaded setting and API name from main process,
+    and opens own mmap connection to same API.
+
+    Attributes:
+        names: module names that can run in engine process.
+    """
+
+    __slots__ = (
+        "_layout",
+        "_input_layout",
+        "_config_version",
+        "_process",
+        "_commands",
+        "_stop_event",
+        "_block",
+        "_input_block",
+        "_mirror_event",
+        "_mirror_thread",
+        "_active",
+        "names",
+    )
+
+    def __init__(self):
+        self._layout = None
+        self._input_layout = None
+        self._config_version = None
+        self._process = None
+        self._commands = None
+        self._stop_event = None
+        self._block = None
+        self._input_block = None
+        self._mirror_event = threading.Event()
+        self._mirror_thread = None
+        self._active: set[str] = set()
+        self.names = frozenset(ENGINE_MODULES)
+
+    def create(self, name: str) -> RemoteModule:
+        """Create remote module proxy"""
+        return RemoteModule(self, name)
+
+    def start_module(self, name: str):
+        """Start module in engine process, start process if not running"""
+        if not self._active:
+            self.__start_process()
+        self._active.add(name)
+        # Send setting only if updated since last sent
+        if self._config_version != cfg.version_update:
+            self._config_version = cfg.version_update
+            self._commands.put(("start", name, export_config()))
+        else:
+            self._commands.put(("start", name, None))
+
+    def close_module(self, name: str):
+        """Close module in engine process, stop process if no active module"""
+        if name not in self._active:
+            return
+        self._active.discard(name)
+        self._commands.put(("close", name, None))
+        if not self._active:
+            self.__stop_process()
+
+    def __start_process(self):
+        """Start engine process & mirror thread"""
+        from .api_control import api
+
+        if self._layout is None:
+            self._layout = create_engine_layout()
+            self._input_layout = create_input_layout()
+        update_interval = cfg.application["minimum_update_interval"] / 1000
+        context = multiprocessing.get_context("spawn")
+        self._commands = context.Queue()
+        self._stop_event = context.Event()
+        self._block = SeqlockBlock(self._layout, create=True)
+        self._input_block = SeqlockBlock(self._input_layout, create=True)
+        self._config_version = cfg.version_update
+        self._process = context.Process(
+            target=run_engine,
+            args=(
+                self._block.name,
+                self._input_block.name,
+                self._commands,
+                self._stop_event,
+                update_interval,
+                export_config(),
+                api.name,
+            ),
+            name="TinyPedal data engine",
+            daemon=True,
+        )
+        self._process.start()
+        self._mirror_event.clear()
+        self._mirror_thread = threading.Thread(
+            target=self.__mirroring, args=(update_interval,), daemon=True)
+        self._mirror_thread.start()
+        logger.info("ENABLED: data engine process (pid %s)", self._process.pid)
+
+    def __stop_process(self):
+        """Stop engine process & mirror thread"""
+        self._stop_event.set()
+        self._process.join(ENGINE_STOP_TIMEOUT)
+        if self._process.is_alive():
+            logger.warning("DATA ENGINE: process not responding, terminating")
+            self._process.terminate()
+            self._process.join()
+        self._mirror_event.set()
+        self._mirror_thread.join()
+        self._block.close(unlink=True)
+        self._input_block.close(unlink=True)
+        self._commands.close()
+        self._process = self._commands = self._stop_event = None
+        self._block = self._input_block = self._mirror_thread = None
+        logger.info("DISABLED: data engine process")
+
+    def __mirroring(self, update_interval: float):
+        """Mirror shared block to local minfo, and local inputs to input block"""
+        _event_wait = self._mirror_event.wait
+        block = self._block
+        input_block = self._input_block
+        input_layout = self._input_layout
+        layout = self._layout
+        last_inputs = None
+        while not _event_wait(update_interval):
+            inputs = input_layout.values(minfo)
+            if last_inputs != inputs:  # write only if changed
+                last_inputs = inputs
+                input_block.write_values(inputs)
+            values = block.read()
+            if values is not None:
+                layout.apply(values, minfo)
+
+
+def override_pyside():
+    """Override PySide2 with PySide6 in engine process, same as launcher"""
+    if os.getenv("PYSIDE_OVERRIDE") == "6":
+        sys.modules["PySide2"] = import_module("PySide6")
+        sys.modules["PySide2.QtCore"] = import_module("PySide6.QtCore")
+
+
+def run_engine(
+    block_name: str,
+    input_block_name: str,
+    commands,
+    stop_event,
+    update_interval: float,
+    config: dict,
+    api_name: str,
+):
+    """Engine process main loop
+
+    Args:
+        block_name: shared memory block name.
+        input_block_name: input shared memory block name.
+        commands: command queue, item = (command, module name, updated setting or None).
+        stop_event: process stop event.
+        update_interval: shared block write interval (seconds).
+        config: loaded setting from main process.
+        api_name: connected API name from main process.
+    """
+    override_pyside()
+    from .api_control import api
+    from .module_control import mctrl
+    from .overlay_control import octrl
+
+    import_config(config)
+    block = SeqlockBlock(create_engine_layout(), block_name)
+    input_block = SeqlockBlock(create_input_layout(), input_block_name)
+    layout = block.layout
+    input_layout = input_block.layout
+    last_outputs = None
+    api.connect(api_name)
+    api.start()
+
+    while not stop_event.wait(update_interval):
+        # Mirror inputs from main process
+        values = input_block.read()
+        if values is not None:
+            input_layout.apply(values, minfo)
+        # Process module commands
+        while True:
+            try:
+                command, name, config = commands.get_nowait()
+            except Empty:
+                break
+            if command == "start":
+                if config is not None:
+                    import_config(config)
+                mctrl.start(name)
+            elif command == "close":
+                mctrl.close(name)
+        # Publish module outputs
+        octrl.state.active = api.state
+        outputs = layout.values(minfo)
+        if last_outputs != outputs:  # write only if changed, reader skips unchanged block
+            last_outputs = outputs
+            block.write_values(outputs)
+
+    mctrl.close()
+    api.stop()
+    input_block.close()
+    block.close()
+
+
+data_engine = DataEngine()
+
+
+def simulate_module_work(stop_event, block_name: str | None = None):
+    """Simulate CPU heavy module work for benchmark, write to shared block if specified"""
+    from random import random
+
+    block = None if block_name is None else SeqlockBlock(create_engine_layout(), block_name)
+    vehicles = [[random(), index] for index in range(128)]
+    while not stop_event.is_set():
+        for _ in range(50):
+            for vehicle in vehicles:
+                vehicle[0] = random()
+            vehicles.sort()
+        minfo.stats.metersDriven += 1
+        if block is not None:
+            block.write(minfo)
+    if block is not None:
+        block.close()
+
+
+def test_engine_jitter(seconds: float = 3, interval: float = 0.01):
+    """Paint timer jitter benchmark
+
+    Compare timer jitter of main thread (simulated 10ms widget timer)
+    while same module work runs in a thread (shared GIL) or in a separated process
+    (with main thread reading shared block).
+    Run with: python -m tinypedal.data_engine
+    """
+    from statistics import mean, pstdev
+    from time import perf_counter, sleep
+
+    def measure_jitter(block: SeqlockBlock | None = None):
+        ticks = []
+        end_time = perf_counter() + seconds
+        last_time = perf_counter()
+        while last_time < end_time:
+            sleep(interval)
+            if block is not None:
+                values = block.read()
+                if values is not None:
+                    block.layout.apply(values, minfo)
+            timestamp = perf_counter()
+            ticks.append((timestamp - last_time - interval) * 1000)
+            last_time = timestamp
+        return f"mean {mean(ticks):.3f}ms, stdev {pstdev(ticks):.3f}ms, max {max(ticks):.3f}ms"
+
+    print(f"Test Engine Jitter - {os.cpu_count()} cpus, {interval * 1000:.0f}ms timer")
+    print(f"idle: {measure_jitter()}")
+
+    stop_event = threading.Event()
+    thread = threading.Thread(target=simulate_module_work, args=(stop_event,), daemon=True)
+    thread.start()
+    print(f"in-process thread: {measure_jitter()}")
+    stop_event.set()
+    thread.join()
+
+    context = multiprocessing.get_context("spawn")
+    block = SeqlockBlock(create_engine_layout(), create=True)
+    stop_event = context.Event()
+    process = context.Process(target=simulate_module_work, args=(stop_event, block.name), daemon=True)
+    process.start()
+    sleep(1)  # wait process start
+    print(f"engine process: {measure_jitter(block)}")
+    stop_event.set()
+    process.join()
+    block.close(unlink=True)
+
+
+if __name__ == "__main__":
+    test_engine_jitter()
@@ -0,0 +1,57 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Latency statistics
+"""
+
+
+class LatencyStats:
+    """Latency statistics (milliseconds)"""
+
+    __slots__ = (
+        "count",
+        "total",
+        "maximum",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Reset statistics"""
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def add(self, latency: float):
+        """Add latency sample"""
+        self.count += 1
+        self.total += latency
+        if self.maximum < latency:
+            self.maximum = latency
+
+    @property
+    def mean(self) -> float:
+        """Mean latency"""
+        if self.count:
+            return self.total / self.count
+        return 0.0
+
+    def __str__(self) -> str:
+        return f"{self.count} samples, mean {self.mean:.2f}ms, max {self.maximum:.2f}ms"
@@ -20,6 +20,8 @@
 Loader function
 """
 
+from __future__ import annotations
+
 import logging
 import os
 import signal
@@ -27,13 +29,40 @@ import sys
 
 from .api_control import api
 from .const_file import FileExt
+from .data_engine import data_engine
+from .log_handler import stop_queue_listeners
 from .module_control import mctrl, wctrl
 from .overlay_control import octrl
 from .setting import cfg
 from .update import update_checker
+from .userfile.json_setting import copy_setting, preset_cache
 
 logger = logging.getLogger(__name__)
 
+# Preset setting types that require full reload if changed
+FULL_RELOAD_PRESETS = (
+    "config",
+    "brakes",
+    "brands",
+    "classes",
+    "compounds",
+    "heatmap",
+    "tracks",
+)
+# Common setting sections that affect all widgets
+WIDGET_COMMON_SECTIONS = frozenset((
+    "overlay",
+    "units",
+))
+# Extra setting sections read by module, key = module name
+MODULE_EXTRA_SECTIONS = {
+    "module_notes": ("pace_notes_playback",),
+    "module_relative": ("relative", "standings"),
+    "module_sampler": ("module_force",),
+}
+# Last loaded setting copy, key = preset setting type
+LAST_LOADED: dict[str, dict] = {}
+
 
 def int_signal_handler(sign, frame):
     """Quit by keyboard interrupt"""
@@ -53,9 +82,11 @@ def start():
     api.connect()
     api.start()
     # 3 start modules
+    set_module_engine()
     mctrl.start()
     # 4 start widgets
     wctrl.start()
+    update_last_loaded()
     # 5 start main window
     from .ui.app import AppWindow
     AppWindow()
@@ -75,6 +106,8 @@ def close():
     unload_modules()
     # 2 stop api
     api.stop()
+    # 3 stop preset cache
+    preset_cache.stop()
 
 
 def restart():
@@ -82,42 +115,138 @@ def restart():
     logger.info("RESTARTING............")
     # Set restart env for skipping single instance check
     os.environ["TINYPEDAL_RESTART"] = "TRUE"
+    # Flush queued log records before replacing process
+    stop_queue_listeners()
     if "tinypedal.exe" in sys.executable:  # if run as exe
         os.execl(sys.executable, *sys.argv)
     else:  # if run as script
         os.execl(sys.executable, sys.executable, *sys.argv)
 
 
-def reload(reload_preset: bool = False):
+def reload(reload_preset: bool = False, force: bool = False):
     """Reload preset, api, modules, widgets
 
+    Compare new setting with last loaded setting, and only reload
+    modules and widgets that affected by changed setting sections.
+    Full reload if forced, or global or style preset changed, or "shared_memory_api" changed.
+
     Args:
         reload_preset:
             Whether to reload preset file.
             Should only done if changed global setting,
             or reloading from preset tab,
             or auto-loading preset.
+        force:
+            Whether to full reload regardless of setting changes.
+            Should only done if manually reloading from menu,
+            which allows to recover stuck api, modules, widgets.
     """
     logger.info("RELOADING............")
-    # 1 unload modules
-    unload_modules()
-    # 2 reload preset file
+    # 1 reload preset file
     if reload_preset:
+        last_setting = cfg.user.setting
         cfg.load()
         cfg.save(0)
-    # 3 restart api
+        reuse_unchanged_section(last_setting, cfg.user.setting)
+    # 2 reload changed
+    changed_sections = diff_setting()
+    if force or changed_sections is None or "shared_memory_api" in changed_sections:
+        full_reload()
+    else:
+        partial_reload(changed_sections)
+    update_last_loaded()
+
+
+def full_reload():
+    """Full reload api, modules, widgets"""
+    # 1 unload modules
+    unload_modules()
+    # 2 restart api
     api.restart()
-    # 4 load modules
+    # 3 load modules
     load_modules()
 
 
+def partial_reload(changed_sections: set[str]):
+    """Partial reload modules, widgets that affected by changed setting sections"""
+    if not changed_sections:
+        logger.info("RELOADING: no setting changed")
+        return
+    # 1 modules
+    for name in mctrl.names:
+        if name in changed_sections or not changed_sections.isdisjoint(
+            MODULE_EXTRA_SECTIONS.get(name, ())
+        ):
+            mctrl.reload(name)
+    # 2 widgets
+    reload_all_widgets = not changed_sections.isdisjoint(WIDGET_COMMON_SECTIONS)
+    for name in wctrl.names:
+        if reload_all_widgets or name in changed_sections:
+            wctrl.reload(name)
+    logger.info("RELOADING: %s setting section(s) changed", len(changed_sections))
+
+
+def diff_setting() -> set[str] | None:
+    """Diff current setting against last loaded setting
+
+    Returns:
+        Changed setting section names, or None if requires full reload.
+    """
+    if not LAST_LOADED:
+        return None
+    for preset_type in FULL_RELOAD_PRESETS:
+        if getattr(cfg.user, preset_type) != LAST_LOADED[preset_type]:
+            return None
+    last_setting = LAST_LOADED["setting"]
+    return {
+        name for name, section in cfg.user.setting.items()
+        if last_setting.get(name) != section
+    }
+
+
+def reuse_unchanged_section(last_setting: dict, new_setting: dict):
+    """Reuse unchanged module and widget setting section from last setting
+
+    Active modules and widgets hold reference to own setting section,
+    reuse unchanged section to keep reference valid after reloaded preset.
+    """
+    for name in (*mctrl.names, *wctrl.names):
+        if last_setting.get(name) == new_setting[name]:
+            new_setting[name] = last_setting[name]
+
+
+def update_last_loaded():
+    """Update last loaded setting copy"""
+    LAST_LOADED["setting"] = copy_setting(cfg.user.setting)
+    for preset_type in FULL_RELOAD_PRESETS:
+        LAST_LOADED[preset_type] = copy_setting(getattr(cfg.user, preset_type))
+
+
+def set_module_engine():
+    """Set whether to run supported modules in out-of-process data engine
+
+    Should only be set while all modules are closed.
+    """
+    if cfg.application["enable_out_of_process_modules"]:
+        mctrl.remote = data_engine
+    else:
+        mctrl.remote = None
+
+
 def load_modules():
     """Load modules, widgets"""
     octrl.enable()  # 1 overlay control
+    set_module_engine()
     mctrl.start()  # 2 module
     wctrl.start()  # 3 widget
 
 
+def log_import_time():
+    """Log import time of loaded modules, widgets"""
+    mctrl.log_import_time()
+    wctrl.log_import_time()
+
+
 def unload_modules():
     """Unload modules, widgets"""
     wctrl.close()  # 1 widget
@@ -20,12 +20,113 @@
 Log handler setup
 """
 
+from __future__ import annotations
+
+import atexit
 import logging
 import sys
+import threading
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
 from .const_app import PATH_GLOBAL
 from .const_file import LogFile
 
+LOG_BUFFER_CAPACITY = 10000  # max number of log lines kept in memory
+QUEUE_LISTENERS: list[QueueListener] = []
+
+
+class LogBuffer:
+    """Fixed-capacity ring buffer log store
+
+    Args:
+        capacity: max number of log lines, oldest lines are discarded first.
+
+    Attributes:
+        total: total number of log lines ever added, used as line serial number.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_lines",
+        "total",
+    )
+
+    def __init__(self, capacity: int = LOG_BUFFER_CAPACITY):
+        self._lock = threading.Lock()
+        self._lines: deque[str] = deque(maxlen=capacity)
+        self.total = 0
+
+    def append(self, line: str):
+        """Append log line"""
+        with self._lock:
+            self._lines.append(line)
+            self.total += 1
+
+    def clear(self):
+        """Clear all log lines, keep line serial number"""
+        with self._lock:
+            self._lines.clear()
+
+    def read(self, start: int = 0) -> tuple[int, list[str], bool]:
+        """Read log lines from line serial number
+
+        Args:
+            start: line serial number to read from.
+
+        Returns:
+            Next line serial number, new log lines,
+            whether all lines are returned due to discarded (or cleared) lines since start.
+        """
+        with self._lock:
+            first = self.total - len(self._lines)
+            if start < first or start > self.total:  # lines discarded
+                return self.total, list(self._lines), True
+            new_count = self.total - start
+            if new_count <= 0:
+                return self.total, [], False
+            lines = list(self._lines)[-new_count:]
+            return self.total, lines, False
+
+    def getvalue(self) -> str:
+        """Get all log lines as text"""
+        with self._lock:
+            return "\n".join(self._lines)
+
+
+class LogBufferHandler(logging.Handler):
+    """Log handler that appends formatted log line to log buffer"""
+
+    def __init__(self, log_buffer: LogBuffer):
+        super().__init__()
+        self.log_buffer = log_buffer
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.log_buffer.append(self.format(record))
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
+def new_buffer_handler(_logger: logging.Logger, log_buffer: LogBuffer) -> LogBufferHandler:
+    """Create new log buffer handler
+
+    Args:
+        _logger: logger instance.
+        log_buffer: log buffer object.
+    Returns:
+        Log buffer handler.
+    """
+    format_console = logging.Formatter(
+        "%(asctime)s %(levelname)s: %(message)s", datefmt="%H:%M:%S"
+    )
+    _handler = LogBufferHandler(log_buffer)
+    _handler.setFormatter(format_console)
+    _handler.setLevel(logging.INFO)
+    _logger.addHandler(_handler)
+    return _handler
+
 
 def new_stream_handler(_logger: logging.Logger, stream) -> logging.StreamHandler:
     """Create new stream handler
@@ -46,38 +147,56 @@ def new_stream_handler(_logger: logging.Logger, stream) -> logging.StreamHandler
     return _handler
 
 
-def new_file_handler(_logger: logging.Logger, filepath: str, filename: str) -> logging.FileHandler:
-    """Create new file handler
+def new_file_handler(_logger: logging.Logger, filepath: str, filename: str) -> QueueHandler:
+    """Create new asynchronous file handler
+
+    Log records are put in queue, and written to file from listener thread,
+    so that logging thread never blocks on file writing.
 
     Args:
         _logger: logger instance.
         filepath: log file path.
         filename: log file name.
     Returns:
-        File handler.
+        Queue handler.
     """
     format_file = logging.Formatter("%(asctime)s %(levelname)s: %(message)s")
-    _handler = logging.FileHandler(f"{filepath}{filename}")
-    _handler.setFormatter(format_file)
+    _file_handler = logging.FileHandler(f"{filepath}{filename}")
+    _file_handler.setFormatter(format_file)
+    _file_handler.setLevel(logging.INFO)
+    _queue: SimpleQueue = SimpleQueue()
+    _listener = QueueListener(_queue, _file_handler, respect_handler_level=True)
+    _listener.start()
+    QUEUE_LISTENERS.append(_listener)
+    _handler = QueueHandler(_queue)
     _handler.setLevel(logging.INFO)
     _logger.addHandler(_handler)
     return _handler
 
 
-def set_logging_level(_logger: logging.Logger, log_stream=None, log_level=1) -> None:
+def stop_queue_listeners() -> None:
+    """Stop queue listeners, flush remaining log records to file"""
+    while QUEUE_LISTENERS:
+        QUEUE_LISTENERS.pop().stop()
+
+
+atexit.register(stop_queue_listeners)
+
+
+def set_logging_level(_logger: logging.Logger, log_buffer: LogBuffer | None = None, log_level=1) -> None:
     """Set logging level
 
     Args:
         _logger: logger instance.
-        log_stream: log stream object.
+        log_buffer: log buffer object.
         log_level:
             0 = output only warning or error to console.
             1 = output all log to console.
             2 = output all log to both console & file.
     """
     _logger.setLevel(logging.INFO)
-    if log_stream is not None:
-        new_stream_handler(_logger, log_stream)
+    if log_buffer is not None:
+        new_buffer_handler(_logger, log_buffer)
     if log_level >= 1:
         new_stream_handler(_logger, sys.stdout)
         _logger.info("LOGGING: output to console")
@@ -20,7 +20,6 @@
 Launcher
 """
 
-import io
 import logging
 import os
 import sys
@@ -38,11 +37,11 @@ from .const_app import (
     VERSION,
 )
 from .const_file import ConfigType, ImageFile, LogFile
-from .log_handler import set_logging_level
+from .log_handler import LogBuffer, set_logging_level
 from .setting import cfg
 
 logger = logging.getLogger(__package__)
-log_stream = io.StringIO()
+log_buffer = LogBuffer()
 
 
 def save_pid_file():
@@ -191,7 +190,7 @@ def set_environment():
 def start_app(cli_args):
     """Init main window"""
     unset_environment()
-    set_logging_level(logger, log_stream, cli_args.log_level)
+    set_logging_level(logger, log_buffer, cli_args.log_level)
     get_version()
     # load global config
     cfg.load_global()
@@ -203,5 +202,7 @@ def start_app(cli_args):
     # Load core modules
     from . import loader
     loader.start()
+    if cli_args.import_time:
+        loader.log_import_time()
     # Start mainloop
     sys.exit(root.exec_())
@@ -0,0 +1,507 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Track map geometry (level of detail)
+"""
+
+from __future__ import annotations
+
+from array import array
+from math import floor, hypot, sqrt
+from typing import NamedTuple, Sequence
+
+from .const_common import FLOAT_INF
+
+LOD_BASE_TOLERANCE = 0.05  # finest simplified level tolerance (map unit, meter)
+LOD_MIN_NODES = 16  # stop adding coarser level below this number of nodes
+PIXEL_TOLERANCE = 0.5  # max deviation (pixel) of simplified map at detail level 1
+INDEX_CHUNK_SEGMENTS = 16  # number of consecutive segments per spatial index chunk
+INDEX_CELL_SCALE = 2  # spatial index grid cell size relative to average chunk size
+
+
+def point_significance(coords: Sequence[tuple[float, float]]) -> array:
+    """Douglas-Peucker significance of each point
+
+    Significance is the largest tolerance at which point is still kept by
+    Douglas-Peucker simplification, so simplifying with any tolerance is done by
+    keeping points with significance greater than tolerance.
+    First & last points are always kept (infinite significance).
+
+    Args:
+        coords: (x, y) coordinates list.
+
+    Returns:
+        Significance array, same length as coords.
+    """
+    total = len(coords)
+    significance = array("d", bytes(8 * total))
+    if total < 1:
+        return significance
+    significance[0] = significance[-1] = FLOAT_INF
+    x_list, y_list = zip(*coords)
+    stack = [(0, total - 1, FLOAT_INF)]
+    while stack:
+        first, last, parent = stack.pop()
+        if last - first < 2:
+            continue
+        start_x = x_list[first]
+        start_y = y_list[first]
+        delta_x = x_list[last] - start_x
+        delta_y = y_list[last] - start_y
+        length_sq = delta_x * delta_x + delta_y * delta_y
+        max_dist = -1.0
+        max_index = first + 1
+        for index in range(first + 1, last):
+            pos_x = x_list[index] - start_x
+            pos_y = y_list[index] - start_y
+            if length_sq > 0:
+                ratio = (pos_x * delta_x + pos_y * delta_y) / length_sq
+                if ratio > 1:
+                    ratio = 1
+                elif ratio < 0:
+                    ratio = 0
+                pos_x -= ratio * delta_x
+                pos_y -= ratio * delta_y
+            dist = hypot(pos_x, pos_y)
+            if dist > max_dist:
+                max_dist = dist
+                max_index = index
+        # Child never more significant than parent, so levels are nested
+        if max_dist > parent:
+            max_dist = parent
+        significance[max_index] = max_dist
+        stack.append((first, max_index, max_dist))
+        stack.append((max_index, last, max_dist))
+    return significance
+
+
+class MapLod:
+    """Track map level of detail (LOD) pyramid
+
+    Built once per map. Each level holds node indexes of Douglas-Peucker simplified map,
+    tolerance doubles per level. Node indexes refer to original coordinates list,
+    so same levels can be used with scaled or rotated coordinates.
+
+    Args:
+        coords: (x, y) coordinates list.
+        base_tolerance: tolerance of finest simplified level (map unit).
+        min_nodes: stop adding coarser level below this number of nodes.
+
+    Attributes:
+        tolerances: tolerance of each level, level 0 is full detail (0 tolerance).
+        levels: node indexes of each level.
+    """
+
+    __slots__ = (
+        "tolerances",
+        "levels",
+    )
+
+    def __init__(
+        self, coords: Sequence[tuple[float, float]],
+        base_tolerance: float = LOD_BASE_TOLERANCE, min_nodes: int = LOD_MIN_NODES):
+        significance = point_significance(coords)
+        tolerances = [0.0]
+        levels = [array("L", range(len(coords)))]
+        tolerance = base_tolerance
+        while len(levels[-1]) > min_nodes and tolerance > 0:
+            indexes = array("L", (
+                index for index in levels[-1] if significance[index] > tolerance))
+            if len(indexes) < len(levels[-1]):
+                tolerances.append(tolerance)
+                levels.append(indexes)
+            if len(indexes) <= 2:
+                break
+            tolerance *= 2
+        self.tolerances = tuple(tolerances)
+        self.levels = tuple(levels)
+
+    def indexes(self, scale: float, detail_level: int = 1) -> array:
+        """Node indexes of coarsest level that is accurate enough for display scale
+
+        Args:
+            scale: display scale (pixel per map unit).
+            detail_level: 0 for full detail, 1 for sub-pixel accuracy,
+                higher value allows larger deviation (multiple of half pixel).
+
+        Returns:
+            Node index array.
+        """
+        if detail_level <= 0 or scale <= 0:
+            return self.levels[0]
+        max_tolerance = PIXEL_TOLERANCE * detail_level / scale
+        for tolerance, indexes in zip(reversed(self.tolerances), reversed(self.levels)):
+            if tolerance <= max_tolerance:
+                return indexes
+        return self.levels[0]
+
+    @property
+    def total(self) -> int:
+        """Total nodes of full detail level"""
+        return len(self.levels[0])
+
+
+def lod_indexes(
+    map_lod: MapLod | None, total: int, scale: float, detail_level: int = 1) -> Sequence[int]:
+    """Node indexes for display scale, full detail if LOD not available or not match map
+
+    Args:
+        map_lod: map LOD pyramid, None if not available.
+        total: total nodes of map coordinates.
+        scale: display scale (pixel per map unit).
+        detail_level: see MapLod.indexes().
+
+    Returns:
+        Node index sequence.
+    """
+    if map_lod is None or map_lod.total != total:
+        return range(total)
+    return map_lod.indexes(scale, detail_level)
+
+
+class MapProjection(NamedTuple):
+    """Map projection result
+
+    Attributes:
+        segment: nearest segment index (from node index to node index + 1).
+        ratio: projected position ratio on segment, 0 = start node, 1 = end node.
+        offset: distance from position to projected position (map unit).
+        x: projected x position.
+        y: projected y position.
+    """
+
+    segment: int
+    ratio: float
+    offset: float
+    x: float
+    y: float
+
+
+class MapIndex:
+    """Track map segment spatial index
+
+    Built once per map. Map segments (line between neighbouring nodes) are grouped
+    in chunks of consecutive segments with bounding box, and chunks are stored in
+    uniform grid cells that chunk bounding box overlaps.
+
+    Nearest segment query checks cells in rings around position, skips chunks
+    whose bounding box is further than nearest segment found, and stops as soon as
+    no unchecked cell can be closer, so query cost only depends on
+    local node density, not total number of nodes.
+
+    Args:
+        coords: (x, y) coordinates list.
+        cell_size: grid cell size (map unit), 0 for auto size from chunk size.
+    """
+
+    __slots__ = (
+        "_x_list",
+        "_y_list",
+        "_boxes",
+        "_cells",
+        "_cell_size",
+        "_cell_range",
+        "total",
+    )
+
+    def __init__(self, coords: Sequence[tuple[float, float]], cell_size: float = 0):
+        self.total = len(coords)
+        if coords:
+            x_list, y_list = (array("d", values) for values in zip(*coords))
+        else:
+            x_list, y_list = array("d"), array("d")
+        self._x_list = x_list
+        self._y_list = y_list
+        # Chunk bounding boxes (min x, min y, max x, max y)
+        boxes = []
+        for first in range(0, self.total - 1, INDEX_CHUNK_SEGMENTS):
+            last = min(first + INDEX_CHUNK_SEGMENTS, self.total - 1) + 1  # include end node
+            boxes.append((
+                min(x_list[first:last]), min(y_list[first:last]),
+                max(x_list[first:last]), max(y_list[first:last]),
+            ))
+        self._boxes = tuple(boxes)
+        if cell_size <= 0:
+            cell_size = sum(
+                max(max_x - min_x, max_y - min_y) for min_x, min_y, max_x, max_y in boxes
+            ) / max(len(boxes), 1) * INDEX_CELL_SCALE or 1.0
+        self._cell_size = cell_size
+        cells: dict[tuple[int, int], list[int]] = {}
+        for chunk, (min_x, min_y, max_x, max_y) in enumerate(boxes):
+            for cell_x in range(floor(min_x / cell_size), floor(max_x / cell_size) + 1):
+                for cell_y in range(floor(min_y / cell_size), floor(max_y / cell_size) + 1):
+                    cells.setdefault((cell_x, cell_y), []).append(chunk)
+        self._cells = {cell: tuple(chunks) for cell, chunks in cells.items()}
+        if cells:
+            cell_x_list, cell_y_list = zip(*cells)
+            self._cell_range = min(cell_x_list), max(cell_x_list), min(cell_y_list), max(cell_y_list)
+        else:
+            self._cell_range = 0, -1, 0, -1
+
+    def nearest(self, pos_x: float, pos_y: float) -> MapProjection | None:
+        """Project position onto nearest map segment
+
+        Args:
+            pos_x: x position.
+            pos_y: y position.
+
+        Returns:
+            Map projection, None if map has no segment.
+        """
+        cells = self._cells
+        if not cells:
+            return None
+        boxes = self._boxes
+        cell_size = self._cell_size
+        center_x = floor(pos_x / cell_size)
+        center_y = floor(pos_y / cell_size)
+        min_x, max_x, min_y, max_y = self._cell_range
+        # Max ring that can contain any cell
+        max_ring = max(
+            abs(center_x - min_x), abs(center_x - max_x),
+            abs(center_y - min_y), abs(center_y - max_y))
+        # Skip empty rings if position is outside grid
+        ring = max(min_x - center_x, center_x - max_x, min_y - center_y, center_y - max_y, 0)
+        best_dist_sq = FLOAT_INF
+        best_segment = 0
+        best_ratio = 0.0
+        checked = set()
+        while ring <= max_ring:
+            # Unchecked chunks in ring, sorted by bounding box distance
+            candidates = []
+            for cell in ring_cells(center_x, center_y, ring):
+                chunks = cells.get(cell)
+                if chunks is None:
+                    continue
+                for chunk in chunks:
+                    if chunk not in checked:
+                        checked.add(chunk)
+                        candidates.append((box_distance_sq(boxes[chunk], pos_x, pos_y), chunk))
+            candidates.sort()
+            for box_dist_sq, chunk in candidates:
+                if box_dist_sq >= best_dist_sq:
+                    break
+                first = chunk * INDEX_CHUNK_SEGMENTS
+                for segment in range(first, min(first + INDEX_CHUNK_SEGMENTS, self.total - 1)):
+                    dist_sq, ratio = self.__segment_distance_sq(segment, pos_x, pos_y)
+                    if dist_sq < best_dist_sq:
+                        best_dist_sq = dist_sq
+                        best_segment = segment
+                        best_ratio = ratio
+            # Cells outside current ring are at least ring * cell_size away
+            if best_dist_sq <= (ring * cell_size) ** 2:
+                break
+            ring += 1
+        start_x = self._x_list[best_segment]
+        start_y = self._y_list[best_segment]
+        return MapProjection(
+            best_segment,
+            best_ratio,
+            sqrt(best_dist_sq),
+            start_x + (self._x_list[best_segment + 1] - start_x) * best_ratio,
+            start_y + (self._y_list[best_segment + 1] - start_y) * best_ratio,
+        )
+
+    def distance(
+        self, pos_x: float, pos_y: float, dists: Sequence[tuple[float, float]]) -> float:
+        """Project position onto nearest map segment, and convert to lap distance
+
+        Args:
+            pos_x: x position.
+            pos_y: y position.
+            dists: (distance, elevation) list of map nodes.
+
+        Returns:
+            Lap distance (map unit), -1 if map has no segment.
+        """
+        result = self.nearest(pos_x, pos_y)
+        if result is None:
+            return -1.0
+        dist_start = dists[result.segment][0]
+        return dist_start + (dists[result.segment + 1][0] - dist_start) * result.ratio
+
+    def segment_distance(self, segment: int, pos_x: float, pos_y: float) -> float:
+        """Distance from position to segment"""
+        return sqrt(self.__segment_distance_sq(segment, pos_x, pos_y)[0])
+
+    def __segment_distance_sq(self, segment: int, pos_x: float, pos_y: float) -> tuple[float, float]:
+        """Squared distance from position to segment, and projected ratio on segment"""
+        start_x = self._x_list[segment]
+        start_y = self._y_list[segment]
+        delta_x = self._x_list[segment + 1] - start_x
+        delta_y = self._y_list[segment + 1] - start_y
+        offset_x = pos_x - start_x
+        offset_y = pos_y - start_y
+        length_sq = delta_x * delta_x + delta_y * delta_y
+        if length_sq > 0:
+            ratio = (offset_x * delta_x + offset_y * delta_y) / length_sq
+            if ratio > 1:
+                ratio = 1.0
+            elif ratio < 0:
+                ratio = 0.0
+            offset_x -= ratio * delta_x
+            offset_y -= ratio * delta_y
+        else:
+            ratio = 0.0
+        return offset_x * offset_x + offset_y * offset_y, ratio
+
+
+def box_distance_sq(box: tuple[float, float, float, float], pos_x: float, pos_y: float) -> float:
+    """Squared distance from position to bounding box, 0 if inside"""
+    min_x, min_y, max_x, max_y = box
+    if pos_x < min_x:
+        delta_x = min_x - pos_x
+    elif pos_x > max_x:
+        delta_x = pos_x - max_x
+    else:
+        delta_x = 0.0
+    if pos_y < min_y:
+        delta_y = min_y - pos_y
+    elif pos_y > max_y:
+        delta_y = pos_y - max_y
+    else:
+        delta_y = 0.0
+    return delta_x * delta_x + delta_y * delta_y
+
+
+def ring_cells(center_x: int, center_y: int, ring: int):
+    """Grid cells on square ring around center cell"""
+    if ring == 0:
+        yield center_x, center_y
+        return
+    for cell_x in range(center_x - ring, center_x + ring + 1):
+        yield cell_x, center_y - ring
+        yield cell_x, center_y + ring
+    for cell_y in range(center_y - ring + 1, center_y + ring):
+        yield center_x - ring, cell_y
+        yield center_x + ring, cell_y
+
+
+def nearest_segment_linear(coords: Sequence[tuple[float, float]], pos_x: float, pos_y: float) -> int:
+    """Find nearest map segment by checking all segments (reference for benchmark)"""
+    best_dist = -1.0
+    best_segment = 0
+    for segment, ((x1, y1), (x2, y2)) in enumerate(zip(coords, coords[1:])):
+        delta_x = x2 - x1
+        delta_y = y2 - y1
+        offset_x = pos_x - x1
+        offset_y = pos_y - y1
+        length_sq = delta_x * delta_x + delta_y * delta_y
+        if length_sq > 0:
+            ratio = min(max((offset_x * delta_x + offset_y * delta_y) / length_sq, 0), 1)
+            offset_x -= ratio * delta_x
+            offset_y -= ratio * delta_y
+        dist = offset_x * offset_x + offset_y * offset_y
+        if best_dist < 0 or dist < best_dist:
+            best_dist = dist
+            best_segment = segment
+    return best_segment
+
+
+def create_test_map(nodes: int) -> tuple[tuple[float, float], ...]:
+    """Create simulated recorded map coordinates"""
+    from math import cos, sin, tau
+
+    return tuple(
+        (
+            1000 * cos(index * tau / nodes) + 50 * sin(index * tau * 7 / nodes),
+            600 * sin(index * tau / nodes) + 30 * cos(index * tau * 11 / nodes),
+        )
+        for index in range(nodes)
+    )
+
+
+def test_index(filename: str = "", nodes: int = 20000, queries: int = 2000):
+    """Spatial index benchmark, compare with linear scan
+
+    Queries are random positions within 50 meters of random map nodes.
+    Run with: python -m tinypedal.map_geometry --index [track map svg file]
+    """
+    import os
+    from random import seed, uniform
+    from time import perf_counter
+
+    if filename:
+        from .userfile.track_map import load_track_map_file
+
+        filepath, filename = os.path.split(os.path.splitext(filename)[0])
+        coords = load_track_map_file(f"{filepath}/" if filepath else "", filename)[0]
+        if not coords:
+            print(f"unable to load track map: {filename}")
+            return
+    else:
+        coords = create_test_map(nodes)
+
+    start_time = perf_counter()
+    map_index = MapIndex(coords)
+    print(f"build index: {(perf_counter() - start_time) * 1000:.1f}ms, {len(coords)} nodes")
+
+    seed(0)
+    positions = []
+    for _ in range(queries):
+        pos_x, pos_y = coords[int(uniform(0, len(coords) - 1))]
+        positions.append((pos_x + uniform(-50, 50), pos_y + uniform(-50, 50)))
+
+    start_time = perf_counter()
+    results = [map_index.nearest(pos_x, pos_y) for pos_x, pos_y in positions]
+    index_time = (perf_counter() - start_time) / queries
+
+    linear_queries = positions[:max(queries // 20, 1)]
+    start_time = perf_counter()
+    linear_results = [nearest_segment_linear(coords, pos_x, pos_y) for pos_x, pos_y in linear_queries]
+    linear_time = (perf_counter() - start_time) / len(linear_queries)
+
+    mismatch = sum(
+        result.segment != segment
+        and abs(result.offset - map_index.segment_distance(segment, *pos)) > 1e-9
+        for result, segment, pos in zip(results, linear_results, linear_queries)
+    )
+    print(
+        f"index query {index_time * 1000000:.1f}us, "
+        f"linear query {linear_time * 1000000:.1f}us, "
+        f"speedup {linear_time / index_time:.0f}x, "
+        f"mismatch {mismatch}"
+    )
+
+
+def test_lod(nodes: int = 20000):
+    """LOD pyramid benchmark with simulated recorded map
+
+    Run with: python -m tinypedal.map_geometry
+    """
+    from time import perf_counter
+
+    coords = create_test_map(nodes)
+    start_time = perf_counter()
+    lod = MapLod(coords)
+    print(f"build LOD: {(perf_counter() - start_time) * 1000:.1f}ms, {nodes} nodes")
+    for tolerance, indexes in zip(lod.tolerances, lod.levels):
+        print(f"tolerance {tolerance:.2f}m: {len(indexes)} nodes")
+
+    for scale in (0.1, 0.5, 2.0, 10.0):
+        print(f"scale {scale} pixel/m: {len(lod.indexes(scale))} nodes")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--index" in sys.argv:
+        test_index(sys.argv[-1] if sys.argv[-1].endswith(".svg") else "")
+    else:
+        test_lod()
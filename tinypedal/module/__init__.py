@@ -19,14 +19,17 @@
 """
 Data modules
 
-Add new module to import list below in ascending order,
+Add new module to name list below in ascending order,
 file name must match corresponding key name
 in template/setting_module.py dictionary.
+
+Modules are imported on demand by module_control when first enabled.
 """
 
 __all__ = [
     "module_delta",
     "module_energy",
+    "module_export",
     "module_force",
     "module_fuel",
     "module_hybrid",
@@ -34,10 +37,9 @@ __all__ = [
     "module_notes",
     "module_relative",
     "module_restapi",
+    "module_sampler",
     "module_sectors",
     "module_stats",
     "module_vehicles",
     "module_wheels",
 ]
-
-from . import *
@@ -26,6 +26,7 @@ from functools import partial
 
 from ..overlay_control import octrl
 from ..setting import Setting
+from ._pipeline import pipeline
 
 logger = logging.getLogger(__name__)
 # Function
@@ -34,7 +35,15 @@ round6 = partial(round, ndigits=6)
 
 
 class DataModule:
-    """Data module base"""
+    """Data module base
+
+    Set inputs & outputs (minfo section names) in child class to join module pipeline,
+    then call wait_inputs() after pinning synced data frame,
+    and publish_outputs() after writing outputs.
+    """
+
+    inputs = ()  # minfo section names read by module
+    outputs = ()  # minfo section names written by module
 
     __slots__ = (
         "module_name",
@@ -83,9 +92,23 @@ class DataModule:
     def update_data(self):
         """Update module data, rewrite in child class"""
 
+    def wait_inputs(self, frame_id: int) -> bool:
+        """Wait until inputs updated for synced data frame, or active update interval timeout"""
+        return pipeline.wait_inputs(self.inputs, frame_id, self.active_interval)
+
+    def publish_outputs(self, frame_id: int):
+        """Publish outputs for synced data frame"""
+        pipeline.publish(self.module_name, frame_id)
+
     def __tasks(self):
         """Run tasks in separated thread"""
+        is_pipeline_stage = bool(self.inputs or self.outputs)
+        if is_pipeline_stage:
+            pipeline.register(
+                self.module_name, self.inputs, self.outputs, self.active_interval)
         self.update_data()
+        if is_pipeline_stage:
+            pipeline.unregister(self.module_name)
         # Wait update_data exit
         self.closed = True
         logger.info("DISABLED: %s", self.module_name.replace("_", " "))
@@ -0,0 +1,271 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Timing event engine
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import NamedTuple
+from weakref import WeakSet
+
+from ..api_control import api
+from ..const_common import FLOAT_INF
+
+MAX_QUEUED_EVENTS = 64  # max number of unread events per subscriber
+VALIDATE_DELAY = 1.0  # seconds after lap start before checking valid lap time
+VALIDATE_TIMEOUT = 10.0  # seconds after lap start before lap considered invalid
+STOPPED_SPEED = 0.1  # meters per second
+
+
+class EventType:
+    """Timing event type"""
+
+    LAP_START = 0
+    LAP_VALIDATED = 1
+    LAP_INVALIDATED = 2
+    SECTOR_CHANGE = 3
+    PIT_ENTRY = 4
+    PIT_EXIT = 5
+    PIT_STOP = 6
+    PIT_GO = 7
+
+
+class TimingEvent(NamedTuple):
+    """Timing event
+
+    Attributes:
+        event_type: event type, see EventType.
+        frame_id: synced data frame ID that event derived from.
+        elapsed: session elapsed time when event occurred.
+        value: event value.
+            LAP_START: raw lap time of completed lap (lap start time difference).
+            LAP_VALIDATED: valid lap time of completed lap.
+            LAP_INVALIDATED: raw lap time of completed lap.
+            SECTOR_CHANGE: new sector index.
+            Others: 0.
+        is_pit_lap: whether completed lap (lap events) or current lap (others) is pit in or pit out lap.
+    """
+
+    event_type: int
+    frame_id: int
+    elapsed: float
+    value: float
+    is_pit_lap: bool
+
+
+class EventQueue:
+    """Timing event subscriber queue
+
+    Subscriber only receives events that occurred after subscribed.
+    """
+
+    __slots__ = (
+        "_engine",
+        "_events",
+        "__weakref__",
+    )
+
+    def __init__(self, engine: TimingEventEngine):
+        self._engine = engine
+        self._events: deque[TimingEvent] = deque(maxlen=MAX_QUEUED_EVENTS)
+
+    def put(self, event: TimingEvent):
+        """Put event"""
+        self._events.append(event)
+
+    def poll(self) -> list[TimingEvent]:
+        """Update engine with current (pinned) synced data frame, then take unread events
+
+        Events derived from newer frame (by other subscriber) are kept in queue,
+        until subscriber's pinned frame catches up.
+        """
+        frame_id = self._engine.update()
+        events = self._events
+        output = []
+        while events and events[0].frame_id <= frame_id:
+            output.append(events.popleft())
+        return output
+
+
+class SyncedFrameEngine:
+    """Synced data frame engine base
+
+    Process local player data once per synced data frame, shared by all modules.
+    Engine is advanced by modules polling, module should pin synced data frame before polling.
+    State is kept while not polled (game paused), and only resynced
+    if API changed, or lap start time decreased (new session).
+
+    Attributes:
+        frame_id: last processed synced data frame ID.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_reader",
+        "_lap_start",
+        "frame_id",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reader = None
+        self._lap_start = -FLOAT_INF
+        self.frame_id = -1
+        self._resync()
+
+    def update(self) -> int:
+        """Update from current (pinned) synced data frame, output frame ID"""
+        reader = api.read
+        frame_id = reader.check.frame_id()
+        with self._lock:
+            if self._reader is reader and frame_id <= self.frame_id:
+                return frame_id  # skip processed or older frame
+            lap_stime = reader.timing.start()
+            # Resync without output if API changed or lap start time decreased (new session)
+            if self._reader is not reader or lap_stime < self._lap_start:
+                self._reader = reader
+                self._resync()
+            self._lap_start = lap_stime
+            self.frame_id = frame_id
+            self._process(reader)
+        return frame_id
+
+    def _resync(self):
+        """Resync state, next frame sets initial state only, rewrite in child class"""
+
+    def _process(self, reader):
+        """Process synced data frame, rewrite in child class"""
+
+
+class TimingEventEngine(SyncedFrameEngine):
+    """Timing event engine
+
+    Derive lap, sector, pit events of local player once per synced data frame,
+    and publish to all subscribers.
+
+    Attributes:
+        lap_start: current lap start time.
+        is_pit_lap: whether current lap is pit in or pit out lap.
+        in_pits: whether in pit lane.
+        sector_index: current sector index.
+    """
+
+    __slots__ = (
+        "_subscribers",
+        "_validate_start",
+        "_validate_laptime",
+        "_validate_pit_lap",
+        "_stopped",
+        "lap_start",
+        "is_pit_lap",
+        "in_pits",
+        "sector_index",
+    )
+
+    def __init__(self):
+        self._subscribers: WeakSet[EventQueue] = WeakSet()
+        super().__init__()
+
+    def subscribe(self) -> EventQueue:
+        """Subscribe timing events, unsubscribed automatically once queue is released"""
+        event_queue = EventQueue(self)
+        with self._lock:
+            self._subscribers.add(event_queue)
+        return event_queue
+
+    def _resync(self):
+        """Reset timing state"""
+        self._validate_start = None
+        self._validate_laptime = 0.0
+        self._validate_pit_lap = False
+        self._stopped = False
+        self.lap_start = FLOAT_INF
+        self.is_pit_lap = False
+        self.in_pits = False
+        self.sector_index = -1
+
+    def __publish(self, event_type: int, elapsed: float, value: float, is_pit_lap: bool):
+        """Publish event to all subscribers"""
+        event = TimingEvent(event_type, self.frame_id, elapsed, value, is_pit_lap)
+        for event_queue in self._subscribers:
+            event_queue.put(event)
+
+    def _process(self, reader):
+        """Derive events from synced data frame"""
+        is_initial = self.sector_index == -1
+        lap_stime = reader.timing.start()
+        elapsed = reader.timing.elapsed()
+        in_pits = bool(reader.vehicle.in_pits())
+        sector_idx = reader.lap.sector_index()
+        stopped = in_pits and reader.vehicle.speed() < STOPPED_SPEED
+
+        # Pit entry & exit
+        if self.in_pits != in_pits:
+            self.in_pits = in_pits
+            if not is_initial:
+                self.__publish(
+                    EventType.PIT_ENTRY if in_pits else EventType.PIT_EXIT,
+                    elapsed, 0.0, True)
+        self.is_pit_lap |= in_pits
+
+        # Pit stop & go
+        if self._stopped != stopped:
+            self._stopped = stopped
+            if not is_initial:
+                self.__publish(
+                    EventType.PIT_STOP if stopped else EventType.PIT_GO,
+                    elapsed, 0.0, self.is_pit_lap)
+
+        # Lap start, new session (lap start time decreased) is resynced before processing
+        if lap_stime > self.lap_start:
+            laptime_raw = lap_stime - self.lap_start
+            self.__publish(EventType.LAP_START, elapsed, laptime_raw, self.is_pit_lap)
+            self._validate_start = elapsed
+            self._validate_laptime = laptime_raw
+            self._validate_pit_lap = self.is_pit_lap
+            self.is_pit_lap = in_pits
+        self.lap_start = lap_stime
+
+        # Lap validation after passing finish line
+        if self._validate_start is not None:
+            timer = elapsed - self._validate_start
+            if timer > VALIDATE_TIMEOUT:
+                self.__publish(
+                    EventType.LAP_INVALIDATED, elapsed,
+                    self._validate_laptime, self._validate_pit_lap)
+                self._validate_start = None
+            elif timer > VALIDATE_DELAY:
+                laptime_valid = reader.timing.last_laptime()
+                if laptime_valid > 0 and abs(laptime_valid - self._validate_laptime) < 0.001:
+                    self.__publish(
+                        EventType.LAP_VALIDATED, elapsed,
+                        laptime_valid, self._validate_pit_lap)
+                    self._validate_start = None
+
+        # Sector change
+        if self.sector_index != sector_idx:
+            if not is_initial:
+                self.__publish(EventType.SECTOR_CHANGE, elapsed, sector_idx, self.is_pit_lap)
+            self.sector_index = sector_idx
+
+
+timing_events = TimingEventEngine()
@@ -0,0 +1,221 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module pipeline
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from time import perf_counter
+from typing import NamedTuple
+
+from ..api_control import api
+from ..latency_stats import LatencyStats
+
+LATENCY_REPORT_INTERVAL = 60.0  # seconds between latency report
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineStage(NamedTuple):
+    """Pipeline stage
+
+    Attributes:
+        name: module name.
+        inputs: minfo section names read by module.
+        outputs: minfo section names written by module.
+        interval: module active update interval (seconds).
+    """
+
+    name: str
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+    interval: float
+
+
+class ModulePipeline:
+    """Module pipeline
+
+    Modules declare minfo sections they read (inputs) and write (outputs).
+    Each module still runs in own thread, but waits for producers of its inputs
+    to publish same (or newer) synced data frame before processing,
+    so modules run in dependency order per frame without one tick lag.
+
+    Consumer only waits for producer that is due to run within consumer's wait timeout
+    (based on producer's last publish time and update interval). Output of producer
+    that runs at longer interval is read from its last published frame instead,
+    so consumer is not delayed on every update.
+
+    A producer that fails to publish within consumer's wait timeout is marked as stalled,
+    and is not waited on again until it publishes next frame.
+
+    Attributes:
+        frame_id: last completed synced data frame ID (published by all publishing stages).
+        latency: latency from frame publish to frame completed by all stages.
+    """
+
+    __slots__ = (
+        "_condition",
+        "_stages",
+        "_producers",
+        "_published",
+        "_published_time",
+        "_stalled",
+        "_last_report",
+        "_source",
+        "frame_id",
+        "latency",
+    )
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._stages: dict[str, PipelineStage] = {}
+        self._producers: dict[str, str] = {}
+        self._published: dict[str, int] = {}
+        self._published_time: dict[str, float] = {}
+        self._stalled: set[str] = set()
+        self._last_report = perf_counter()
+        self._source = None
+        self.frame_id = -1
+        self.latency = LatencyStats()
+
+    def register(
+        self, name: str, inputs: tuple[str, ...], outputs: tuple[str, ...], interval: float):
+        """Register module stage"""
+        with self._condition:
+            self._stages[name] = PipelineStage(name, inputs, outputs, interval)
+            self.__update_producers()
+
+    def unregister(self, name: str):
+        """Unregister module stage"""
+        with self._condition:
+            if self._stages.pop(name, None) is None:
+                return
+            self._published.pop(name, None)
+            self._published_time.pop(name, None)
+            self._stalled.discard(name)
+            self.__update_producers()
+            if not self._stages:
+                self.frame_id = -1
+                if self.latency.count:
+                    logger.info("PIPELINE: latency: %s", self.latency)
+                    self.latency.reset()
+            # Wake up consumers that wait for removed stage
+            self._condition.notify_all()
+
+    def wait_inputs(self, inputs: tuple[str, ...], frame_id: int, timeout: float) -> bool:
+        """Wait until producers of inputs published synced data frame
+
+        Args:
+            inputs: minfo section names.
+            frame_id: synced data frame ID that consumer pinned.
+            timeout: max waiting time (seconds).
+
+        Returns:
+            True if all inputs are up to date, False if timed out.
+        """
+        if not inputs:
+            return True
+        with self._condition:
+            producers, timeout = self.__due_producers(inputs, frame_id, timeout)
+            if not producers or self._condition.wait_for(
+                lambda: self.__is_published(producers, frame_id), timeout):
+                return True
+            # Mark stalled producers
+            for name in producers:
+                if name in self._stages and self._published.get(name, -1) < frame_id:
+                    self._stalled.add(name)
+            return False
+
+    def publish(self, name: str, frame_id: int):
+        """Publish outputs of module stage for synced data frame"""
+        with self._condition:
+            if name not in self._stages:
+                return
+            if self._source is not api.read:  # frame ID restarted from new API
+                self._source = api.read
+                self.frame_id = -1
+                self._published.clear()
+                self._published_time.clear()
+            self._published[name] = frame_id
+            self._published_time[name] = perf_counter()
+            self._stalled.discard(name)
+            # Check frame completed by all publishing stages
+            completed = min(
+                _frame_id for _name, _frame_id in self._published.items()
+                if _name not in self._stalled)
+            if self.frame_id < completed == frame_id:
+                self.frame_id = frame_id
+                self.__add_latency()
+            self._condition.notify_all()
+
+    def __due_producers(
+        self, inputs: tuple[str, ...], frame_id: int, timeout: float
+    ) -> tuple[tuple[str, ...], float]:
+        """Active producer names of inputs that are due to publish frame within timeout
+
+        Returns:
+            Producer names, and wait timeout extended to cover producer due time.
+        """
+        timestamp = perf_counter()
+        due_time = 0.0
+        producers = []
+        for section in inputs:
+            name = self._producers.get(section)
+            if (name is None
+                or name in producers
+                or name in self._stalled
+                or self._published.get(name, -1) >= frame_id):
+                continue
+            last_time = self._published_time.get(name)
+            if last_time is not None:  # always due if never published (starting)
+                next_time = last_time + self._stages[name].interval - timestamp
+                if next_time > timeout:
+                    continue  # read last published frame from slower producer
+                if due_time < next_time:
+                    due_time = next_time
+            producers.append(name)
+        return tuple(producers), due_time + timeout
+
+    def __is_published(self, producers: tuple[str, ...], frame_id: int) -> bool:
+        """Check whether all active producers published frame (or newer frame)"""
+        for name in producers:
+            if (name in self._stages
+                and name not in self._stalled
+                and self._published.get(name, -1) < frame_id):
+                return False
+        return True
+
+    def __update_producers(self):
+        """Update producer names of minfo sections"""
+        self._producers = {
+            section: stage.name for stage in self._stages.values() for section in stage.outputs}
+
+    def __add_latency(self):
+        """Add latency sample for completed frame (pinned in current thread)"""
+        timestamp = perf_counter()
+        self.latency.add((timestamp - api.read.check.frame_time()) * 1000)
+        if timestamp - self._last_report > LATENCY_REPORT_INTERVAL:
+            self._last_report = timestamp
+            logger.info("PIPELINE: latency: %s", self.latency)
+
+
+pipeline = ModulePipeline()
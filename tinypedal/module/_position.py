@@ -0,0 +1,149 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Position estimator
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from .. import calculation as calc
+from ..const_common import POS_XYZ_INF
+from ..validator import vehicle_position_sync
+from ._event import SyncedFrameEngine
+
+MAX_MOVED_SPEED = 1500  # meters per second, ignore moved distance above this speed (teleport)
+MIN_MOVED_INTERVAL = 0.01  # seconds, min time interval for moved distance check
+
+
+class PositionOutput(NamedTuple):
+    """Position estimator output
+
+    Attributes:
+        frame_id: synced data frame ID that output derived from.
+        lap_distance: lap distance from API (meters).
+        estimated_distance: estimated lap distance, API distance plus GPS moved distance (meters).
+        synced_distance: synced (smoothed) estimated lap distance (meters).
+        moved_distance: GPS moved distance in last frame (meters).
+        driven_distance: accumulated GPS driven distance since start (meters).
+    """
+
+    frame_id: int = -1
+    lap_distance: float = 0.0
+    estimated_distance: float = 0.0
+    synced_distance: float = 0.0
+    moved_distance: float = 0.0
+    driven_distance: float = 0.0
+
+
+class PositionEstimator(SyncedFrameEngine):
+    """Position estimator
+
+    Estimate local player lap distance once per synced data frame from API lap distance
+    and GPS moved distance between API updates, shared by all modules.
+
+    Attributes:
+        output: last position output (immutable, swapped per frame).
+    """
+
+    __slots__ = (
+        "_gen_position_sync",
+        "_pos_last",
+        "_is_pos_synced",
+        "_gps_last",
+        "_elapsed_last",
+        "output",
+    )
+
+    def __init__(self):
+        self._gen_position_sync = vehicle_position_sync()
+        self.output = PositionOutput()
+        super().__init__()
+
+    def read(self) -> PositionOutput:
+        """Update from current (pinned) synced data frame, then read position output"""
+        self.update()
+        return self.output
+
+    def _resync(self):
+        """Reset position state, keep driven distance"""
+        self._gen_position_sync.send(None)
+        self._pos_last = 0.0
+        self._is_pos_synced = False
+        self._gps_last = POS_XYZ_INF
+        self._elapsed_last = 0.0
+        self.output = self.output._replace(
+            lap_distance=0.0,
+            estimated_distance=0.0,
+            synced_distance=0.0,
+            moved_distance=0.0,
+        )
+
+    def _process(self, reader):
+        """Estimate position from synced data frame"""
+        last = self.output
+        pos_curr = reader.lap.distance()
+        gps_curr = reader.vehicle.position_xyz()
+        elapsed = reader.timing.elapsed()
+        laptime_curr = reader.timing.current_laptime()
+
+        # Distance desync check at start of new lap, reset if higher than normal distance
+        if 0 < laptime_curr < 1 and pos_curr > 300:
+            self._pos_last = pos_curr = 0
+
+        # Sync estimate position if API position value is different & positive
+        if 0 <= pos_curr != self._pos_last:
+            self._pos_last = pos_curr
+            self._is_pos_synced = True
+
+        if self._gps_last == gps_curr:
+            self.output = last._replace(frame_id=self.frame_id, lap_distance=pos_curr, moved_distance=0.0)
+            return
+
+        if self._gps_last is POS_XYZ_INF:  # first frame
+            moved_distance = 0.0
+        else:
+            moved_distance = calc.distance(self._gps_last, gps_curr)
+        self._gps_last = gps_curr
+
+        # Estimate distance into lap
+        if self._is_pos_synced:
+            pos_estimate = pos_curr
+            self._is_pos_synced = False
+        else:
+            pos_estimate = last.estimated_distance + moved_distance
+
+        # Accumulate driven distance, ignore teleport
+        driven_distance = last.driven_distance
+        if moved_distance < MAX_MOVED_SPEED * max(elapsed - self._elapsed_last, MIN_MOVED_INTERVAL):
+            driven_distance += moved_distance
+        self._elapsed_last = elapsed
+
+        self.output = PositionOutput(
+            self.frame_id,
+            pos_curr,
+            pos_estimate,
+            self._gen_position_sync.send(pos_estimate),
+            moved_distance,
+            driven_distance,
+        )
+
+
+position_estimator = PositionEstimator()
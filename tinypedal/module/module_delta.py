@@ -27,19 +27,20 @@ from ..api_control import api
 from ..const_common import (
     DELTA_DEFAULT,
     DELTA_ZERO,
-    FLOAT_INF,
     MAX_SECONDS,
-    POS_XYZ_ZERO,
 )
 from ..module_info import minfo
 from ..userfile.delta_best import load_delta_best_file, save_delta_best_file
-from ..validator import is_same_session, valid_delta_raw, vehicle_position_sync
+from ..validator import is_same_session, valid_delta_raw
 from ._base import DataModule, round6
+from ._event import EventType, timing_events
+from ._position import position_estimator
 
 
 class Realtime(DataModule):
     """Delta time data"""
 
+    outputs = ("delta",)
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -70,7 +71,6 @@ class Realtime(DataModule):
             calc.ema_factor(min(max(self.mcfg["laptime_pace_samples"], 1), 20))
         )
         laptime_pace_margin = max(self.mcfg["laptime_pace_margin"], 0.1)
-        gen_position_sync = vehicle_position_sync()
 
         while not _event_wait(update_interval):
             if self.state.active:
@@ -80,10 +80,9 @@ class Realtime(DataModule):
                     update_interval = self.active_interval
 
                     recording = False
-                    validating = 0
-                    is_pit_lap = 0  # whether pit in or pit out lap
+                    validating = False
+                    timing_event_queue = timing_events.subscribe()
 
-                    gen_position_sync.send(None)
                     combo_id = api.read.check.combo_id()
                     session_id = api.read.check.session_id()
 
@@ -111,71 +110,51 @@ class Realtime(DataModule):
                     laptime_last = 0.0  # last laptime
                     laptime_pace = init_laptime_pace(laptime_best)  # avearge laptime pace
 
-                    last_lap_stime = FLOAT_INF  # last lap start time
                     pos_recorded = 0.0  # last recorded vehicle position
                     pos_last = 0.0  # last checked vehicle position
-                    pos_estimate = 0.0  # estimated vehicle position
-                    pos_synced = 0.0  # synced estimated vehicle position
                     pos_synced_last = 0.0  # last synced estimated vehicle position
-                    is_pos_synced = False  # vehicle position synced with API
-                    gps_last = POS_XYZ_ZERO  # last global position
+                    last_frame_id = -1  # last synced data frame ID
+
+                # Skip if no new synced data frame
+                frame_id = api.read.check.pin_frame()
+                if last_frame_id == frame_id:
+                    continue
+                last_frame_id = frame_id
 
                 # Read telemetry
-                lap_stime = api.read.timing.start()
                 laptime_curr = max(api.read.timing.current_laptime(), 0)
                 laptime_valid = api.read.timing.last_laptime()
-                pos_curr = api.read.lap.distance()
-                gps_curr = api.read.vehicle.position_xyz()
-                in_pits = api.read.vehicle.in_pits()
-                is_pit_lap |= in_pits
-
-                # Reset delta stint best if in pit and stopped
-                if in_pits and laptime_stint_best != MAX_SECONDS and api.read.vehicle.speed() < 0.1:
-                    delta_array_stint = DELTA_DEFAULT
-                    laptime_stint_best = MAX_SECONDS
-
-                # Lap start & finish detection
-                if lap_stime > last_lap_stime:
-                    laptime_last = lap_stime - last_lap_stime
-                    if valid_delta_raw(delta_array_raw, laptime_last, 1):  # set end value
-                        delta_array_raw.append((round6(pos_last + 10), round6(laptime_last)))
-                        delta_array_last = tuple(delta_array_raw)
-                        validating = api.read.timing.elapsed()
-                    delta_array_raw[:] = DELTA_DEFAULT
-                    pos_last = pos_recorded = pos_curr
-                    recording = laptime_curr < 1
-                    is_pit_lap = 0
-                last_lap_stime = lap_stime  # reset
-
-                # 1 sec position distance check after new lap begins
-                # Reset to 0 if higher than normal distance
-                if 0 < laptime_curr < 1 and pos_curr > 300:
-                    pos_last = pos_recorded = pos_curr = 0
-
-                # Update if position value is different & positive
-                if 0 <= pos_curr != pos_last:
-                    if recording and pos_curr - pos_recorded >= min_delta_distance:
-                        delta_array_raw.append((round6(pos_curr), round6(laptime_curr)))
-                        pos_recorded = pos_curr
-                    pos_last = pos_curr  # reset last position
-                    is_pos_synced = True
-
-                # Validating 1s after passing finish line
-                if validating:
-                    timer = api.read.timing.elapsed() - validating
-                    if timer > 10:  # switch off after 10s
-                        validating = 0
-                    elif (timer > 1 and  # compare current time
-                        laptime_valid > 0 and  # is valid laptime
-                        abs(laptime_valid - laptime_last) < 0.001):  # is matched laptime
+                position = position_estimator.read()
+                pos_curr = position.lap_distance
+                pos_synced = position.synced_distance
+
+                # Timing events
+                for event in timing_event_queue.poll():
+                    # Reset delta stint best if in pit and stopped
+                    if event.event_type == EventType.PIT_STOP:
+                        delta_array_stint = DELTA_DEFAULT
+                        laptime_stint_best = MAX_SECONDS
+                    # Lap start & finish
+                    elif event.event_type == EventType.LAP_START:
+                        laptime_last = event.value
+                        validating = valid_delta_raw(delta_array_raw, laptime_last, 1)
+                        if validating:  # set end value
+                            delta_array_raw.append((round6(pos_last + 10), round6(laptime_last)))
+                            delta_array_last = tuple(delta_array_raw)
+                        delta_array_raw[:] = DELTA_DEFAULT
+                        pos_last = pos_recorded = pos_curr
+                        recording = laptime_curr < 1
+                    # Lap validated (matched laptime) after passing finish line
+                    elif event.event_type == EventType.LAP_VALIDATED and validating:
+                        validating = False
                         # Update laptime pace
-                        if not is_pit_lap:
+                        if not event.is_pit_lap:
                             # Set initial laptime if invalid, or align to faster laptime
-                            if not 0 < laptime_pace < MAX_SECONDS or laptime_valid < laptime_pace:
-                                laptime_pace = laptime_valid
+                            if not 0 < laptime_pace < MAX_SECONDS or event.value < laptime_pace:
+                                laptime_pace = event.value
                             else:
                                 laptime_pace = min(
-                                    calc_ema_laptime(laptime_pace, laptime_valid),
+                                    calc_ema_laptime(laptime_pace, event.value),
                                     laptime_pace + laptime_pace_margin,
                                 )
                         # Update delta best list
@@ -195,19 +174,20 @@ class Realtime(DataModule):
                         if laptime_stint_best > laptime_last:
                             laptime_stint_best = laptime_last
                             delta_array_stint = delta_array_last
-                        validating = 0
+                    elif event.event_type == EventType.LAP_INVALIDATED:
+                        validating = False
+
+                # 1 sec position distance check after new lap begins
+                # Reset to 0 if higher than normal distance
+                if 0 < laptime_curr < 1 and pos_curr > 300:
+                    pos_last = pos_recorded = pos_curr = 0
 
-                # Calc distance
-                if gps_last != gps_curr:
-                    moved_distance = calc.distance(gps_last, gps_curr)
-                    gps_last = gps_curr
-                    # Estimate distance into lap
-                    if is_pos_synced:
-                        pos_estimate = pos_curr
-                        is_pos_synced = False
-                    else:
-                        pos_estimate += moved_distance
-                    pos_synced = gen_position_sync.send(pos_estimate)
+                # Update if position value is different & positive
+                if 0 <= pos_curr != pos_last:
+                    if recording and pos_curr - pos_recorded >= min_delta_distance:
+                        delta_array_raw.append((round6(pos_curr), round6(laptime_curr)))
+                        pos_recorded = pos_curr
+                    pos_last = pos_curr  # reset last position
 
                 # Calc delta
                 if pos_synced_last != pos_synced:
@@ -265,6 +245,7 @@ class Realtime(DataModule):
                 output.lapTimeStint = laptime_stint_best
                 output.lapTimePace = laptime_pace
                 output.lapDistance = pos_synced
+                self.publish_outputs(frame_id)
 
             else:
                 if reset:
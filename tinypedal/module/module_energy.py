@@ -33,6 +33,8 @@ from .module_fuel import calc_consumption
 class Realtime(DataModule):
     """Energy usage data"""
 
+    inputs = ("delta", "fuel")
+    outputs = ("energy",)
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -49,6 +51,9 @@ class Realtime(DataModule):
         while not _event_wait(update_interval):
             if self.state.active:
 
+                # Pin synced data frame for timing events
+                frame_id = api.read.check.pin_frame()
+
                 if not reset:
                     reset = True
                     update_interval = self.active_interval
@@ -66,6 +71,7 @@ class Realtime(DataModule):
                     minfo.energy.reset()
 
                 # Run calculation if virtual energy available
+                self.wait_inputs(frame_id)
                 if minfo.restapi.maxVirtualEnergy:
                     gen_calc_energy.send(True)
 
@@ -77,6 +83,7 @@ class Realtime(DataModule):
                     minfo.hybrid.fuelEnergyBias = (
                         minfo.fuel.estimatedLaps - minfo.energy.estimatedLaps
                     )
+                self.publish_outputs(frame_id)
 
             else:
                 if reset:
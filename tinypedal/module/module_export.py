@@ -0,0 +1,112 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Export module
+"""
+
+from __future__ import annotations
+
+import logging
+from operator import attrgetter
+
+from ..api_control import api
+from ..const_common import MAX_VEHICLES, REL_TIME_DEFAULT
+from ..module_info import minfo
+from ..shared_block import BlockLayout, SeqlockBlock
+from ..shared_export import EXPORT_FIELDS, EXPORT_NAME, EXPORT_VERSION
+from ._base import DataModule
+
+logger = logging.getLogger(__name__)
+
+
+class Realtime(DataModule):
+    """Shared memory export"""
+
+    inputs = ("delta", "fuel", "relative", "vehicles")
+    __slots__ = ()
+
+    def __init__(self, config, module_name):
+        super().__init__(config, module_name)
+
+    def update_data(self):
+        """Update module data"""
+        _event_wait = self._event.wait
+        reset = False
+        update_interval = self.active_interval
+
+        try:
+            block = SeqlockBlock(create_export_layout(), EXPORT_NAME, create=True)
+        except OSError as error:
+            logger.error("EXPORT: failed to create shared memory %s: %s", EXPORT_NAME, error)
+            return
+        logger.info("EXPORT: shared memory %s created", EXPORT_NAME)
+
+        while not _event_wait(update_interval):
+            if self.state.active:
+
+                if not reset:
+                    reset = True
+                    update_interval = self.active_interval
+                    last_frame_id = -1  # last synced data frame ID
+
+                # Skip if no new synced data frame
+                frame_id = api.read.check.pin_frame()
+                if last_frame_id == frame_id:
+                    continue
+                last_frame_id = frame_id
+
+                # Export after input modules updated same frame
+                self.wait_inputs(frame_id)
+                block.write(minfo)
+
+            else:
+                if reset:
+                    reset = False
+                    update_interval = self.idle_interval
+
+        block.close(unlink=True)
+
+
+def create_export_layout() -> BlockLayout:
+    """Create export layout with minfo value getters"""
+    getters = []
+    for field in EXPORT_FIELDS:
+        # Default getter reads "section.name" attribute (including vehicles column arrays)
+        getter = EXPORT_GETTERS.get(f"{field.section}.{field.name}")
+        if getter is None:
+            getter = attrgetter(f"{field.section}.{field.name}")
+        getters.append(getter)
+    return BlockLayout(EXPORT_FIELDS, getters, EXPORT_VERSION)
+
+
+def padded(values: list, fill) -> list:
+    """Pad or cut values to max vehicles"""
+    return values[:MAX_VEHICLES] + [fill] * (MAX_VEHICLES - len(values))
+
+
+EXPORT_GETTERS = {
+    "frame.frameId": lambda _: api.read.check.frame_id(),
+    "relative.relativeCount": lambda info: min(len(info.relative.relative), MAX_VEHICLES),
+    "relative.relativeTimeGap": lambda info: padded(
+        [rel[0] for rel in info.relative.relative], REL_TIME_DEFAULT[0]),
+    "relative.relativeIndex": lambda info: padded(
+        [rel[1] for rel in info.relative.relative], REL_TIME_DEFAULT[1]),
+    "relative.standingsCount": lambda info: min(len(info.relative.standings), MAX_VEHICLES),
+    "relative.standingsIndex": lambda info: padded(info.relative.standings, -1),
+}
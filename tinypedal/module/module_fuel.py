@@ -27,7 +27,7 @@ from typing import Callable
 
 from .. import calculation as calc
 from ..api_control import api
-from ..const_common import DELTA_DEFAULT, DELTA_ZERO, FLOAT_INF, POS_XYZ_ZERO
+from ..const_common import DELTA_DEFAULT, DELTA_ZERO, FLOAT_INF
 from ..const_file import FileExt
 from ..module_info import ConsumptionDataSet, FuelInfo, minfo
 from ..userfile.consumption_history import (
@@ -40,11 +40,15 @@ from ..userfile.fuel_delta import (
 )
 from ..validator import generator_init, valid_delta_raw
 from ._base import DataModule, round6
+from ._event import EventType, timing_events
+from ._position import position_estimator
 
 
 class Realtime(DataModule):
     """Fuel usage data"""
 
+    inputs = ("delta",)
+    outputs = ("fuel",)
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -61,6 +65,9 @@ class Realtime(DataModule):
         while not _event_wait(update_interval):
             if self.state.active:
 
+                # Pin synced data frame for timing events
+                frame_id = api.read.check.pin_frame()
+
                 if not reset:
                     reset = True
                     update_interval = self.active_interval
@@ -78,8 +85,10 @@ class Realtime(DataModule):
                     minfo.fuel.reset()
                     load_consumption_history(userpath_fuel_delta, combo_id)
 
-                # Run calculation
+                # Run calculation after delta lap time pace updated
+                self.wait_inputs(frame_id)
                 gen_calc_fuel.send(True)
+                self.publish_outputs(frame_id)
 
                 # Update consumption history
                 update_consumption_history()
@@ -168,8 +177,8 @@ def calc_consumption(
     """Calculate consumption data"""
     recording = False
     delayed_save = False
-    validating = 0
-    is_pit_lap = 0  # whether pit in or pit out lap
+    validating = False
+    timing_event_queue = timing_events.subscribe()
 
     delta_array_last, used_last_valid, laptime_last = load_fuel_delta_file(
         filepath=filepath,
@@ -196,14 +205,11 @@ def calc_consumption(
     est_pits_early = 0.0  # estimate end-lap pit stop counts
     used_est_less = 0.0  # estimate fuel consumption for one less pit stop
 
-    last_lap_stime = FLOAT_INF  # last lap start time
     laps_left = 0.0  # amount laps left at current lap distance
     end_timer_laps_left = 0.0  # amount laps left from start of current lap to end of race timer
     pos_recorded = 0.0  # last recorded vehicle position
     pos_last = 0.0  # last checked vehicle position
-    pos_estimate = 0.0  # estimated vehicle position
-    is_pos_synced = False  # vehicle position synced with API
-    gps_last = POS_XYZ_ZERO  # last global position
+    pos_synced_last = 0.0  # last synced estimated vehicle position
 
     while True:
         updating = yield None
@@ -221,15 +227,14 @@ def calc_consumption(
 
         # Read telemetry
         capacity, amount_curr = telemetry_func()
-        lap_stime = api.read.timing.start()
         laptime_curr = api.read.timing.current_laptime()
         time_left = api.read.session.remaining()
         in_garage = api.read.vehicle.in_garage()
-        pos_curr = api.read.lap.distance()
-        gps_curr = api.read.vehicle.position_xyz()
+        position = position_estimator.read()
+        pos_curr = position.lap_distance
+        pos_synced = position.synced_distance
         laps_done = api.read.lap.completed_laps()
         lap_into = api.read.lap.progress()
-        is_pit_lap |= api.read.vehicle.in_pits()
         laptime_last = minfo.delta.lapTimePace
 
         # Realtime fuel consumption
@@ -246,23 +251,32 @@ def calc_consumption(
             used_curr += amount_last - amount_curr
             amount_last = amount_curr
 
-        # Lap start & finish detection
-        if lap_stime > last_lap_stime:
-            if not is_pit_lap and valid_delta_raw(delta_array_raw, used_curr, 1):
-                delta_array_raw.append((  # set end value
-                    round6(pos_last + 10),
-                    round6(used_curr),
-                    round6(lap_stime - last_lap_stime)
-                ))
-                delta_array_temp = tuple(delta_array_raw)
-                validating = api.read.timing.elapsed()
-            delta_array_raw[:] = DELTA_DEFAULT
-            pos_last = pos_recorded = pos_curr
-            used_last_raw = used_curr
-            used_curr = 0
-            recording = laptime_curr < 1
-            is_pit_lap = 0
-        last_lap_stime = lap_stime  # reset
+        # Timing events
+        for event in timing_event_queue.poll():
+            # Lap start & finish
+            if event.event_type == EventType.LAP_START:
+                validating = not event.is_pit_lap and valid_delta_raw(delta_array_raw, used_curr, 1)
+                if validating:
+                    delta_array_raw.append((  # set end value
+                        round6(pos_last + 10),
+                        round6(used_curr),
+                        round6(event.value)
+                    ))
+                    delta_array_temp = tuple(delta_array_raw)
+                delta_array_raw[:] = DELTA_DEFAULT
+                pos_last = pos_recorded = pos_curr
+                used_last_raw = used_curr
+                used_curr = 0
+                recording = laptime_curr < 1
+            # Lap validated (matched laptime) after passing finish line
+            elif event.event_type == EventType.LAP_VALIDATED and validating:
+                used_last_valid = used_last_raw
+                delta_array_last = delta_array_temp
+                delta_array_temp = DELTA_DEFAULT
+                delayed_save = True
+                validating = False
+            elif event.event_type == EventType.LAP_INVALIDATED:
+                validating = False
 
         # Distance desync check at start of new lap, reset if higher than normal distance
         if 0 < laptime_curr < 1 and pos_curr > 300:
@@ -274,40 +288,20 @@ def calc_consumption(
                 delta_array_raw.append((round6(pos_curr), round6(used_curr)))
                 pos_recorded = pos_curr
             pos_last = pos_curr  # reset last position
-            is_pos_synced = True
-
-        # Validating 1s after passing finish line
-        if validating:
-            timer = api.read.timing.elapsed() - validating
-            if timer > 3:  # switch off after 3s
-                validating = 0
-            elif (timer > 0.3 and  # compare current time
-                api.read.timing.last_laptime() > 0):  # is valid laptime
-                used_last_valid = used_last_raw
-                delta_array_last = delta_array_temp
-                delta_array_temp = DELTA_DEFAULT
-                delayed_save = True
-                validating = 0
 
         # Calc delta
-        if gps_last != gps_curr:
-            if is_pos_synced:
-                pos_estimate = pos_curr
-                is_pos_synced = False
-            else:
-                pos_estimate += calc.distance(gps_last, gps_curr)
-            gps_last = gps_curr
-            # Update delta
+        if pos_synced_last != pos_synced:
+            pos_synced_last = pos_synced
             delta_fuel = calc.delta_telemetry(
                 delta_array_last,
-                pos_estimate,
+                pos_synced,
                 used_curr,
                 laptime_curr > 0.3 and not in_garage,  # 300ms delay
             )
 
         # Exclude first lap & pit in/out lap
         used_est = calc.end_lap_consumption(
-            used_last_valid, delta_fuel, 0 == is_pit_lap < laps_done)
+            used_last_valid, delta_fuel, 0 == timing_events.is_pit_lap < laps_done)
 
         # Total refuel = laps left * last consumption - remaining fuel
         if api.read.session.lap_type():  # lap-type
@@ -23,6 +23,7 @@ Mapping module
 from .. import calculation as calc
 from ..api_control import api
 from ..const_file import FileExt
+from ..map_geometry import MapLod
 from ..module_info import minfo
 from ..userfile.track_info import load_track_info, save_track_info
 from ..userfile.track_map import load_track_map_file, save_track_map_file
@@ -59,7 +60,9 @@ class Realtime(DataModule):
                     recorder.load_map(api.read.check.track_id())
                     if recorder.map_exist:
                         output.coordinates = recorder.output.coords
+                        output.coordinatesLod = recorder.output.coords_lod
                         output.elevations = recorder.output.dists
+                        output.elevationsLod = recorder.output.dists_lod
                         output.sectors = recorder.output.sectors
                         output.lastModified = recorder.last_modified
                     else:
@@ -152,6 +155,8 @@ class MapCoords:
         "coords",
         "dists",
         "sectors",
+        "coords_lod",
+        "dists_lod",
     )
 
     def __init__(self, coords=None, dists=None, sectors=None):
@@ -164,12 +169,21 @@ class MapCoords:
         self.coords = coords
         self.dists = dists
         self.sectors = sectors
+        self.coords_lod = None
+        self.dists_lod = None
 
     def clear(self):
         """Clear coords data"""
         self.coords = None
         self.dists = None
         self.sectors = None
+        self.coords_lod = None
+        self.dists_lod = None
+
+    def update_lod(self):
+        """Build map LOD pyramid from coords data (once per map)"""
+        self.coords_lod = MapLod(self.coords) if self.coords else None
+        self.dists_lod = MapLod(self.dists) if self.dists else None
 
     def reset(self):
         """Reset coords data"""
@@ -296,6 +310,7 @@ class MapRecorder:
             self.output.coords = raw_coords
             self.output.dists = raw_dists
             self.output.sectors = sectors_index
+            self.output.update_lod()
             self.map_exist = True
             #logger.info("map exist")
         else:
@@ -308,6 +323,7 @@ class MapRecorder:
         self.output.coords = self._temp_data.coords
         self.output.dists = self._temp_data.dists
         self.output.sectors = self._temp_data.sectors
+        self.output.update_lod()
         # Save to svg file
         save_track_map_file(
             filepath=self._filepath,
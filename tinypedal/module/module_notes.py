@@ -22,18 +22,17 @@ Notes module
 
 from __future__ import annotations
 
-from typing import Callable, Mapping
+from array import array
+from bisect import bisect_right
 
-from .. import calculation as calc
 from ..api_control import api
 from ..const_file import FileExt
 from ..module_info import NotesInfo, minfo
 from ..userfile.track_notes import (
-    COLUMN_DISTANCE,
     HEADER_PACE_NOTES,
     HEADER_TRACK_NOTES,
-    load_notes_file,
-    parse_csv_notes_only,
+    CompiledNotes,
+    load_compiled_notes_file,
 )
 from ..validator import generator_init
 from ._base import DataModule
@@ -75,27 +74,25 @@ class Realtime(DataModule):
                         filepath=userpath_pace_notes,
                         filename=track_name,
                         table_header=HEADER_PACE_NOTES,
-                        parser=parse_csv_notes_only,
                         extension=FileExt.TPPN,
                     )
                     if pace_notes:
                         gen_pacenotes = notes_selector(
                             output=output_pacenotes,
-                            dataset=pace_notes,
+                            compiled=pace_notes,
                         )
 
                     # Load track notes
-                    track_notes = load_notes_file(
+                    track_notes = load_compiled_notes_file(
                         filepath=userpath_track_notes,
                         filename=track_name,
                         table_header=HEADER_TRACK_NOTES,
-                        parser=parse_csv_notes_only,
                         extension=FileExt.TPTN,
                     )
                     if track_notes:
                         gen_tracknotes = notes_selector(
                             output=output_tracknotes,
-                            dataset=track_notes,
+                            compiled=track_notes,
                         )
 
                 # Update position
@@ -119,44 +116,47 @@ class Realtime(DataModule):
 
 def load_pace_notes_file(
     config: dict, filepath: str, filename: str,
-    table_header: tuple, parser: Callable, extension: str):
+    table_header: tuple, extension: str) -> CompiledNotes | None:
     """Load pace notes"""
     if config["enable_manual_file_selector"]:
         filepath = ""
         filename = config["pace_notes_file_name"]
         extension = ""
-    return load_notes_file(
+    return load_compiled_notes_file(
         filepath=filepath,
         filename=filename,
         table_header=table_header,
-        parser=parser,
         extension=extension,
     )
 
 
 @generator_init
-def notes_selector(output: NotesInfo, dataset: list[Mapping]):
+def notes_selector(output: NotesInfo, compiled: CompiledNotes):
     """Notes selector
 
     Args:
         output: module info.
-        dataset: list of notes.
+        compiled: compiled notes.
     """
-    last_index = -99999  # make sure initial index is different
-    next_index = 0  # next note line index
+    distances = compiled.distances
+    dataset = compiled.notes
+    curr_index = -1  # -1 = before first note line
     end_index = len(dataset) - 1  # end note line index
-    pos_reference = reference_position(dataset)
-    pos_final = pos_reference[-1]  # final reference position
+    pos_final = distances[-1]  # final reference position
     output.reset()  # initial reset before updating
+    output.dataSet = dataset
+    output.currentIndex = curr_index
+    output.currentNote = dataset[curr_index]
+    output.nextNote = dataset[0]
 
     while True:
         pos_curr = yield
-        curr_index = calc.binary_search_lower(pos_reference, pos_curr, 0, end_index)
+        last_index = curr_index
+        curr_index = seek_index(distances, pos_curr, curr_index, end_index)
 
         if last_index == curr_index:
             continue
 
-        last_index = curr_index
         next_index = (curr_index + 1) * (pos_curr < pos_final)
 
         output.currentIndex = curr_index
@@ -165,6 +165,17 @@ def notes_selector(output: NotesInfo, dataset: list[Mapping]):
         output.nextNote = dataset[next_index]
 
 
-def reference_position(notes: list[Mapping]) -> tuple[float, ...]:
-    """Reference notes position list"""
-    return tuple(note_line[COLUMN_DISTANCE] for note_line in notes)
+def seek_index(distances: array, position: float, index: int, end_index: int) -> int:
+    """Seek note index from last index (cursor)
+
+    Check current and next note range first, bisect only if jumped further.
+
+    Returns:
+        Index of last note at or before position, -1 if before first note.
+    """
+    if index < 0 or distances[index] <= position:
+        if index >= end_index or position < distances[index + 1]:
+            return index
+        if index + 1 >= end_index or position < distances[index + 2]:
+            return index + 1
+    return bisect_right(distances, position) - 1
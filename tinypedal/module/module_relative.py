@@ -34,7 +34,7 @@ from ._base import DataModule
 REF_PLACES = tuple(range(1, MAX_VEHICLES + 1))
 TEMP_RELATIVE_AHEAD = [[0, -1] for _ in range(MAX_VEHICLES)]
 TEMP_RELATIVE_BEHIND = [[0, -1] for _ in range(MAX_VEHICLES)]
-TEMP_CLASSES = [["", -1, -1, -1.0, -1.0] for _ in range(MAX_VEHICLES)]
+TEMP_CLASSES = [[-1, -1, -1, -1.0, -1.0, ""] for _ in range(MAX_VEHICLES)]
 TEMP_CLASSES_POS = [[0, 1, "", 0.0, -1, -1, -1, False] for _ in range(MAX_VEHICLES)]
 TEMP_DRAW_ORDER = list(range(MAX_VEHICLES))
 
@@ -42,6 +42,7 @@ TEMP_DRAW_ORDER = list(range(MAX_VEHICLES))
 class Realtime(DataModule):
     """Relative & standings data"""
 
+    outputs = ("relative",)
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -64,6 +65,13 @@ class Realtime(DataModule):
                 if not reset:
                     reset = True
                     update_interval = self.active_interval
+                    last_frame_id = -1  # last synced data frame ID
+
+                # Skip if no new synced data frame
+                frame_id = api.read.check.pin_frame()
+                if last_frame_id == frame_id:
+                    continue
+                last_frame_id = frame_id
 
                 # Check setting
                 if last_version_update != self.cfg.version_update:
@@ -118,6 +126,7 @@ class Realtime(DataModule):
                 output.standings = standings_index_list
                 output.classes = class_pos_list
                 output.drawOrder = draw_order_list
+                self.publish_outputs(frame_id)
 
             else:
                 if reset:
@@ -129,7 +138,7 @@ def get_vehicles_info(veh_total: int, plr_index: int, show_in_garage: bool):
     """Get vehicles info: relative time gap, classes, places, laptime"""
     laptime_est = api.read.timing.estimated_laptime()
     plr_time = api.read.timing.estimated_time_into()
-    last_class_name = None
+    last_class_id = None
     classes_count = 0
     recorded_index = 0
     leader_index = 0
@@ -161,7 +170,7 @@ def get_vehicles_info(veh_total: int, plr_index: int, show_in_garage: bool):
             recorded_index += 1
 
         # Update classes list
-        class_name = api.read.vehicle.class_name(index)
+        class_id = api.read.vehicle.class_id(index)
         place_overall = api.read.vehicle.place(index)
         laptime_best = api.read.timing.best_laptime(index)
         laptime_last = api.read.timing.last_laptime(index)
@@ -177,11 +186,12 @@ def get_vehicles_info(veh_total: int, plr_index: int, show_in_garage: bool):
             laptime_personal_best = MAX_SECONDS
 
         TEMP_CLASSES[index][:] = (
-            class_name,  # 0 vehicle class name
+            class_id,  # 0 vehicle class id
             place_overall,  # 1 overall position/place
             index,  # 2 player index
             laptime_personal_best,  # 3 best lap time
             laptime_personal_last,  # 4 last lap time (for fastest last lap check)
+            api.read.vehicle.class_name(index),  # 5 vehicle class name
         )
 
         # Update draw order list
@@ -192,8 +202,8 @@ def get_vehicles_info(veh_total: int, plr_index: int, show_in_garage: bool):
             pitter_index += 1
 
         # Check is multi classes
-        if classes_count < 2 and last_class_name != class_name:
-            last_class_name = class_name
+        if classes_count < 2 and last_class_id != class_id:
+            last_class_id = class_id
             classes_count += 1
 
     # Finalize draw order list
@@ -212,7 +222,7 @@ def get_vehicles_info(veh_total: int, plr_index: int, show_in_garage: bool):
     relative_behind.sort(reverse=True)  # by reversed time gap
 
     new_classes = TEMP_CLASSES[:veh_total]
-    new_classes.sort()  # by vehicle class
+    new_classes.sort()  # by vehicle class id
 
     return (
         relative_ahead,
@@ -239,7 +249,7 @@ def create_relative_index(
 
 def create_position_in_class(sorted_veh_class: list, plr_index: int):
     """Create vehicle position in class list"""
-    last_class_name = None
+    last_class_id = None
     place_in_class = 0
     opt_index_ahead = -1
     opt_index_leader = -1
@@ -251,12 +261,12 @@ def create_position_in_class(sorted_veh_class: list, plr_index: int):
     plr_class_place = 0
     slot_index = 0
 
-    for class_name, _, opt_index, laptime_best, laptime_last in sorted_veh_class:
-        if last_class_name == class_name:
+    for class_id, _, opt_index, laptime_best, laptime_last, class_name in sorted_veh_class:
+        if last_class_id == class_id:
             place_in_class += 1
             TEMP_CLASSES_POS[slot_index - 1][5] = opt_index  # set opponent index behind
         else:
-            last_class_name = class_name  # reset class name
+            last_class_id = class_id  # reset class id
             place_in_class = 1  # reset position counter
             opt_index_ahead = -1  # no opponent ahead of class leader
             opt_index_leader = opt_index
@@ -277,7 +287,7 @@ def create_position_in_class(sorted_veh_class: list, plr_index: int):
         TEMP_CLASSES_POS[slot_index][:] = (
             opt_index,  # 0 - 2 player index
             place_in_class,  # 1 - position in class
-            class_name,  # 2 - 0 class name
+            class_name,  # 2 - 5 class name
             laptime_class_best,  # 3 classes best
             opt_index_ahead,  # 4 opponent index ahead
             -1,  # 5 opponent index behind
@@ -392,6 +402,6 @@ def max_vehicles_in_class(max_cls_veh: int, min_top_veh: int, min_add_veh: int =
     return max(int(max_cls_veh), min_top_veh + min_add_veh)
 
 
-def sort_class_collection(collection: list) -> float:
-    """Sort class collection by class best laptime"""
-    return collection[0][3]  # 3 class best laptime
+def sort_class_collection(collection: list) -> tuple[float, str]:
+    """Sort class collection by class best laptime, then class name"""
+    return collection[0][3], collection[0][2]  # 3 class best laptime, 2 class name
@@ -0,0 +1,89 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Sampler module
+"""
+
+from ..api_control import api
+from ..module_info import minfo
+from ._base import DataModule
+
+
+class Realtime(DataModule):
+    """Input sampler"""
+
+    __slots__ = ()
+
+    def __init__(self, config, module_name):
+        super().__init__(config, module_name)
+
+    def update_data(self):
+        """Update module data"""
+        _event_wait = self._event.wait
+        reset = False
+        update_interval = self.active_interval
+
+        output = minfo.sampler
+        capacity = output.capacity
+        g_accel = max(self.cfg.user.setting["module_force"]["gravitational_acceleration"], 0.01)
+
+        while not _event_wait(update_interval):
+            if self.state.active:
+
+                if not reset:
+                    reset = True
+                    update_interval = self.active_interval
+                    last_frame_id = -1  # last synced data frame ID
+                    last_lap_etime = -1.0
+
+                # Skip if no new synced data frame
+                frame_id = api.read.check.pin_frame()
+                if last_frame_id == frame_id:
+                    continue
+                last_frame_id = frame_id
+
+                # Skip if telemetry not updated (paused, or scoring only frame)
+                lap_etime = api.read.timing.elapsed()
+                if last_lap_etime == lap_etime:
+                    continue
+                last_lap_etime = lap_etime
+
+                # Write sample, then increase total to make it readable
+                index = output.total % capacity
+                slip_ratio = minfo.wheels.slipRatio
+                output.elapsed[index] = lap_etime
+                output.throttle[index] = api.read.inputs.throttle()
+                output.throttleRaw[index] = api.read.inputs.throttle_raw()
+                output.brake[index] = api.read.inputs.brake()
+                output.brakeRaw[index] = api.read.inputs.brake_raw()
+                output.brakePressure[index] = sum(api.read.brake.pressure())
+                output.clutch[index] = api.read.inputs.clutch()
+                output.clutchRaw[index] = api.read.inputs.clutch_raw()
+                output.steering[index] = api.read.inputs.steering()
+                output.forceFeedback[index] = api.read.inputs.force_feedback()
+                output.slipRatioMin[index] = min(slip_ratio)
+                output.slipRatioMax[index] = max(slip_ratio)
+                output.lgtGForce[index] = api.read.vehicle.accel_longitudinal() / g_accel
+                output.latGForce[index] = api.read.vehicle.accel_lateral() / g_accel
+                output.total += 1
+
+            else:
+                if reset:
+                    reset = False
+                    update_interval = self.idle_interval
@@ -22,12 +22,12 @@ Stats module
 
 from __future__ import annotations
 
-from .. import calculation as calc
 from ..api_control import api
-from ..const_common import FLOAT_INF, POS_XYZ_INF
+from ..const_common import FLOAT_INF
 from ..module_info import minfo
 from ..userfile.driver_stats import DriverStats, load_driver_stats, save_driver_stats
 from ._base import DataModule
+from ._position import position_estimator
 
 
 class Realtime(DataModule):
@@ -45,7 +45,6 @@ class Realtime(DataModule):
         update_interval = self.active_interval
 
         output = minfo.stats
-        max_moved_distance = 1500 * update_interval
         podium_by_class = self.mcfg["enable_podium_by_class"]
         vehicle_class = self.mcfg["vehicle_classification"]
 
@@ -59,6 +58,10 @@ class Realtime(DataModule):
                 continue
 
             if self.state.active:
+
+                # Pin synced data frame for position
+                api.read.check.pin_frame()
+
                 if not reset:
 
                     reset = True
@@ -78,7 +81,7 @@ class Realtime(DataModule):
                     last_num_penalties = 99999
                     fuel_last = 0.0
                     last_finish_state = 99999
-                    gps_last = POS_XYZ_INF
+                    driven_last = position_estimator.read().driven_distance
 
                 # General
                 lap_stime = api.read.timing.start()
@@ -94,12 +97,10 @@ class Realtime(DataModule):
                         driver_stats.pb = last_valid_laptime
 
                 # Driven distance
-                gps_curr = api.read.vehicle.position_xyz()
-                if gps_last != gps_curr:
-                    moved_distance = calc.distance(gps_last, gps_curr)
-                    if moved_distance < max_moved_distance:
-                        driver_stats.meters += moved_distance
-                    gps_last = gps_curr
+                driven_curr = position_estimator.read().driven_distance
+                if driven_last < driven_curr:
+                    driver_stats.meters += driven_curr - driven_last
+                    driven_last = driven_curr
 
                 # Laps complete
                 if last_lap_stime > lap_stime:
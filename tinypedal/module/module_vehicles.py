@@ -22,10 +22,15 @@ Vehicles module
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from .. import calculation as calc
 from ..api_control import api
 from ..const_common import MAX_METERS, MAX_SECONDS
-from ..module_info import VehiclesInfo, minfo
+from ..formatter import random_color_class, shorten_driver_name
+from ..module_info import VehicleDataSet, VehiclesInfo, minfo
+from ..setting import Setting
+from ..userfile.heatmap import select_compound_symbol
 from ..validator import state_timer
 from ._base import DataModule
 
@@ -33,6 +38,8 @@ from ._base import DataModule
 class Realtime(DataModule):
     """Vehicles info"""
 
+    inputs = ("relative",)
+    outputs = ("vehicles",)
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -58,10 +65,21 @@ class Realtime(DataModule):
                     update_interval = self.active_interval
                     output.dataSetVersion = -1
                     last_veh_total = 0
+                    last_frame_id = -1  # last synced data frame ID
+
+                # Skip if no new synced data frame
+                frame_id = api.read.check.pin_frame()
+                if last_frame_id == frame_id:
+                    continue
+                last_frame_id = frame_id
+
+                # Wait relative class positions from same frame
+                self.wait_inputs(frame_id)
 
                 veh_total = output.totalVehicles = api.read.vehicle.total_vehicles()
                 if veh_total > 0:
                     update_vehicle_data(
+                        self.cfg,
                         output,
                         minfo.relative.classes,
                         max_lap_diff_ahead,
@@ -74,6 +92,8 @@ class Realtime(DataModule):
                     if veh_total > 0:
                         update_qualify_position(output)
 
+                self.publish_outputs(frame_id)
+
             else:
                 if reset:
                     reset = False
@@ -81,6 +101,7 @@ class Realtime(DataModule):
 
 
 def update_vehicle_data(
+    config: Setting,
     output: VehiclesInfo,
     class_pos_list: list,
     max_lap_diff_ahead: float,
@@ -104,104 +125,97 @@ def update_vehicle_data(
     plr_laptime_est = api.read.timing.estimated_laptime()
     plr_timeinto_est = api.read.timing.estimated_time_into()
 
-    # Update dataset from all vehicles in current session
-    for index, data, class_pos in zip(range(output.totalVehicles), output.dataSet, class_pos_list):
+    # Vehicle columns
+    is_player = output.isPlayer
+    current_lap_progress = output.currentLapProgress
+    total_lap_progress = output.totalLapProgress
+    is_yellow = output.isYellow
+    in_pit = output.inPit
+    pit_timer = output.pitTimer
+    world_pos_x = output.worldPositionX
+    world_pos_y = output.worldPositionY
+    rel_orientation = output.relativeOrientationRadians
+    rel_rotated_pos_x = output.relativeRotatedPositionX
+    rel_rotated_pos_y = output.relativeRotatedPositionY
+    rel_straight_distance = output.relativeStraightDistance
+    is_lapped = output.isLapped
+
+    # Player position & orientation
+    plr_pos_x = api.read.vehicle.position_longitudinal()
+    plr_pos_y = api.read.vehicle.position_lateral()
+    plr_ori_yaw = api.read.vehicle.orientation_yaw_radians()
+
+    # Update high priority info from all vehicles in current session
+    for index in range(output.totalVehicles):
         # Temp var only
         laps_completed = api.read.lap.completed_laps(index)
         lap_distance = api.read.lap.distance(index)
-
-        # Update high priority info
-        data.isPlayer = api.read.vehicle.is_player(index)
-        data.currentLapProgress = calc.lap_progress_distance(lap_distance, track_length)
-        data.totalLapProgress = laps_completed + data.currentLapProgress
-        data.isYellow = api.read.vehicle.speed(index) < 8
-        data.inPit = api.read.vehicle.in_paddock(index)
-        data.pitTimer.update(api.read.vehicle.slot_id(index), data.inPit, elapsed_time, laps_completed)
-        data.worldPositionX = api.read.vehicle.position_longitudinal(index)
-        data.worldPositionY = api.read.vehicle.position_lateral(index)
-
-        if data.isPlayer:
+        veh_lap_progress = calc.lap_progress_distance(lap_distance, track_length)
+        veh_lap_progress_total = laps_completed + veh_lap_progress
+        veh_is_player = api.read.vehicle.is_player(index)
+        veh_is_yellow = api.read.vehicle.speed(index) < 8
+        veh_in_pit = api.read.vehicle.in_paddock(index)
+        veh_pos_x = api.read.vehicle.position_longitudinal(index)
+        veh_pos_y = api.read.vehicle.position_lateral(index)
+
+        is_player[index] = veh_is_player
+        current_lap_progress[index] = veh_lap_progress
+        total_lap_progress[index] = veh_lap_progress_total
+        is_yellow[index] = veh_is_yellow
+        in_pit[index] = veh_in_pit
+        pit_timer[index].update(api.read.vehicle.slot_id(index), veh_in_pit, elapsed_time, laps_completed)
+        world_pos_x[index] = veh_pos_x
+        world_pos_y[index] = veh_pos_y
+
+        if veh_is_player:
             output.playerIndex = index
-            if data.isYellow:
+            if veh_is_yellow:
                 nearest_yellow_ahead = 0.0
                 nearest_yellow_behind = 0.0
-        else:
-            # Relative position & orientation
-            plr_pos_x = api.read.vehicle.position_longitudinal()
-            plr_pos_y = api.read.vehicle.position_lateral()
-            plr_ori_yaw = api.read.vehicle.orientation_yaw_radians()
-            opt_ori_yaw = api.read.vehicle.orientation_yaw_radians(index)
-
-            data.relativeOrientationRadians = opt_ori_yaw - plr_ori_yaw
-            data.relativeRotatedPositionX, data.relativeRotatedPositionY = calc.rotate_coordinate(
-                plr_ori_yaw - 3.14159265,  # plr_ori_rad, rotate view
-                data.worldPositionX - plr_pos_x,     # x position related to player
-                data.worldPositionY - plr_pos_y,     # y position related to player
-            )
-
-            # Relative distance & time gap
-            data.relativeStraightDistance = calc.distance(
-                (plr_pos_x, plr_pos_y),
-                (data.worldPositionX, data.worldPositionY)
+            continue
+
+        # Relative position & orientation
+        rel_orientation[index] = api.read.vehicle.orientation_yaw_radians(index) - plr_ori_yaw
+        rel_rotated_pos_x[index], rel_rotated_pos_y[index] = calc.rotate_coordinate(
+            plr_ori_yaw - 3.14159265,  # plr_ori_rad, rotate view
+            veh_pos_x - plr_pos_x,     # x position related to player
+            veh_pos_y - plr_pos_y,     # y position related to player
+        )
+
+        # Relative distance & time gap
+        veh_distance = rel_straight_distance[index] = calc.distance(
+            (plr_pos_x, plr_pos_y),
+            (veh_pos_x, veh_pos_y)
+        )
+        is_lapped[index] = calc.lap_difference(
+            veh_lap_progress_total, plr_lap_progress_total,
+            max_lap_diff_ahead, max_lap_diff_behind
+        ) if in_race else 0
+
+        # Nearest straight line distance (non local players)
+        if nearest_line > veh_distance:
+            nearest_line = veh_distance
+        # Nearest traffic time gap (opponents behind local players)
+        if not veh_in_pit:
+            opt_time_behind = calc.circular_relative_distance(
+                plr_laptime_est,
+                plr_timeinto_est,
+                api.read.timing.estimated_time_into(index),
             )
-            data.isLapped = calc.lap_difference(
-                data.totalLapProgress, plr_lap_progress_total,
-                max_lap_diff_ahead, max_lap_diff_behind
-            ) if in_race else 0
-
-            # Nearest straight line distance (non local players)
-            if nearest_line > data.relativeStraightDistance:
-                nearest_line = data.relativeStraightDistance
-            # Nearest traffic time gap (opponents behind local players)
-            if not data.inPit:
-                opt_time_behind = calc.circular_relative_distance(
-                    plr_laptime_est,
-                    plr_timeinto_est,
-                    api.read.timing.estimated_time_into(index),
-                )
-                if 0 > opt_time_behind > nearest_time_behind:
-                    nearest_time_behind = opt_time_behind
-            # Nearest yellow flag distance
-            if data.isYellow:
-                opt_rel_distance = calc.circular_relative_distance(
-                    track_length, plr_lap_distance, lap_distance)
-                if nearest_yellow_ahead > opt_rel_distance >= 0:
-                    nearest_yellow_ahead = opt_rel_distance
-                if nearest_yellow_behind < opt_rel_distance <= 0:
-                    nearest_yellow_behind = opt_rel_distance
-
-        # Update low priority info
-        if update_low_priority:
-            opt_index_ahead = class_pos[4]
-            opt_index_leader = class_pos[6]
-            data.positionInClass = class_pos[1]
-            data.classBestLapTime = class_pos[3]
-            data.isClassFastestLastLap = class_pos[7]
-
-            data.positionOverall = api.read.vehicle.place(index)
-            data.lastLapTime = api.read.timing.last_laptime(index)
-            data.bestLapTime = api.read.timing.best_laptime(index)
-            data.numPitStops = api.read.vehicle.number_pitstops(index, api.read.vehicle.number_penalties(index))
-            data.pitState = api.read.vehicle.pit_request(index)
-            data.driverName = api.read.vehicle.driver_name(index)
-            data.vehicleName = api.read.vehicle.vehicle_name(index)
-            data.vehicleClass = api.read.vehicle.class_name(index)
-            data.tireCompoundFront = f"{data.vehicleClass} - {api.read.tyre.compound_name_front(index)}"
-            data.tireCompoundRear = f"{data.vehicleClass} - {api.read.tyre.compound_name_rear(index)}"
-
-            data.gapBehindNext = calc_gap_behind_next(index)
-            data.gapBehindLeader = calc_gap_behind_leader(index)
-            data.gapBehindNextInClass = calc_time_gap_behind(opt_index_ahead, index, track_length, data.totalLapProgress)
-            data.gapBehindLeaderInClass = calc_time_gap_behind(opt_index_leader, index, track_length, data.totalLapProgress)
-
-            data.energyRemaining = calc_stint_energy(data.driverName, data.vehicleClass, data.totalLapProgress, data.pitTimer.pitting and not data.inPit)
-
-            data.lapTimeHistory.update(api.read.timing.start(index), elapsed_time, data.lastLapTime)
-
-            # Save leader info
-            if data.positionOverall == 1:
-                output.leaderIndex = index
-                output.leaderBestLapTime = data.bestLapTime
+            if 0 > opt_time_behind > nearest_time_behind:
+                nearest_time_behind = opt_time_behind
+        # Nearest yellow flag distance
+        if veh_is_yellow:
+            opt_rel_distance = calc.circular_relative_distance(
+                track_length, plr_lap_distance, lap_distance)
+            if nearest_yellow_ahead > opt_rel_distance >= 0:
+                nearest_yellow_ahead = opt_rel_distance
+            if nearest_yellow_behind < opt_rel_distance <= 0:
+                nearest_yellow_behind = opt_rel_distance
+
+    # Update low priority info
+    if update_low_priority:
+        update_vehicle_standings(config, output, class_pos_list, track_length, elapsed_time)
 
     # Output extra info
     output.nearestLine = nearest_line
@@ -211,24 +225,134 @@ def update_vehicle_data(
     output.dataSetVersion += 1
 
 
+def update_vehicle_standings(
+    config: Setting,
+    output: VehiclesInfo,
+    class_pos_list: list,
+    track_length: float,
+    elapsed_time: float,
+) -> None:
+    """Update vehicle standings, timing & display info (low priority)"""
+    total_lap_progress = output.totalLapProgress
+    in_pit = output.inPit
+    pit_timer = output.pitTimer
+    position_overall = output.positionOverall
+    position_in_class = output.positionInClass
+    class_best_laptime = output.classBestLapTime
+    is_class_fastest_last_lap = output.isClassFastestLastLap
+    last_laptime = output.lastLapTime
+    best_laptime = output.bestLapTime
+    num_pit_stops = output.numPitStops
+    pit_state = output.pitState
+    driver_name = output.driverName
+    vehicle_name = output.vehicleName
+    vehicle_class = output.vehicleClass
+    tire_compound_front = output.tireCompoundFront
+    tire_compound_rear = output.tireCompoundRear
+    gap_behind_next = output.gapBehindNext
+    gap_behind_leader = output.gapBehindLeader
+    gap_behind_next_in_class = output.gapBehindNextInClass
+    gap_behind_leader_in_class = output.gapBehindLeaderInClass
+    energy_remaining = output.energyRemaining
+    lap_time_history = output.lapTimeHistory
+
+    for index, data, class_pos in zip(range(output.totalVehicles), output.dataSet, class_pos_list):
+        opt_index_ahead = class_pos[4]
+        opt_index_leader = class_pos[6]
+        veh_lap_progress_total = total_lap_progress[index]
+        veh_place = api.read.vehicle.place(index)
+        veh_last_laptime = api.read.timing.last_laptime(index)
+        veh_driver_name = api.read.vehicle.driver_name(index)
+        veh_class = api.read.vehicle.class_name(index)
+
+        position_in_class[index] = class_pos[1]
+        class_best_laptime[index] = class_pos[3]
+        is_class_fastest_last_lap[index] = class_pos[7]
+
+        position_overall[index] = veh_place
+        last_laptime[index] = veh_last_laptime
+        best_laptime[index] = api.read.timing.best_laptime(index)
+        num_pit_stops[index] = api.read.vehicle.number_pitstops(index, api.read.vehicle.number_penalties(index))
+        pit_state[index] = api.read.vehicle.pit_request(index)
+        driver_name[index] = veh_driver_name
+        vehicle_name[index] = api.read.vehicle.vehicle_name(index)
+        vehicle_class[index] = veh_class
+        tire_compound_front[index] = compound_label(veh_class, api.read.tyre.compound_name_front(index))
+        tire_compound_rear[index] = compound_label(veh_class, api.read.tyre.compound_name_rear(index))
+        update_display_attribute(config, data)
+
+        gap_behind_next[index] = calc_gap_behind_next(index)
+        gap_behind_leader[index] = calc_gap_behind_leader(index)
+        gap_behind_next_in_class[index] = calc_time_gap_behind(opt_index_ahead, index, track_length, veh_lap_progress_total)
+        gap_behind_leader_in_class[index] = calc_time_gap_behind(opt_index_leader, index, track_length, veh_lap_progress_total)
+
+        energy_remaining[index] = calc_stint_energy(
+            veh_driver_name, veh_class, veh_lap_progress_total, pit_timer[index].pitting and not in_pit[index])
+
+        lap_time_history[index].update(api.read.timing.start(index), elapsed_time, veh_last_laptime)
+
+        # Save leader info
+        if veh_place == 1:
+            output.leaderIndex = index
+            output.leaderBestLapTime = best_laptime[index]
+
+
+def update_display_attribute(config: Setting, data: VehicleDataSet) -> None:
+    """Update vehicle display attribute
+
+    Resolve only if vehicle identity or style preset changed.
+    """
+    display_key = (
+        data.driverName,
+        data.vehicleName,
+        data.vehicleClass,
+        data.tireCompoundFront,
+        data.tireCompoundRear,
+        config.version_update,
+    )
+    if data.displayKey == display_key:
+        return
+    data.displayKey = display_key
+    data.driverNameShort = shorten_driver_name(data.driverName)
+    data.brandName = config.user.brands.get(data.vehicleName, data.vehicleName)
+    class_style = config.user.classes.get(data.vehicleClass)
+    if class_style is not None:
+        data.classAlias = class_style["alias"]
+        data.classColor = class_style["color"]
+    else:
+        data.classAlias = data.vehicleClass
+        data.classColor = None
+    data.classColorRandom = random_color_class(data.vehicleClass)
+    data.tireCompoundSymbol = (
+        f"{select_compound_symbol(data.tireCompoundFront)}"
+        f"{select_compound_symbol(data.tireCompoundRear)}"
+    )
+
+
+@lru_cache(maxsize=128)
+def compound_label(class_name: str, compound_name: str) -> str:
+    """Tyre compound label (class name - compound name)"""
+    return f"{class_name} - {compound_name}"
+
+
 def update_qualify_position(output: VehiclesInfo) -> None:
     """Update qualify position"""
     temp_class = sorted((
-        api.read.vehicle.class_name(index),  # 0 class name
+        api.read.vehicle.class_id(index),  # 0 class id
         api.read.vehicle.qualification(index),  # 1 qualification position
         index,  # 2 player index
     ) for index in range(output.totalVehicles))
     # Update position
     qualify_in_class = 0
-    last_class_name = None
-    for class_name, qualify_overall, plr_index in temp_class:
-        if last_class_name != class_name:
-            last_class_name = class_name
+    last_class_id = None
+    for class_id, qualify_overall, plr_index in temp_class:
+        if last_class_id != class_id:
+            last_class_id = class_id
             qualify_in_class = 1
         else:
             qualify_in_class += 1
-        output.dataSet[plr_index].qualifyOverall = qualify_overall
-        output.dataSet[plr_index].qualifyInClass = qualify_in_class
+        output.qualifyOverall[plr_index] = qualify_overall
+        output.qualifyInClass[plr_index] = qualify_in_class
 
 
 def calc_time_gap_behind(
@@ -66,6 +66,9 @@ class Realtime(DataModule):
         while not _event_wait(update_interval):
             if self.state.active:
 
+                # Pin synced data frame, all reads in same update are from same frame
+                api.read.check.pin_frame()
+
                 if not reset:
                     reset = True
                     update_interval = self.active_interval
@@ -23,8 +23,9 @@ Module and widget control
 from __future__ import annotations
 
 import logging
-from time import sleep
-from types import MappingProxyType
+from importlib import import_module
+from time import perf_counter, sleep
+from types import MappingProxyType, ModuleType
 from typing import Any, KeysView
 
 from . import module, widget
@@ -34,16 +35,57 @@ from .setting import cfg
 logger = logging.getLogger(__name__)
 
 
-def create_module_pack(target: Any) -> dict:
-    """Create module reference pack as dictionary
+class LazyModulePack:
+    """Lazy module reference pack
+
+    Record module names from package __all__ list up front,
+    and import module on first access.
 
     Args:
-        target: module.
+        target: package.
+
+    Attributes:
+        import_time: imported module import time (ms) dict, key = module name.
+    """
+
+    __slots__ = (
+        "_package_name",
+        "_modules",
+        "import_time",
+    )
+
+    def __init__(self, target: Any):
+        self._package_name = target.__name__
+        self._modules: dict[str, ModuleType | None] = dict.fromkeys(target.__all__)
+        self.import_time: dict[str, float] = {}
+
+    def __getitem__(self, name: str) -> ModuleType:
+        """Get module, import if not imported yet"""
+        _module = self._modules[name]
+        if _module is None:
+            start_time = perf_counter()
+            _module = self._modules[name] = import_module(f"{self._package_name}.{name}")
+            self.import_time[name] = (perf_counter() - start_time) * 1000
+        return _module
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def keys(self) -> KeysView[str]:
+        """Module names"""
+        return self._modules.keys()
+
+
+def create_module_pack(target: Any) -> LazyModulePack:
+    """Create lazy module reference pack
+
+    Args:
+        target: package.
 
     Returns:
-        Dictionary, key = module name. value = imported module.
+        Lazy module pack, key = module name. value = module (imported on first access).
     """
-    return {name: getattr(target, name) for name in target.__all__}
+    return LazyModulePack(target)
 
 
 class ModuleControl:
@@ -55,6 +97,7 @@ class ModuleControl:
     Attributes:
         type_id: module type indentifier, either "module" or "widget".
         active_modules: active module reference dict (read-only).
+        remote: remote engine that runs supported modules out of process, None to disable.
     """
 
     __slots__ = (
@@ -62,6 +105,7 @@ class ModuleControl:
         "_active_modules",
         "type_id",
         "active_modules",
+        "remote",
     )
 
     def __init__(self, target: Any, type_id: str):
@@ -69,6 +113,7 @@ class ModuleControl:
         self._active_modules: dict = {}
         self.type_id = type_id
         self.active_modules: MappingProxyType = MappingProxyType(self._active_modules)
+        self.remote = None
 
     def start(self, name: str = ""):
         """Start module, specify name for selected module"""
@@ -124,7 +169,10 @@ class ModuleControl:
         """Start selected module"""
         if cfg.user.setting[name]["enable"] and name not in self._active_modules:
             # Create module instance and add to dict
-            self._active_modules[name] = self._imported_modules[name].Realtime(cfg, name)
+            if self.remote is not None and name in self.remote.names:
+                self._active_modules[name] = self.remote.create(name)
+            else:
+                self._active_modules[name] = self._imported_modules[name].Realtime(cfg, name)
             self._active_modules[name].start()
 
     def __close_enabled(self):
@@ -157,6 +205,24 @@ class ModuleControl:
         """List of module names"""
         return self._imported_modules.keys()
 
+    @property
+    def import_time(self) -> dict[str, float]:
+        """Imported module import time (ms)"""
+        return self._imported_modules.import_time
+
+    def log_import_time(self):
+        """Log imported module import time (ms), in descending order"""
+        import_time = self.import_time
+        for _name in sorted(import_time, key=import_time.get, reverse=True):
+            logger.info("IMPORT TIME: %s: %.2fms", _name, import_time[_name])
+        logger.info(
+            "IMPORT TIME: %s %s(s) imported in %.2fms, %s not imported",
+            len(import_time),
+            self.type_id,
+            sum(import_time.values()),
+            self.number_total - len(import_time),
+        )
+
 
 mctrl = ModuleControl(target=module, type_id=ConfigType.MODULE)
 wctrl = ModuleControl(target=widget, type_id=ConfigType.WIDGET)
@@ -24,7 +24,7 @@ from __future__ import annotations
 
 from array import array
 from collections import deque
-from typing import Mapping, NamedTuple
+from typing import Mapping, NamedTuple, Sequence
 
 from .const_common import (
     ABS_ZERO_CELSIUS,
@@ -37,6 +37,9 @@ from .const_common import (
     REL_TIME_DEFAULT,
     WHEELS_ZERO,
 )
+from .map_geometry import MapLod
+
+SAMPLER_CAPACITY = 1024  # number of input samples in ring buffer, ~10 seconds at 100Hz
 
 
 class ConsumptionDataSet(NamedTuple):
@@ -147,81 +150,77 @@ class VehiclePitTimer:
         self.pitting = (in_pit > 0 or laps_done == self._last_pit_lap)
 
 
+def vehicle_column(name: str) -> property:
+    """Create vehicle data set property that reads & writes vehicles info column by slot index"""
+
+    def getter(self):
+        return getattr(self._info, name)[self._index]
+
+    def setter(self, value):
+        getattr(self._info, name)[self._index] = value
+
+    return property(getter, setter, doc=f"Vehicle {name} (column view)")
+
+
 class VehicleDataSet:
-    """Vehicle data set"""
+    """Vehicle data set
+
+    View of single vehicle slot in VehiclesInfo columns,
+    attributes read & write column values of slot index.
+    Each attribute read costs a column lookup, per-frame loops
+    should index VehiclesInfo columns directly instead.
+    """
 
     __slots__ = (
-        "isPlayer",
-        "positionOverall",
-        "positionInClass",
-        "qualifyOverall",
-        "qualifyInClass",
-        "driverName",
-        "vehicleName",
-        "vehicleClass",
-        "classBestLapTime",
-        "bestLapTime",
-        "lastLapTime",
-        "currentLapProgress",
-        "totalLapProgress",
-        "gapBehindNext",
-        "gapBehindNextInClass",
-        "gapBehindLeader",
-        "gapBehindLeaderInClass",
-        "isLapped",
-        "isYellow",
-        "inPit",
-        "isClassFastestLastLap",
-        "numPitStops",
-        "pitState",
-        "tireCompoundFront",
-        "tireCompoundRear",
-        "relativeOrientationRadians",
-        "relativeStraightDistance",
-        "worldPositionX",
-        "worldPositionY",
-        "relativeRotatedPositionX",
-        "relativeRotatedPositionY",
-        "energyRemaining",
-        "pitTimer",
-        "lapTimeHistory",
+        "_info",
+        "_index",
     )
 
-    def __init__(self):
-        self.isPlayer: bool = False
-        self.positionOverall: int = 0
-        self.positionInClass: int = 0
-        self.qualifyOverall: int = 0
-        self.qualifyInClass: int = 0
-        self.driverName: str = ""
-        self.vehicleName: str = ""
-        self.vehicleClass: str = ""
-        self.classBestLapTime: float = MAX_SECONDS
-        self.bestLapTime: float = MAX_SECONDS
-        self.lastLapTime: float = MAX_SECONDS
-        self.currentLapProgress: float = 0.0
-        self.totalLapProgress: float = 0.0
-        self.gapBehindNext: float = 0.0
-        self.gapBehindNextInClass: float = 0.0
-        self.gapBehindLeader: float = 0.0
-        self.gapBehindLeaderInClass: float = 0.0
-        self.isLapped: float = 0.0
-        self.isYellow: bool = False
-        self.inPit: int = 0
-        self.isClassFastestLastLap: bool = False
-        self.numPitStops: int = 0
-        self.pitState: bool = False
-        self.tireCompoundFront: str = ""
-        self.tireCompoundRear: str = ""
-        self.relativeOrientationRadians: float = 0.0
-        self.relativeStraightDistance: float = 0.0
-        self.worldPositionX: float = 0.0
-        self.worldPositionY: float = 0.0
-        self.relativeRotatedPositionX: float = 0.0
-        self.relativeRotatedPositionY: float = 0.0
-        self.energyRemaining: float = 0.0
-        self.pitTimer: VehiclePitTimer = VehiclePitTimer()
-        self.lapTimeHistory: DeltaLapTime = DeltaLapTime("d", [0.0] * 6)
+    def __init__(self, info: VehiclesInfo, index: int):
+        self._info = info
+        self._index = index
+
+    isPlayer = vehicle_column("isPlayer")
+    positionOverall = vehicle_column("positionOverall")
+    positionInClass = vehicle_column("positionInClass")
+    qualifyOverall = vehicle_column("qualifyOverall")
+    qualifyInClass = vehicle_column("qualifyInClass")
+    driverName = vehicle_column("driverName")
+    driverNameShort = vehicle_column("driverNameShort")
+    vehicleName = vehicle_column("vehicleName")
+    vehicleClass = vehicle_column("vehicleClass")
+    brandName = vehicle_column("brandName")
+    classAlias = vehicle_column("classAlias")
+    classColor = vehicle_column("classColor")
+    classColorRandom = vehicle_column("classColorRandom")
+    classBestLapTime = vehicle_column("classBestLapTime")
+    bestLapTime = vehicle_column("bestLapTime")
+    lastLapTime = vehicle_column("lastLapTime")
+    currentLapProgress = vehicle_column("currentLapProgress")
+    totalLapProgress = vehicle_column("totalLapProgress")
+    gapBehindNext = vehicle_column("gapBehindNext")
+    gapBehindNextInClass = vehicle_column("gapBehindNextInClass")
+    gapBehindLeader = vehicle_column("gapBehindLeader")
+    gapBehindLeaderInClass = vehicle_column("gapBehindLeaderInClass")
+    isLapped = vehicle_column("isLapped")
+    isYellow = vehicle_column("isYellow")
+    inPit = vehicle_column("inPit")
+    isClassFastestLastLap = vehicle_column("isClassFastestLastLap")
+    numPitStops = vehicle_column("numPitStops")
+    pitState = vehicle_column("pitState")
+    tireCompoundFront = vehicle_column("tireCompoundFront")
+    tireCompoundRear = vehicle_column("tireCompoundRear")
+    tireCompoundSymbol = vehicle_column("tireCompoundSymbol")
+    displayKey = vehicle_column("displayKey")
+    relativeOrientationRadians = vehicle_column("relativeOrientationRadians")
+    relativeStraightDistance = vehicle_column("relativeStraightDistance")
+    worldPositionX = vehicle_column("worldPositionX")
+    worldPositionY = vehicle_column("worldPositionY")
+    relativeRotatedPositionX = vehicle_column("relativeRotatedPositionX")
+    relativeRotatedPositionY = vehicle_column("relativeRotatedPositionY")
+    energyRemaining = vehicle_column("energyRemaining")
+    pitTimer = vehicle_column("pitTimer")
+    lapTimeHistory = vehicle_column("lapTimeHistory")
 
 
 class DeltaInfo:
@@ -399,7 +398,9 @@ class MappingInfo:
 
     __slots__ = (
         "coordinates",
+        "coordinatesLod",
         "elevations",
+        "elevationsLod",
         "sectors",
         "lastModified",
         "pitEntryPosition",
@@ -414,7 +415,9 @@ class MappingInfo:
     def reset(self):
         """Reset"""
         self.coordinates: tuple[tuple[float, float], ...] | None = None
+        self.coordinatesLod: MapLod | None = None
         self.elevations: tuple[tuple[float, float], ...] | None = None
+        self.elevationsLod: MapLod | None = None
         self.sectors: tuple[int, int] | None = None
         self.lastModified: float = 0.0
         self.pitEntryPosition: float = 0.0
@@ -431,6 +434,7 @@ class NotesInfo:
         "currentNote",
         "nextIndex",
         "nextNote",
+        "dataSet",
     )
 
     def __init__(self):
@@ -442,6 +446,7 @@ class NotesInfo:
         self.currentNote: Mapping[str, float | str] = EMPTY_DICT
         self.nextIndex: int = 0
         self.nextNote: Mapping[str, float | str] = EMPTY_DICT
+        self.dataSet: Sequence[Mapping[str, float | str]] = ()
 
 
 class RelativeInfo:
@@ -500,6 +505,76 @@ class RestAPIInfo:
         self.pitStopEstimate: tuple[float, float, float, float, int] = PITEST_DEFAULT
 
 
+class SamplerInfo:
+    """Sampler module output data
+
+    Preallocated ring buffers of input samples, one sample per telemetry frame.
+    Written by sampler module only, new sample becomes readable after total is increased.
+
+    Attributes:
+        capacity: number of samples in ring buffer.
+        total: total number of samples written, next sample ring index = total % capacity.
+    """
+
+    __slots__ = (
+        "capacity",
+        "total",
+        "elapsed",
+        "throttle",
+        "throttleRaw",
+        "brake",
+        "brakeRaw",
+        "brakePressure",
+        "clutch",
+        "clutchRaw",
+        "steering",
+        "forceFeedback",
+        "slipRatioMin",
+        "slipRatioMax",
+        "lgtGForce",
+        "latGForce",
+    )
+
+    def __init__(self, capacity: int = SAMPLER_CAPACITY):
+        self.capacity: int = capacity
+        self.total: int = 0
+        self.elapsed: array = array("d", bytes(8 * capacity))
+        self.throttle: array = array("d", bytes(8 * capacity))
+        self.throttleRaw: array = array("d", bytes(8 * capacity))
+        self.brake: array = array("d", bytes(8 * capacity))
+        self.brakeRaw: array = array("d", bytes(8 * capacity))
+        self.brakePressure: array = array("d", bytes(8 * capacity))
+        self.clutch: array = array("d", bytes(8 * capacity))
+        self.clutchRaw: array = array("d", bytes(8 * capacity))
+        self.steering: array = array("d", bytes(8 * capacity))
+        self.forceFeedback: array = array("d", bytes(8 * capacity))
+        self.slipRatioMin: array = array("d", bytes(8 * capacity))
+        self.slipRatioMax: array = array("d", bytes(8 * capacity))
+        self.lgtGForce: array = array("d", bytes(8 * capacity))
+        self.latGForce: array = array("d", bytes(8 * capacity))
+
+    def samples_since(self, last_total: int) -> tuple[int, list[int]]:
+        """Ring indexes of samples written since last read
+
+        Reading is limited to most recent half capacity, so that unread samples
+        are not overwritten by writer while reading.
+
+        Args:
+            last_total: total number of samples at last read.
+
+        Returns:
+            Current total number of samples, ring indexes of new samples in written order.
+        """
+        total = self.total
+        start = min(max(last_total, total - self.capacity // 2), total)
+        capacity = self.capacity
+        return total, [index % capacity for index in range(start, total)]
+
+    def latest(self) -> int:
+        """Ring index of latest sample, -1 if no sample"""
+        return (self.total - 1) % self.capacity if self.total else -1
+
+
 class SectorsInfo:
     """Sectors module output data"""
 
@@ -548,6 +623,48 @@ class VehiclesInfo:
         "nearestYellowAhead",
         "nearestYellowBehind",
         "leaderBestLapTime",
+        # Vehicle columns, indexed by slot
+        "isPlayer",
+        "positionOverall",
+        "positionInClass",
+        "qualifyOverall",
+        "qualifyInClass",
+        "driverName",
+        "driverNameShort",
+        "vehicleName",
+        "vehicleClass",
+        "brandName",
+        "classAlias",
+        "classColor",
+        "classColorRandom",
+        "classBestLapTime",
+        "bestLapTime",
+        "lastLapTime",
+        "currentLapProgress",
+        "totalLapProgress",
+        "gapBehindNext",
+        "gapBehindNextInClass",
+        "gapBehindLeader",
+        "gapBehindLeaderInClass",
+        "isLapped",
+        "isYellow",
+        "inPit",
+        "isClassFastestLastLap",
+        "numPitStops",
+        "pitState",
+        "tireCompoundFront",
+        "tireCompoundRear",
+        "tireCompoundSymbol",
+        "displayKey",
+        "relativeOrientationRadians",
+        "relativeStraightDistance",
+        "worldPositionX",
+        "worldPositionY",
+        "relativeRotatedPositionX",
+        "relativeRotatedPositionY",
+        "energyRemaining",
+        "pitTimer",
+        "lapTimeHistory",
     )
 
     def __init__(self):
@@ -555,7 +672,7 @@ class VehiclesInfo:
         self.leaderIndex: int = 0
         self.playerIndex: int = -1
         self.dataSet: tuple[VehicleDataSet, ...] = tuple(
-            VehicleDataSet() for _ in range(MAX_VEHICLES)
+            VehicleDataSet(self, index) for index in range(MAX_VEHICLES)
         )
         self.dataSetVersion: int = -1
         self.nearestLine: float = MAX_METERS
@@ -563,6 +680,48 @@ class VehiclesInfo:
         self.nearestYellowAhead: float = MAX_METERS
         self.nearestYellowBehind: float = -MAX_METERS
         self.leaderBestLapTime: float = MAX_SECONDS
+        # Vehicle columns
+        self.isPlayer: list[bool] = [False] * MAX_VEHICLES
+        self.positionOverall: array = array("q", [0]) * MAX_VEHICLES
+        self.positionInClass: array = array("q", [0]) * MAX_VEHICLES
+        self.qualifyOverall: array = array("q", [0]) * MAX_VEHICLES
+        self.qualifyInClass: array = array("q", [0]) * MAX_VEHICLES
+        self.driverName: list[str] = [""] * MAX_VEHICLES
+        self.driverNameShort: list[str] = [""] * MAX_VEHICLES
+        self.vehicleName: list[str] = [""] * MAX_VEHICLES
+        self.vehicleClass: list[str] = [""] * MAX_VEHICLES
+        self.brandName: list[str] = [""] * MAX_VEHICLES
+        self.classAlias: list[str] = [""] * MAX_VEHICLES
+        self.classColor: list[str | None] = [None] * MAX_VEHICLES  # None if no user class style
+        self.classColorRandom: list[str] = [""] * MAX_VEHICLES
+        self.classBestLapTime: array = array("d", [MAX_SECONDS]) * MAX_VEHICLES
+        self.bestLapTime: array = array("d", [MAX_SECONDS]) * MAX_VEHICLES
+        self.lastLapTime: array = array("d", [MAX_SECONDS]) * MAX_VEHICLES
+        self.currentLapProgress: array = array("d", [0.0]) * MAX_VEHICLES
+        self.totalLapProgress: array = array("d", [0.0]) * MAX_VEHICLES
+        self.gapBehindNext: list[float | int] = [0.0] * MAX_VEHICLES  # int = laps behind
+        self.gapBehindNextInClass: list[float | int] = [0.0] * MAX_VEHICLES
+        self.gapBehindLeader: list[float | int] = [0.0] * MAX_VEHICLES
+        self.gapBehindLeaderInClass: list[float | int] = [0.0] * MAX_VEHICLES
+        self.isLapped: array = array("d", [0.0]) * MAX_VEHICLES
+        self.isYellow: list[bool] = [False] * MAX_VEHICLES
+        self.inPit: array = array("q", [0]) * MAX_VEHICLES
+        self.isClassFastestLastLap: list[bool] = [False] * MAX_VEHICLES
+        self.numPitStops: array = array("q", [0]) * MAX_VEHICLES
+        self.pitState: list[bool] = [False] * MAX_VEHICLES
+        self.tireCompoundFront: list[str] = [""] * MAX_VEHICLES
+        self.tireCompoundRear: list[str] = [""] * MAX_VEHICLES
+        self.tireCompoundSymbol: list[str] = [""] * MAX_VEHICLES
+        self.displayKey: list[tuple] = [()] * MAX_VEHICLES
+        self.relativeOrientationRadians: array = array("d", [0.0]) * MAX_VEHICLES
+        self.relativeStraightDistance: array = array("d", [0.0]) * MAX_VEHICLES
+        self.worldPositionX: array = array("d", [0.0]) * MAX_VEHICLES
+        self.worldPositionY: array = array("d", [0.0]) * MAX_VEHICLES
+        self.relativeRotatedPositionX: array = array("d", [0.0]) * MAX_VEHICLES
+        self.relativeRotatedPositionY: array = array("d", [0.0]) * MAX_VEHICLES
+        self.energyRemaining: array = array("d", [0.0]) * MAX_VEHICLES
+        self.pitTimer: list[VehiclePitTimer] = [VehiclePitTimer() for _ in range(MAX_VEHICLES)]
+        self.lapTimeHistory: list[DeltaLapTime] = [DeltaLapTime("d", [0.0] * 6) for _ in range(MAX_VEHICLES)]
 
 
 class WheelsInfo:
@@ -610,6 +769,7 @@ class ModuleInfo:
         "pacenotes",
         "relative",
         "restapi",
+        "sampler",
         "sectors",
         "stats",
         "tracknotes",
@@ -628,6 +788,7 @@ class ModuleInfo:
         self.pacenotes = NotesInfo()
         self.relative = RelativeInfo()
         self.restapi = RestAPIInfo()
+        self.sampler = SamplerInfo()
         self.sectors = SectorsInfo()
         self.stats = StatsInfo()
         self.tracknotes = NotesInfo()
@@ -48,6 +48,7 @@ from .userfile.json_setting import (
     copy_setting,
     load_setting_json_file,
     load_style_json_file,
+    preset_cache,
     save_and_verify_json_file,
 )
 from .validator import is_allowed_filename
@@ -302,6 +303,17 @@ class Setting:
         self.overlay = self.user.setting["overlay"]
         self.shared_memory_api = self.user.setting["shared_memory_api"]
         self.units = self.user.setting["units"]
+        # Preload primary presets for fast switching
+        self.preload_primary_preset()
+
+    def preload_primary_preset(self):
+        """Preload & validate primary preset files in background"""
+        for preset_name in self.primary_preset.values():
+            if preset_name and is_allowed_filename(preset_name):
+                preset_cache.preload(
+                    f"{self.path.settings}{preset_name}{FileExt.JSON}",
+                    self.default.setting,
+                )
 
     @property
     def preset_list(self) -> list[str]:
@@ -331,6 +343,7 @@ class Setting:
             filename=filename,
             filepath=self.path.settings,
             max_attempts=self.max_saving_attempts,
+            dict_def=self.sparse_format_default,
         )
 
     def save(self, delay: int = 66, cfg_type: str = ConfigType.SETTING, next_task: bool = False):
@@ -364,7 +377,12 @@ class Setting:
                 else:
                     filepath = self.path.settings
                 dict_user = getattr(self.user, cfg_type)
-                self._save_queue[filename] = (filepath, dict_user)
+                # Save preset in sparse format (optional)
+                if cfg_type == ConfigType.SETTING:
+                    dict_def = self.sparse_format_default
+                else:
+                    dict_def = None
+                self._save_queue[filename] = (filepath, dict_user, dict_def)
 
         for queue_filename, queue_filedata in self._save_queue.items():
             break  # get next file in queue
@@ -380,7 +398,7 @@ class Setting:
                 args=(queue_filename, *queue_filedata),
             ).start()
 
-    def __saving(self, filename: str, filepath: str, dict_user: dict):
+    def __saving(self, filename: str, filepath: str, dict_user: dict, dict_def: dict | None):
         """Saving thread"""
         # Update save delay
         while self._save_delay > 0:
@@ -392,6 +410,7 @@ class Setting:
             filename=filename,
             filepath=filepath,
             max_attempts=self.max_saving_attempts,
+            dict_def=dict_def,
         )
 
         self._save_queue.pop(filename, None)
@@ -402,6 +421,13 @@ class Setting:
         if self._save_queue:
             self.save(0, next_task=True)
 
+    @property
+    def sparse_format_default(self) -> dict | None:
+        """Get default preset setting if sparse preset format enabled, otherwise None"""
+        if self.application["enable_sparse_preset_format"]:
+            return self.default.setting
+        return None
+
     @property
     def max_saving_attempts(self) -> int:
         """Get max saving attempts"""
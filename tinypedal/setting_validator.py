@@ -23,7 +23,8 @@ Setting validator function
 from __future__ import annotations
 
 import re
-from typing import Any, Mapping
+from functools import partial
+from typing import Any, Callable, Mapping, NamedTuple
 
 from . import regex_pattern as rxp
 from .template.setting_brakes import BRAKEINFO_DEFAULT
@@ -91,113 +92,141 @@ class StyleValidator:
 
 
 class ValueValidator:
-    """Value validator"""
+    """Value validator
+
+    Check value from user dictionary, correct or remove invalid value.
+    """
 
     @staticmethod
-    def boolean(key: str, dict_user: dict) -> bool:
+    def boolean(key: str, dict_user: dict) -> None:
         """Value - Boolean"""
-        if not re.search(rxp.CFG_BOOL, key):
-            return False
         if not isinstance(dict_user[key], bool):
             dict_user[key] = bool(dict_user[key])
-        return True
-
-    @staticmethod
-    def choice_units(key: str, dict_user: dict) -> bool:
-        """Value - units choice list"""
-        for ref_key, choice_list in rxp.CHOICE_UNITS.items():
-            if re.search(ref_key, key):
-                if dict_user[key] not in choice_list:
-                    dict_user.pop(key)
-                return True
-        return False
 
     @staticmethod
-    def choice_common(key: str, dict_user: dict) -> bool:
-        """Value - common choice list"""
-        for ref_key, choice_list in rxp.CHOICE_COMMON.items():
-            if re.search(ref_key, key):
-                if dict_user[key] not in choice_list:
-                    dict_user.pop(key)
-                return True
-        return False
+    def choice(key: str, dict_user: dict, choices: frozenset[str]) -> None:
+        """Value - choice list"""
+        value = dict_user[key]
+        if not isinstance(value, str) or value not in choices:
+            dict_user.pop(key)
 
     @staticmethod
-    def color(key: str, dict_user: dict) -> bool:
+    def color(key: str, dict_user: dict) -> None:
         """Value - Color string"""
-        if not re.search(rxp.CFG_COLOR, key):
-            return False
         if not is_hex_color(dict_user[key]):
             dict_user.pop(key)
-        return True
 
     @staticmethod
-    def clock_format(key: str, dict_user: dict) -> bool:
+    def clock_format(key: str, dict_user: dict) -> None:
         """Value - clock format string"""
-        if not re.search(rxp.CFG_CLOCK_FORMAT, key):
-            return False
         if not is_clock_format(dict_user[key]):
             dict_user.pop(key)
-        return True
 
     @staticmethod
-    def string(key: str, dict_user: dict) -> bool:
+    def string(key: str, dict_user: dict) -> None:
         """Value - string"""
-        if not re.search(COMMON_STRINGS, key):
-            return False
         if not isinstance(dict_user[key], str):
             dict_user.pop(key)
-        return True
 
     @staticmethod
-    def integer(key: str, dict_user: dict) -> bool:
+    def integer(key: str, dict_user: dict) -> None:
         """Value - integer"""
-        if not re.search(rxp.CFG_INTEGER, key):
-            return False
         if not isinstance(dict_user[key], int) or isinstance(dict_user[key], bool):
             dict_user.pop(key)
-        return True
 
     @staticmethod
-    def numeric(key: str, dict_user: dict) -> bool:
+    def numeric(key: str, dict_user: dict) -> None:
         """Value - numeric"""
         if not isinstance(dict_user[key], (float, int)) or isinstance(dict_user[key], bool):
             dict_user.pop(key)
-        return True
+
+
+def compile_value_validator(key: str) -> Callable[[str, dict], None]:
+    """Compile value validator for key name
+
+    Match key name against setting key patterns in ordered list, only once per key.
+
+    Returns:
+        Value validator function.
+    """
+    if re.search(rxp.CFG_BOOL, key):
+        return ValueValidator.boolean
+    for ref_key, choice_list in rxp.CHOICE_UNITS.items():
+        if re.search(ref_key, key):
+            return partial(ValueValidator.choice, choices=frozenset(choice_list))
+    for ref_key, choice_list in rxp.CHOICE_COMMON.items():
+        if re.search(ref_key, key):
+            return partial(ValueValidator.choice, choices=frozenset(choice_list))
+    if re.search(rxp.CFG_COLOR, key):
+        return ValueValidator.color
+    if re.search(rxp.CFG_CLOCK_FORMAT, key):
+        return ValueValidator.clock_format
+    if re.search(COMMON_STRINGS, key):
+        return ValueValidator.string
+    if re.search(rxp.CFG_INTEGER, key):
+        return ValueValidator.integer
+    return ValueValidator.numeric
+
+
+class KeyValidators(dict):
+    """Compiled key validator dictionary
+
+    Key = setting key name, value = value validator function.
+    Compile on first access, cached across preset reloads.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> Callable[[str, dict], None]:
+        validator = self[key] = compile_value_validator(key)
+        return validator
+
+
+class PresetSchema(NamedTuple):
+    """Compiled preset schema for a default setting dictionary"""
+
+    dict_def: Mapping[str, Any]
+    key_list: tuple[str, ...]
+    key_set: frozenset[str]
 
 
 class PresetValidator:
     """Preset validator"""
 
-    # Set validator methods in ordered list
-    _value_validators = (
-        ValueValidator.boolean,
-        ValueValidator.choice_units,
-        ValueValidator.choice_common,
-        ValueValidator.color,
-        ValueValidator.clock_format,
-        ValueValidator.string,
-        ValueValidator.integer,
-        ValueValidator.numeric,
-    )
+    # Compiled key validators, shared by all default setting dictionaries
+    _key_validators = KeyValidators()
+    # Compiled preset schema, key = id of default setting dictionary
+    _schemas: dict[int, PresetSchema] = {}
+
+    @classmethod
+    def schema(cls, dict_def: Mapping[str, Any]) -> PresetSchema:
+        """Get compiled preset schema, compile if not cached"""
+        schema = cls._schemas.get(id(dict_def))
+        if schema is None or schema.dict_def is not dict_def:
+            key_list = tuple(dict_def)
+            schema = cls._schemas[id(dict_def)] = PresetSchema(dict_def, key_list, frozenset(key_list))
+            # Compile value validators for all value keys
+            for key in key_list:
+                if not isinstance(dict_def[key], dict):
+                    cls._key_validators[key]
+        return schema
 
     @classmethod
-    def remove_invalid_key(cls, key_list_def: tuple[str, ...], dict_user: dict) -> None:
+    def remove_invalid_key(cls, key_set_def: frozenset[str], dict_user: dict) -> None:
         """Remove invalid key & value from user dictionary"""
         key_list_user = tuple(dict_user)  # create user key list
+        key_validators = cls._key_validators
 
         for key in key_list_user:  # loop through user key list
             # Remove invalid key
-            if key not in key_list_def:  # check in default list
+            if key not in key_set_def:  # check in default set
                 dict_user.pop(key)
                 continue
             # Skip sub_level dict
             if isinstance(dict_user[key], dict):
                 continue
             # Validate values
-            for _validator in cls._value_validators:
-                if _validator(key, dict_user):
-                    break
+            key_validators[key](key, dict_user)
 
     @staticmethod
     def fix_outdated_key(dict_user: dict) -> None:
@@ -215,10 +244,9 @@ class PresetValidator:
     def add_missing_key(key_list_def: tuple[str, ...], dict_user: dict, dict_def: dict) -> bool:
         """Add missing default key to user list"""
         is_modified = False
-        key_list_user = tuple(dict_user)  # create user key list
 
         for key in key_list_def:  # loop through default key list
-            if key not in key_list_user:  # check each default key in user list
+            if key not in dict_user:  # check each default key in user dict
                 dict_user[key] = dict_def[key]  # add missing item to user
                 is_modified = True
 
@@ -228,19 +256,17 @@ class PresetValidator:
     def sort_key_order(key_list_def: tuple[str, ...], dict_user: dict) -> None:
         """Sort user key order according to default key list"""
         for d_key in key_list_def:  # loop through default key list
-            temp_value = dict_user[d_key]  # store user value
-            dict_user.pop(d_key)  # delete user key
-            dict_user[d_key] = temp_value  # append user key at the end
+            dict_user[d_key] = dict_user.pop(d_key)  # append user key at the end
 
     @classmethod
     def validate_key_pair(cls, dict_user: dict, dict_def: dict, sub_level: bool) -> None:
-        """Create key-only check list, then validate key"""
-        key_list_def = tuple(dict_def)
+        """Get compiled schema, then validate key"""
+        schema = cls.schema(dict_def)
         if sub_level:
             cls.fix_outdated_key(dict_user)
-        cls.remove_invalid_key(key_list_def, dict_user)
-        cls.add_missing_key(key_list_def, dict_user, dict_def)
-        cls.sort_key_order(key_list_def, dict_user)
+        cls.remove_invalid_key(schema.key_set, dict_user)
+        cls.add_missing_key(schema.key_list, dict_user, dict_def)
+        cls.sort_key_order(schema.key_list, dict_user)
 
     @classmethod
     def validate(cls, dict_user: dict, dict_def: dict) -> dict:
@@ -251,3 +277,37 @@ class PresetValidator:
         for item in dict_user.keys():  # list each key lists
             cls.validate_key_pair(dict_user[item], dict_def[item], True)
         return dict_user
+
+
+def test_validate(loops: int = 100):
+    """Full preset validation benchmark
+
+    Compare first validation (compile schema) with cached schema validation.
+    Run with: python -m tinypedal.setting_validator
+    """
+    from copy import deepcopy
+    from time import perf_counter
+    from types import MappingProxyType
+    from collections import ChainMap
+
+    from .template.setting_common import COMMON_DEFAULT
+    from .template.setting_module import MODULE_DEFAULT
+    from .template.setting_widget import WIDGET_DEFAULT
+
+    dict_def = MappingProxyType(ChainMap(WIDGET_DEFAULT, MODULE_DEFAULT, COMMON_DEFAULT))
+    total_keys = sum(len(section) for section in dict_def.values())
+    print(f"Test Validate - {len(dict_def)} sections, {total_keys} keys")
+
+    start_time = perf_counter()
+    PresetValidator.validate(deepcopy(dict(dict_def)), dict_def)
+    print(f"first validation (compile schema): {(perf_counter() - start_time) * 1000:.2f}ms")
+
+    presets = [deepcopy(dict(dict_def)) for _ in range(loops)]
+    start_time = perf_counter()
+    for dict_user in presets:
+        PresetValidator.validate(dict_user, dict_def)
+    print(f"cached schema validation: {(perf_counter() - start_time) * 1000 / loops:.2f}ms")
+
+
+if __name__ == "__main__":
+    test_validate()
@@ -0,0 +1,396 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Shared memory block with seqlock
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import struct
+import zlib
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Callable, NamedTuple, Sequence
+
+BLOCK_MAGIC = b"TPSB"
+BLOCK_HEADER = struct.Struct("<4sIQI4x")  # magic, layout version, sequence, payload size
+DATA_HEADER = struct.Struct("<I")  # data field length
+DATA_OVERFLOW = 0xFFFFFFFF  # data field length marker, data exceeded field size and not written
+SEQUENCE_OFFSET = 8  # 8 bytes aligned sequence counter
+MAX_READ_ATTEMPTS = 1000  # max seqlock read retries before giving up
+
+# Struct format from value type, list value uses same format per element,
+# array value uses own type code
+TYPE_FORMAT = {
+    bool: "?",
+    int: "q",
+    float: "d",
+}
+LIST_TYPES = (bool, float)  # list element types of fixed layout list value
+DATA_FORMAT = "s"  # data field format, value is pickled into fixed size area
+
+logger = logging.getLogger(__name__)
+
+
+class BlockField(NamedTuple):
+    """Shared block field
+
+    Attributes:
+        section: minfo section name.
+        name: attribute name.
+        fmt: struct format of single value, or "s" for data field.
+        count: number of elements, 0 for single value, or max data size (bytes) of data field.
+    """
+
+    section: str
+    name: str
+    fmt: str
+    count: int
+
+
+def field_format(value: Any) -> tuple[str, int] | None:
+    """Get struct format and number of elements of fixed layout value
+
+    Returns:
+        (format, count), count is 0 for single value. None if not fixed layout value.
+    """
+    if isinstance(value, array):
+        return (value.typecode, len(value)) if value else None
+    if isinstance(value, list):
+        if (value and type(value[0]) in LIST_TYPES
+                and all(type(_value) is type(value[0]) for _value in value)):
+            return TYPE_FORMAT[type(value[0])], len(value)
+        return None
+    fmt = TYPE_FORMAT.get(type(value))
+    return None if fmt is None else (fmt, 0)
+
+
+def section_fields(
+    section: str,
+    info: Any,
+    exclude: tuple[str, ...] = (),
+    data_size: int = 0,
+    data_names: tuple[str, ...] = (),
+) -> list[BlockField]:
+    """Create fixed layout fields from minfo section object
+
+    Only bool, int, float, non-empty array, and fixed length list of bool or float values
+    are included, other values are included as data field if data size is set.
+
+    Args:
+        section: minfo section name.
+        info: minfo section object (with default values).
+        exclude: excluded attribute names.
+        data_size: max data size (bytes) of each data field, 0 to exclude data field.
+        data_names: attribute names included as data field regardless of value type,
+            such as list that holds mixed value types.
+
+    Returns:
+        Field list.
+    """
+    fields = []
+    for name in info.__slots__:
+        if name in exclude:
+            continue
+        fmt_count = None if name in data_names else field_format(getattr(info, name))
+        if fmt_count is not None:
+            fields.append(BlockField(section, name, *fmt_count))
+        elif data_size:
+            fields.append(BlockField(section, name, DATA_FORMAT, data_size))
+    return fields
+
+
+def encode_data(value: Any) -> bytes:
+    """Encode data field value"""
+    if isinstance(value, MappingProxyType):
+        value = dict(value)
+    return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
+def assign_value(info: Any, name: str, value: Any):
+    """Assign value to info attribute, update list or array in place
+
+    Keep list or array object unchanged, so references held by readers stay valid.
+    """
+    target = getattr(info, name)
+    if isinstance(target, array) and isinstance(value, (array, list, tuple)):
+        if type(value) is not array:
+            value = array(target.typecode, value)
+        target[:] = value
+    elif isinstance(target, list) and isinstance(value, (list, tuple)):
+        target[:] = value
+    else:
+        setattr(info, name, value)
+
+
+class BlockLayout:
+    """Fixed binary layout of minfo sections
+
+    Numeric fields are packed first, followed by data fields.
+    Each data field is a fixed size area with data length header and pickled value,
+    data that exceeds field size is not written, and reader keeps last value.
+    Data field is only written or applied if encoded data changed since last write or apply.
+
+    Args:
+        fields: field list.
+        getters: value getter for each field, default reads "section.name" attribute from info.
+        version: layout version, default uses checksum of field definitions.
+
+    Attributes:
+        fields: field tuple.
+        version: layout version.
+        size: payload size in bytes.
+    """
+
+    __slots__ = (
+        "_struct",
+        "_getters",
+        "_data_fields",
+        "_written_data",
+        "_applied_data",
+        "_overflow",
+        "fields",
+        "version",
+        "size",
+    )
+
+    def __init__(
+        self,
+        fields: Sequence[BlockField],
+        getters: Sequence[Callable[[Any], Any]] | None = None,
+        version: int | None = None,
+    ):
+        if getters is None:
+            getters = [attrgetter(f"{field.section}.{field.name}") for field in fields]
+        # Sort numeric fields before data fields
+        field_getters = sorted(zip(fields, getters), key=lambda item: item[0].fmt == DATA_FORMAT)
+        self.fields = tuple(field for field, _ in field_getters)
+        self._getters = tuple(getter for _, getter in field_getters)
+        self._struct = struct.Struct(
+            "<" + "".join(f"{field.count}{field.fmt}" if field.count else field.fmt
+                          for field in self.fields if field.fmt != DATA_FORMAT))
+        data_fields = []
+        offset = self._struct.size
+        for field in self.fields:
+            if field.fmt == DATA_FORMAT:
+                data_fields.append((field, offset))
+                offset += DATA_HEADER.size + field.count
+        self._data_fields = tuple(data_fields)
+        self._written_data: list[bytes | None] = [None] * len(data_fields)
+        self._applied_data: list[bytes | None] = [None] * len(data_fields)
+        self._overflow: set[str] = set()
+        if version is None:
+            version = zlib.crc32(
+                ";".join(f"{field.section}.{field.name}:{field.count}{field.fmt}"
+                         for field in self.fields).encode())
+        self.version = version
+        self.size = offset
+
+    def reset(self):
+        """Reset last written & applied data, call when layout is used by new block"""
+        self._written_data[:] = [None] * len(self._data_fields)
+        self._applied_data[:] = [None] * len(self._data_fields)
+
+    def values(self, info: Any) -> list:
+        """Get flattened values from info, data field value is encoded"""
+        values = []
+        for field, getter in zip(self.fields, self._getters):
+            if field.fmt == DATA_FORMAT:
+                values.append(encode_data(getter(info)))
+            elif field.count:
+                values.extend(getter(info))
+            else:
+                values.append(getter(info))
+        return values
+
+    def pack_into(self, buffer: memoryview, offset: int, values: Sequence):
+        """Pack flattened values into buffer"""
+        data_index = len(values) - len(self._data_fields)
+        self._struct.pack_into(buffer, offset, *values[:data_index])
+        written_data = self._written_data
+        for data_index, ((field, data_offset), data) in enumerate(
+            zip(self._data_fields, values[data_index:])
+        ):
+            if written_data[data_index] == data:
+                continue  # not changed, keep last written data
+            written_data[data_index] = data
+            data_offset += offset
+            data_size = len(data)
+            if data_size > field.count:
+                DATA_HEADER.pack_into(buffer, data_offset, DATA_OVERFLOW)
+                self.__log_overflow(field, data_size)
+                continue
+            DATA_HEADER.pack_into(buffer, data_offset, data_size)
+            data_offset += DATA_HEADER.size
+            buffer[data_offset:data_offset + data_size] = data
+
+    def unpack_from(self, buffer: memoryview, offset: int) -> tuple:
+        """Unpack raw values from buffer, data field value is None if not written"""
+        values = self._struct.unpack_from(buffer, offset)
+        if not self._data_fields:
+            return values
+        data_values = []
+        for _, data_offset in self._data_fields:
+            data_offset += offset
+            data_size = DATA_HEADER.unpack_from(buffer, data_offset)[0]
+            if data_size == DATA_OVERFLOW:
+                data_values.append(None)
+            else:
+                data_offset += DATA_HEADER.size
+                data_values.append(bytes(buffer[data_offset:data_offset + data_size]))
+        return values + tuple(data_values)
+
+    def apply(self, values: tuple, info: Any):
+        """Apply unpacked values to info"""
+        index = 0
+        data_index = 0
+        applied_data = self._applied_data
+        for field in self.fields:
+            if field.fmt == DATA_FORMAT:
+                value = values[index]
+                index += 1
+                data_index += 1
+                if value is None or applied_data[data_index - 1] == value:
+                    continue  # not written or not changed, keep last value
+                applied_data[data_index - 1] = value
+                value = pickle.loads(value)
+            elif field.count:
+                value = values[index:index + field.count]
+                index += field.count
+            else:
+                value = values[index]
+                index += 1
+            assign_value(getattr(info, field.section), field.name, value)
+
+    def __log_overflow(self, field: BlockField, data_size: int):
+        """Log data field overflow once per field"""
+        name = f"{field.section}.{field.name}"
+        if name not in self._overflow:
+            self._overflow.add(name)
+            logger.warning(
+                "SHARED BLOCK: %s data size (%s bytes) exceeds field size (%s bytes)",
+                name, data_size, field.count)
+
+
+class SeqlockBlock:
+    """Shared memory block with seqlock
+
+    Single writer, multiple readers. Writer sets sequence to odd number before writing,
+    and to even number after writing. Reader retries if sequence is odd
+    or changed while reading, so reader never blocks writer.
+
+    Args:
+        layout: block layout.
+        name: shared memory name, None for random name (create only).
+        create: whether to create new block, or attach to existing block.
+        track: whether attached block is tracked by resource tracker (POSIX).
+            Set False in process that is not spawned by creator,
+            otherwise block is unlinked on exit by resource tracker.
+    """
+
+    __slots__ = (
+        "_shm",
+        "_buffer",
+        "_sequence",
+        "_last_sequence",
+        "layout",
+    )
+
+    def __init__(
+        self, layout: BlockLayout, name: str | None = None, create: bool = False, track: bool = True):
+        self.layout = layout
+        layout.reset()
+        if create:
+            self._shm = create_shared_memory(name, BLOCK_HEADER.size + layout.size)
+            BLOCK_HEADER.pack_into(self._shm.buf, 0, BLOCK_MAGIC, layout.version, 0, layout.size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            if not track and os.name == "posix":
+                resource_tracker.unregister(self._shm._name, "shared_memory")  # pylint: disable=protected-access
+            magic, version, _, size = BLOCK_HEADER.unpack_from(self._shm.buf, 0)
+            if magic != BLOCK_MAGIC or version != layout.version or size != layout.size:
+                self._shm.close()
+                raise ValueError(f"shared block layout mismatch: {name}")
+        self._buffer = self._shm.buf
+        self._sequence = self._buffer[SEQUENCE_OFFSET:SEQUENCE_OFFSET + 8].cast("Q")
+        self._last_sequence = 0  # skip block that is never written
+
+    @property
+    def name(self) -> str:
+        """Shared memory name"""
+        return self._shm.name
+
+    @property
+    def sequence(self) -> int:
+        """Current sequence counter"""
+        return self._sequence[0]
+
+    def write(self, info: Any):
+        """Write info to block (writer only)"""
+        self.write_values(self.layout.values(info))
+
+    def write_values(self, values: Sequence):
+        """Write flattened values to block (writer only)"""
+        sequence = self._sequence[0]
+        self._sequence[0] = sequence + 1
+        self.layout.pack_into(self._buffer, BLOCK_HEADER.size, values)
+        self._sequence[0] = sequence + 2
+
+    def read(self) -> tuple | None:
+        """Read consistent values from block
+
+        Returns:
+            Unpacked values, or None if not updated since last read or failed.
+        """
+        _sequence = self._sequence
+        for _ in range(MAX_READ_ATTEMPTS):
+            sequence = _sequence[0]
+            if sequence == self._last_sequence:
+                return None
+            if sequence & 1:  # writing
+                continue
+            values = self.layout.unpack_from(self._buffer, BLOCK_HEADER.size)
+            if sequence == _sequence[0]:
+                self._last_sequence = sequence
+                return values
+        return None
+
+    def close(self, unlink: bool = False):
+        """Close block, unlink to release shared memory (creator only)"""
+        self._sequence.release()
+        self._buffer = None
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+
+
+def create_shared_memory(name: str | None, size: int) -> shared_memory.SharedMemory:
+    """Create shared memory, replace stale block with same name (left by crashed process)"""
+    try:
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
+    except FileExistsError:
+        stale = shared_memory.SharedMemory(name=name)
+        stale.close()
+        stale.unlink()
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
@@ -0,0 +1,302 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Shared memory export layout & reference reader
+
+Export block is a named shared memory segment ("TinyPedal_Export"),
+little-endian, 8 bytes aligned, no padding between fields:
+
+    struct TinyPedalExportHeader {
+        char magic[4];          // "TPSB"
+        uint32_t version;       // EXPORT_VERSION
+        uint64_t sequence;      // seqlock counter, odd while writing
+        uint32_t payload_size;  // size of payload in bytes
+        uint32_t reserved;
+    };
+
+Payload follows header, see EXPORT_FIELDS (or run with --header) for struct definition.
+All values are either double ("d") or int64 ("q"), bool values are exported as int64.
+Vehicle columns are indexed by vehicle slot (same as minfo.vehicles columns).
+
+Reader protocol (seqlock):
+    1. read sequence, retry if odd (writer is writing).
+    2. copy payload (or fields needed).
+    3. read sequence again, retry if changed.
+
+Run reference reader: python -m tinypedal.shared_export
+Run throughput test: python -m tinypedal.shared_export --test
+Print C struct: python -m tinypedal.shared_export --header
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter, sleep
+
+from .const_common import MAX_VEHICLES
+from .shared_block import BLOCK_HEADER, BlockField, BlockLayout, SeqlockBlock
+
+EXPORT_NAME = "TinyPedal_Export"
+EXPORT_VERSION = 1  # increase whenever EXPORT_FIELDS changed
+
+EXPORT_FIELDS = (
+    # Frame
+    BlockField("frame", "frameId", "q", 0),
+    # Delta
+    BlockField("delta", "deltaBest", "d", 0),
+    BlockField("delta", "deltaLast", "d", 0),
+    BlockField("delta", "deltaSession", "d", 0),
+    BlockField("delta", "deltaStint", "d", 0),
+    BlockField("delta", "isValidLap", "q", 0),
+    BlockField("delta", "lapTimeCurrent", "d", 0),
+    BlockField("delta", "lapTimeLast", "d", 0),
+    BlockField("delta", "lapTimeBest", "d", 0),
+    BlockField("delta", "lapTimeEstimated", "d", 0),
+    BlockField("delta", "lapTimeSession", "d", 0),
+    BlockField("delta", "lapTimeStint", "d", 0),
+    BlockField("delta", "lapTimePace", "d", 0),
+    BlockField("delta", "lapDistance", "d", 0),
+    # Fuel
+    BlockField("fuel", "capacity", "d", 0),
+    BlockField("fuel", "amountStart", "d", 0),
+    BlockField("fuel", "amountCurrent", "d", 0),
+    BlockField("fuel", "amountUsedCurrent", "d", 0),
+    BlockField("fuel", "amountEndStint", "d", 0),
+    BlockField("fuel", "neededRelative", "d", 0),
+    BlockField("fuel", "neededAbsolute", "d", 0),
+    BlockField("fuel", "lastLapConsumption", "d", 0),
+    BlockField("fuel", "estimatedConsumption", "d", 0),
+    BlockField("fuel", "estimatedValidConsumption", "d", 0),
+    BlockField("fuel", "estimatedLaps", "d", 0),
+    BlockField("fuel", "estimatedMinutes", "d", 0),
+    BlockField("fuel", "estimatedNumPitStopsEnd", "d", 0),
+    BlockField("fuel", "estimatedNumPitStopsEarly", "d", 0),
+    BlockField("fuel", "expectedConsumption", "d", 0),
+    BlockField("fuel", "deltaConsumption", "d", 0),
+    BlockField("fuel", "oneLessPitConsumption", "d", 0),
+    # Relative, padded with 0.0 gap & -1 index
+    BlockField("relative", "relativeCount", "q", 0),
+    BlockField("relative", "relativeTimeGap", "d", MAX_VEHICLES),
+    BlockField("relative", "relativeIndex", "q", MAX_VEHICLES),
+    # Standings, padded with -1 index
+    BlockField("relative", "standingsCount", "q", 0),
+    BlockField("relative", "standingsIndex", "q", MAX_VEHICLES),
+    # Vehicles
+    BlockField("vehicles", "totalVehicles", "q", 0),
+    BlockField("vehicles", "leaderIndex", "q", 0),
+    BlockField("vehicles", "playerIndex", "q", 0),
+    BlockField("vehicles", "nearestLine", "d", 0),
+    BlockField("vehicles", "nearestTraffic", "d", 0),
+    BlockField("vehicles", "nearestYellowAhead", "d", 0),
+    BlockField("vehicles", "nearestYellowBehind", "d", 0),
+    BlockField("vehicles", "leaderBestLapTime", "d", 0),
+    # Vehicles columns
+    BlockField("vehicles", "isPlayer", "q", MAX_VEHICLES),
+    BlockField("vehicles", "positionOverall", "q", MAX_VEHICLES),
+    BlockField("vehicles", "positionInClass", "q", MAX_VEHICLES),
+    BlockField("vehicles", "classBestLapTime", "d", MAX_VEHICLES),
+    BlockField("vehicles", "bestLapTime", "d", MAX_VEHICLES),
+    BlockField("vehicles", "lastLapTime", "d", MAX_VEHICLES),
+    BlockField("vehicles", "currentLapProgress", "d", MAX_VEHICLES),
+    BlockField("vehicles", "totalLapProgress", "d", MAX_VEHICLES),
+    BlockField("vehicles", "gapBehindNext", "d", MAX_VEHICLES),
+    BlockField("vehicles", "gapBehindNextInClass", "d", MAX_VEHICLES),
+    BlockField("vehicles", "gapBehindLeader", "d", MAX_VEHICLES),
+    BlockField("vehicles", "gapBehindLeaderInClass", "d", MAX_VEHICLES),
+    BlockField("vehicles", "isLapped", "d", MAX_VEHICLES),
+    BlockField("vehicles", "isYellow", "q", MAX_VEHICLES),
+    BlockField("vehicles", "inPit", "q", MAX_VEHICLES),
+    BlockField("vehicles", "numPitStops", "q", MAX_VEHICLES),
+    BlockField("vehicles", "pitState", "q", MAX_VEHICLES),
+    BlockField("vehicles", "relativeStraightDistance", "d", MAX_VEHICLES),
+    BlockField("vehicles", "energyRemaining", "d", MAX_VEHICLES),
+)
+
+C_TYPES = {"d": "double", "q": "int64_t"}
+
+
+def c_header() -> str:
+    """Create C struct definition of export payload"""
+    lines = ["struct TinyPedalExportPayload {"]
+    for field in EXPORT_FIELDS:
+        array = f"[{field.count}]" if field.count else ""
+        lines.append(f"    {C_TYPES[field.fmt]} {field.section}_{field.name}{array};")
+    lines.append("};")
+    return "\n".join(lines)
+
+
+class ExportReader:
+    """Export block reference reader
+
+    Args:
+        name: shared memory name.
+        track: whether block is tracked by resource tracker (POSIX),
+            only set True if reader process is spawned by TinyPedal.
+
+    Raises:
+        FileNotFoundError: if export block not found (TinyPedal export module not running).
+        ValueError: if export block layout version mismatch.
+    """
+
+    __slots__ = (
+        "_block",
+        "_keys",
+        "_slices",
+    )
+
+    def __init__(self, name: str = EXPORT_NAME, track: bool = False):
+        layout = BlockLayout(EXPORT_FIELDS, version=EXPORT_VERSION)
+        self._block = SeqlockBlock(layout, name, track=track)
+        self._keys = tuple(f"{field.section}.{field.name}" for field in EXPORT_FIELDS)
+        slices = []
+        index = 0
+        for field in EXPORT_FIELDS:
+            if field.count:
+                slices.append(slice(index, index + field.count))
+                index += field.count
+            else:
+                slices.append(index)
+                index += 1
+        self._slices = tuple(slices)
+
+    def read_raw(self) -> tuple | None:
+        """Read flattened values, None if not updated since last read"""
+        return self._block.read()
+
+    def read(self) -> dict | None:
+        """Read values dict, key = "section.name", None if not updated since last read"""
+        values = self._block.read()
+        if values is None:
+            return None
+        return {key: values[index] for key, index in zip(self._keys, self._slices)}
+
+    def close(self):
+        """Close reader"""
+        self._block.close()
+
+
+def test_throughput(seconds: float = 2):
+    """Export block throughput & consistency test
+
+    Writer process writes same counter value to all fields at different rates
+    (0 = full speed), reader polls at full speed and checks every read value
+    is consistent (no torn read).
+    """
+    import multiprocessing
+
+    name = f"{EXPORT_NAME}_Test"
+    layout = BlockLayout(EXPORT_FIELDS, version=EXPORT_VERSION)
+    values_total = sum(field.count or 1 for field in EXPORT_FIELDS)
+    size = BLOCK_HEADER.size + layout.size
+    context = multiprocessing.get_context("spawn")
+    print(f"Test Export Throughput - {size} bytes block, {values_total} values")
+
+    for write_rate in (100, 1000, 0):
+        block = SeqlockBlock(layout, name, create=True)
+        stop_event = context.Event()
+        writer = context.Process(
+            target=throughput_writer,
+            args=(name, stop_event, values_total, write_rate),
+            daemon=True,
+        )
+        writer.start()
+        sleep(0.5)  # wait writer start
+
+        reader = ExportReader(name, track=True)
+        reads = polls = torn = 0
+        read_time = 0.0
+        start_sequence = block.sequence
+        start_time = perf_counter()
+        end_time = start_time + seconds
+        while perf_counter() < end_time:
+            polls += 1
+            read_start = perf_counter()
+            values = reader.read_raw()
+            if values is None:
+                continue
+            read_time += perf_counter() - read_start
+            reads += 1
+            if min(values) != max(values):
+                torn += 1
+        elapsed = perf_counter() - start_time
+        writes = (block.sequence - start_sequence) // 2
+        stop_event.set()
+        writer.join()
+        reader.close()
+        block.close(unlink=True)
+
+        print(
+            f"write rate {write_rate or 'max'}: "
+            f"writes {writes / elapsed:.0f}/s, "
+            f"polls {polls / elapsed:.0f}/s, "
+            f"reads {reads / elapsed:.0f}/s, "
+            f"read time {read_time / max(reads, 1) * 1000000:.1f}us, "
+            f"torn reads {torn}"
+        )
+
+
+def throughput_writer(name: str, stop_event, values_total: int, write_rate: int):
+    """Throughput test writer process"""
+    block = SeqlockBlock(BlockLayout(EXPORT_FIELDS, version=EXPORT_VERSION), name)
+    write_interval = 1 / write_rate if write_rate else 0
+    next_time = perf_counter()
+    counter = 0
+    while not stop_event.is_set():
+        counter += 1
+        block.write_values((counter,) * values_total)
+        if write_interval:
+            next_time += write_interval
+            delay = next_time - perf_counter()
+            if delay > 0:
+                sleep(delay)
+    block.close()
+
+
+def print_export():
+    """Reference reader, print exported values once per second"""
+    try:
+        reader = ExportReader()
+    except FileNotFoundError:
+        print(f"{EXPORT_NAME} not found, enable export module in TinyPedal first")
+        return
+    try:
+        while True:
+            values = reader.read()
+            if values is not None:
+                player_index = values["vehicles.playerIndex"]
+                print(
+                    f"frame {values['frame.frameId']}, "
+                    f"delta best {values['delta.deltaBest']:+.3f}, "
+                    f"fuel laps {values['fuel.estimatedLaps']:.2f}, "
+                    f"class position {values['vehicles.positionInClass'][player_index]}"
+                )
+            sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+
+
+if __name__ == "__main__":
+    if "--test" in sys.argv:
+        test_throughput()
+    elif "--header" in sys.argv:
+        print(c_header())
+    else:
+        print_export()
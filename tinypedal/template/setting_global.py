@@ -37,6 +37,8 @@ GLOBAL_DEFAULT = {
         "grid_move_size": 8,
         "minimum_update_interval": 10,
         "maximum_saving_attempts": 10,
+        "enable_sparse_preset_format": False,
+        "enable_out_of_process_modules": False,
         "position_x": 0,
         "position_y": 0,
         "window_width": 0,
@@ -37,6 +37,11 @@ MODULE_DEFAULT = {
         "idle_update_interval": 400,
         "minimum_delta_distance": 5,
     },
+    "module_export": {
+        "enable": False,
+        "update_interval": 10,
+        "idle_update_interval": 400,
+    },
     "module_force": {
         "enable": True,
         "update_interval": 10,
@@ -91,6 +96,11 @@ MODULE_DEFAULT = {
         "enable_vehicle_info": True,
         "enable_weather_info": True,
     },
+    "module_sampler": {
+        "enable": True,
+        "update_interval": 10,
+        "idle_update_interval": 400,
+    },
     "module_sectors": {
         "enable": True,
         "update_interval": 10,
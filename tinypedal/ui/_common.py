@@ -20,6 +20,8 @@
 Common
 """
 
+from __future__ import annotations
+
 import os
 import re
 from collections import deque
@@ -59,6 +61,7 @@ from ..const_app import APP_NAME
 from ..const_file import FileFilter
 from ..module_control import mctrl, wctrl
 from ..validator import image_exists, is_hex_color, is_string_number
+from ._table_model import ColumnTableModel
 
 # Validator
 QVAL_INTEGER = QIntValidator(-999999, 999999)
@@ -74,6 +77,13 @@ color_pick_history = deque(
 )
 
 
+def contrast_text_color(bg_color: QColor) -> str:
+    """Set foreground (text) color based on background color lightness"""
+    if bg_color.alpha() > 128 > qGray(bg_color.rgb()):
+        return "#FFF"
+    return "#000"
+
+
 class UIScaler:
     """UI font & size scaler"""
     # Global base font size in point (not counting dpi scale)
@@ -310,10 +320,11 @@ class TableBatchReplace(BaseDialog):
     """Table batch replace"""
 
     def __init__(
-        self, parent, table_selector: dict, table_data: QTableWidget):
+        self, parent, table_selector: dict, table_data: QTableWidget | ColumnTableModel):
         """
         Args:
             table_selector: table selector dictionary. key=column name, value=column index.
+            table_data: table widget, or table model (text columns).
         """
         super().__init__(parent)
         self.table_selector = table_selector
@@ -372,13 +383,19 @@ class TableBatchReplace(BaseDialog):
         """Update selector list"""
         column_index = self.table_selector[self.column_selector.currentText()]
         self.search_selector.clear()
-        selector_list = set(
-            self.table_data.item(row_index, column_index).text()
-            for row_index in range(self.table_data.rowCount())
-        )
+        selector_list = set(self.column_texts(column_index))
         self.search_selector.addItems(sorted(selector_list))
         self.search_selector.setCurrentText(last_search)
 
+    def column_texts(self, column_index: int) -> list[str]:
+        """Column texts from table widget or table model"""
+        if isinstance(self.table_data, QTableWidget):
+            return [
+                self.table_data.item(row_index, column_index).text()
+                for row_index in range(self.table_data.rowCount())
+            ]
+        return self.table_data.column_values(column_index)
+
     def replacing(self):
         """Replace"""
         if not self.search_selector.currentText():
@@ -398,9 +415,16 @@ class TableBatchReplace(BaseDialog):
         else:
             match_flag = re.IGNORECASE
 
-        for row_index in range(self.table_data.rowCount()):
-            item = self.table_data.item(row_index, column_index)
-            item.setText(re.sub(pattern, replace, item.text(), flags=match_flag))
+        if isinstance(self.table_data, QTableWidget):
+            for row_index in range(self.table_data.rowCount()):
+                item = self.table_data.item(row_index, column_index)
+                item.setText(re.sub(pattern, replace, item.text(), flags=match_flag))
+        else:  # replace whole column in one batch
+            self.table_data.set_column_values(
+                column_index,
+                [re.sub(pattern, replace, text, flags=match_flag)
+                 for text in self.table_data.column_values(column_index)],
+            )
 
         self.update_selector(column_index, search)
 
@@ -474,12 +498,7 @@ class DoubleClickEdit(QLineEdit):
         """Update edit preview color"""
         color_str = self.text()
         if is_hex_color(color_str):
-            # Set foreground color based on background color lightness
-            qcolor = QColor(color_str)
-            if qcolor.alpha() > 128 > qGray(qcolor.rgb()):
-                fg_color = "#FFF"
-            else:
-                fg_color = "#000"
+            fg_color = contrast_text_color(QColor(color_str))
             # Apply style
             self.setStyleSheet(f"QLineEdit {{color:{fg_color};background:{color_str};}}")
 
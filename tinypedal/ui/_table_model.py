@@ -0,0 +1,349 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Columnar table model
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Callable, Iterable, NamedTuple, Sequence
+
+from PySide2.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from ..validator import is_string_number
+
+
+class TableColumn(NamedTuple):
+    """Table column
+
+    Attributes:
+        name: header name.
+        numeric: whether column stores float values (array), otherwise any values (list).
+        decimals: round numeric value to decimal places, -1 for no rounding.
+        editable: whether column is editable.
+        selectable: whether column is selectable.
+        alignment: text alignment, None for default alignment.
+        formatter: display text formatter, None for str().
+        parser: edited text parser of non-numeric column, None for unchanged text.
+    """
+
+    name: str
+    numeric: bool = False
+    decimals: int = -1
+    editable: bool = True
+    selectable: bool = True
+    alignment: Any = None
+    formatter: Callable[[Any], str] | None = None
+    parser: Callable[[str], Any] | None = None
+
+
+def create_column(column: TableColumn, values: Iterable = ()) -> array | list:
+    """Create column data"""
+    if not column.numeric:
+        return list(values)
+    if column.decimals >= 0:
+        return array("d", (round(value, column.decimals) for value in values))
+    return array("d", values)
+
+
+def reorder_column(column_data: array | list, rows: Sequence[int]) -> array | list:
+    """Create reordered column data from data row indexes"""
+    if isinstance(column_data, array):
+        return array(column_data.typecode, map(column_data.__getitem__, rows))
+    return list(map(column_data.__getitem__, rows))
+
+
+class ColumnTableModel(QAbstractTableModel):
+    """Columnar table model
+
+    Table data is stored per column (float array for numeric column, list for others),
+    display text is only created for cells requested by view.
+    Sorting reorders column data, filtering keeps a list of visible data rows.
+
+    Row arguments of all methods are view rows (after filtering),
+    except methods that operate on whole columns.
+    """
+
+    def __init__(self, parent, columns: Sequence[TableColumn] = ()):
+        super().__init__(parent)
+        self.columns: tuple[TableColumn, ...] = tuple(columns)
+        self._data: list[array | list] = [create_column(column) for column in self.columns]
+        self._visible: list[int] | None = None  # visible data rows, None if not filtered
+        self._filter_text = ""
+        self._filter_columns: tuple[int, ...] | None = None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Visible row count"""
+        if parent.isValid():
+            return 0
+        if self._visible is not None:
+            return len(self._visible)
+        return self.data_row_count()
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Column count"""
+        if parent.isValid():
+            return 0
+        return len(self.columns)
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        """Header data"""
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            if 0 <= section < len(self.columns):
+                return self.columns[section].name
+            return None
+        return str(section + 1)
+
+    def flags(self, index: QModelIndex):
+        """Item flags"""
+        column = self.columns[index.column()]
+        if not column.selectable:
+            return Qt.NoItemFlags
+        if column.editable:
+            return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        """Item data, display text is formatted on request"""
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole or role == Qt.EditRole:
+            return self.text(index.row(), index.column())
+        if role == Qt.TextAlignmentRole:
+            return self.columns[index.column()].alignment
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role=Qt.EditRole) -> bool:
+        """Set edited value, invalid numeric value is rejected (old value kept)"""
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        column_index = index.column()
+        value = self.parse(column_index, value)
+        if value is None:
+            return False
+        self._data[column_index][self._source_row(index.row())] = value
+        self.dataChanged.emit(index, index)
+        return True
+
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """Sort all data rows by column value (stable)"""
+        self.layoutAboutToBeChanged.emit()
+        row_count = self.rowCount()
+        persistent = self.persistentIndexList()
+        persistent_rows = [
+            self._source_row(index.row()) if 0 <= index.row() < row_count else -1
+            for index in persistent
+        ]
+
+        values = self._data[column]
+        new_order = sorted(
+            range(len(values)),
+            key=values.__getitem__,
+            reverse=order == Qt.DescendingOrder,
+        )
+        self._data = [reorder_column(column_data, new_order) for column_data in self._data]
+        self.__update_filter()
+
+        # Map persistent indexes (selection) to new rows
+        new_rows = [0] * len(new_order)
+        for new_row, data_row in enumerate(new_order):
+            new_rows[data_row] = new_row
+        if self._visible is None:
+            view_rows = None
+        else:
+            view_rows = {data_row: view_row for view_row, data_row in enumerate(self._visible)}
+        new_persistent = []
+        for index, data_row in zip(persistent, persistent_rows):
+            if data_row < 0:
+                new_persistent.append(QModelIndex())
+                continue
+            row = new_rows[data_row]
+            if view_rows is not None:
+                row = view_rows.get(row, -1)
+            if row < 0:
+                new_persistent.append(QModelIndex())
+            else:
+                new_persistent.append(self.index(row, index.column()))
+        self.changePersistentIndexList(persistent, new_persistent)
+        self.layoutChanged.emit()
+
+    def data_row_count(self) -> int:
+        """Total data row count (including filtered rows)"""
+        if self._data:
+            return len(self._data[0])
+        return 0
+
+    def reset_table(self, rows: Iterable[Sequence], columns: Sequence[TableColumn] | None = None):
+        """Reset table data from rows of values, optionally set new columns"""
+        self.beginResetModel()
+        if columns is not None:
+            self.columns = tuple(columns)
+        data_columns = tuple(zip(*rows)) or ((),) * len(self.columns)
+        self._data = [
+            create_column(column, values)
+            for column, values in zip(self.columns, data_columns)
+        ]
+        self.__update_filter()
+        self.endResetModel()
+
+    def parse(self, column: int, value: Any) -> Any:
+        """Parse input value of column, None if invalid"""
+        column_info = self.columns[column]
+        if column_info.numeric:
+            if isinstance(value, str) and not is_string_number(value):
+                return None
+            value = float(value)
+            if column_info.decimals >= 0:
+                return round(value, column_info.decimals)
+            return value
+        if column_info.parser is not None:
+            return column_info.parser(value)
+        return value
+
+    def text(self, row: int, column: int) -> str:
+        """Display text"""
+        value = self._data[column][self._source_row(row)]
+        formatter = self.columns[column].formatter
+        if formatter is None:
+            return str(value)
+        return formatter(value)
+
+    def value(self, row: int, column: int) -> Any:
+        """Raw value"""
+        return self._data[column][self._source_row(row)]
+
+    def set_value(self, row: int, column: int, value: Any):
+        """Set raw value"""
+        if self.columns[column].numeric and self.columns[column].decimals >= 0:
+            value = round(value, self.columns[column].decimals)
+        self._data[column][self._source_row(row)] = value
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index)
+
+    def insert_row(self, row: int, values: Sequence | None = None):
+        """Insert row before view row, default values if not set"""
+        if values is None:
+            values = tuple(0.0 if column.numeric else "" for column in self.columns)
+        if self._visible is None:
+            data_row = row
+        elif row < len(self._visible):
+            data_row = self._visible[row]
+        else:
+            data_row = self.data_row_count()
+        self.beginInsertRows(QModelIndex(), row, row)
+        for column, column_data, value in zip(self.columns, self._data, values):
+            if column.numeric and column.decimals >= 0:
+                value = round(value, column.decimals)
+            column_data.insert(data_row, value)
+        if self._visible is not None:  # inserted row is always visible
+            self._visible = [_row + (_row >= data_row) for _row in self._visible]
+            self._visible.insert(row, data_row)
+        self.endInsertRows()
+
+    def remove_rows(self, rows: Iterable[int]):
+        """Remove view rows"""
+        removed = set(map(self._source_row, rows))
+        if not removed:
+            return
+        kept = [row for row in range(self.data_row_count()) if row not in removed]
+        self.beginResetModel()
+        self._data = [reorder_column(column_data, kept) for column_data in self._data]
+        self.__update_filter()
+        self.endResetModel()
+
+    def column_values(self, column: int) -> list:
+        """Raw values of all data rows in column"""
+        return list(self._data[column])
+
+    def set_column_values(self, column: int, values: Iterable):
+        """Set raw values of all data rows in column, values are parsed"""
+        column_data = self._data[column]
+        for data_row, value in enumerate(values):
+            value = self.parse(column, value)
+            if value is not None:
+                column_data[data_row] = value
+        self.__column_changed(column, 0, self.rowCount() - 1)
+
+    def offset_values(self, column: int, rows: Iterable[int], offset: float, is_scale_mode: bool):
+        """Apply offset (or scale) to numeric column values of view rows in one batch"""
+        rows = sorted(set(rows))
+        if not rows:
+            return
+        column_data = self._data[column]
+        decimals = self.columns[column].decimals
+        data_rows = list(map(self._source_row, rows))
+        if is_scale_mode:
+            new_values = [column_data[data_row] * offset for data_row in data_rows]
+        else:
+            new_values = [column_data[data_row] + offset for data_row in data_rows]
+        if decimals >= 0:
+            new_values = [round(value, decimals) for value in new_values]
+        for data_row, value in zip(data_rows, new_values):
+            column_data[data_row] = value
+        self.__column_changed(column, rows[0], rows[-1])
+
+    def to_records(self, keys: Sequence[str]) -> list[dict]:
+        """Convert all data rows to list of dict, key = column key"""
+        return [dict(zip(keys, values)) for values in zip(*self._data)]
+
+    def set_filter(self, text: str, columns: Sequence[int] | None = None):
+        """Show only rows that contain text (case-insensitive) in any of columns
+
+        Args:
+            text: filter text, empty text to show all rows.
+            columns: column indexes to search, None for all columns.
+        """
+        self.beginResetModel()
+        self._filter_text = text.lower()
+        self._filter_columns = None if columns is None else tuple(columns)
+        self.__update_filter()
+        self.endResetModel()
+
+    def _source_row(self, row: int) -> int:
+        """Data row index from view row"""
+        if self._visible is not None:
+            return self._visible[row]
+        return row
+
+    def __update_filter(self):
+        """Update visible data rows"""
+        text = self._filter_text
+        if not text:
+            self._visible = None
+            return
+        if self._filter_columns is None:
+            columns = range(len(self.columns))
+        else:
+            columns = [column for column in self._filter_columns if column < len(self.columns)]
+        matched = set()
+        for column in columns:
+            formatter = self.columns[column].formatter or str
+            matched.update(
+                data_row for data_row, value in enumerate(self._data[column])
+                if text in formatter(value).lower()
+            )
+        self._visible = sorted(matched)
+
+    def __column_changed(self, column: int, first_row: int, last_row: int):
+        """Notify view rows changed in column"""
+        if first_row <= last_row:
+            self.dataChanged.emit(self.index(first_row, column), self.index(last_row, column))
@@ -373,6 +373,13 @@ class AppWindow(QMainWindow):
         self.load_window_style()
         self.refresh_states()
 
+    @Slot(bool)  # type: ignore[operator]
+    def force_reload_preset(self):
+        """Force full reload current preset, api, module, widget"""
+        loader.reload(reload_preset=True, force=True)
+        self.load_window_style()
+        self.refresh_states()
+
     def reload_only(self):
         """Reload only api, module, widget"""
         loader.reload(reload_preset=False)
@@ -25,22 +25,31 @@ from __future__ import annotations
 import os
 import re
 import time
-from typing import Callable
-
-from PySide2.QtCore import QPoint, Qt
-from PySide2.QtGui import QFontDatabase
+from functools import lru_cache
+from typing import Callable, NamedTuple, Sequence
+
+from PySide2.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QPoint,
+    QSortFilterProxyModel,
+    Qt,
+)
+from PySide2.QtGui import QColor, QFontDatabase
 from PySide2.QtWidgets import (
-    QCheckBox,
+    QAbstractItemView,
     QComboBox,
     QDialogButtonBox,
     QGridLayout,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QLineEdit,
     QMenu,
     QMessageBox,
-    QScrollArea,
     QSpinBox,
+    QStyledItemDelegate,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -58,17 +67,20 @@ from ._common import (
     BaseDialog,
     DoubleClickEdit,
     UIScaler,
+    contrast_text_color,
 )
 
-COLUMN_LABEL = 0  # grid layout column index
+COLUMN_LABEL = 0  # option table column index
 COLUMN_OPTION = 1
+ROLE_SEARCH = Qt.UserRole + 1  # option search text (key name & label)
 
 
-def get_font_list() -> list[str]:
-    """Get all available font families list"""
+@lru_cache(maxsize=1)
+def get_font_list() -> tuple[str, ...]:
+    """Get all available font families list, cached after first query"""
     if os.getenv("PYSIDE_OVERRIDE") == "6":  # no instance in qt6
-        return QFontDatabase.families()  # type: ignore[call-arg]
-    return QFontDatabase().families()
+        return tuple(QFontDatabase.families())  # type: ignore[call-arg]
+    return tuple(QFontDatabase().families())
 
 
 class FontConfig(BaseDialog):
@@ -83,7 +95,7 @@ class FontConfig(BaseDialog):
 
         # Combobox
         self.edit_fontname = QComboBox(self)
-        self.edit_fontname.addItems(["no change"] + get_font_list())
+        self.edit_fontname.addItems(("no change", *get_font_list()))
         self.edit_fontname.setFixedWidth(UIScaler.size(9))
 
         self.edit_fontsize = QSpinBox(self)
@@ -157,8 +169,247 @@ class FontConfig(BaseDialog):
         self.reloading()
 
 
+class OptionEditor:
+    """Option editor type"""
+
+    BOOL = 0
+    CHOICE = 1
+    COLOR = 2
+    PATH = 3
+    IMAGE = 4
+    FONT = 5
+    HEATMAP = 6
+    CLOCK = 7
+    STRING = 8
+    INTEGER = 9
+    FLOAT = 10
+
+
+class OptionType(NamedTuple):
+    """Option type
+
+    Attributes:
+        editor: editor type, see OptionEditor.
+        choices: choice list for CHOICE editor.
+    """
+
+    editor: int
+    choices: tuple[str, ...] = ()
+
+
+def compile_option_type(key: str) -> OptionType:
+    """Compile option type for key name
+
+    Match key name against setting key patterns in ordered list, only once per key.
+    """
+    if re.search(rxp.CFG_BOOL, key):
+        return OptionType(OptionEditor.BOOL)
+    for ref_key, choice_list in rxp.CHOICE_UNITS.items():
+        if re.search(ref_key, key):
+            return OptionType(OptionEditor.CHOICE, tuple(choice_list))
+    for ref_key, choice_list in rxp.CHOICE_COMMON.items():
+        if re.search(ref_key, key):
+            return OptionType(OptionEditor.CHOICE, tuple(choice_list))
+    if re.search(rxp.CFG_COLOR, key):
+        return OptionType(OptionEditor.COLOR)
+    if re.search(rxp.CFG_USER_PATH, key):
+        return OptionType(OptionEditor.PATH)
+    if re.search(rxp.CFG_USER_IMAGE, key):
+        return OptionType(OptionEditor.IMAGE)
+    if re.search(rxp.CFG_FONT_NAME, key):
+        return OptionType(OptionEditor.FONT)
+    if re.search(rxp.CFG_HEATMAP, key):
+        return OptionType(OptionEditor.HEATMAP)
+    if re.search(rxp.CFG_CLOCK_FORMAT, key):
+        return OptionType(OptionEditor.CLOCK)
+    if re.search(rxp.CFG_STRING, key):
+        return OptionType(OptionEditor.STRING)
+    if re.search(rxp.CFG_INTEGER, key):
+        return OptionType(OptionEditor.INTEGER)
+    return OptionType(OptionEditor.FLOAT)
+
+
+class OptionTypes(dict):
+    """Compiled option type dictionary
+
+    Key = setting key name, value = option type.
+    Compile on first access, cached across all config dialogs.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> OptionType:
+        option_type = self[key] = compile_option_type(key)
+        return option_type
+
+
+OPTION_TYPES = OptionTypes()
+
+
+class OptionTableModel(QAbstractTableModel):
+    """Option table model
+
+    Option values are edited in a copy of setting dictionary,
+    labels and value texts are only created for rows requested by view.
+    """
+
+    def __init__(self, parent, user_setting: dict, default_setting: dict):
+        super().__init__(parent)
+        self.keys = tuple(user_setting)
+        self.values = user_setting.copy()
+        self.defaults = default_setting
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Option count"""
+        if parent.isValid():
+            return 0
+        return len(self.keys)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Column count"""
+        if parent.isValid():
+            return 0
+        return 2
+
+    def option_type(self, row: int) -> OptionType:
+        """Option type of row"""
+        return OPTION_TYPES[self.keys[row]]
+
+    def flags(self, index: QModelIndex):
+        """Item flags"""
+        if index.column() == COLUMN_LABEL:
+            return Qt.ItemIsEnabled
+        if self.option_type(index.row()).editor == OptionEditor.BOOL:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        """Item data"""
+        if not index.isValid():
+            return None
+        key = self.keys[index.row()]
+        if index.column() == COLUMN_LABEL:
+            if role == Qt.DisplayRole:
+                return format_option_name(key)
+            if role == ROLE_SEARCH:
+                return f"{key} {format_option_name(key)}"
+            return None
+        value = self.values[key]
+        editor_type = OPTION_TYPES[key].editor
+        if editor_type == OptionEditor.BOOL:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if value else Qt.Unchecked
+            return None
+        if role == Qt.DisplayRole or role == Qt.EditRole:
+            return str(value)
+        if editor_type == OptionEditor.COLOR and is_hex_color(value):
+            if role == Qt.BackgroundRole:
+                return QColor(value)
+            if role == Qt.ForegroundRole:
+                return QColor(contrast_text_color(QColor(value)))
+        return None
+
+    def setData(self, index: QModelIndex, value, role=Qt.EditRole) -> bool:
+        """Set option value"""
+        if not index.isValid() or index.column() != COLUMN_OPTION:
+            return False
+        key = self.keys[index.row()]
+        if role == Qt.CheckStateRole:
+            self.values[key] = Qt.CheckState(value) == Qt.Checked
+        elif role == Qt.EditRole:
+            self.values[key] = value
+        else:
+            return False
+        self.dataChanged.emit(index, index)
+        return True
+
+    def reset_option(self, row: int):
+        """Reset option to default"""
+        self.values[self.keys[row]] = self.defaults[self.keys[row]]
+        index = self.index(row, COLUMN_OPTION)
+        self.dataChanged.emit(index, index)
+
+    def reset_all(self):
+        """Reset all options to default"""
+        self.beginResetModel()
+        for key in self.keys:
+            self.values[key] = self.defaults[key]
+        self.endResetModel()
+
+
+class OptionDelegate(QStyledItemDelegate):
+    """Option delegate, create editor only for option being edited"""
+
+    def __init__(self, parent, proxy: QSortFilterProxyModel, model: OptionTableModel):
+        super().__init__(parent)
+        self.proxy = proxy
+        self.model = model
+
+    def option_type(self, index: QModelIndex) -> OptionType:
+        """Option type of proxy index"""
+        return self.model.option_type(self.proxy.mapToSource(index).row())
+
+    def createEditor(self, parent, option, index: QModelIndex):
+        """Create editor"""
+        editor_type, choices = self.option_type(index)
+        value = str(index.data(Qt.EditRole))
+        if editor_type == OptionEditor.CHOICE:
+            return create_combolist(parent, choices)
+        if editor_type == OptionEditor.FONT:
+            return create_combolist(parent, get_font_list())
+        if editor_type == OptionEditor.HEATMAP:
+            return create_combolist(parent, tuple(cfg.user.heatmap))
+        if editor_type == OptionEditor.COLOR:
+            editor = DoubleClickEdit(parent, mode="color", init=value)
+            editor.setMaxLength(9)
+            editor.setValidator(QVAL_COLOR)
+            editor.textChanged.connect(editor.preview_color)
+            return editor
+        if editor_type == OptionEditor.PATH:
+            return DoubleClickEdit(parent, mode="path", init=value)
+        if editor_type == OptionEditor.IMAGE:
+            return DoubleClickEdit(parent, mode="image", init=value)
+        editor = QLineEdit(parent)
+        if editor_type == OptionEditor.INTEGER:
+            editor.setValidator(QVAL_INTEGER)
+        elif editor_type == OptionEditor.FLOAT:
+            editor.setValidator(QVAL_FLOAT)
+        return editor
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex):
+        """Load option value to editor"""
+        value = str(index.data(Qt.EditRole))
+        if isinstance(editor, QComboBox):
+            editor.setCurrentText(value)
+        else:
+            editor.setText(value)
+
+    def setModelData(self, editor: QWidget, model, index: QModelIndex):
+        """Save editor value to option, invalid number is discarded"""
+        editor_type = self.option_type(index).editor
+        if isinstance(editor, QComboBox):
+            model.setData(index, editor.currentText())
+            return
+        value = editor.text()
+        if editor_type == OptionEditor.INTEGER:
+            if is_string_number(value):
+                model.setData(index, int(value))
+        elif editor_type == OptionEditor.FLOAT:
+            if is_string_number(value):
+                value = float(value)
+                if value % 1 == 0:  # remove unnecessary decimal points
+                    value = int(value)
+                model.setData(index, value)
+        else:
+            model.setData(index, value)
+
+
 class UserConfig(BaseDialog):
-    """User configuration"""
+    """User configuration
+
+    Options are displayed in table view, editor is only created for option being edited,
+    so dialog opens in same time regardless of number of options.
+    """
 
     def __init__(
         self, parent, key_name: str, cfg_type: str, user_setting: dict,
@@ -182,16 +433,37 @@ class UserConfig(BaseDialog):
         self.default_setting = default_setting
         self.option_width = UIScaler.size(option_width)
 
-        # Option dict (key: option editor)
-        self.option_bool: dict = {}
-        self.option_color: dict = {}
-        self.option_path: dict = {}
-        self.option_image: dict = {}
-        #self.option_fontname: dict = {}
-        self.option_droplist: dict = {}
-        self.option_string: dict = {}
-        self.option_integer: dict = {}
-        self.option_float: dict = {}
+        # Option model
+        self.option_model = OptionTableModel(
+            self, user_setting[key_name], default_setting[key_name])
+        self.option_proxy = QSortFilterProxyModel(self)
+        self.option_proxy.setSourceModel(self.option_model)
+        self.option_proxy.setFilterKeyColumn(COLUMN_LABEL)
+        self.option_proxy.setFilterRole(ROLE_SEARCH)
+        self.option_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+        # Search
+        self.search_entry = QLineEdit(self)
+        self.search_entry.setPlaceholderText("Search Option")
+        self.search_entry.setClearButtonEnabled(True)
+        self.search_entry.textChanged.connect(self.option_proxy.setFilterFixedString)
+
+        # Option table
+        self.table_option = QTableView(self)
+        self.table_option.setModel(self.option_proxy)
+        self.table_option.setItemDelegateForColumn(
+            COLUMN_OPTION, OptionDelegate(self.table_option, self.option_proxy, self.option_model))
+        self.table_option.setEditTriggers(QAbstractItemView.AllEditTriggers)
+        self.table_option.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table_option.setShowGrid(False)
+        self.table_option.horizontalHeader().setVisible(False)
+        self.table_option.horizontalHeader().setSectionResizeMode(COLUMN_LABEL, QHeaderView.Stretch)
+        self.table_option.horizontalHeader().setSectionResizeMode(COLUMN_OPTION, QHeaderView.Fixed)
+        self.table_option.setColumnWidth(COLUMN_OPTION, self.option_width)
+        self.table_option.verticalHeader().setVisible(False)
+        self.table_option.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_option.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.table_option.customContextMenuRequested.connect(self.open_context_menu)
 
         # Button
         button_reset = QDialogButtonBox(QDialogButtonBox.Reset)
@@ -204,23 +476,12 @@ class UserConfig(BaseDialog):
         button_save.accepted.connect(self.saving)
         button_save.rejected.connect(self.reject)
 
-        # Create options
-        layout_option = QGridLayout()
-        layout_option.setAlignment(Qt.AlignTop)
-        self.create_options(layout_option)
-        option_box = QWidget(self)
-        option_box.setLayout(layout_option)
-
-        # Create scroll box
-        scroll_box = QScrollArea(self)
-        scroll_box.setWidget(option_box)
-        scroll_box.setWidgetResizable(True)
-
         # Set layout
         layout_main = QVBoxLayout()
         layout_button = QHBoxLayout()
 
-        layout_main.addWidget(scroll_box)
+        layout_main.addWidget(self.search_entry)
+        layout_main.addWidget(self.table_option)
         layout_button.addWidget(button_reset)
         layout_button.addStretch(1)
         layout_button.addWidget(button_apply)
@@ -228,7 +489,7 @@ class UserConfig(BaseDialog):
         layout_main.addLayout(layout_button)
         layout_main.setContentsMargins(self.MARGIN, self.MARGIN, self.MARGIN, self.MARGIN)
         self.setLayout(layout_main)
-        self.setMinimumWidth(self.sizeHint().width() + UIScaler.size(2))
+        self.setMinimumWidth(self.option_width * 2 + UIScaler.size(2))
 
     def applying(self):
         """Save & apply"""
@@ -245,94 +506,47 @@ class UserConfig(BaseDialog):
             "Changes are only saved after clicking Apply or Save Button."
         )
         if self.confirm_operation(title="Reset Options", message=msg_text):
-            for editor in self.option_bool.values():
-                editor.setChecked(editor.defaults)
-
-            for editor in self.option_color.values():
-                editor.setText(editor.defaults)
-
-            for editor in self.option_path.values():
-                editor.setText(editor.defaults)
-
-            for editor in self.option_image.values():
-                editor.setText(editor.defaults)
-
-            #for editor in self.option_fontname.values():
-            #    editor.setCurrentFont(editor.defaults)
-
-            for editor in self.option_droplist.values():
-                editor.setCurrentText(str(editor.defaults))
-
-            for editor in self.option_string.values():
-                editor.setText(editor.defaults)
+            self.option_model.reset_all()
 
-            for editor in self.option_integer.values():
-                editor.setText(str(editor.defaults))
-
-            for editor in self.option_float.values():
-                editor.setText(str(editor.defaults))
+    def open_context_menu(self, position: QPoint):
+        """Open context menu"""
+        index = self.table_option.indexAt(position)
+        if not index.isValid():
+            return
+        menu = QMenu()  # no parent for temp menu
+        option_reset = menu.addAction("Reset to Default")
+        action = menu.exec_(self.table_option.viewport().mapToGlobal(position))
+        if action == option_reset:
+            self.table_option.closePersistentEditor(index)
+            self.option_model.reset_option(self.option_proxy.mapToSource(index).row())
 
     def save_setting(self, is_apply: bool):
         """Save setting"""
         user_setting = self.user_setting[self.key_name]
+        option_values = self.option_model.values
         error_found = False
-        for key, editor in self.option_bool.items():
-            user_setting[key] = editor.isChecked()
-
-        for key, editor in self.option_color.items():
-            value = editor.text()
-            if is_hex_color(value):
-                user_setting[key] = value
-            else:
-                self.value_error_message("color", key)
-                error_found = True
-
-        for key, editor in self.option_path.items():
-            # Try convert to relative path again, in case user manually sets path
-            value = set_relative_path(editor.text())
-            if set_user_data_path(value):
-                user_setting[key] = value
-                editor.setText(value)  # update reformatted path
-            else:
-                self.value_error_message("path", key)
-                error_found = True
-
-        for key, editor in self.option_image.items():
-            user_setting[key] = editor.text()
-
-        #for key, editor in self.option_fontname.items():
-        #    user_setting[key] = editor.currentFont().family()
-
-        for key, editor in self.option_droplist.items():
-            user_setting[key] = editor.currentText()
-
-        for key, editor in self.option_string.items():
-            value = editor.text()
-            if re.search(rxp.CFG_CLOCK_FORMAT, key) and not is_clock_format(value):
-                self.value_error_message("clock format", key)
-                error_found = True
-                continue
+        for key, value in option_values.items():
+            editor_type = OPTION_TYPES[key].editor
+            if editor_type == OptionEditor.COLOR:
+                if not is_hex_color(value):
+                    self.value_error_message("color", key)
+                    error_found = True
+                    continue
+            elif editor_type == OptionEditor.PATH:
+                # Try convert to relative path again, in case user manually sets path
+                value = set_relative_path(value)
+                if not set_user_data_path(value):
+                    self.value_error_message("path", key)
+                    error_found = True
+                    continue
+                option_values[key] = value  # update reformatted path
+            elif editor_type == OptionEditor.CLOCK:
+                if not is_clock_format(value):
+                    self.value_error_message("clock format", key)
+                    error_found = True
+                    continue
             user_setting[key] = value
 
-        for key, editor in self.option_integer.items():
-            value = editor.text()
-            if is_string_number(value):
-                user_setting[key] = int(value)
-            else:
-                self.value_error_message("number", key)
-                error_found = True
-
-        for key, editor in self.option_float.items():
-            value = editor.text()
-            if is_string_number(value):
-                value = float(value)
-                if value % 1 == 0:  # remove unnecessary decimal points
-                    value = int(value)
-                user_setting[key] = value
-            else:
-                self.value_error_message("number", key)
-                error_found = True
-
         # Abort saving if error found
         if error_found:
             return
@@ -360,196 +574,6 @@ class UserConfig(BaseDialog):
         )
         QMessageBox.warning(self, "Error", msg_text)
 
-    def create_options(self, layout):
-        """Create options"""
-        key_list_user = tuple(self.user_setting[self.key_name])  # create user key list
-
-        for idx, key in enumerate(key_list_user):
-            self.__add_option_label(idx, key, layout)
-            # Bool
-            if re.search(rxp.CFG_BOOL, key):
-                self.__add_option_bool(idx, key, layout)
-                continue
-            # Units choice list string
-            if self.__choice_match(rxp.CHOICE_UNITS, idx, key, layout):
-                continue
-            # Common choice list string
-            if self.__choice_match(rxp.CHOICE_COMMON, idx, key, layout):
-                continue
-            # Color string
-            if re.search(rxp.CFG_COLOR, key):
-                self.__add_option_color(idx, key, layout)
-                continue
-            # User path string
-            if re.search(rxp.CFG_USER_PATH, key):
-                self.__add_option_path(idx, key, layout)
-                continue
-            # User image file path string
-            if re.search(rxp.CFG_USER_IMAGE, key):
-                self.__add_option_image(idx, key, layout)
-                continue
-            # Font name string
-            if re.search(rxp.CFG_FONT_NAME, key):
-                self.__add_option_combolist(idx, key, layout, get_font_list())
-                continue
-            # Heatmap string
-            if re.search(rxp.CFG_HEATMAP, key):
-                self.__add_option_combolist(idx, key, layout, tuple(cfg.user.heatmap))
-                continue
-            # Clock format string
-            if re.search(rxp.CFG_CLOCK_FORMAT, key):
-                self.__add_option_string(idx, key, layout)
-                continue
-            # String
-            if re.search(rxp.CFG_STRING, key):
-                self.__add_option_string(idx, key, layout)
-                continue
-            # Int
-            if re.search(rxp.CFG_INTEGER, key):
-                self.__add_option_integer(idx, key, layout)
-                continue
-            # Float or int
-            self.__add_option_float(idx, key, layout)
-
-    def __choice_match(self, choice_dict, idx, key, layout):
-        """Choice match"""
-        for ref_key, choice_list in choice_dict.items():
-            if re.search(ref_key, key):
-                self.__add_option_combolist(
-                    idx, key, layout, choice_list)
-                return True
-        return False
-
-    def __add_option_label(self, idx, key, layout):
-        """Option label"""
-        label = QLabel(format_option_name(key))
-        layout.addWidget(label, idx, COLUMN_LABEL)
-
-    def __add_option_bool(self, idx, key, layout):
-        """Bool"""
-        editor = QCheckBox(self)
-        editor.setFixedWidth(self.option_width)
-        editor.setChecked(self.user_setting[self.key_name][key])
-        # Context menu
-        editor.defaults = self.default_setting[self.key_name][key]
-        add_context_menu(editor)
-        # Add layout
-        layout.addWidget(editor, idx, COLUMN_OPTION)
-        self.option_bool[key] = editor
-
-    def __add_option_color(self, idx, key, layout):
-        """Color string"""
-        editor = DoubleClickEdit(
-            self, mode="color", init=self.user_setting[self.key_name][key])
-        editor.setFixedWidth(self.option_width)
-        editor.setMaxLength(9)
-        editor.setValidator(QVAL_COLOR)
-        editor.textChanged.connect(editor.preview_color)
-        # Load selected option
-        editor.setText(self.user_setting[self.key_name][key])
-        # Context menu
-        editor.defaults = self.default_setting[self.key_name][key]
-        add_context_menu(editor)
-        # Add layout
-        layout.addWidget(editor, idx, COLUMN_OPTION)
-        self.option_color[key] = editor
-
-    def __add_option_path(self, idx, key, layout):
-        """Path string"""
-        editor = DoubleClickEdit(
-            self, mode="path", init=self.user_setting[self.key_name][key])
-        editor.setFixedWidth(self.option_width)
-        # Load selected option
-        editor.setText(self.user_setting[self.key_name][key])
-        # Context menu
-        editor.defaults = self.default_setting[self.key_name][key]
-        add_context_menu(editor)
-        # Add layout
-        layout.addWidget(editor, idx, COLUMN_OPTION)
-        self.option_path[key] = editor
-
-    def __add_option_image(self, idx, key, layout):
-        """Image file path string"""
-        editor = DoubleClickEdit(
-            self, mode="image", init=self.user_setting[self.key_name][key])
-        editor.setFixedWidth(self.option_width)
-        # Load selected option
-        editor.setText(self.user_setting[self.key_name][key])
-        # Context menu
-        editor.defaults = self.default_setting[self.key_name][key]
-        add_context_menu(editor)
-        # Add layout
-        layout.addWidget(editor, idx, COLUMN_OPTION)
-        self.option_image[key] = editor
-
-    #def __add_option_fontname(self, idx, key, layout):
-    #    """Font name string"""
-    #    editor = QFontComboBox(self)
-    #    editor.setFixedWidth(self.option_width)
-    #    # Load selected option
-    #    editor.setCurrentFont(self.user_setting[self.key_name][key])
-    #    # Context menu
-    #    editor.defaults = self.default_setting[self.key_name][key]
-    #    add_context_menu(editor)
-    #    # Add layout
-    #    layout.addWidget(editor, idx, COLUMN_OPTION)
-    #    self.option_fontname[key] = editor
-
-    def __add_option_combolist(self, idx, key, layout, item_list):
-        """Combo droplist string"""
-        editor = QComboBox(self)
-        editor.setFixedWidth(self.option_width)
-        editor.addItems(item_list)
-        # Load selected option
-        editor.setCurrentText(str(self.user_setting[self.key_name][key]))
-        # Context menu
-        editor.defaults = self.default_setting[self.key_name][key]
-        add_context_menu(editor)
-        # Add layout
-        layout.addWidget(editor, idx, COLUMN_OPTION)
-        self.option_droplist[key] = editor
-
-    def __add_option_string(self, idx, key, layout):
-        """String"""
-        editor = QLineEdit(self)
-        editor.setFixedWidth(self.option_width)
-        # Load selected option
-        editor.setText(self.user_setting[self.key_name][key])
-        # Context menu
-        editor.defaults = self.default_setting[self.key_name][key]
-        add_context_menu(editor)
-        # Add layout
-        layout.addWidget(editor, idx, COLUMN_OPTION)
-        self.option_string[key] = editor
-
-    def __add_option_integer(self, idx, key, layout):
-        """Integer"""
-        editor = QLineEdit(self)
-        editor.setFixedWidth(self.option_width)
-        editor.setValidator(QVAL_INTEGER)
-        # Load selected option
-        editor.setText(str(self.user_setting[self.key_name][key]))
-        # Context menu
-        editor.defaults = self.default_setting[self.key_name][key]
-        add_context_menu(editor)
-        # Add layout
-        layout.addWidget(editor, idx, COLUMN_OPTION)
-        self.option_integer[key] = editor
-
-    def __add_option_float(self, idx, key, layout):
-        """Float"""
-        editor = QLineEdit(self)
-        editor.setFixedWidth(self.option_width)
-        editor.setValidator(QVAL_FLOAT)
-        # Load selected option
-        editor.setText(str(self.user_setting[self.key_name][key]))
-        # Context menu
-        editor.defaults = self.default_setting[self.key_name][key]
-        add_context_menu(editor)
-        # Add layout
-        layout.addWidget(editor, idx, COLUMN_OPTION)
-        self.option_float[key] = editor
-
 
 def set_preset_name(cfg_type: str):
     """Set preset name"""
@@ -558,26 +582,8 @@ def set_preset_name(cfg_type: str):
     return cfg.filename.setting
 
 
-def add_context_menu(parent: QWidget):
-    """Add context menu"""
-    parent.setContextMenuPolicy(Qt.CustomContextMenu)
-    parent.customContextMenuRequested.connect(
-        lambda position, parent=parent: context_menu_reset_option(position, parent)
-    )
-
-
-def context_menu_reset_option(position: QPoint, parent: QWidget):
-    """Context menu reset option"""
-    menu = QMenu()  # no parent for temp menu
-    option_reset = menu.addAction("Reset to Default")
-    action = menu.exec_(parent.mapToGlobal(position))
-    if action == option_reset:
-        if isinstance(parent, QCheckBox):
-            parent.setChecked(parent.defaults)
-            return
-        if isinstance(parent, QLineEdit):
-            parent.setText(str(parent.defaults))
-            return
-        if isinstance(parent, QComboBox):
-            parent.setCurrentText(str(parent.defaults))
-            return
\ No newline at end of file
+def create_combolist(parent: QWidget, item_list: Sequence[str]) -> QComboBox:
+    """Create combo droplist editor"""
+    editor = QComboBox(parent)
+    editor.addItems(item_list)
+    return editor
@@ -22,16 +22,18 @@ Driver stats viewer
 
 from __future__ import annotations
 
+from functools import partial
+
 from PySide2.QtCore import QPoint, Qt
 from PySide2.QtWidgets import (
     QAbstractItemView,
     QComboBox,
     QHBoxLayout,
     QHeaderView,
+    QLineEdit,
     QMenu,
     QMessageBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
 )
 
@@ -50,9 +52,9 @@ from ..userfile.driver_stats import (
 from ._common import (
     BaseEditor,
     CompactButton,
-    NumericTableItem,
     UIScaler,
 )
+from ._table_model import ColumnTableModel, TableColumn
 from .track_map_viewer import TrackMapViewer
 
 
@@ -77,6 +79,25 @@ def parse_display_value(key: str, value: int | float) -> str | int | float:
     return value
 
 
+def format_display_text(key: str, value: int | float) -> str:
+    """Format stats display text"""
+    return str(parse_display_value(key, value))
+
+
+def set_table_columns(header_keys: list[str]) -> list[TableColumn]:
+    """Set stats table columns, float stats are stored in numeric columns"""
+    columns = [TableColumn(format_header_key(header_keys[0]), editable=False)]
+    for key in header_keys[1:]:
+        columns.append(TableColumn(
+            format_header_key(key),
+            numeric=isinstance(DriverStats.__dict__[key], float),
+            editable=False,
+            alignment=Qt.AlignCenter,
+            formatter=partial(format_display_text, key),
+        ))
+    return columns
+
+
 def format_header_key(key: str):
     """Format header key"""
     if key == "pb":
@@ -114,10 +135,11 @@ class DriverStatsViewer(BaseEditor):
 
         # Set table
         self.table_header_key = ["vehicle", *DriverStats.keys()]
-        self.table_stats = QTableWidget(self)
-        self.table_stats.setColumnCount(len(self.table_header_key))
+        self.stats_model = ColumnTableModel(self, set_table_columns(self.table_header_key))
+        self.table_stats = QTableView(self)
+        self.table_stats.setModel(self.stats_model)
         self.table_stats.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.table_stats.setHorizontalHeaderLabels([format_header_key(key) for key in self.table_header_key])
+        self.table_stats.setSortingEnabled(True)  # sorted by model
         self.table_stats.verticalHeader().setVisible(False)
         self.table_stats.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.table_stats.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
@@ -134,6 +156,12 @@ class DriverStatsViewer(BaseEditor):
         self.reload_stats()
         self.refresh_table()
 
+        # Vehicle filter
+        self.filter_entry = QLineEdit()
+        self.filter_entry.setPlaceholderText("Filter Vehicle")
+        self.filter_entry.setClearButtonEnabled(True)
+        self.filter_entry.textChanged.connect(self.filter_vehicle)
+
         # Button
         button_delete = CompactButton("Delete")
         button_delete.clicked.connect(self.delete_stats_key)
@@ -157,7 +185,7 @@ class DriverStatsViewer(BaseEditor):
         layout_selector.addWidget(button_delete)
 
         layout_button.addWidget(button_reload)
-        layout_button.addStretch(1)
+        layout_button.addWidget(self.filter_entry, stretch=1)
         layout_button.addWidget(button_close)
 
         layout_main.addLayout(layout_selector)
@@ -188,35 +216,16 @@ class DriverStatsViewer(BaseEditor):
 
     def refresh_table(self):
         """Refresh stats table"""
-        self.table_stats.setSortingEnabled(False)  # must disable before refresh
-        self.table_stats.setRowCount(0)
-
-        row_index = 0
-        for veh_name, veh_data in self.selected_stats_dict.items():
-            self.add_stats_vehicle(row_index, veh_name, veh_data)
-            row_index += 1
-
-        self.table_stats.setSortingEnabled(True)
+        stats_keys = self.table_header_key[1:]
+        self.stats_model.reset_table(
+            [str(veh_name), *(veh_data.get(key, 0) for key in stats_keys)]
+            for veh_name, veh_data in self.selected_stats_dict.items()
+        )
         self.table_stats.sortByColumn(1, Qt.AscendingOrder)  # sort by laptime
 
-    def add_stats_vehicle(self, row_index: int, veh_name: str, veh_data: dict):
-        """Add stats vehicle to table"""
-        self.table_stats.insertRow(row_index)
-        flag_selectable = Qt.ItemIsSelectable | Qt.ItemIsEnabled
-
-        for column_index, header_key in enumerate(self.table_header_key):
-            # Vehicle name
-            if column_index == 0:
-                item = QTableWidgetItem(str(veh_name))
-                item.setFlags(flag_selectable)
-                self.table_stats.setItem(row_index, column_index, item)
-                continue
-            # Vehicle stats
-            value_raw = veh_data.get(header_key, 0)
-            item = NumericTableItem(value_raw, str(parse_display_value(header_key, value_raw)))
-            item.setFlags(flag_selectable)
-            item.setTextAlignment(Qt.AlignCenter)
-            self.table_stats.setItem(row_index, column_index, item)
+    def filter_vehicle(self, text: str):
+        """Filter vehicle name"""
+        self.stats_model.set_filter(text, (0,))
 
     def select_stats(self):
         """Select stats key"""
@@ -225,7 +234,7 @@ class DriverStatsViewer(BaseEditor):
             self.selected_stats_dict = self.stats_temp[self.selected_stats_key]
             self.refresh_table()
         else:
-            self.table_stats.setRowCount(0)  # clear table if no track data found
+            self.stats_model.reset_table(())  # clear table if no track data found
 
     def delete_stats_key(self):
         """Delete stats key"""
@@ -248,7 +257,8 @@ class DriverStatsViewer(BaseEditor):
 
     def remove_vehicle(self):
         """Remove vehicle and stats"""
-        selected_rows = list(data.row() for data in self.table_stats.selectedIndexes())
+        selected_rows = list(
+            data.row() for data in self.table_stats.selectionModel().selectedIndexes())
         if not selected_rows:
             QMessageBox.warning(self, "Error", "No data selected.")
             return
@@ -258,7 +268,7 @@ class DriverStatsViewer(BaseEditor):
             QMessageBox.warning(self, "Error", "No data found.")
             return
 
-        selected_vehicle = self.table_stats.item(selected_rows[0], 0).text()
+        selected_vehicle = self.stats_model.value(selected_rows[0], 0)
         msg_text = (
             f"Remove all stats from <b>{selected_vehicle}</b>?<br><br>"
             "This cannot be undone!"
@@ -273,9 +283,9 @@ class DriverStatsViewer(BaseEditor):
 
     def reset_stat(self, row: int, column: int):
         """Reset stat"""
-        selected_vehicle = self.table_stats.item(row, 0).text()
+        selected_vehicle = self.stats_model.value(row, 0)
         selected_column = self.table_header_key[column]
-        best_laptime = self.table_stats.item(row, column).text()
+        best_laptime = self.stats_model.text(row, column)
         msg_text = (
             f"Reset <b>{best_laptime}</b> lap time for <b>{selected_vehicle}</b>?<br><br>"
             "This cannot be undone!"
@@ -291,10 +301,10 @@ class DriverStatsViewer(BaseEditor):
 
     def open_context_menu(self, position: QPoint):
         """Open context menu"""
-        if not self.table_stats.itemAt(position):
+        if not self.table_stats.indexAt(position).isValid():
             return
 
-        for data in self.table_stats.selectedIndexes():
+        for data in self.table_stats.selectionModel().selectedIndexes():
             item_row = data.row()
             item_column = data.column()
             break
@@ -26,7 +26,7 @@ import os
 from collections import deque
 from math import ceil, floor
 
-from PySide2.QtCore import Qt
+from PySide2.QtCore import QModelIndex, Qt
 from PySide2.QtGui import QColor, QPainter
 from PySide2.QtWidgets import (
     QDoubleSpinBox,
@@ -41,8 +41,7 @@ from PySide2.QtWidgets import (
     QPushButton,
     QSpinBox,
     QStatusBar,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -50,12 +49,20 @@ from PySide2.QtWidgets import (
 from .. import calculation as calc
 from ..api_control import api
 from ..const_file import FileFilter
-from ..formatter import laptime_string_to_seconds
 from ..module_info import ConsumptionDataSet, minfo
 from ..setting import cfg
 from ..units import set_symbol_fuel, set_unit_fuel
 from ..userfile.consumption_history import load_consumption_history_file
 from ._common import BaseDialog, UIScaler
+from ._table_model import ColumnTableModel, TableColumn
+
+COLUMN_VALID_LAP = 8  # hidden valid lap column
+COLUMNS_INVALID_COLOR = (1, 2, 3)  # columns to highlight invalid lap
+
+
+def format_number(value: float) -> str:
+    """Format number with 3 decimal places"""
+    return f"{value:.3f}"
 
 
 def set_grid_layout(spacing: int = 2, margin: int = 4):
@@ -73,6 +80,21 @@ def highlight_invalid(line_edit: QLineEdit, invalid=False):
     line_edit.setStyleSheet("background: #F40;" if invalid else "")
 
 
+class HistoryTableModel(ColumnTableModel):
+    """Consumption history table model, highlight invalid lap"""
+
+    invalid_color = QColor("#F40")
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        """Item data"""
+        if (role == Qt.ForegroundRole
+            and index.isValid()
+            and index.column() in COLUMNS_INVALID_COLOR
+            and not self.value(index.row(), COLUMN_VALID_LAP)):
+            return self.invalid_color
+        return super().data(index, role)
+
+
 class PitStopPreview(QWidget):
     """Pit stop preview"""
 
@@ -203,41 +225,37 @@ class FuelCalculator(BaseDialog):
 
     def add_selected_data(self):
         """Add selected history data"""
-        selected_data = self.table_history.selectedItems()
+        selected_data = self.table_history.selectionModel().selectedIndexes()
         if not selected_data:
             QMessageBox.warning(
                 self, "Error",
                 "No data selected.")
             return
 
-        data_laptime = [data for data in selected_data if data.column() == 1]
-        data_fuel = [data for data in selected_data if data.column() == 2]
-        data_energy = [data for data in selected_data if data.column() == 3]
-        data_tyrewear = [data for data in selected_data if data.column() == 6]
-        data_capacity = [data for data in selected_data if data.column() == 7]
+        history_model = self.history_model
+        data_laptime = [history_model.value(data.row(), 1) for data in selected_data if data.column() == 1]
+        data_fuel = [history_model.value(data.row(), 2) for data in selected_data if data.column() == 2]
+        data_energy = [history_model.value(data.row(), 3) for data in selected_data if data.column() == 3]
+        data_tyrewear = [history_model.value(data.row(), 6) for data in selected_data if data.column() == 6]
+        data_capacity = [history_model.value(data.row(), 7) for data in selected_data if data.column() == 7]
 
         # Send data to calculator
         if data_laptime:
-            dataset = [laptime_string_to_seconds(data.text()) for data in data_laptime]
-            output_value = calc.mean(dataset) if len(data_laptime) > 1 else dataset[0]
+            output_value = calc.mean(data_laptime) if len(data_laptime) > 1 else data_laptime[0]
             self.input_laptime.minutes.setValue(output_value // 60)
             self.input_laptime.seconds.setValue(output_value % 60)
             self.input_laptime.mseconds.setValue(output_value % 1 * 1000)
         if data_fuel:
-            dataset = [float(data.text()) for data in data_fuel]
-            output_value = calc.mean(dataset) if len(data_fuel) > 1 else dataset[0]
+            output_value = calc.mean(data_fuel) if len(data_fuel) > 1 else data_fuel[0]
             self.input_fuel.fuel_used.setValue(output_value)
         if data_energy:
-            dataset = [float(data.text()) for data in data_energy]
-            output_value = calc.mean(dataset) if len(data_energy) > 1 else dataset[0]
+            output_value = calc.mean(data_energy) if len(data_energy) > 1 else data_energy[0]
             self.input_fuel.energy_used.setValue(output_value)
         if data_tyrewear:
-            dataset = [float(data.text()) for data in data_tyrewear]
-            output_value = calc.mean(dataset) if len(data_tyrewear) > 1 else dataset[0]
+            output_value = calc.mean(data_tyrewear) if len(data_tyrewear) > 1 else data_tyrewear[0]
             self.input_tyre.wear_lap.setValue(output_value)
         if data_capacity:
-            output_value = float(data_capacity[0].text())
-            self.input_fuel.capacity.setValue(output_value)
+            self.input_fuel.capacity.setValue(data_capacity[0])
 
     def load_file(self):
         """Load history data from file"""
@@ -289,43 +307,21 @@ class FuelCalculator(BaseDialog):
 
     def refresh_table(self, dataset: deque[ConsumptionDataSet]):
         """Refresh history data table"""
-        self.table_history.setRowCount(0)
-        invalid_color = QColor("#F40")
-        flag_selectable = Qt.ItemIsSelectable | Qt.ItemIsEnabled
-        flag_unselectable = Qt.NoItemFlags
-
-        for row_index, lap_data in enumerate(dataset):
-            lapnumber = self.__add_table_item(f"{lap_data.lapNumber}", flag_unselectable)
-            laptime = self.__add_table_item(calc.sec2laptime_full(lap_data.lapTimeLast), flag_selectable)
-            used_fuel = self.__add_table_item(f"{self.unit_fuel(lap_data.lastLapUsedFuel):.3f}", flag_selectable)
-            used_energy = self.__add_table_item(f"{lap_data.lastLapUsedEnergy:.3f}", flag_selectable)
-            battery_drain = self.__add_table_item(f"{lap_data.batteryDrainLast:.3f}", flag_unselectable)
-            battery_regen = self.__add_table_item(f"{lap_data.batteryRegenLast:.3f}", flag_unselectable)
-            tyre_wear = self.__add_table_item(f"{lap_data.tyreAvgWearLast:.3f}", flag_selectable)
-            capacity_fuel = self.__add_table_item(f"{self.unit_fuel(lap_data.capacityFuel):.3f}", flag_selectable)
-
-            if not lap_data.isValidLap:  # set invalid lap text color
-                laptime.setForeground(invalid_color)
-                used_fuel.setForeground(invalid_color)
-                used_energy.setForeground(invalid_color)
-
-            self.table_history.insertRow(row_index)
-            self.table_history.setItem(row_index, 0, lapnumber)
-            self.table_history.setItem(row_index, 1, laptime)
-            self.table_history.setItem(row_index, 2, used_fuel)
-            self.table_history.setItem(row_index, 3, used_energy)
-            self.table_history.setItem(row_index, 4, battery_drain)
-            self.table_history.setItem(row_index, 5, battery_regen)
-            self.table_history.setItem(row_index, 6, tyre_wear)
-            self.table_history.setItem(row_index, 7, capacity_fuel)
-
-    def __add_table_item(self, text: str, flags: Qt.ItemFlags):
-        """Add table item"""
-        item = QTableWidgetItem()
-        item.setText(text)
-        item.setTextAlignment(Qt.AlignCenter)
-        item.setFlags(flags)
-        return item
+        unit_fuel = self.unit_fuel
+        self.history_model.reset_table(
+            (
+                lap_data.lapNumber,
+                lap_data.lapTimeLast,
+                unit_fuel(lap_data.lastLapUsedFuel),
+                lap_data.lastLapUsedEnergy,
+                lap_data.batteryDrainLast,
+                lap_data.batteryRegenLast,
+                lap_data.tyreAvgWearLast,
+                unit_fuel(lap_data.capacityFuel),
+                lap_data.isValidLap,
+            )
+            for lap_data in dataset
+        )
 
     def set_panel_calculator(self, panel):
         """Set panel calculator"""
@@ -413,23 +409,32 @@ class FuelCalculator(BaseDialog):
     def set_panel_table(self, panel):
         """Set panel table"""
         columns_stretch = 7
-        self.table_history = QTableWidget(self)
-        self.table_history.setColumnCount(1 + columns_stretch)
+        self.history_model = HistoryTableModel(self, (
+            TableColumn("Lap", editable=False, selectable=False, alignment=Qt.AlignCenter),
+            TableColumn("Time", numeric=True, editable=False, alignment=Qt.AlignCenter,
+                        formatter=calc.sec2laptime_full),
+            TableColumn(f"Fuel({self.symbol_fuel})", numeric=True, editable=False,
+                        alignment=Qt.AlignCenter, formatter=format_number),
+            TableColumn("Energy(%)", numeric=True, editable=False,
+                        alignment=Qt.AlignCenter, formatter=format_number),
+            TableColumn("Drain(%)", numeric=True, editable=False, selectable=False,
+                        alignment=Qt.AlignCenter, formatter=format_number),
+            TableColumn("Regen(%)", numeric=True, editable=False, selectable=False,
+                        alignment=Qt.AlignCenter, formatter=format_number),
+            TableColumn("Tyre(%)", numeric=True, editable=False,
+                        alignment=Qt.AlignCenter, formatter=format_number),
+            TableColumn(f"Tank({self.symbol_fuel})", numeric=True, editable=False,
+                        alignment=Qt.AlignCenter, formatter=format_number),
+            TableColumn("Valid", editable=False, selectable=False),
+        ))
+        self.table_history = QTableView(self)
+        self.table_history.setModel(self.history_model)
+        self.table_history.setColumnHidden(COLUMN_VALID_LAP, True)
         self.table_history.verticalHeader().setVisible(False)
         self.table_history.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table_history.horizontalHeader().setSectionResizeMode(0, QHeaderView.Fixed)
         self.table_history.setColumnWidth(0, UIScaler.size(3))
         self.table_history.setFixedWidth(UIScaler.size(3 + 5 * columns_stretch))
-        self.table_history.setHorizontalHeaderLabels((
-            "Lap",
-            "Time",
-            f"Fuel({self.symbol_fuel})",
-            "Energy(%)",
-            "Drain(%)",
-            "Regen(%)",
-            "Tyre(%)",
-            f"Tank({self.symbol_fuel})",
-        ))
 
         button_adddata = QPushButton("Add Selected Data")
         button_adddata.clicked.connect(self.add_selected_data)
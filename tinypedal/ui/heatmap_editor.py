@@ -20,8 +20,12 @@
 Heatmap editor
 """
 
+from __future__ import annotations
+
 import time
 
+from PySide2.QtCore import QModelIndex, Qt
+from PySide2.QtGui import QColor
 from PySide2.QtWidgets import (
     QComboBox,
     QDialogButtonBox,
@@ -29,12 +33,14 @@ from PySide2.QtWidgets import (
     QHeaderView,
     QLineEdit,
     QMessageBox,
-    QTableWidget,
+    QStyledItemDelegate,
+    QTableView,
     QVBoxLayout,
 )
 
 from ..const_file import ConfigType
 from ..setting import cfg, copy_setting
+from ..validator import is_hex_color
 from ._common import (
     QVAL_COLOR,
     QVAL_HEATMAP,
@@ -43,11 +49,44 @@ from ._common import (
     BatchOffset,
     CompactButton,
     DoubleClickEdit,
-    FloatTableItem,
     UIScaler,
+    contrast_text_color,
 )
+from ._table_model import ColumnTableModel, TableColumn
 
 HEADER_HEATMAP = "Temperature (Celsius)","Color"
+COLUMNS_HEATMAP = (
+    TableColumn(HEADER_HEATMAP[0], numeric=True),
+    TableColumn(HEADER_HEATMAP[1]),
+)
+
+
+class HeatmapTableModel(ColumnTableModel):
+    """Heatmap table model, preview color in color column"""
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        """Item data"""
+        if index.isValid() and index.column() == 1 and (
+            role == Qt.BackgroundRole or role == Qt.ForegroundRole):
+            color_str = self.value(index.row(), 1)
+            if not is_hex_color(color_str):
+                return None
+            if role == Qt.BackgroundRole:
+                return QColor(color_str)
+            return QColor(contrast_text_color(QColor(color_str)))
+        return super().data(index, role)
+
+
+class ColorEditDelegate(QStyledItemDelegate):
+    """Color edit delegate, double click editor to open color dialog"""
+
+    def createEditor(self, parent, option, index: QModelIndex):
+        """Create color editor"""
+        color_edit = DoubleClickEdit(parent, mode="color", init=index.data())
+        color_edit.setMaxLength(9)
+        color_edit.setValidator(QVAL_COLOR)
+        color_edit.textChanged.connect(color_edit.preview_color)
+        return color_edit
 
 
 class HeatmapEditor(BaseEditor):
@@ -58,7 +97,6 @@ class HeatmapEditor(BaseEditor):
         self.set_utility_title("Heatmap Editor")
         self.setMinimumHeight(UIScaler.size(30))
 
-        self._verify_enabled = True
         self.heatmap_temp = copy_setting(cfg.user.heatmap)
         self.selected_heatmap_key = next(iter(self.heatmap_temp.keys()))
         self.selected_heatmap_dict = self.heatmap_temp[self.selected_heatmap_key]
@@ -69,16 +107,16 @@ class HeatmapEditor(BaseEditor):
         self.heatmap_list.currentIndexChanged.connect(self.select_heatmap)
 
         # Heatmap list box
-        self.table_heatmap = QTableWidget(self)
-        self.table_heatmap.setColumnCount(len(HEADER_HEATMAP))
-        self.table_heatmap.setHorizontalHeaderLabels(HEADER_HEATMAP)
+        self.heatmap_model = HeatmapTableModel(self, COLUMNS_HEATMAP)
+        self.heatmap_model.dataChanged.connect(self.set_modified)
+        self.table_heatmap = QTableView(self)
+        self.table_heatmap.setModel(self.heatmap_model)
+        self.table_heatmap.setItemDelegateForColumn(1, ColorEditDelegate(self.table_heatmap))
         self.table_heatmap.verticalHeader().setVisible(False)
         self.table_heatmap.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.table_heatmap.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table_heatmap.horizontalHeader().setSectionResizeMode(1, QHeaderView.Fixed)
         self.table_heatmap.setColumnWidth(1, UIScaler.size(8))
-        self.table_heatmap.cellChanged.connect(self.set_modified)
-        self.table_heatmap.cellChanged.connect(self.verify_input)
         self.refresh_table()
         self.set_unmodified()
 
@@ -145,30 +183,15 @@ class HeatmapEditor(BaseEditor):
 
     def refresh_table(self):
         """Refresh temperature table"""
-        self.table_heatmap.setRowCount(0)
-        row_index = 0
-
-        self._verify_enabled = False
-        for temperature, color in self.selected_heatmap_dict.items():
-            self.add_temperature_entry(row_index, float(temperature), color)
-            row_index += 1
-        self._verify_enabled = True
-
-    def __add_option_color(self, key):
-        """Color string"""
-        color_edit = DoubleClickEdit(self, mode="color", init=key)
-        color_edit.setMaxLength(9)
-        color_edit.setValidator(QVAL_COLOR)
-        color_edit.textChanged.connect(self.set_modified)
-        color_edit.textChanged.connect(color_edit.preview_color)
-        color_edit.setText(key)  # load selected option
-        return color_edit
+        self.heatmap_model.reset_table(
+            (float(temperature), color)
+            for temperature, color in self.selected_heatmap_dict.items()
+        )
 
     def add_temperature_entry(self, row_index: int, temperature: float, color: str):
         """Add new temperature entry to table"""
-        self.table_heatmap.insertRow(row_index)
-        self.table_heatmap.setItem(row_index, 0, FloatTableItem(temperature))
-        self.table_heatmap.setCellWidget(row_index, 1, self.__add_option_color(color))
+        self.heatmap_model.insert_row(row_index, (temperature, color))
+        self.set_modified()
 
     def open_create_dialog(self):
         """Create heatmap preset"""
@@ -198,50 +221,38 @@ class HeatmapEditor(BaseEditor):
     def column_selection_count(self, column_index: int = 0) -> int:
         """Column selection count"""
         row_count = 0
-        for data in self.table_heatmap.selectedIndexes():
+        for data in self.table_heatmap.selectionModel().selectedIndexes():
             if data.column() == column_index:
                 row_count += 1
             else:
                 return 0
         return row_count
 
-    def verify_input(self, row_index: int, column_index: int):
-        """Verify input value"""
-        if self._verify_enabled:
-            self.set_modified()
-            item = self.table_heatmap.item(row_index, column_index)
-            if column_index == 0:
-                item.validate()
-
     def apply_batch_offset(self, offset: int, is_scale_mode: bool):
         """Apply batch offset"""
-        self._verify_enabled = False
-        for item in self.table_heatmap.selectedItems():
-            value = item.value()
-            if is_scale_mode:
-                value *= offset
-            else:
-                value += offset
-            item.setValue(value)
-        self._verify_enabled = True
-        self.set_modified()
+        selected_rows = [
+            data.row() for data in self.table_heatmap.selectionModel().selectedIndexes()
+            if data.column() == 0
+        ]
+        self.heatmap_model.offset_values(0, selected_rows, offset, is_scale_mode)
 
     def add_temperature(self):
         """Add new temperature"""
         self.sort_temperature()
-        row_index = self.table_heatmap.rowCount()
+        row_index = self.heatmap_model.rowCount()
         if row_index > 0:
-            temperature = self.table_heatmap.item(row_index - 1, 0).value() + 10
+            temperature = self.heatmap_model.value(row_index - 1, 0) + 10
             color = "#FFFFFF"
         else:
             temperature = -273.0
             color = "#4444FF"
         self.add_temperature_entry(row_index, temperature, color)
-        self.table_heatmap.setCurrentCell(row_index, 0)
+        self.table_heatmap.setCurrentIndex(self.heatmap_model.index(row_index, 0))
 
     def delete_temperature(self, row_index: int):
         """Delete temperature entry"""
-        selected_rows = set(data.row() for data in self.table_heatmap.selectedIndexes())
+        selected_rows = set(
+            data.row() for data in self.table_heatmap.selectionModel().selectedIndexes())
         if not selected_rows:
             QMessageBox.warning(self, "Error", "No data selected.")
             return
@@ -249,14 +260,13 @@ class HeatmapEditor(BaseEditor):
         if not self.confirm_operation(message="<b>Delete selected temperature?</b>"):
             return
 
-        for row_index in sorted(selected_rows, reverse=True):
-            self.table_heatmap.removeRow(row_index)
+        self.heatmap_model.remove_rows(selected_rows)
         self.set_modified()
 
     def sort_temperature(self):
         """Sort temperature"""
-        if self.table_heatmap.rowCount() > 1:
-            self.table_heatmap.sortItems(0)
+        if self.heatmap_model.rowCount() > 1:
+            self.heatmap_model.sort(0)
             self.set_modified()
 
     def select_heatmap(self):
@@ -302,6 +312,7 @@ class HeatmapEditor(BaseEditor):
         if self.confirm_operation(message=msg_text):
             self.selected_heatmap_dict = cfg.default.heatmap[self.selected_heatmap_key].copy()
             self.refresh_table()
+            self.set_modified()
 
     def applying(self):
         """Save & apply"""
@@ -316,10 +327,9 @@ class HeatmapEditor(BaseEditor):
         """Update temporary changes to selected heatmap first"""
         self.sort_temperature()
         self.selected_heatmap_dict.clear()
-        for index in range(self.table_heatmap.rowCount()):
-            temperature = f"{self.table_heatmap.item(index, 0).value():.1f}"
-            color_string = self.table_heatmap.cellWidget(index, 1).text()
-            self.selected_heatmap_dict[temperature] = color_string
+        for temperature, color_string in zip(
+            self.heatmap_model.column_values(0), self.heatmap_model.column_values(1)):
+            self.selected_heatmap_dict[f"{temperature:.1f}"] = color_string
         # Apply changes to heatmap preset dictionary
         self.heatmap_temp[self.selected_heatmap_key] = self.selected_heatmap_dict
 
@@ -20,6 +20,7 @@
 Log window
 """
 
+from PySide2.QtCore import QTimer
 from PySide2.QtGui import QTextCursor, QTextOption
 from PySide2.QtWidgets import (
     QFileDialog,
@@ -30,7 +31,8 @@ from PySide2.QtWidgets import (
 )
 
 from ..const_file import FileFilter
-from ..main import log_stream
+from ..log_handler import LOG_BUFFER_CAPACITY
+from ..main import log_buffer
 from ._common import BaseDialog, CompactButton, UIScaler
 
 
@@ -45,8 +47,15 @@ class LogInfo(BaseDialog):
         self.log_view = QTextBrowser(self)
         self.log_view.setMinimumSize(UIScaler.size(42), UIScaler.size(22))
         self.log_view.setWordWrapMode(QTextOption.NoWrap)
+        self.log_view.document().setMaximumBlockCount(LOG_BUFFER_CAPACITY)
+        self.log_serial = -1
         self.refresh_log()
 
+        # Auto refresh new log lines
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.timeout.connect(self.refresh_log)
+        self._refresh_timer.start(1000)
+
         # Button
         button_refresh = CompactButton("Refresh")
         button_refresh.clicked.connect(self.refresh_log)
@@ -79,16 +88,21 @@ class LogInfo(BaseDialog):
         self.setLayout(layout_main)
 
     def refresh_log(self):
-        """Refresh log"""
-        self.log_view.setText(log_stream.getvalue())
+        """Refresh log, append new log lines only"""
+        self.log_serial, lines, is_reset = log_buffer.read(self.log_serial)
+        if is_reset:
+            self.log_view.setPlainText("\n".join(lines))
+        elif lines:
+            self.log_view.append("\n".join(lines))
+        else:
+            return
         self.log_view.moveCursor(QTextCursor.End)
 
     def clear_log(self):
         """Clear log"""
         if self.confirm_operation(message="Clear all log?"):
-            log_stream.truncate(0)
-            log_stream.seek(0)
-            self.refresh_log()
+            log_buffer.clear()
+            self.log_view.clear()
 
     def copy_log(self):
         """Copy log"""
@@ -105,8 +119,5 @@ class LogInfo(BaseDialog):
         )[0]
         if not filename_full:
             return
-        with open(filename_full, "w", newline="", encoding="utf-8") as log_file:
-            log_stream.seek(0)
-            log_file.writelines(log_stream)
-        # Set back to end
-        log_stream.seek(2)
+        with open(filename_full, "w", encoding="utf-8") as log_file:
+            log_file.write(log_buffer.getvalue())
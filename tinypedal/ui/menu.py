@@ -81,7 +81,7 @@ class OverlayMenu(QMenu):
 
         # Reload preset
         reload_preset = self.addAction("Reload")
-        reload_preset.triggered.connect(parent.reload_preset)
+        reload_preset.triggered.connect(parent.force_reload_preset)
         self.addSeparator()
 
         # Restart API
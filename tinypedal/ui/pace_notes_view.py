@@ -24,10 +24,12 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Callable
+from collections import deque
+from time import perf_counter
+from typing import Callable, Mapping, Sequence
 
 from PySide2.QtCore import QBasicTimer, Qt, QUrl
-from PySide2.QtMultimedia import QMediaPlayer
+from PySide2.QtMultimedia import QMediaPlayer, QSoundEffect
 from PySide2.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -45,19 +47,99 @@ from PySide2.QtWidgets import (
 )
 
 from .. import set_relative_path
+from ..api_control import api
 from ..const_file import FileFilter
+from ..latency_stats import LatencyStats
 from ..module_control import mctrl
 from ..module_info import minfo
 from ..overlay_control import octrl
 from ..setting import cfg
-from ..userfile.track_notes import COLUMN_PACENOTE
+from ..userfile.track_notes import COLUMN_DISTANCE, COLUMN_PACENOTE
 from ._common import CompactButton, UIScaler
 
+PLAY_LATENCY_ESTIMATE = 0.03  # seconds, initial playback start latency before measured
+MIN_LOOKAHEAD_SPEED = 1.0  # meters per second, minimum speed for lookahead scheduling
+
 logger = logging.getLogger(__name__)
 
 
+class PaceNotesSoundBank:
+    """Pre-decoded pace notes sound bank
+
+    Load each unique pace note sound of current pace notes into memory once,
+    so playback starts without opening & decoding file.
+    Only WAV format is supported (QSoundEffect).
+    """
+
+    __slots__ = (
+        "_parent",
+        "_on_playing",
+        "_sounds",
+        "_source",
+    )
+
+    def __init__(self, parent, on_playing: Callable):
+        self._parent = parent
+        self._on_playing = on_playing
+        self._sounds: dict[str, QSoundEffect] = {}
+        self._source = None
+
+    def load(self, dataset: Sequence[Mapping], sound_path: str, sound_format: str, volume: int):
+        """Load sounds of pace notes dataset, skip if same source already loaded"""
+        source = (dataset, sound_path, sound_format)
+        if (self._source is not None
+            and self._source[0] is dataset
+            and self._source[1:] == source[1:]):
+            return
+        self.clear()
+        self._source = source
+        if sound_format.lower() != "wav":
+            return
+        for note_line in dataset:
+            pace_note = note_line.get(COLUMN_PACENOTE)
+            if not pace_note or pace_note in self._sounds:
+                continue
+            filename = f"{sound_path}{pace_note}.{sound_format}"
+            if not os.path.isfile(filename):
+                continue
+            sound = QSoundEffect(self._parent)
+            sound.playingChanged.connect(self._on_playing)
+            sound.setSource(QUrl.fromLocalFile(os.path.abspath(filename)))
+            sound.setVolume(volume / 100)
+            self._sounds[pace_note] = sound
+        if self._sounds:
+            logger.info("PACE NOTES: %s sounds pre-loaded", len(self._sounds))
+
+    def get(self, pace_note: str) -> QSoundEffect | None:
+        """Get loaded sound, None if not found or not ready"""
+        sound = self._sounds.get(pace_note)
+        if sound is not None and sound.status() == QSoundEffect.Status.Ready:
+            return sound
+        return None
+
+    def set_volume(self, volume: int):
+        """Set volume of all sounds"""
+        for sound in self._sounds.values():
+            sound.setVolume(volume / 100)
+
+    def clear(self):
+        """Clear all sounds"""
+        for sound in self._sounds.values():
+            sound.stop()
+            sound.deleteLater()
+        self._sounds.clear()
+        self._source = None
+
+
 class PaceNotesPlayer(QMediaPlayer):
-    """Pace notes player"""
+    """Pace notes player
+
+    Pace notes are played from pre-decoded sound bank if available,
+    otherwise from file via media player.
+
+    Next pace note is scheduled ahead of reaching note position,
+    by time-to-reach (distance / speed) minus measured playback start latency.
+    """
     set_source: Callable
     set_volume: Callable
     is_playing: Callable
@@ -69,11 +151,22 @@ class PaceNotesPlayer(QMediaPlayer):
 
         # Set update timer
         self._update_timer = QBasicTimer()
+        self._update_interval = 0.0
 
         # Last data
         self._checked = False
         self._last_notes_index = None
-        self._play_queue: list[str] = []
+        self._scheduled_index = None
+        self._play_queue: deque[tuple[str, float]] = deque()
+        self._playing_sound = None
+        self._play_time = 0.0
+        self._play_due = 0.0
+        self._play_pending = False
+
+        # Playback statistics (milliseconds)
+        self.start_latency = LatencyStats()
+        self.timing_error = LatencyStats()
+        self._sound_bank = PaceNotesSoundBank(self, self.__update_latency)
 
         # Set compatibility
         if os.getenv("PYSIDE_OVERRIDE") == "6":
@@ -85,11 +178,13 @@ class PaceNotesPlayer(QMediaPlayer):
             self.set_source = self.setSource
             self.set_volume = audio_output.setVolume
             self.is_playing = self.__is_playing_qt6
+            self.playbackStateChanged.connect(self.__update_latency)
         else:
             # Assign methods for qt5
             self.set_source = self.setMedia
             self.set_volume = self.setVolume
             self.is_playing = self.__is_playing_qt5
+            self.stateChanged.connect(self.__update_latency)
 
     def set_playback(self, enabled: bool):
         """Set playback state"""
@@ -99,19 +194,40 @@ class PaceNotesPlayer(QMediaPlayer):
                 self.mcfg["update_interval"],
                 cfg.application["minimum_update_interval"],
             )
+            self._update_interval = update_interval / 1000
             self._update_timer.start(update_interval, self)
             logger.info("ENABLED: pace notes sounds playback")
         else:
             self._update_timer.stop()
+            self._sound_bank.clear()
             logger.info("DISABLED: pace notes sounds playback")
 
+    def set_playback_volume(self, volume: int):
+        """Set playback volume of media player & sound bank"""
+        self.set_volume(volume)
+        self._sound_bank.set_volume(volume)
+
     def reset_playback(self):
         """Reset"""
+        if self.start_latency.count:
+            logger.info(
+                "PACE NOTES: %s sounds, start latency mean %.2fms, max %.2fms, "
+                "timing error mean %.2fms, max %.2fms",
+                self.start_latency.count,
+                self.start_latency.mean,
+                self.start_latency.maximum,
+                self.timing_error.mean,
+                self.timing_error.maximum,
+            )
+        self.start_latency.reset()
+        self.timing_error.reset()
         self._checked = False
         self._last_notes_index = None
+        self._scheduled_index = None
         self._play_queue.clear()
-        self.stop()
-        self.set_volume(self.mcfg["pace_notes_sound_volume"])
+        self._play_pending = False
+        self.__stop_sound()
+        self.set_playback_volume(self.mcfg["pace_notes_sound_volume"])
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
@@ -121,11 +237,30 @@ class PaceNotesPlayer(QMediaPlayer):
             if not self._checked:
                 self._checked = True
 
+            # Load sound bank
+            self._sound_bank.load(
+                minfo.pacenotes.dataSet,
+                self.mcfg["pace_notes_sound_path"],
+                self.mcfg["pace_notes_sound_format"].strip("."),
+                self.mcfg["pace_notes_sound_volume"],
+            )
+
             # Playback
             notes_index = minfo.pacenotes.currentIndex
             if self._last_notes_index != notes_index:
                 self._last_notes_index = notes_index
-                self.__update_queue(minfo.pacenotes.currentNote.get(COLUMN_PACENOTE))
+                is_scheduled = self._scheduled_index == notes_index
+                # Clear schedule on any index change, as index either reached scheduled note,
+                # or skipped past it, or moved backwards (new lap, teleport)
+                self._scheduled_index = None
+                if not is_scheduled:  # not already queued ahead
+                    self.__update_queue(
+                        minfo.pacenotes.currentNote.get(COLUMN_PACENOTE), perf_counter())
+
+            # Lookahead
+            next_index = minfo.pacenotes.nextIndex
+            if next_index != notes_index and next_index != self._scheduled_index:
+                self.__schedule_next(next_index, minfo.pacenotes.nextNote)
 
             if self._play_queue:
                 self.__play_next_in_queue()
@@ -142,29 +277,77 @@ class PaceNotesPlayer(QMediaPlayer):
         """Check playing state (qt6 only)"""
         return self.playbackState() == QMediaPlayer.PlayingState
 
-    def source_url(self) -> QUrl:
+    def source_url(self, pace_note: str) -> QUrl:
         """Get sound source url"""
-        pace_note = self._play_queue[0]
         sound_path = self.mcfg["pace_notes_sound_path"]
         sound_format = self.mcfg["pace_notes_sound_format"].strip(".")
         return QUrl(f"{sound_path}{pace_note}.{sound_format}")
 
-    def __update_queue(self, pace_note: str | None):
+    def __schedule_next(self, next_index: int, next_note: Mapping):
+        """Queue next pace note ahead if it will be reached within playback start latency"""
+        speed = api.read.vehicle.speed()
+        if speed < MIN_LOOKAHEAD_SPEED:
+            return
+        pos_curr = minfo.delta.lapDistance + self.mcfg["pace_notes_global_offset"]
+        distance = next_note.get(COLUMN_DISTANCE, 0.0) - pos_curr
+        if distance < 0:  # next note in next lap
+            distance += api.read.lap.track_length()
+        time_to_reach = distance / speed
+        if self.start_latency.count:
+            lead_time = self.start_latency.mean / 1000
+        else:
+            lead_time = PLAY_LATENCY_ESTIMATE
+        # Timer may fire up to one interval late, schedule half interval earlier on average
+        if 0 <= time_to_reach <= lead_time + self._update_interval * 0.5:
+            self._scheduled_index = next_index
+            self.__update_queue(next_note.get(COLUMN_PACENOTE), perf_counter() + time_to_reach)
+
+    def __update_queue(self, pace_note: str | None, due_time: float):
         """Update playback queue"""
         if (pace_note is not None
             and len(self._play_queue) < self.mcfg["pace_notes_sound_max_queue"]):
-            self._play_queue.append(pace_note)
+            self._play_queue.append((pace_note, due_time))
+
+    def __is_sound_playing(self) -> bool:
+        """Check whether last sound is playing"""
+        if self._playing_sound is not None:
+            return self._playing_sound.isPlaying()
+        return self.is_playing()
+
+    def __stop_sound(self):
+        """Stop last sound"""
+        if self._playing_sound is not None:
+            self._playing_sound.stop()
+            self._playing_sound = None
+        self.stop()
 
     def __play_next_in_queue(self):
         """Play next sound in playback queue"""
         # Wait if is playing & not exceeded max duration
-        if (self.is_playing() and
-            self.position() < self.mcfg["pace_notes_sound_max_duration"] * 1000):
+        if (self.__is_sound_playing() and
+            perf_counter() - self._play_time < self.mcfg["pace_notes_sound_max_duration"]):
             return
         # Play next sound in queue
-        self.set_source(self.source_url())
-        self.play()
-        self._play_queue.pop(0)  # remove playing notes from queue
+        pace_note, due_time = self._play_queue.popleft()  # remove playing notes from queue
+        self.__stop_sound()
+        self._play_time = perf_counter()
+        self._play_due = due_time
+        self._play_pending = True
+        sound = self._sound_bank.get(pace_note)
+        if sound is not None:
+            self._playing_sound = sound
+            sound.play()
+        else:
+            self.set_source(self.source_url(pace_note))
+            self.play()
+
+    def __update_latency(self, *_):
+        """Update playback start latency & timing error once sound started playing"""
+        if self._play_pending and self.__is_sound_playing():
+            self._play_pending = False
+            timestamp = perf_counter()
+            self.start_latency.add((timestamp - self._play_time) * 1000)
+            self.timing_error.add((timestamp - self._play_due) * 1000)
 
 
 class PaceNotesControl(QWidget):
@@ -339,7 +522,7 @@ class PaceNotesControl(QWidget):
         """Set sound volume"""
         self.label_volume.setText(f"Playback Volume: {volume}%")
         if self.update_config("pace_notes_sound_volume", volume):
-            self.pace_notes_player.set_volume(volume)
+            self.pace_notes_player.set_playback_volume(volume)
 
     def toggle_selector_state(self, checked: bool):
         """Toggle file selector state"""
@@ -188,6 +188,7 @@ class PresetTransfer(BaseEditor):
             filename=dest_preset_name,
             filepath=cfg.path.settings,
             max_attempts=cfg.max_saving_attempts,
+            dict_def=cfg.sparse_format_default,
         )
         msg_text = (
             f"Settings are transferred from <b>{loaded_preset_name}</b>"
@@ -42,6 +42,7 @@ from PySide2.QtWidgets import (
 
 from .. import calculation as calc
 from ..const_file import ConfigType, FileExt, FileFilter
+from ..map_geometry import MapIndex, MapLod, lod_indexes
 from ..setting import cfg
 from ..userfile.track_map import load_track_map_file
 from ._common import BaseDialog, CompactButton, UIScaler
@@ -108,7 +109,9 @@ class MapView(QWidget):
         self.raw_coords = None
         self.raw_dists = None
 
-        self.map_path = None
+        self.map_lod = None
+        self.map_index = None
+        self.map_paths = {}  # map path cache, key = LOD node count
         self.sfinish_path = None
         self.sector1_path = None
         self.sector2_path = None
@@ -372,6 +375,9 @@ class MapView(QWidget):
             self.map_length = 0
             self.map_nodes = 0
             self.map_filename = ""
+            self.map_lod = None
+            self.map_index = None
+            self.map_paths.clear()
             msg_text = (
                 "Unable to load track map file from<br>"
                 f"<b>{filepath}{filename}{FileExt.SVG}</b><br><br>"
@@ -384,20 +390,14 @@ class MapView(QWidget):
         self.reloaded.emit(True)
 
     def create_map_path(self, raw_coords, sectors_index):
-        """Create map path"""
-        map_path = QPainterPath()
+        """Create map LOD & sector paths, map path is created per LOD level on demand"""
         sfinish_path = QPainterPath()
         sector1_path = QPainterPath()
         sector1_path = QPainterPath()
 
-        for index, coords in enumerate(raw_coords):
-            if index == 0:
-                map_path.moveTo(*coords)
-            else:
-                map_path.lineTo(*coords)
-        # Close map loop if start & end distance less than 500 meters
-        if calc.distance(raw_coords[0], raw_coords[-1]) < 500:
-            map_path.closeSubpath()
+        self.map_lod = MapLod(raw_coords)
+        self.map_index = MapIndex(raw_coords)
+        self.map_paths.clear()
         # Create start/finish path
         sfinish_path = self.create_sector_path(
             sfinish_path, self.ecfg["start_line_length"], 0, 1)
@@ -409,11 +409,25 @@ class MapView(QWidget):
             sector1_path, self.ecfg["sector_line_length"],
             sectors_index[1], sectors_index[1] + 1)
 
-        self.map_path = map_path
         self.sfinish_path = sfinish_path
         self.sector1_path = sector1_path
         self.sector2_path = sector1_path
 
+    def level_map_path(self) -> QPainterPath:
+        """Map path of coarsest LOD level that is accurate enough for current map scale"""
+        node_indexes = lod_indexes(self.map_lod, len(self.raw_coords), self.map_scale)
+        map_path = self.map_paths.get(len(node_indexes))
+        if map_path is None:
+            map_path = QPainterPath()
+            map_path.moveTo(*self.raw_coords[0])
+            for index in node_indexes[1:]:
+                map_path.lineTo(*self.raw_coords[index])
+            # Close map loop if start & end distance less than 500 meters
+            if calc.distance(self.raw_coords[0], self.raw_coords[-1]) < 500:
+                map_path.closeSubpath()
+            self.map_paths[len(node_indexes)] = map_path
+        return map_path
+
     def create_sector_path(self, sector_path, length, node_idx1, node_idx2):
         """Create sector line"""
         pos_x1, pos_y1, pos_x2, pos_y2 = calc.line_intersect_coords(
@@ -443,6 +457,18 @@ class MapView(QWidget):
             scale -= zoom_step
         self.spinbox_map_scale.setValue(scale)
 
+    def mouseDoubleClickEvent(self, event):
+        """Double click to seek position on map that is nearest to cursor"""
+        if event.button() != Qt.LeftButton or not self.raw_coords or self.map_index is None:
+            return
+        # Convert cursor position to raw coordinates
+        pos_x, pos_y = self.raw_coords[self.map_seek_index]
+        cursor_x = pos_x + (event.pos().x() - self.center_x) / self.map_scale
+        cursor_y = pos_y + (event.pos().y() - self.center_y) / self.map_scale
+        pos_dist = self.map_index.distance(cursor_x, cursor_y, self.raw_dists)
+        if pos_dist >= 0:
+            self.spinbox_pos_dist.setValue(round(pos_dist))
+
     def paintEvent(self, event):
         """Draw"""
         painter = QPainter(self)
@@ -527,18 +553,19 @@ class MapView(QWidget):
 
     def draw_map_image(self, painter):
         """Draw map image"""
+        map_path = self.level_map_path()
         # Draw map outline
         if self.ecfg["map_outline_width"] > 0:
             self.pen.setWidth(self.ecfg["map_width"] + self.ecfg["map_outline_width"])
             self.pen.setColor(self.ecfg["map_outline_color"])
             painter.setPen(self.pen)
-            painter.drawPath(self.map_path)
+            painter.drawPath(map_path)
 
         # Draw map
         self.pen.setWidth(self.ecfg["map_width"])
         self.pen.setColor(self.ecfg["map_color"])
         painter.setPen(self.pen)
-        painter.drawPath(self.map_path)
+        painter.drawPath(map_path)
 
         # Draw start/finish line
         self.pen.setWidth(self.ecfg["start_line_width"])
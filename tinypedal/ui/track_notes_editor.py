@@ -20,9 +20,11 @@
 Track & pace notes editor
 """
 
+from __future__ import annotations
+
 import os
 
-from PySide2.QtCore import QPoint, Qt
+from PySide2.QtCore import QModelIndex, QPoint, Qt
 from PySide2.QtWidgets import (
     QFileDialog,
     QFrame,
@@ -36,8 +38,7 @@ from PySide2.QtWidgets import (
     QPushButton,
     QSplitter,
     QStatusBar,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
 )
 
@@ -61,10 +62,10 @@ from ._common import (
     BaseEditor,
     BatchOffset,
     CompactButton,
-    FloatTableItem,
     TableBatchReplace,
     UIScaler,
 )
+from ._table_model import ColumnTableModel, TableColumn
 from .track_map_viewer import MapView
 
 DECIMALS = 2
@@ -90,7 +91,6 @@ class TrackNotesEditor(BaseEditor):
         self.notes_header = None
         self.notes_metadata = create_notes_metadata()
         self.notes_temp = []
-        self._verify_enabled = True
 
         # Set status bar
         self.status_bar = QStatusBar(self)
@@ -152,10 +152,12 @@ class TrackNotesEditor(BaseEditor):
     def set_layout_editor(self):
         """Set editor panel"""
         # Notes table
-        self.table_notes = QTableWidget(self)
+        self.notes_model = ColumnTableModel(self)
+        self.notes_model.dataChanged.connect(self.verify_input)
+        self.table_notes = QTableView(self)
+        self.table_notes.setModel(self.notes_model)
         self.table_notes.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table_notes.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
-        self.table_notes.cellChanged.connect(self.verify_input)
 
         self.table_context_menu = self.set_context_menu()
         self.table_notes.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -165,6 +167,12 @@ class TrackNotesEditor(BaseEditor):
         self.filename_entry = QLineEdit()
         self.filename_entry.setValidator(QVAL_FILENAME)
 
+        # Notes filter edit
+        self.filter_entry = QLineEdit()
+        self.filter_entry.setPlaceholderText("Filter Notes")
+        self.filter_entry.setClearButtonEnabled(True)
+        self.filter_entry.textChanged.connect(self.filter_notes)
+
         # File menu
         file_menu = QMenu(self)
 
@@ -242,7 +250,7 @@ class TrackNotesEditor(BaseEditor):
         layout_button.addWidget(button_delete)
         layout_button.addWidget(button_replace)
         layout_button.addWidget(button_offset)
-        layout_button.addStretch(1)
+        layout_button.addWidget(self.filter_entry, stretch=1)
         layout_button.addWidget(button_close)
 
         layout_editor = QVBoxLayout()
@@ -331,28 +339,36 @@ class TrackNotesEditor(BaseEditor):
 
     def refresh_table(self):
         """Refresh notes table"""
-        self.table_notes.setRowCount(0)
-        self.table_notes.setColumnCount(len(self.notes_header))
-        self.table_notes.setHorizontalHeaderLabels(self.notes_header)
+        self.notes_model.reset_table(
+            rows=(
+                [note_line[fieldname] for fieldname in self.notes_header]
+                for note_line in self.notes_temp
+            ),
+            columns=self.set_table_columns(),
+        )
+        self.table_notes.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table_notes.horizontalHeader().setSectionResizeMode(0, QHeaderView.Fixed)
         self.table_notes.setColumnWidth(0, UIScaler.size(6))
 
-        self._verify_enabled = False
-        for row_index, note_line in enumerate(self.notes_temp):
-            self.table_notes.insertRow(row_index)
-            for column_index, fieldname in enumerate(self.notes_header):
-                value = note_line[fieldname]
-                if column_index == 0:
-                    item = FloatTableItem(round(value, DECIMALS))
-                else:
-                    item = QTableWidgetItem(value)
-                self.table_notes.setItem(row_index, column_index, item)
-        self._verify_enabled = True
+    def set_table_columns(self) -> list[TableColumn]:
+        """Set table columns from notes header"""
+        columns = [TableColumn(self.notes_header[0], numeric=True, decimals=DECIMALS)]
+        for column_index, fieldname in enumerate(self.notes_header[1:], start=1):
+            if column_index == 1 and self.notes_type == NOTESTYPE_PACE:
+                # Remove invalid char (filename) from pace note column
+                columns.append(TableColumn(fieldname, parser=strip_invalid_char))
+            else:
+                columns.append(TableColumn(fieldname))
+        return columns
+
+    def filter_notes(self, text: str):
+        """Filter notes by text columns"""
+        self.notes_model.set_filter(text, range(1, len(self.notes_header)))
 
     def open_replace_dialog(self):
         """Open replace dialog"""
         selector = {name:idx for idx, name in enumerate(self.notes_header) if idx > 0}
-        _dialog = TableBatchReplace(self, selector, self.table_notes)
+        _dialog = TableBatchReplace(self, selector, self.notes_model)
         _dialog.open()
 
     def open_metadata_dialog(self):
@@ -376,17 +392,8 @@ class TrackNotesEditor(BaseEditor):
 
     def apply_batch_offset(self, offset: float, is_scale_mode: bool):
         """Apply batch offset"""
-        self._verify_enabled = False
-        for item in self.table_notes.selectedItems():
-            value = item.value()
-            if is_scale_mode:
-                value *= offset
-            else:
-                value += offset
-            item.setValue(round(value, DECIMALS))
-        self._verify_enabled = True
-        self.set_modified()
-        self.mark_positions_on_map()
+        self.notes_model.offset_values(
+            0, self.column_selection_rows(0), offset, is_scale_mode)
 
     def set_position_from_map(self):
         """Set position from map"""
@@ -408,37 +415,31 @@ class TrackNotesEditor(BaseEditor):
         if not self.confirm_operation(message=f"Set position at <b>{position}</b> {source}?"):
             return
 
-        pos_curr = round(position, DECIMALS)
-        row_index = self.table_notes.currentRow()
-        self.table_notes.item(row_index, 0).setValue(pos_curr)
-        self.mark_positions_on_map()
+        row_index = self.table_notes.currentIndex().row()
+        self.notes_model.set_value(row_index, 0, position)
         self.highlight_position_on_map()
-        self.table_notes.setCurrentCell(-1, -1)  # deselect to avoid mis-clicking
+        self.table_notes.setCurrentIndex(QModelIndex())  # deselect to avoid mis-clicking
+        self.table_notes.clearSelection()
 
     def add_notes(self):
         """Add new notes entry"""
-        self.add_table_row(
-            self.table_notes.rowCount(),
-            self.table_notes.columnCount()
-        )
+        self.add_table_row(self.notes_model.rowCount())
 
     def insert_notes(self, row_offset: int = 0):
         """Insert new notes entry"""
-        self.add_table_row(
-            self.table_notes.currentRow() + row_offset,
-            self.table_notes.columnCount()
-        )
+        self.add_table_row(max(self.table_notes.currentIndex().row() + row_offset, 0))
 
     def sort_notes(self) -> bool:
         """Sort notes by distance in ascending order"""
-        if self.table_notes.rowCount() > 1:
-            self.table_notes.sortItems(0)
+        if self.notes_model.data_row_count() > 1:
+            self.notes_model.sort(0)
             self.set_modified()
         return True
 
     def delete_notes(self):
         """Delete notes entry"""
-        selected_rows = set(data.row() for data in self.table_notes.selectedIndexes())
+        selected_rows = set(
+            data.row() for data in self.table_notes.selectionModel().selectedIndexes())
         if not selected_rows:
             QMessageBox.warning(self, "Error", "No data selected.")
             return
@@ -446,30 +447,13 @@ class TrackNotesEditor(BaseEditor):
         if not self.confirm_operation(message="<b>Delete selected rows?</b>"):
             return
 
-        for row_index in sorted(selected_rows, reverse=True):
-            self.table_notes.removeRow(row_index)
+        self.notes_model.remove_rows(selected_rows)
         self.set_modified()
         self.mark_positions_on_map()
 
     def update_notes_temp(self, table_header):
-        """Update temporary changes to notes temp"""
-        temp = (
-            {
-                fieldname: self.parse_notes(
-                    self.table_notes.item(row_index, column_index), column_index
-                )
-                for column_index, fieldname in enumerate(table_header)
-            }
-            for row_index in range(self.table_notes.rowCount())
-        )
-        self.notes_temp = list(temp)
-
-    @staticmethod
-    def parse_notes(item, index: int):
-        """Parse notes"""
-        if index == 0:
-            return round(item.value(), DECIMALS)
-        return item.text()
+        """Update temporary changes to notes temp (including filtered notes)"""
+        self.notes_temp = self.notes_model.to_records(table_header)
 
     def saving(self):
         """Save notes"""
@@ -516,24 +500,25 @@ class TrackNotesEditor(BaseEditor):
     def column_selection_count(self, column_index: int = 0) -> int:
         """Column selection count"""
         row_count = 0
-        for data in self.table_notes.selectedIndexes():
+        for data in self.table_notes.selectionModel().selectedIndexes():
             if data.column() == column_index:
                 row_count += 1
             else:
                 return 0
         return row_count
 
-    def verify_input(self, row_index: int, column_index: int):
-        """Verify input value"""
-        if self._verify_enabled:
-            self.set_modified()
-            item = self.table_notes.item(row_index, column_index)
-            if column_index == 0:
-                item.validate()
-                self.mark_positions_on_map()
-            elif column_index == 1 and self.notes_type == NOTESTYPE_PACE:
-                # Remove invalid char (filename) from pace note column
-                item.setText(strip_invalid_char(item.text()))
+    def column_selection_rows(self, column_index: int = 0) -> list[int]:
+        """Selected rows in column"""
+        return [
+            data.row() for data in self.table_notes.selectionModel().selectedIndexes()
+            if data.column() == column_index
+        ]
+
+    def verify_input(self, top_left: QModelIndex, bottom_right: QModelIndex):
+        """Verify input value (validated & parsed by table model)"""
+        self.set_modified()
+        if top_left.column() == 0:
+            self.mark_positions_on_map()
 
     def set_context_menu(self):
         """Set context menu"""
@@ -550,7 +535,7 @@ class TrackNotesEditor(BaseEditor):
 
     def open_context_menu(self, position: QPoint):
         """Open context menu"""
-        if not self.table_notes.itemAt(position):
+        if not self.table_notes.indexAt(position).isValid():
             return
 
         position += QPoint(  # position correction from header
@@ -579,16 +564,16 @@ class TrackNotesEditor(BaseEditor):
 
     def highlight_position_on_map(self):
         """Highlight selected position on map"""
-        value = self.table_notes.item(self.table_notes.currentRow(), 0).value()
+        row_index = self.table_notes.currentIndex().row()
+        if row_index < 0:
+            return
+        value = self.notes_model.value(row_index, 0)
         self.trackmap.spinbox_pos_dist.setValue(value)
         self.trackmap.update_highlighted_coords()
 
     def mark_positions_on_map(self):
         """Mark all positions on map"""
-        temp_coords = set(
-            self.table_notes.item(row_index, 0).value()
-            for row_index in range(self.table_notes.rowCount())
-        )
+        temp_coords = set(self.notes_model.column_values(0))
         self.trackmap.update_marked_coords(temp_coords)
 
     def get_track_name(self) -> str:
@@ -598,16 +583,13 @@ class TrackNotesEditor(BaseEditor):
             return self.trackmap.map_filename
         return track_name
 
-    def add_table_row(self, row_index: int, column_count: int):
+    def add_table_row(self, row_index: int):
         """Add new table row"""
-        self.table_notes.insertRow(row_index)
-        self.table_notes.setCurrentCell(row_index, 0)
-        for column_index in range(column_count):
-            if column_index == 0:
-                item = FloatTableItem(0)
-            else:
-                item = QTableWidgetItem("")
-            self.table_notes.setItem(row_index, column_index, item)
+        row_index = min(row_index, self.notes_model.rowCount())
+        self.notes_model.insert_row(row_index)
+        self.table_notes.setCurrentIndex(self.notes_model.index(row_index, 0))
+        self.set_modified()
+        self.mark_positions_on_map()
 
 
 class MetaDataEditor(BaseDialog):
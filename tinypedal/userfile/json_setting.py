@@ -22,18 +22,179 @@ Setting file function
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import shutil
+import threading
 from time import localtime, monotonic, sleep, strftime
-from typing import Callable
+from typing import Callable, NamedTuple
 
 from ..const_file import FileExt
 from ..setting_validator import PresetValidator
 
 logger = logging.getLogger(__name__)
 
+PRESET_WATCH_INTERVAL = 2  # seconds
+SPARSE_FORMAT_KEY = "__sparse_format__"
+SPARSE_FORMAT_VERSION = 1
+
+
+class CachedPreset(NamedTuple):
+    """Cached validated preset
+
+    Attributes:
+        file_key: file (modified time, size).
+        dict_def: default setting dict that used for validation.
+        dict_user: validated setting dict (do not modify).
+        reloadable: whether to reload in background if file changed, otherwise remove.
+    """
+
+    file_key: tuple[int, int]
+    dict_def: dict
+    dict_user: dict
+    reloadable: bool
+
+
+def get_file_key(filename_source: str) -> tuple[int, int] | None:
+    """Get file key (modified time, size), None if file not accessible"""
+    try:
+        file_stat = os.stat(filename_source)
+    except OSError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def parse_setting_json_file(filename_source: str, dict_def: dict) -> dict | None:
+    """Parse setting json file & verify, without fall back, None if failed"""
+    try:
+        with open(filename_source, "r", encoding="utf-8") as jsonfile:
+            setting_user = expand_sparse_setting(json.load(jsonfile), dict_def)
+        return PresetValidator.validate(setting_user, dict_def)
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError, OSError):
+        return None
+
+
+class PresetCache:
+    """Validated preset cache
+
+    Preload and validate preset files in background thread,
+    keyed by full file path, and verified by file modified time & size.
+    Watch cached files, reload changed preset, or remove changed style preset.
+    Cached setting dict is copied on access.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_cache",
+        "_pending",
+        "_event",
+        "_stopped",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cache: dict[str, CachedPreset] = {}
+        self._pending: dict[str, dict] = {}
+        self._event = threading.Event()
+        self._stopped = True
+
+    def get(self, filename_source: str, dict_def: dict) -> dict | None:
+        """Get copy of cached preset, None if not cached or file changed"""
+        with self._lock:
+            cached = self._cache.get(filename_source)
+        if cached is None or cached.dict_def is not dict_def:
+            return None
+        if cached.file_key != get_file_key(filename_source):
+            return None
+        return copy_setting(cached.dict_user)
+
+    def add(self, filename_source: str, dict_user: dict, dict_def: dict, reloadable: bool = True):
+        """Add copy of validated preset to cache"""
+        file_key = get_file_key(filename_source)
+        if file_key is None:
+            return
+        with self._lock:
+            self._cache[filename_source] = CachedPreset(
+                file_key, dict_def, copy_setting(dict_user), reloadable)
+
+    def preload(self, filename_source: str, dict_def: dict):
+        """Add preset file to background preloading queue"""
+        with self._lock:
+            self._pending[filename_source] = dict_def
+        self.start()
+
+    def clear(self):
+        """Clear cache"""
+        with self._lock:
+            self._cache.clear()
+            self._pending.clear()
+
+    def start(self):
+        """Start preloading & watching thread"""
+        if self._stopped:
+            self._stopped = False
+            self._event.clear()
+            threading.Thread(target=self.__watching, daemon=True).start()
+            logger.info("USERDATA: preset cache started")
+
+    def stop(self):
+        """Stop thread"""
+        self._event.set()
+        while not self._stopped:
+            sleep(0.01)
+
+    def __watching(self):
+        """Preload pending preset, watch & update cached preset"""
+        _event_wait = self._event.wait
+        while True:
+            self.__preload_pending()
+            self.__update_changed()
+            if _event_wait(PRESET_WATCH_INTERVAL):
+                break
+        self._stopped = True
+        logger.info("USERDATA: preset cache stopped")
+
+    def __preload_pending(self):
+        """Preload pending preset files"""
+        with self._lock:
+            pending = tuple(self._pending.items())
+            self._pending.clear()
+        for filename_source, dict_def in pending:
+            with self._lock:
+                cached = self._cache.get(filename_source)
+            if (cached is not None and cached.dict_def is dict_def
+                    and cached.file_key == get_file_key(filename_source)):
+                continue
+            self.__reload(filename_source, dict_def)
+
+    def __update_changed(self):
+        """Reload or remove cached preset if file changed"""
+        with self._lock:
+            cached_items = tuple(self._cache.items())
+        for filename_source, cached in cached_items:
+            if cached.file_key == get_file_key(filename_source):
+                continue
+            if cached.reloadable:
+                self.__reload(filename_source, cached.dict_def)
+            else:
+                with self._lock:
+                    if self._cache.get(filename_source) is cached:
+                        self._cache.pop(filename_source)
+
+    def __reload(self, filename_source: str, dict_def: dict):
+        """Parse & validate preset file, remove from cache if failed"""
+        file_key = get_file_key(filename_source)
+        dict_user = parse_setting_json_file(filename_source, dict_def)
+        with self._lock:
+            # Skip if file changed while parsing
+            if dict_user is None or file_key != get_file_key(filename_source):
+                self._cache.pop(filename_source, None)
+            else:
+                self._cache[filename_source] = CachedPreset(file_key, dict_def, dict_user, True)
+                logger.info("USERDATA: %s preloaded", os.path.basename(filename_source))
+
 
 def set_backup_timestamp(prefix: str = ".backup-", timestamp: bool = True) -> str:
     """Set backup timestamp"""
@@ -53,16 +214,65 @@ def copy_setting(dict_user: dict) -> dict:
     return dict_user.copy()
 
 
+def create_sparse_setting(dict_user: dict, dict_def: dict) -> dict:
+    """Create sparse setting that only contains values different from default
+
+    Value is considered different if either type or value is different.
+    Sparse format version header is added as first key.
+    """
+    setting_sparse = {SPARSE_FORMAT_KEY: SPARSE_FORMAT_VERSION}
+    for name, section_user in dict_user.items():
+        section_def = dict_def.get(name)
+        if not isinstance(section_user, dict) or not isinstance(section_def, dict):
+            setting_sparse[name] = section_user
+            continue
+        section_sparse = {
+            key: value for key, value in section_user.items()
+            if key not in section_def
+            or type(value) is not type(section_def[key])
+            or value != section_def[key]
+        }
+        if section_sparse:
+            setting_sparse[name] = section_sparse
+    return setting_sparse
+
+
+def expand_sparse_setting(setting_user: dict, dict_def: dict) -> dict:
+    """Expand sparse setting to full setting, return as it is if not sparse format
+
+    Raises:
+        ValueError: if sparse format version is not supported.
+    """
+    if not isinstance(setting_user, dict) or SPARSE_FORMAT_KEY not in setting_user:
+        return setting_user
+    version = setting_user.pop(SPARSE_FORMAT_KEY)
+    if version != SPARSE_FORMAT_VERSION:
+        raise ValueError(f"unsupported sparse format version: {version}")
+    setting_full = copy_setting(dict_def)
+    for name, section_user in setting_user.items():
+        section_full = setting_full.get(name)
+        if isinstance(section_user, dict) and isinstance(section_full, dict):
+            section_full.update(section_user)
+        else:
+            setting_full[name] = section_user
+    return setting_full
+
+
 def load_setting_json_file(
     filename: str, filepath: str, dict_def: dict, file_info: str = "user preset"
 ) -> dict:
     """Load setting json file & verify"""
     filename_source = f"{filepath}{filename}"
+    setting_user = preset_cache.get(filename_source, dict_def)
+    if setting_user is not None:
+        logger.info("USERDATA: %s loaded (%s, cached)", filename, file_info)
+        return setting_user
     try:
         with open(filename_source, "r", encoding="utf-8") as jsonfile:
-            setting_user = json.load(jsonfile)
+            setting_user = expand_sparse_setting(json.load(jsonfile), dict_def)
         # Verify & assign setting
         setting_user = PresetValidator.validate(setting_user, dict_def)
+        preset_cache.add(filename_source, setting_user, dict_def)
     except FileNotFoundError:
         logger.info("USERDATA: %s not found, fall back to default", filename)
         setting_user = copy_setting(dict_def)
@@ -82,6 +292,10 @@ def load_style_json_file(
 ) -> dict:
     """Load style json file & verify (optional)"""
     filename_source = f"{filepath}{filename}"
+    style_user = preset_cache.get(filename_source, dict_def)
+    if style_user is not None:
+        logger.info("USERDATA: %s loaded (%s, cached)", filename, file_info)
+        return style_user
     msg_text = "loaded"
     try:
         with open(filename_source, "r", encoding="utf-8") as jsonfile:
@@ -107,6 +321,8 @@ def load_style_json_file(
 
     if msg_text == "updated":
         save_json_file(style_user, filename, filepath)
+    # Style validation may modify file, remove from cache if changed
+    preset_cache.add(filename_source, style_user, dict_def, reloadable=False)
 
     logger.info("USERDATA: %s %s (%s)", filename, msg_text, file_info)
     return style_user
@@ -124,17 +340,29 @@ def save_json_file(
             json.dump(dict_user, jsonfile, indent=4)
 
 
-def verify_json_file(
-    dict_user: dict, filename: str, filepath: str, extension: str = ""
+def save_text_file(text: str, filename: str, filepath: str, extension: str = "") -> None:
+    """Save text file"""
+    filename_source = f"{filepath}{filename}{extension}"
+    with open(filename_source, "w", encoding="utf-8") as textfile:
+        textfile.write(text)
+
+
+def text_checksum(text: str) -> bytes:
+    """Text checksum"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def verify_text_file(
+    checksum: bytes, filename: str, filepath: str, extension: str = ""
 ) -> bool:
-    """Verify saved json file"""
+    """Verify saved text file against checksum, without parsing"""
     filename_source = f"{filepath}{filename}{extension}"
     try:
-        with open(filename_source, "r", encoding="utf-8") as jsonfile:
-            return json.load(jsonfile) == dict_user
+        with open(filename_source, "r", encoding="utf-8") as textfile:
+            return text_checksum(textfile.read()) == checksum
     except FileNotFoundError:
         logger.error("USERDATA: not found %s", filename_source)
-    except (ValueError, OSError):
+    except (UnicodeDecodeError, OSError):
         logger.error("USERDATA: unable to verify %s", filename_source)
     return False
 
@@ -221,8 +449,26 @@ def save_and_verify_json_file(
     filepath: str,
     max_attempts: int = 10,
     compact_json: bool = False,
+    dict_def: dict | None = None,
 ) -> None:
-    """Save and verify json file, backup or restore if saving failed"""
+    """Save and verify json file, backup or restore if saving failed
+
+    Args:
+        dict_user: user setting dict.
+        filename: file name.
+        filepath: file path.
+        max_attempts: max saving attempts.
+        compact_json: whether to save in compact json format.
+        dict_def: default setting dict, if set, save in sparse format
+            that only contains values different from default.
+    """
+    if dict_def is not None:
+        dict_user = create_sparse_setting(dict_user, dict_def)
+    if compact_json:
+        json_text = json.dumps(dict_user, separators=(",", ":"))
+    else:
+        json_text = json.dumps(dict_user, indent=4)
+    checksum = text_checksum(json_text)
     file_found = os.path.exists(f"{filepath}{filename}")
     # Create backup: abort saving if backup failed; skip backup and create new if not exist
     if not file_found:
@@ -234,8 +480,8 @@ def save_and_verify_json_file(
     attempts = max_attempts
     timer_start = monotonic()
     while attempts > 0:
-        save_json_file(dict_user, filename, filepath, compact_json=compact_json)
-        if verify_json_file(dict_user, filename, filepath):
+        save_text_file(json_text, filename, filepath)
+        if verify_text_file(checksum, filename, filepath):
             break
         attempts -= 1
         logger.error("USERDATA: %s failed saving, %s attempt(s) left", filename, attempts)
@@ -258,3 +504,6 @@ def save_and_verify_json_file(
         max_attempts - attempts,
         attempts,
     )
+
+
+preset_cache = PresetCache()
@@ -25,11 +25,16 @@ from __future__ import annotations
 import csv
 import logging
 import os
+import struct
+import sys
+import zlib
+from array import array
 from operator import itemgetter
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Mapping, NamedTuple
 
 from ..const_common import CRLF
-from ..const_file import FileFilter
+from ..const_file import FileExt, FileFilter
+from .json_setting import get_file_key
 
 NOTESTYPE_PACE = "Pace Notes"
 NOTESTYPE_TRACK = "Track Notes"
@@ -44,6 +49,12 @@ HEADER_TRACK_NOTES = COLUMN_DISTANCE, COLUMN_TRACKNOTE, COLUMN_COMMENT
 
 METADATA_FIELDNAMES = "TITLE", "AUTHOR", "DATE", "DESCRIPTION"
 
+# Compiled notes cache
+CACHE_MAGIC = b"TPNC"
+CACHE_VERSION = 1
+# magic, version, source modified time, source size, header checksum, notes count, strings count
+CACHE_HEADER = struct.Struct("<4sIqqIII")
+
 logger = logging.getLogger(__name__)
 
 
@@ -187,6 +198,159 @@ def load_notes_file(
     return None
 
 
+class CompiledNotes(NamedTuple):
+    """Compiled notes
+
+    Attributes:
+        distances: sorted note distance array.
+        notes: note dict for each distance, same string values are shared (interned).
+    """
+
+    distances: array
+    notes: tuple[Mapping[str, float | str], ...]
+
+
+def compile_notes(dataset: list[Mapping], table_header: tuple[str, ...]) -> CompiledNotes:
+    """Compile parsed (sorted) notes, keep only table header columns"""
+    column_key = table_header[0]
+    column_text = table_header[1:]
+    distances = array("d", (note_line[column_key] for note_line in dataset))
+    notes = tuple(
+        {
+            column_key: distance,
+            **{key: sys.intern(str(note_line.get(key, ""))) for key in column_text},
+        }
+        for distance, note_line in zip(distances, dataset)
+    )
+    return CompiledNotes(distances, notes)
+
+
+def pack_compiled_notes(
+    compiled: CompiledNotes, table_header: tuple[str, ...], file_key: tuple[int, int]) -> bytes:
+    """Pack compiled notes to binary cache
+
+    Layout: header, distances (double), string IDs (uint32, per note per text column),
+    string lengths (uint32), utf-8 string data.
+    """
+    string_ids: dict[str, int] = {}
+    id_list = array("I", (
+        string_ids.setdefault(note_line[key], len(string_ids))
+        for note_line in compiled.notes
+        for key in table_header[1:]
+    ))
+    encoded = [string.encode("utf-8") for string in string_ids]
+    lengths = array("I", map(len, encoded))
+    header = CACHE_HEADER.pack(
+        CACHE_MAGIC, CACHE_VERSION, *file_key, header_checksum(table_header),
+        len(compiled.notes), len(encoded))
+    return b"".join((
+        header,
+        to_little_endian(compiled.distances),
+        to_little_endian(id_list),
+        to_little_endian(lengths),
+        *encoded,
+    ))
+
+
+def unpack_compiled_notes(
+    data: bytes, table_header: tuple[str, ...], file_key: tuple[int, int]) -> CompiledNotes | None:
+    """Unpack compiled notes from binary cache, None if outdated or invalid"""
+    if len(data) < CACHE_HEADER.size:
+        return None
+    magic, version, mtime, size, checksum, notes_count, strings_count = CACHE_HEADER.unpack_from(data)
+    if (magic != CACHE_MAGIC or version != CACHE_VERSION or (mtime, size) != file_key
+            or checksum != header_checksum(table_header)):
+        return None
+    column_key = table_header[0]
+    column_text = table_header[1:]
+    offset = CACHE_HEADER.size
+    distances = from_little_endian("d", data, offset, notes_count)
+    offset += distances.itemsize * notes_count
+    id_list = from_little_endian("I", data, offset, notes_count * len(column_text))
+    offset += id_list.itemsize * len(id_list)
+    lengths = from_little_endian("I", data, offset, strings_count)
+    offset += lengths.itemsize * strings_count
+    strings = []
+    for length in lengths:
+        strings.append(sys.intern(data[offset:offset + length].decode("utf-8")))
+        offset += length
+    if offset != len(data):
+        return None
+    text_count = len(column_text)
+    notes = tuple(
+        {
+            column_key: distance,
+            **{key: strings[id_list[index * text_count + column]]
+               for column, key in enumerate(column_text)},
+        }
+        for index, distance in enumerate(distances)
+    )
+    return CompiledNotes(distances, notes)
+
+
+def header_checksum(table_header: tuple[str, ...]) -> int:
+    """Table header checksum"""
+    return zlib.crc32(",".join(table_header).encode("utf-8"))
+
+
+def to_little_endian(data: array) -> bytes:
+    """Convert array to little-endian bytes"""
+    if sys.byteorder != "little":
+        data = array(data.typecode, data)
+        data.byteswap()
+    return data.tobytes()
+
+
+def from_little_endian(typecode: str, data: bytes, offset: int, count: int) -> array:
+    """Create array from little-endian bytes"""
+    output = array(typecode)
+    end = offset + output.itemsize * count
+    if end > len(data):
+        raise ValueError("truncated notes cache")
+    output.frombytes(data[offset:end])
+    if sys.byteorder != "little":
+        output.byteswap()
+    return output
+
+
+def load_compiled_notes_file(
+    filepath: str, filename: str, table_header: tuple[str, ...],
+    extension: str = "") -> CompiledNotes | None:
+    """Load compiled notes from cache file, or parse notes file and update cache
+
+    Cache file is saved next to notes file, and is only valid for same notes file
+    (modified time & size) and table header. None if no valid notes.
+    """
+    filename_full = f"{filepath}{filename}{extension}"
+    filename_cache = f"{filename_full}{FileExt.CACHE}"
+    file_key = get_file_key(filename_full)
+    if file_key is not None:
+        try:
+            with open(filename_cache, "rb") as cache_file:
+                compiled = unpack_compiled_notes(cache_file.read(), table_header, file_key)
+            if compiled is not None:
+                return compiled
+        except (UnicodeDecodeError, ValueError, OSError):
+            pass
+
+    notes = load_notes_file(
+        filepath=filepath,
+        filename=filename,
+        table_header=table_header,
+        parser=parse_csv_notes_only,
+        extension=extension,
+    )
+    if not notes or file_key is None:
+        return None
+    compiled = compile_notes(notes, table_header)
+    try:
+        with open(filename_cache, "wb") as cache_file:
+            cache_file.write(pack_compiled_notes(compiled, table_header, file_key))
+    except OSError:
+        logger.info("USERDATA: failed saving track notes (%s) cache", extension)
+    return compiled
+
+
 def write_csv_notes(
     notes_file: Any, table_header: tuple, dataset: list, metadata: dict, _: str):
     """Write TinyPedal notes format to file"""
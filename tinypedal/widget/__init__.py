@@ -19,9 +19,11 @@
 """
 Widget modules
 
-Add new widget to import list below in ascending order,
+Add new widget to name list below in ascending order,
 file name must match corresponding key name
 in template/setting_widget.py dictionary.
+
+Widgets are imported on demand by module_control when first enabled.
 """
 
 __all__ = [
@@ -87,5 +89,3 @@ __all__ = [
     "weather_forecast",
     "wheel_alignment",
 ]
-
-from . import *
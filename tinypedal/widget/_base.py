@@ -24,7 +24,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from PySide2.QtCore import QBasicTimer, Qt, Slot
+from PySide2.QtCore import QBasicTimer, QRect, QRectF, Qt, Slot
 from PySide2.QtGui import QFont, QFontMetrics, QPalette, QPixmap
 from PySide2.QtWidgets import QGridLayout, QLabel, QLayout, QMenu, QWidget
 
@@ -34,6 +34,7 @@ from ..formatter import format_module_name
 from ..overlay_control import octrl
 from ..setting import Setting
 from ._common import ExLabel, FontMetrics, MousePosition
+from ._painter import device_pixel, dirty_region, span_rect
 
 mousepos = MousePosition()  # single instance shared by all widgets
 
@@ -89,8 +90,10 @@ class Overlay(QWidget):
         """Unload resource (such as images) on close, can re-implement in widget"""
         instance_var_list = dir(self)
         for var in instance_var_list:
-            if var.startswith("pixmap_"):  # unload all pixmap instance
+            if var.startswith("pixmap_") or var.startswith("image_"):  # unload all pixmap, image instance
                 setattr(self, var, None)
+            elif var.startswith("renderer_"):  # cancel pending render
+                getattr(self, var).cancel()
 
     def __set_window_attributes(self):
         """Set window attributes"""
@@ -223,6 +226,37 @@ class Overlay(QWidget):
             event.ignore()
 
     # Common GUI methods
+    def quantize_pixel(self, value: float) -> float:
+        """Quantize logical position to device pixel
+
+        Compare quantized position with last position to skip repaint
+        if value change is not visible on screen.
+        """
+        return device_pixel(value, self.devicePixelRatioF())
+
+    def update_span(
+        self,
+        pos_last: float,
+        pos: float,
+        bounds: QRectF | None = None,
+        *rects: QRect | QRectF,
+        margin: float = 1,
+        vertical: bool = False,
+    ):
+        """Repaint changed span between last & current position, instead of whole widget
+
+        Args:
+            pos_last: last (quantized) position in pixel.
+            pos: current (quantized) position in pixel.
+            bounds: bar rect that limits span on cross axis, default whole widget.
+            rects: extra changed rects to repaint, such as readings.
+            margin: extra pixels on both ends of span (line width & antialiasing).
+            vertical: whether bar axis is vertical.
+        """
+        if bounds is None:
+            bounds = QRectF(self.rect())
+        self.update(dirty_region(span_rect(pos_last, pos, bounds, margin, vertical), *rects))
+
     def config_font(self, name: str = "", size: int = 1, weight: str = "") -> QFont:
         """Config font
 
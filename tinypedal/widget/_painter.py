@@ -22,12 +22,21 @@ Overlay base painter class.
 
 from __future__ import annotations
 
-from PySide2.QtCore import QRectF, Qt
-from PySide2.QtGui import QFont, QPainter, QPen, QPixmap
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable
+
+from PySide2.QtCore import QRect, QRectF, Qt
+from PySide2.QtGui import QColor, QFont, QImage, QPainter, QPen, QPixmap, QRegion
 from PySide2.QtWidgets import QWidget
 
 from ..const_common import GEAR_SEQUENCE
 
+MAX_RENDER_WORKERS = 2
+
+logger = logging.getLogger(__name__)
+_render_pool: ThreadPoolExecutor | None = None
+
 
 def split_pixmap_icon(
     pixmap_icon: QPixmap, icon_size: int, h_offset: int = 0, v_offset: int = 0) -> QPixmap:
@@ -39,6 +48,128 @@ def split_pixmap_icon(
     return pixmap
 
 
+def create_image(width: int, height: int, fill: Any = Qt.transparent) -> QImage:
+    """Create filled image for painting outside GUI thread (QPixmap is GUI thread only)"""
+    image = QImage(max(width, 1), max(height, 1), QImage.Format_ARGB32_Premultiplied)
+    image.fill(QColor(fill) if isinstance(fill, str) else fill)
+    return image
+
+
+def render_pool() -> ThreadPoolExecutor:
+    """Shared render worker thread pool, created on first use"""
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = ThreadPoolExecutor(
+            max_workers=MAX_RENDER_WORKERS, thread_name_prefix="TinyPedal render")
+    return _render_pool
+
+
+class ImageRenderer:
+    """Off GUI thread image renderer
+
+    Run render function on shared worker thread pool, render function must only
+    paint into QImage (or build QPainterPath), and must not modify widget state.
+    Each render is tagged with a key (such as map last modified time & size),
+    widget polls finished result from GUI thread, then swaps result in.
+    Result of stale render (superseded by newer key) is discarded.
+    """
+
+    __slots__ = (
+        "_key",
+        "_future",
+    )
+
+    def __init__(self):
+        self._key: Hashable = None
+        self._future: Future | None = None
+
+    def submit(self, key: Hashable, render: Callable[..., Any], *args: Any):
+        """Submit render job, skip if render with same key is pending or finished
+
+        Args:
+            key: render tag.
+            render: render function.
+            args: render function arguments.
+        """
+        if self._key == key:
+            return
+        if self._future is not None:
+            self._future.cancel()  # discard stale render
+        self._key = key
+        self._future = render_pool().submit(render, *args)
+
+    def take(self) -> Any | None:
+        """Take finished render result (GUI thread only)
+
+        Returns:
+            Render result, or None if not finished or failed.
+        """
+        future = self._future
+        if future is None or not future.done():
+            return None
+        self._future = None
+        if future.cancelled():
+            return None
+        error = future.exception()
+        if error is not None:
+            logger.error("RENDER: failed to render image: %s", error)
+            return None
+        return future.result()
+
+    def cancel(self):
+        """Cancel pending render"""
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+        self._key = None
+
+
+def device_pixel(value: float, ratio: float = 1.0) -> float:
+    """Quantize logical position to device pixel
+
+    Args:
+        value: logical position in pixel.
+        ratio: device pixel ratio of widget.
+
+    Returns:
+        Logical position aligned to nearest device pixel.
+    """
+    return round(value * ratio) / ratio
+
+
+def span_rect(
+    pos_last: float, pos: float, bounds: QRectF, margin: float = 1, vertical: bool = False) -> QRect:
+    """Changed span between last & current position along bar axis
+
+    Args:
+        pos_last: last position in pixel.
+        pos: current position in pixel.
+        bounds: bar rect that limits span on cross axis.
+        margin: extra pixels on both ends (line width & antialiasing).
+        vertical: whether bar axis is vertical.
+
+    Returns:
+        Pixel aligned span rect.
+    """
+    if pos_last > pos:
+        pos_last, pos = pos, pos_last
+    if vertical:
+        rect = QRectF(bounds.left(), pos_last - margin, bounds.width(), pos - pos_last + margin * 2)
+    else:
+        rect = QRectF(pos_last - margin, bounds.top(), pos - pos_last + margin * 2, bounds.height())
+    return rect.toAlignedRect()
+
+
+def dirty_region(*rects: QRect | QRectF) -> QRegion:
+    """Combine changed rects into update region"""
+    region = QRegion()
+    for rect in rects:
+        if isinstance(rect, QRectF):
+            rect = rect.toAlignedRect()
+        region = region.united(rect)
+    return region
+
+
 class WheelGaugeBar(QWidget):
     """Wheel gauge bar"""
 
@@ -159,21 +290,48 @@ class PedalInputBar(QWidget):
         self.setFixedSize(pedal_size[2], pedal_size[3])
 
     def update_input(self, input_raw: float, input_filtered: float):
-        """Update input value - horizontal style"""
-        self.input_reading = max(input_raw, input_filtered) * 100
+        """Update input value, repaint changed area only"""
+        input_reading = round(max(input_raw, input_filtered) * 100)
+        ratio = self.devicePixelRatioF()
+        if self.horizontal_style:
+            scaled_raw = device_pixel(self.__scale_horizontal(input_raw), ratio)
+            scaled_filtered = device_pixel(self.__scale_horizontal(input_filtered), ratio)
+            last_raw = self.rect_raw.right()
+            last_filtered = self.rect_filtered.right()
+            is_maxed = scaled_raw >= self.pedal_length
+        else:
+            scaled_raw = device_pixel(self.__scale_vertical(input_raw), ratio)
+            scaled_filtered = device_pixel(self.__scale_vertical(input_filtered), ratio)
+            last_raw = self.rect_raw.top()
+            last_filtered = self.rect_filtered.top()
+            is_maxed = scaled_raw <= self.pedal_extend
+
+        # Skip if no visible change
+        changed_reading = self.show_reading and self.input_reading != input_reading
+        changed_maxed = self.is_maxed != is_maxed
+        if (last_raw == scaled_raw and last_filtered == scaled_filtered
+            and not changed_reading and not changed_maxed):
+            return
+
+        self.input_reading = input_reading
+        self.is_maxed = is_maxed
         if self.horizontal_style:
-            scaled_raw = self.__scale_horizontal(input_raw)
-            scaled_filtered = self.__scale_horizontal(input_filtered)
             self.rect_raw.setRight(scaled_raw)
             self.rect_filtered.setRight(scaled_filtered)
-            self.is_maxed = scaled_raw >= self.pedal_length
         else:
-            scaled_raw = self.__scale_vertical(input_raw)
-            scaled_filtered = self.__scale_vertical(input_filtered)
             self.rect_raw.setTop(scaled_raw)
             self.rect_filtered.setTop(scaled_filtered)
-            self.is_maxed = scaled_raw <= self.pedal_extend
-        self.update()
+
+        vertical = not self.horizontal_style
+        rects = [
+            span_rect(last_raw, scaled_raw, self.rect_raw, vertical=vertical),
+            span_rect(last_filtered, scaled_filtered, self.rect_filtered, vertical=vertical),
+        ]
+        if changed_reading:
+            rects.append(self.rect_text)
+        if changed_maxed:
+            rects.append(self.rect_max)
+        self.update(dirty_region(*rects))
 
     def __scale_horizontal(self, input_value: float) -> float:
         """Scale input - horizontal style"""
@@ -218,6 +376,7 @@ class ProgressBar(QWidget):
         super().__init__(parent)
         self.last = -1
         self.input_reading = 0.0
+        self.last_color = input_color
         if show_reading:
             height = max(font.pixelSize(), height)
             self.setFont(font)
@@ -236,13 +395,41 @@ class ProgressBar(QWidget):
         self.setFixedSize(width, height)
 
     def update_input(self, input_value: float, input_reading: float):
-        """Update input"""
+        """Update input, repaint changed area only"""
+        ratio = self.devicePixelRatioF()
+        if self.right_side:
+            last_pos = self.rect_input.left()
+            pos = device_pixel((1 - input_value) * self.bar_width, ratio)
+        else:
+            last_pos = self.rect_input.right()
+            pos = device_pixel(input_value * self.bar_width, ratio)
+        changed_reading = self.show_reading and (
+            round(self.input_reading, self.decimals) != round(input_reading, self.decimals))
         self.input_reading = input_reading
+
+        # Repaint all if color changed
+        if self.last_color != self.input_color:
+            self.last_color = self.input_color
+            self.__set_position(pos)
+            self.update()
+            return
+
+        # Skip if no visible change
+        if last_pos == pos and not changed_reading:
+            return
+
+        self.__set_position(pos)
+        if changed_reading:
+            self.update(dirty_region(span_rect(last_pos, pos, self.rect_bar), self.rect_text))
+        else:
+            self.update(span_rect(last_pos, pos, self.rect_bar))
+
+    def __set_position(self, pos: float):
+        """Set input position"""
         if self.right_side:
-            self.rect_input.setLeft((1 - input_value) * self.bar_width)
+            self.rect_input.setLeft(pos)
         else:
-            self.rect_input.setRight(input_value * self.bar_width)
-        self.update()
+            self.rect_input.setRight(pos)
 
     def paintEvent(self, event):
         """Draw"""
@@ -287,11 +474,30 @@ class FuelLevelBar(QWidget):
         self.setFixedSize(width, height)
 
     def update_input(self, input_value: float, start_value: float, refill_value: float):
-        """Update input"""
-        self.rect_input.setRight(input_value * self.bar_width)
-        self.rect_start.moveLeft(start_value * self.bar_width)
-        self.rect_refuel.moveLeft(refill_value * self.bar_width)
-        self.update()
+        """Update input, repaint changed area only"""
+        ratio = self.devicePixelRatioF()
+        pos_input = device_pixel(input_value * self.bar_width, ratio)
+        pos_start = device_pixel(start_value * self.bar_width, ratio)
+        pos_refuel = device_pixel(refill_value * self.bar_width, ratio)
+        last_input = self.rect_input.right()
+        last_start = self.rect_start.left()
+        last_refuel = self.rect_refuel.left()
+        # Skip if no visible change
+        if last_input == pos_input and last_start == pos_start and last_refuel == pos_refuel:
+            return
+        self.rect_input.setRight(pos_input)
+        self.rect_start.moveLeft(pos_start)
+        self.rect_refuel.moveLeft(pos_refuel)
+        # Marks: repaint both old & new mark area
+        start_width = self.rect_start.width()
+        refuel_width = self.rect_refuel.width()
+        self.update(dirty_region(
+            span_rect(last_input, pos_input, self.rect_bar),
+            span_rect(last_start, last_start + start_width, self.rect_bar),
+            span_rect(pos_start, pos_start + start_width, self.rect_bar),
+            span_rect(last_refuel, last_refuel + refuel_width, self.rect_bar),
+            span_rect(pos_refuel, pos_refuel + refuel_width, self.rect_bar),
+        ))
 
     def paintEvent(self, event):
         """Draw"""
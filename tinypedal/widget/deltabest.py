@@ -93,8 +93,12 @@ class Realtime(Overlay):
 
         # Last data
         self.delta_best = 0
+        self.delta_text = ""
+        self.delta_pos = self.dbar_length
+        self.is_loss = False
         self.last_laptime = 0
         self.new_lap = True
+        self.update_delta(0)
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
@@ -110,24 +114,29 @@ class Realtime(Overlay):
 
         if self.delta_best != temp_best:
             self.delta_best = temp_best
-            self.update()
+            self.update_delta(temp_best)
 
     # GUI update methods
-    def paintEvent(self, event):
-        """Draw"""
-        painter = QPainter(self)
-        delta_pos = self.delta_position(
+    def update_delta(self, delta_best):
+        """Delta best update, repaint changed area only"""
+        delta_text = f"{calc.sym_max(delta_best, self.delta_display_range):+.{self.decimals}f}"[:self.max_padding]
+        delta_pos = self.quantize_pixel(self.delta_position(
             self.wcfg["bar_display_range"],
-            self.delta_best,
-            self.dbar_length)
-        highlight_color = self.delta_color[self.delta_best > 0]
+            delta_best,
+            self.dbar_length))
+        is_loss = delta_best > 0
+
+        # Skip if no visible change
+        if self.delta_text == delta_text and self.delta_pos == delta_pos and self.is_loss == is_loss:
+            return
+
+        last_pos = self.delta_pos
+        last_rect_delta = self.rect_delta.toAlignedRect()
+        self.delta_text = delta_text
+        self.delta_pos = delta_pos
 
-        # Draw deltabar
         if self.wcfg["show_delta_bar"]:
             self.rect_deltapos.setLeft(delta_pos)
-            painter.fillRect(self.rect_deltabar, self.wcfg["bkg_color_deltabar"])
-            painter.fillRect(self.rect_deltapos, highlight_color)
-
             if self.wcfg["show_animated_deltabest"]:
                 pos_x = calc.zero_max(
                     delta_pos - self.delta_width * 0.5,
@@ -136,6 +145,26 @@ class Realtime(Overlay):
                 self.rect_delta.moveLeft(pos_x)
                 self.rect_text_delta.moveLeft(pos_x)
 
+        # Repaint all if highlight color changed
+        if self.is_loss != is_loss:
+            self.is_loss = is_loss
+            self.update()
+        elif self.wcfg["show_delta_bar"]:
+            self.update_span(
+                last_pos, delta_pos, self.rect_deltabar, last_rect_delta, self.rect_delta)
+        else:
+            self.update(self.rect_delta.toAlignedRect())
+
+    def paintEvent(self, event):
+        """Draw"""
+        painter = QPainter(self)
+        highlight_color = self.delta_color[self.is_loss]
+
+        # Draw deltabar
+        if self.wcfg["show_delta_bar"]:
+            painter.fillRect(self.rect_deltabar, self.wcfg["bkg_color_deltabar"])
+            painter.fillRect(self.rect_deltapos, highlight_color)
+
         # Draw delta readings
         if self.wcfg["swap_style"]:
             self.pen_text.setColor(self.wcfg["bkg_color_deltabest"])
@@ -146,11 +175,7 @@ class Realtime(Overlay):
 
         painter.fillRect(self.rect_delta, bg_color)
         painter.setPen(self.pen_text)
-        painter.drawText(
-            self.rect_text_delta,
-            Qt.AlignCenter,
-            f"{calc.sym_max(self.delta_best, self.delta_display_range):+.{self.decimals}f}"[:self.max_padding]
-        )
+        painter.drawText(self.rect_text_delta, Qt.AlignCenter, self.delta_text)
 
     # Additional methods
     @staticmethod
@@ -21,13 +21,15 @@ Elevation Widget
 """
 
 from PySide2.QtCore import QRectF, Qt
-from PySide2.QtGui import QBrush, QPainter, QPainterPath, QPen, QPixmap
+from PySide2.QtGui import QBrush, QPainter, QPainterPath, QPen
 
 from .. import calculation as calc
 from ..api_control import api
+from ..map_geometry import lod_indexes
 from ..module_info import minfo
 from ..units import set_symbol_distance, set_unit_distance
 from ._base import Overlay
+from ._painter import ImageRenderer, create_image
 
 
 class Realtime(Overlay):
@@ -75,65 +77,81 @@ class Realtime(Overlay):
 
         # Config canvas
         self.resize(self.display_width, self.display_height)
-        self.pixmap_background = QPixmap(self.display_width, self.display_height)
-        self.pixmap_progress = QPixmap(self.display_width, self.display_height)
-        self.pixmap_progress_line = QPixmap(self.display_width, self.display_height)
-        self.pixmap_marks = QPixmap(self.display_width, self.display_height)
+        self.renderer_map = ImageRenderer()
 
         self.pen_mark = QPen()
         self.pen_mark.setWidth(self.wcfg["position_mark_width"])
+        self.mark_margin = max(self.wcfg["position_mark_width"], 0) * 0.5 + 1
         self.pen_mark.setColor(self.wcfg["position_mark_color"])
         self.pen_text = QPen()
         self.pen_text.setColor(self.wcfg["font_color"])
 
         # Last data
-        self.last_modified = 0
+        self.last_modified = -1
         self.veh_pos = 0
+        self.image_background = None
+        self.image_progress = None
+        self.image_progress_line = None
+        self.image_marks = None
         self.map_scaled = None
         self.map_range = (0,10,0,10)
         self.map_scale = 1,1
 
-        self.update_elevation(-1)
+        # Temp map
+        self.swap_elevation(self.render_elevation(None, None, None))
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         # Elevation map
         modified = minfo.mapping.lastModified
         self.update_elevation(modified)
+        self.swap_elevation(self.renderer_map.take())
 
-        # Vehicle position
-        temp_veh_pos = self.display_width * api.read.lap.progress()
+        # Vehicle position, repaint changed span & reading only
+        temp_veh_pos = self.quantize_pixel(self.display_width * api.read.lap.progress())
         if self.veh_pos != temp_veh_pos:
+            last_veh_pos = self.veh_pos
             self.veh_pos = temp_veh_pos
-            self.update()
+            if self.wcfg["show_elevation_reading"]:
+                self.update_span(
+                    last_veh_pos, temp_veh_pos, None, self.rect_text_elevation,
+                    margin=self.mark_margin)
+            else:
+                self.update_span(last_veh_pos, temp_veh_pos, margin=self.mark_margin)
 
     # GUI update methods
     def update_elevation(self, data):
-        """Elevation map update"""
+        """Elevation map update, render map images in worker thread"""
         if self.last_modified != data:
             self.last_modified = data
             raw_data = minfo.mapping.elevations if data != -1 else None
-            map_path = self.create_elevation_path(raw_data)
-            self.draw_background(map_path)
-            self.draw_progress(map_path)
-            self.draw_progress_line(map_path)
-            self.draw_marks(map_path)
+            self.renderer_map.submit(
+                (data, self.display_width, self.display_height),
+                self.render_elevation, raw_data, minfo.mapping.sectors, minfo.mapping.elevationsLod)
+
+    def swap_elevation(self, result):
+        """Swap in rendered map images & map data"""
+        if result is None:
+            return
+        (self.image_background, self.image_progress, self.image_progress_line, self.image_marks,
+         self.map_scaled, self.map_range, self.map_scale) = result
+        self.update()
 
     def paintEvent(self, event):
         """Draw"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing, True)
-        painter.drawPixmap(0, 0, self.pixmap_background)
+        painter.drawImage(0, 0, self.image_background)
 
         # Draw elevation progress
         if self.wcfg["show_elevation_progress"]:
-            painter.drawPixmap(0, 0, self.pixmap_progress, 0, 0, self.veh_pos, 0)
+            painter.drawImage(0, 0, self.image_progress, 0, 0, self.veh_pos, 0)
 
         # Draw marks
-        painter.drawPixmap(0, 0, self.pixmap_marks)
+        painter.drawImage(0, 0, self.image_marks)
 
         if self.wcfg["show_elevation_progress_line"]:
-            painter.drawPixmap(0, 0, self.pixmap_progress_line, 0, 0, self.veh_pos, 0)
+            painter.drawImage(0, 0, self.image_progress_line, 0, 0, self.veh_pos, 0)
 
         if self.wcfg["show_position_mark"]:
             painter.setPen(self.pen_mark)
@@ -156,68 +174,89 @@ class Realtime(Overlay):
                 f"1:{map_scale}"
             )
 
-    def create_elevation_path(self, raw_coords=None):
-        """Create elevation path"""
+    def render_elevation(self, raw_coords, sectors_index, map_lod):
+        """Render map images (worker thread)
+
+        Returns:
+            Background, progress, progress line, marks images,
+            scaled map coordinates, map range, scale.
+        """
+        map_path, map_data = self.create_elevation_path(raw_coords, map_lod)
+        return (
+            self.draw_background(map_path, map_data[0]),
+            self.draw_progress(map_path, map_data[0]),
+            self.draw_progress_line(map_path, map_data[0]),
+            self.draw_marks(map_path, map_data, sectors_index),
+            *map_data,
+        )
+
+    def create_elevation_path(self, raw_coords=None, map_lod=None):
+        """Create elevation path from coarsest map LOD level that is accurate enough for map scale
+
+        Returns:
+            Map path, map data (scaled map coordinates, map range, scale).
+        """
         map_path = QPainterPath()
         if raw_coords:
-            self.map_scaled, self.map_range, self.map_scale = calc.scale_elevation(
+            map_scaled, map_range, map_scale = calc.scale_elevation(
                 raw_coords,
                 self.display_width,
                 self.display_height - self.display_margin_top - self.display_margin_bottom)
 
             # Correct start & finish nodes position
-            sf_y_average = (self.map_scaled[0][1] + self.map_scaled[-1][1]) * 0.5
+            sf_y_average = (map_scaled[0][1] + map_scaled[-1][1]) * 0.5
 
             # Set boundary start node
-            map_path.moveTo(-999, self.map_scaled[-2][1])  # 2nd last node y pos
+            map_path.moveTo(-999, map_scaled[-2][1])  # 2nd last node y pos
 
             # Set middle nodes
-            total_nodes = len(self.map_scaled) - 1
-            skip_node = calc.skip_map_nodes(total_nodes, self.display_width, self.display_detail_level)
+            total_nodes = len(map_scaled) - 1
+            node_indexes = lod_indexes(  # scale distance & elevation with larger scale
+                map_lod, len(map_scaled), max(map_scale), self.display_detail_level)
             last_dist = 0
-            last_skip = 0
-            for index, coords in enumerate(self.map_scaled):
+            for index in node_indexes:
+                coords = map_scaled[index]
                 if index == 0:
                     map_path.lineTo(0, sf_y_average)
-                elif index >= total_nodes:  # don't skip last node
+                elif index >= total_nodes:  # last node
                     map_path.lineTo(self.display_width, sf_y_average)
-                elif coords[0] > last_dist and last_skip >= skip_node:
+                elif coords[0] > last_dist:
                     map_path.lineTo(*coords)
-                    last_skip = 0
                     last_dist = coords[0]
-                last_skip += 1
 
             # Set boundary end node
-            map_path.lineTo(self.display_width + 999, self.map_scaled[1][1])  # 2nd node y pos
+            map_path.lineTo(self.display_width + 999, map_scaled[1][1])  # 2nd node y pos
             map_path.lineTo(self.display_width + 999, -999)
             map_path.lineTo(-999, -999)
             map_path.closeSubpath()
 
         # Temp map
         else:
-            self.map_scaled = None
+            map_scaled = None
+            map_range = (0,10,0,10)
+            map_scale = 1,1
             map_path.moveTo(-999, self.display_height * 0.5)
             map_path.lineTo(self.display_width + 999, self.display_height * 0.5)
             map_path.lineTo(self.display_width + 999, -999)
             map_path.lineTo(-999, -999)
             map_path.closeSubpath()
 
-        return map_path
+        return map_path, (map_scaled, map_range, map_scale)
 
-    def draw_background(self, map_path):
+    def draw_background(self, map_path, map_scaled):
         """Draw background image"""
         if self.wcfg["show_background"]:
-            self.pixmap_background.fill(self.wcfg["bkg_color"])
+            image = create_image(self.display_width, self.display_height, self.wcfg["bkg_color"])
         else:
-            self.pixmap_background.fill(Qt.transparent)
-        painter = QPainter(self.pixmap_background)
+            image = create_image(self.display_width, self.display_height)
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
         # Set vertical flip to correct elevation direction
         painter.setViewport(0, self.display_height, self.display_width, -self.display_height)
 
         # Add margin offset
-        if self.map_scaled:
+        if map_scaled:
             painter.translate(0, self.display_margin_bottom)
 
         # Draw elevation background
@@ -227,18 +266,20 @@ class Realtime(Overlay):
             painter.setBrush(brush)
             painter.setPen(Qt.NoPen)
             painter.drawPath(map_path)
+        painter.end()
+        return image
 
-    def draw_progress(self, map_path):
+    def draw_progress(self, map_path, map_scaled):
         """Draw progress image"""
-        self.pixmap_progress.fill(Qt.transparent)
-        painter = QPainter(self.pixmap_progress)
+        image = create_image(self.display_width, self.display_height)
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
         # Set vertical flip to correct elevation direction
         painter.setViewport(0, self.display_height, self.display_width, -self.display_height)
 
         # Add margin offset
-        if self.map_scaled:
+        if map_scaled:
             painter.translate(0, self.display_margin_bottom)
 
         # Draw elevation progress
@@ -247,18 +288,20 @@ class Realtime(Overlay):
         painter.setBrush(brush)
         painter.setPen(Qt.NoPen)
         painter.drawPath(map_path)
+        painter.end()
+        return image
 
-    def draw_progress_line(self, map_path):
+    def draw_progress_line(self, map_path, map_scaled):
         """Draw progress line image"""
-        self.pixmap_progress_line.fill(Qt.transparent)
-        painter = QPainter(self.pixmap_progress_line)
+        image = create_image(self.display_width, self.display_height)
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
         # Set vertical flip to correct elevation direction
         painter.setViewport(0, self.display_height, self.display_width, -self.display_height)
 
         # Add margin offset
-        if self.map_scaled:
+        if map_scaled:
             painter.translate(0, self.display_margin_bottom)
 
         # Draw elevation progress line
@@ -268,18 +311,21 @@ class Realtime(Overlay):
         pen.setColor(self.wcfg["elevation_progress_line_color"])
         painter.setPen(pen)
         painter.drawPath(map_path)
+        painter.end()
+        return image
 
-    def draw_marks(self, map_path):
+    def draw_marks(self, map_path, map_data, sectors_index):
         """Draw marks image"""
-        self.pixmap_marks.fill(Qt.transparent)
-        painter = QPainter(self.pixmap_marks)
+        map_scaled, map_range, map_scale = map_data
+        image = create_image(self.display_width, self.display_height)
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
         # Set vertical flip to correct elevation direction
         painter.setViewport(0, self.display_height, self.display_width, -self.display_height)
 
         # Add margin offset
-        if self.map_scaled:
+        if map_scaled:
             painter.translate(0, self.display_margin_bottom)
 
         # Set pen style
@@ -302,20 +348,21 @@ class Realtime(Overlay):
             painter.drawLine(self.display_width, -999, self.display_width, 999)
 
         # Draw sector line
-        sectors_index = minfo.mapping.sectors
-        if self.wcfg["show_sector_line"] and self.map_scaled and isinstance(sectors_index, tuple):
+        if self.wcfg["show_sector_line"] and map_scaled and isinstance(sectors_index, tuple):
             pen.setWidth(self.wcfg["sector_line_width"])
             pen.setColor(self.wcfg["sector_line_color"])
             painter.setPen(pen)
             for index in sectors_index:
-                pos_x = self.map_scaled[index][0]
+                pos_x = map_scaled[index][0]
                 painter.drawLine(pos_x, -999, pos_x, 999)
 
         # Draw zero elevation line
-        if self.wcfg["show_zero_elevation_line"] and self.map_scaled:
+        if self.wcfg["show_zero_elevation_line"] and map_scaled:
             pen.setWidth(self.wcfg["zero_elevation_line_width"])
             pen.setColor(self.wcfg["zero_elevation_line_color"])
             painter.setPen(pen)
             # scale * (0pos - min_range)
-            zero_elevation = self.map_scale[1] * -self.map_range[2]
+            zero_elevation = map_scale[1] * -map_range[2]
             painter.drawLine(0, zero_elevation, self.display_width, zero_elevation)
+        painter.end()
+        return image
@@ -111,22 +111,41 @@ class Realtime(Overlay):
         self.data_gforce = deque([], max(self.wcfg["trace_max_samples"], 5))
         self.last_x = self.area_center
         self.last_y = self.area_center
+        self.last_total = minfo.sampler.total
 
     def post_update(self):
         self.data_gforce.clear()
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
-        # Read acceleration data
+        updated = False
+        if self.cfg.user.setting["module_sampler"]["enable"]:
+            # Read acceleration samples since last update
+            sampler = minfo.sampler
+            self.last_total, indexes = sampler.samples_since(self.last_total)
+            for index in indexes:
+                if self.update_gforce(sampler.lgtGForce[index], sampler.latGForce[index]):
+                    updated = True
+        else:
+            # Read live acceleration if sampler module disabled
+            updated = self.update_gforce(minfo.force.lgtGForceRaw, minfo.force.latGForceRaw)
+
+        if updated:
+            if self.wcfg["show_trace"]:
+                self.draw_trace()
+            self.update()
+
+    def update_gforce(self, lgt_gforce, lat_gforce):
+        """Update g force position, return True if changed"""
         if self.wcfg["show_inverted_orientation"]:
             temp_gforce_raw = (  # accel top, brake bottom
-                round(minfo.force.lgtGForceRaw, 3),
-                round(-minfo.force.latGForceRaw, 3),
+                round(lgt_gforce, 3),
+                round(-lat_gforce, 3),
             )
         else:
             temp_gforce_raw = (  # brake top, accel bottom
-                round(-minfo.force.lgtGForceRaw, 3),
-                round(minfo.force.latGForceRaw, 3),
+                round(-lgt_gforce, 3),
+                round(lat_gforce, 3),
             )
 
         if self.gforce_raw != temp_gforce_raw:
@@ -136,8 +155,8 @@ class Realtime(Overlay):
             self.last_y = temp_gforce_raw[0] * self.global_scale + self.area_center
             if self.wcfg["show_trace"]:
                 self.data_gforce.append(QPointF(self.last_x, self.last_y))
-                self.draw_trace()
-            self.update()
+            return True
+        return False
 
     # GUI update methods
     def paintEvent(self, event):
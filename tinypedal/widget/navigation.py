@@ -25,8 +25,10 @@ from PySide2.QtGui import QBrush, QPainter, QPainterPath, QPen, QPixmap, QRadial
 
 from .. import calculation as calc
 from ..api_control import api
+from ..map_geometry import lod_indexes
 from ..module_info import minfo
 from ._base import Overlay
+from ._painter import ImageRenderer
 
 
 class Realtime(Overlay):
@@ -78,7 +80,6 @@ class Realtime(Overlay):
         self.map_path = None
         self.sfinish_path = None
         self.sector_path = None
-        self.create_map_path()
 
         # Config canvas
         self.resize(self.area_size, self.area_size)
@@ -112,33 +113,43 @@ class Realtime(Overlay):
 
         # Last data
         self.last_veh_data_version = None
-        self.last_modified = 0
-        self.map_scaled = None
-        self.map_size = 1,1
-        self.map_offset = 0,0
+        self.last_modified = -1
+        self.renderer_map = ImageRenderer()
+        self.swap_map(self.create_map_path(None, None, None))
 
         self.draw_background()
         self.draw_map_mask_pixmap()
-        self.update_map(-1)
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         # Map
         modified = minfo.mapping.lastModified
         self.update_map(modified)
+        map_updated = self.swap_map(self.renderer_map.take())
 
         # Vehicles
         veh_data_version = minfo.vehicles.dataSetVersion
-        if self.last_veh_data_version != veh_data_version:
+        if self.last_veh_data_version != veh_data_version or map_updated:
             self.last_veh_data_version = veh_data_version
             self.update()
 
     # GUI update methods
     def update_map(self, data):
-        """Map update"""
+        """Map update, create map paths in worker thread"""
         if self.last_modified != data:
             self.last_modified = data
-            self.create_map_path(minfo.mapping.coordinates)
+            self.renderer_map.submit(
+                (data, self.global_scale),
+                self.create_map_path,
+                minfo.mapping.coordinates, minfo.mapping.sectors, minfo.mapping.coordinatesLod)
+
+    def swap_map(self, result):
+        """Swap in map paths & map data, output whether swapped"""
+        if result is None:
+            return False
+        (self.map_path, self.sfinish_path, self.sector_path,
+         self.map_scaled, self.map_size, self.map_offset) = result
+        return True
 
     def paintEvent(self, event):
         """Draw"""
@@ -187,46 +198,45 @@ class Realtime(Overlay):
                 (self.area_center - self.wcfg["circle_outline_width"]) * 2
             )
 
-    def create_map_path(self, raw_coords=None):
-        """Create map path"""
+    def create_map_path(self, raw_coords, sectors_index, map_lod):
+        """Create map path (worker thread) from map LOD level that is accurate enough for map scale
+
+        Returns:
+            Map path, start/finish path, sectors path,
+            scaled map coordinates, map size, map offset.
+        """
         if raw_coords:
             map_path = QPainterPath()
             dist = calc.distance(raw_coords[0], raw_coords[-1])
-            (self.map_scaled, self.map_size, self.map_offset
-             ) = calc.zoom_map(raw_coords, self.global_scale)
-            for index, coords in enumerate(self.map_scaled):
-                if index == 0:
-                    map_path.moveTo(*coords)
-                else:
-                    map_path.lineTo(*coords)
+            map_scaled, map_size, map_offset = calc.zoom_map(raw_coords, self.global_scale)
+            map_path.moveTo(*map_scaled[0])
+            for index in lod_indexes(map_lod, len(map_scaled), self.global_scale)[1:]:
+                map_path.lineTo(*map_scaled[index])
             # Close map loop if start & end distance less than 500 meters
             if dist < 500:
                 map_path.closeSubpath()
             # Create start/finish path
             sfinish_path = QPainterPath()
             self.create_sector_path(
-                sfinish_path, self.map_scaled, 0, self.wcfg["start_line_length"])
+                sfinish_path, map_scaled, 0, self.wcfg["start_line_length"])
             # Create sectors paths
-            sectors_index = minfo.mapping.sectors
             if isinstance(sectors_index, tuple):
                 sector_path = QPainterPath()
                 for index in sectors_index:
                     self.create_sector_path(
-                        sector_path, self.map_scaled, index, self.wcfg["sector_line_length"]
+                        sector_path, map_scaled, index, self.wcfg["sector_line_length"]
                     )
             else:
                 sector_path = None
         else:
-            self.map_scaled = None
-            self.map_size = 1,1
-            self.map_offset = 0,0
+            map_scaled = None
+            map_size = 1,1
+            map_offset = 0,0
             map_path = None
             sfinish_path = None
             sector_path = None
 
-        self.map_path = map_path
-        self.sfinish_path = sfinish_path
-        self.sector_path = sector_path
+        return map_path, sfinish_path, sector_path, map_scaled, map_size, map_offset
 
     def draw_map_image(self, painter):
         """Draw map image"""
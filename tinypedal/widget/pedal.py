@@ -21,6 +21,7 @@ Pedal Widget
 """
 
 from ..api_control import api
+from ..module_info import minfo
 from ._base import Overlay
 from ._painter import PedalInputBar
 
@@ -125,23 +126,45 @@ class Realtime(Overlay):
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
+        # Latest input sample, or live inputs if sampler module disabled
+        if self.cfg.user.setting["module_sampler"]["enable"]:
+            sampler = minfo.sampler
+            index = sampler.latest()
+            if index < 0:
+                return
+            raw_throttle = sampler.throttleRaw[index]
+            filtered_throttle = sampler.throttle[index]
+            raw_brake = sampler.brakeRaw[index]
+            filtered_brake = sampler.brake[index]
+            brake_pressure = sampler.brakePressure[index]
+            raw_clutch = sampler.clutchRaw[index]
+            filtered_clutch = sampler.clutch[index]
+            ffb = sampler.forceFeedback[index]
+        else:
+            raw_throttle = api.read.inputs.throttle_raw()
+            filtered_throttle = api.read.inputs.throttle()
+            raw_brake = api.read.inputs.brake_raw()
+            filtered_brake = api.read.inputs.brake()
+            brake_pressure = sum(api.read.brake.pressure())
+            raw_clutch = api.read.inputs.clutch_raw()
+            filtered_clutch = api.read.inputs.clutch()
+            ffb = api.read.inputs.force_feedback()
+
         # Throttle
         if self.wcfg["show_throttle"]:
-            raw_throttle = api.read.inputs.throttle_raw()
             if self.wcfg["show_throttle_filtered"]:
-                throttle = raw_throttle + api.read.inputs.throttle()
+                throttle = raw_throttle + filtered_throttle
             else:
                 throttle = raw_throttle + raw_throttle
             self.update_pedal(self.bar_throttle, throttle, raw_throttle)
 
         # Brake
         if self.wcfg["show_brake"]:
-            raw_brake = api.read.inputs.brake_raw()
             if self.wcfg["show_brake_filtered"]:
                 if self.wcfg["show_brake_pressure"]:
-                    f_brake = self.filtered_brake_pressure(api.read.brake.pressure())
+                    f_brake = self.filtered_brake_pressure(brake_pressure)
                 else:
-                    f_brake = api.read.inputs.brake()
+                    f_brake = filtered_brake
                 brake = raw_brake + f_brake
             else:
                 brake = raw_brake + raw_brake
@@ -149,17 +172,15 @@ class Realtime(Overlay):
 
         # Clutch
         if self.wcfg["show_clutch"]:
-            raw_clutch = api.read.inputs.clutch_raw()
             if self.wcfg["show_clutch_filtered"]:
-                clutch = raw_clutch + api.read.inputs.clutch()
+                clutch = raw_clutch + filtered_clutch
             else:
                 clutch = raw_clutch + raw_clutch
             self.update_pedal(self.bar_clutch, clutch, raw_clutch)
 
         # Force feedback
         if self.wcfg["show_ffb_meter"]:
-            ffb = abs(api.read.inputs.force_feedback())
-            self.update_ffb(self.bar_ffb, ffb)
+            self.update_ffb(self.bar_ffb, abs(ffb))
 
     # GUI update methods
     def update_pedal(self, target, data, raw):
@@ -175,9 +196,8 @@ class Realtime(Overlay):
             target.update_input(data, data)
 
     # Additional methods
-    def filtered_brake_pressure(self, value):
+    def filtered_brake_pressure(self, brake_pres):
         """Percentage filtered brake pressure"""
-        brake_pres = sum(value)
         if brake_pres > self.max_brake_pres:
             self.max_brake_pres = brake_pres
         return brake_pres / self.max_brake_pres
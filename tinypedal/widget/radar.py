@@ -20,8 +20,7 @@
 Radar Widget
 """
 
-from itertools import islice
-from typing import NamedTuple
+from typing import Iterator, NamedTuple
 
 from PySide2.QtCore import QRectF, Qt
 from PySide2.QtGui import (
@@ -36,7 +35,7 @@ from PySide2.QtGui import (
 
 from .. import calculation as calc
 from ..api_control import api
-from ..module_info import minfo
+from ..module_info import VehiclesInfo, minfo
 from ._base import Overlay
 
 
@@ -304,40 +303,40 @@ class Realtime(Overlay):
         nearest_right = indicator.max_range_x
 
         # Draw opponent vehicle within radar range
-        for veh_info in islice(minfo.vehicles.dataSet, minfo.vehicles.totalVehicles):
-            if veh_info.isPlayer:
-                continue
+        vehicles = minfo.vehicles
+        rel_pos_x = vehicles.relativeRotatedPositionX
+        rel_pos_y = vehicles.relativeRotatedPositionY
+        rel_orientation = vehicles.relativeOrientationRadians
+        for index in opponents_in_range(vehicles, self.vehicle_hide_range):
             # -x = left, +x = right, -y = ahead, +y = behind
-            raw_pos_x = veh_info.relativeRotatedPositionX
-            raw_pos_y = veh_info.relativeRotatedPositionY
-            if (self.vehicle_hide_range.behind > raw_pos_y > -self.vehicle_hide_range.ahead and
-                -self.vehicle_hide_range.side < raw_pos_x < self.vehicle_hide_range.side):
-
-                # Find nearest vehicle coordinates
-                if (self.wcfg["show_overlap_indicator"] and
-                    abs(raw_pos_x) < indicator.max_range_x and
-                    abs(raw_pos_y) < indicator.max_range_y):
-                    if -indicator.min_range_x > raw_pos_x > nearest_left:
-                        nearest_left = raw_pos_x
-                    if indicator.min_range_x < raw_pos_x < nearest_right:
-                        nearest_right = raw_pos_x
-
-                # Rotated position relative to player
-                pos_x = self.scale_veh_pos(raw_pos_x)
-                pos_y = self.scale_veh_pos(raw_pos_y)
-                angle_deg = calc.rad2deg(-veh_info.relativeOrientationRadians)
-
-                # Draw vehicle
-                self.brush_veh.setColor(self.color_lap_diff(veh_info))
-                painter.setBrush(self.brush_veh)
-                painter.translate(pos_x, pos_y)
-                painter.rotate(angle_deg)
-                painter.drawRoundedRect(
-                    self.veh_shape,
-                    self.wcfg["vehicle_border_radius"],
-                    self.wcfg["vehicle_border_radius"]
-                )
-                painter.resetTransform()
+            raw_pos_x = rel_pos_x[index]
+            raw_pos_y = rel_pos_y[index]
+
+            # Find nearest vehicle coordinates
+            if (self.wcfg["show_overlap_indicator"] and
+                abs(raw_pos_x) < indicator.max_range_x and
+                abs(raw_pos_y) < indicator.max_range_y):
+                if -indicator.min_range_x > raw_pos_x > nearest_left:
+                    nearest_left = raw_pos_x
+                if indicator.min_range_x < raw_pos_x < nearest_right:
+                    nearest_right = raw_pos_x
+
+            # Rotated position relative to player
+            pos_x = self.scale_veh_pos(raw_pos_x)
+            pos_y = self.scale_veh_pos(raw_pos_y)
+            angle_deg = calc.rad2deg(-rel_orientation[index])
+
+            # Draw vehicle
+            self.brush_veh.setColor(self.color_lap_diff(vehicles.dataSet[index]))
+            painter.setBrush(self.brush_veh)
+            painter.translate(pos_x, pos_y)
+            painter.rotate(angle_deg)
+            painter.drawRoundedRect(
+                self.veh_shape,
+                self.wcfg["vehicle_border_radius"],
+                self.wcfg["vehicle_border_radius"]
+            )
+            painter.resetTransform()
 
         # Draw overlap indicator below vehicle shape
         if self.wcfg["show_overlap_indicator"]:
@@ -413,12 +412,8 @@ class Realtime(Overlay):
 
     def is_nearby(self):
         """Check nearby vehicles"""
-        for veh_info in islice(minfo.vehicles.dataSet, minfo.vehicles.totalVehicles):
-            # -x = left, +x = right, -y = ahead, +y = behind
-            if (not veh_info.isPlayer and
-                self.radar_hide_range.behind > veh_info.relativeRotatedPositionY > -self.radar_hide_range.ahead and
-                -self.radar_hide_range.side < veh_info.relativeRotatedPositionX < self.radar_hide_range.side):
-                return True
+        for _ in opponents_in_range(minfo.vehicles, self.radar_hide_range):
+            return True
         return False
 
     def calc_indicator_dimension(self, veh_width, veh_length):
@@ -463,3 +458,21 @@ class Realtime(Overlay):
         range_diff = range_fade_out - range_fade_in
         range_scale = range_fade_out / range_diff
         return range_scale / radar_radius
+
+
+def opponents_in_range(vehicles: VehiclesInfo, hide_range: DistanceRect) -> Iterator[int]:
+    """Filter opponent vehicle slot indexes within hide range (relative to player)
+
+    -x = left, +x = right, -y = ahead, +y = behind.
+    """
+    is_player = vehicles.isPlayer
+    rel_pos_x = vehicles.relativeRotatedPositionX
+    rel_pos_y = vehicles.relativeRotatedPositionY
+    range_ahead = -hide_range.ahead
+    range_behind = hide_range.behind
+    range_side = hide_range.side
+    for index in range(vehicles.totalVehicles):
+        if (not is_player[index] and
+            range_behind > rel_pos_y[index] > range_ahead and
+            -range_side < rel_pos_x[index] < range_side):
+            yield index
@@ -22,10 +22,8 @@ Relative Widget
 
 from .. import calculation as calc
 from ..const_common import TEXT_PLACEHOLDER
-from ..formatter import random_color_class, shorten_driver_name
 from ..module_info import minfo
 from ..userfile.brand_logo import load_brand_logo_file
-from ..userfile.heatmap import select_compound_symbol
 from ._base import Overlay
 
 
@@ -361,6 +359,7 @@ class Realtime(Overlay):
         """Update when vehicle on track"""
         relative_list = minfo.relative.relative
         total_rel_idx = len(relative_list)
+        vehicles = minfo.vehicles
 
         # Relative update
         for idx in range(self.veh_range):
@@ -380,61 +379,68 @@ class Realtime(Overlay):
                 self.row_visible[idx] = False
                 state = 0
 
-            # Get vehicle dataset
-            veh_info = minfo.vehicles.dataSet[rel_idx]
             # Highlighted player
-            hi_player = self.wcfg["show_player_highlighted"] and veh_info.isPlayer
+            hi_player = self.wcfg["show_player_highlighted"] and vehicles.isPlayer[rel_idx]
             # Check whether is lapped
-            is_lapped = veh_info.isLapped
+            is_lapped = vehicles.isLapped[rel_idx]
             # Driver position
             if self.wcfg["show_position"]:
-                self.update_pos(self.bars_pos[idx], veh_info.positionOverall, is_lapped, hi_player, state)
+                self.update_pos(self.bars_pos[idx], vehicles.positionOverall[rel_idx], is_lapped, hi_player, state)
             # Driver position change
             if self.wcfg["show_position_change"]:
                 if self.wcfg["show_position_change_in_class"]:
-                    pos_diff = veh_info.qualifyInClass - veh_info.positionInClass
+                    pos_diff = vehicles.qualifyInClass[rel_idx] - vehicles.positionInClass[rel_idx]
                 else:
-                    pos_diff = veh_info.qualifyOverall - veh_info.positionOverall
+                    pos_diff = vehicles.qualifyOverall[rel_idx] - vehicles.positionOverall[rel_idx]
                 self.update_pgl(self.bars_pgl[idx], pos_diff, hi_player, state)
             # Driver name
             if self.wcfg["show_driver_name"]:
-                self.update_drv(self.bars_drv[idx], veh_info.driverName, is_lapped, hi_player, state)
+                if self.wcfg["driver_name_shorten"]:
+                    driver_name = vehicles.driverNameShort[rel_idx]
+                else:
+                    driver_name = vehicles.driverName[rel_idx]
+                self.update_drv(self.bars_drv[idx], driver_name, is_lapped, hi_player, state)
             # Vehicle name
             if self.wcfg["show_vehicle_name"]:
-                self.update_veh(self.bars_veh[idx], veh_info.vehicleName, is_lapped, hi_player, state)
+                if self.wcfg["show_vehicle_brand_as_name"]:
+                    vehicle_name = vehicles.brandName[rel_idx]
+                else:
+                    vehicle_name = vehicles.vehicleName[rel_idx]
+                self.update_veh(self.bars_veh[idx], vehicle_name, is_lapped, hi_player, state)
             # Brand logo
             if self.wcfg["show_brand_logo"]:
-                self.update_brd(self.bars_brd[idx], veh_info.vehicleName, hi_player, state)
+                self.update_brd(self.bars_brd[idx], vehicles.brandName[rel_idx], hi_player, state)
             # Time gap
             if self.wcfg["show_time_gap"]:
                 self.update_gap(self.bars_gap[idx], rel_time_gap, hi_player, state)
             # Vehicle laptime
             if self.wcfg["show_laptime"]:
-                if veh_info.pitTimer.pitting:
-                    laptime = self.set_pittime(veh_info.inPit, veh_info.pitTimer.elapsed)
+                if vehicles.pitTimer[rel_idx].pitting:
+                    laptime = self.set_pittime(vehicles.inPit[rel_idx], vehicles.pitTimer[rel_idx].elapsed)
                     is_class_best = False
                 else:
-                    laptime = self.set_laptime(veh_info.lastLapTime)
-                    is_class_best = veh_info.isClassFastestLastLap
+                    laptime = self.set_laptime(vehicles.lastLapTime[rel_idx])
+                    is_class_best = vehicles.isClassFastestLastLap[rel_idx]
                 self.update_lpt(self.bars_lpt[idx], laptime, is_class_best, hi_player, state)
             # Position in class
             if self.wcfg["show_position_in_class"]:
-                self.update_pic(self.bars_pic[idx], veh_info.positionInClass, hi_player, state)
+                self.update_pic(self.bars_pic[idx], vehicles.positionInClass[rel_idx], hi_player, state)
             # Vehicle class
             if self.wcfg["show_class"]:
-                self.update_cls(self.bars_cls[idx], veh_info.vehicleClass, state)
+                self.update_cls(self.bars_cls[idx], *self.set_class_style(vehicles, rel_idx), state)
             # Vehicle in pit
             if self.wcfg["show_pit_status"]:
-                self.update_pit(self.bars_pit[idx], veh_info.inPit, state)
+                self.update_pit(self.bars_pit[idx], vehicles.inPit[rel_idx], state)
             # Tyre compound index
             if self.wcfg["show_tyre_compound"]:
-                self.update_tcp(self.bars_tcp[idx], veh_info.tireCompoundFront, veh_info.tireCompoundRear, hi_player, state)
+                self.update_tcp(self.bars_tcp[idx], vehicles.tireCompoundSymbol[rel_idx], hi_player, state)
             # Pitstop count
             if self.wcfg["show_pitstop_count"]:
-                self.update_psc(self.bars_psc[idx], veh_info.numPitStops, veh_info.pitState, hi_player, state)
+                self.update_psc(
+                    self.bars_psc[idx], vehicles.numPitStops[rel_idx], vehicles.pitState[rel_idx], hi_player, state)
             # Remaining energy
             if self.wcfg["show_energy_remaining"]:
-                self.update_nrg(self.bars_nrg[idx], veh_info.energyRemaining, hi_player, state)
+                self.update_nrg(self.bars_nrg[idx], vehicles.energyRemaining[rel_idx], hi_player, state)
 
     # GUI update methods
     def update_pos(self, target, *data):
@@ -488,10 +494,7 @@ class Realtime(Overlay):
             else:
                 color = self.bar_style_drv[0]
             if data[-1]:
-                if self.wcfg["driver_name_shorten"]:
-                    text = shorten_driver_name(data[0])
-                else:
-                    text = data[0]
+                text = data[0]
                 if self.wcfg["driver_name_uppercase"]:
                     text = text.upper()
                 if self.wcfg["driver_name_align_center"]:
@@ -514,10 +517,7 @@ class Realtime(Overlay):
             else:
                 color = self.bar_style_veh[0]
             if data[-1]:
-                if self.wcfg["show_vehicle_brand_as_name"]:
-                    text = self.cfg.user.brands.get(data[0], data[0])
-                else:
-                    text = data[0]
+                text = data[0]
                 if self.wcfg["vehicle_name_uppercase"]:
                     text = text.upper()
                 if self.wcfg["vehicle_name_align_center"]:
@@ -534,7 +534,7 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             if data[-1]:
-                brand_name = self.cfg.user.brands.get(data[0], data[0])
+                brand_name = data[0]
             else:
                 brand_name = ""
             target.setPixmap(self.set_brand_logo(brand_name))
@@ -595,9 +595,8 @@ class Realtime(Overlay):
         """Vehicle class"""
         if target.last != data:
             target.last = data
-            text, bg_color = self.set_class_style(data[0])
-            target.setText(text[:self.cls_width])
-            target.updateStyle(f"color:{self.wcfg['font_color_class']};background:{bg_color};")
+            target.setText(data[0][:self.cls_width])
+            target.updateStyle(f"color:{self.wcfg['font_color_class']};background:{data[1]};")
 
     def update_pit(self, target, *data):
         """Vehicle in pit"""
@@ -615,11 +614,11 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             if data[-1]:
-                text = f"{select_compound_symbol(data[0])}{select_compound_symbol(data[1])}"
+                text = data[0]
             else:
                 text = ""
             target.setText(text)
-            target.updateStyle(self.bar_style_tcp[data[2]])
+            target.updateStyle(self.bar_style_tcp[data[1]])
 
     def update_psc(self, target, *data):
         """Pitstop count"""
@@ -700,14 +699,13 @@ class Realtime(Overlay):
             )
         return self.pixmap_brandlogo[brand_name]
 
-    def set_class_style(self, class_name: str):
-        """Compare vehicle class name with user defined dictionary"""
-        style = self.cfg.user.classes.get(class_name)
-        if style is not None:
-            return style["alias"], style["color"]
-        if class_name and self.wcfg["show_random_color_for_unknown_class"]:
-            return class_name, random_color_class(class_name)
-        return class_name, self.wcfg["bkg_color_class"]
+    def set_class_style(self, vehicles, index):
+        """Set vehicle class alias & color from vehicle display attribute"""
+        if vehicles.classColor[index] is not None:  # user defined class style
+            return vehicles.classAlias[index], vehicles.classColor[index]
+        if vehicles.vehicleClass[index] and self.wcfg["show_random_color_for_unknown_class"]:
+            return vehicles.classAlias[index], vehicles.classColorRandom[index]
+        return vehicles.classAlias[index], self.wcfg["bkg_color_class"]
 
     @staticmethod
     def set_laptime(laptime):
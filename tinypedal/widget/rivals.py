@@ -23,10 +23,8 @@ Rivals Widget
 from .. import calculation as calc
 from ..api_control import api
 from ..const_common import TEXT_PLACEHOLDER
-from ..formatter import random_color_class, shorten_driver_name
 from ..module_info import minfo
 from ..userfile.brand_logo import load_brand_logo_file
-from ..userfile.heatmap import select_compound_symbol
 from ._base import Overlay
 from ._common import ExFrame
 
@@ -372,8 +370,8 @@ class Realtime(Overlay):
         """Update when vehicle on track"""
         classes_list = minfo.relative.classes
         total_cls_idx = len(classes_list)
-        player_idx = minfo.vehicles.playerIndex
-        plr_veh_info = minfo.vehicles.dataSet[player_idx]
+        vehicles = minfo.vehicles
+        player_idx = vehicles.playerIndex
         in_race = api.read.session.in_race()
 
         if player_idx < total_cls_idx:
@@ -394,70 +392,77 @@ class Realtime(Overlay):
                 self.row_visible[idx] = False
                 state = 0
 
-            # Get vehicle dataset
-            veh_info = minfo.vehicles.dataSet[rvl_idx]
             # Driver position
             if self.wcfg["show_position"]:
-                self.update_pos(self.bars_pos[idx], veh_info.positionOverall, state)
+                self.update_pos(self.bars_pos[idx], vehicles.positionOverall[rvl_idx], state)
             # Driver position change
             if self.wcfg["show_position_change"]:
                 if self.wcfg["show_position_change_in_class"]:
-                    pos_diff = veh_info.qualifyInClass - veh_info.positionInClass
+                    pos_diff = vehicles.qualifyInClass[rvl_idx] - vehicles.positionInClass[rvl_idx]
                 else:
-                    pos_diff = veh_info.qualifyOverall - veh_info.positionOverall
+                    pos_diff = vehicles.qualifyOverall[rvl_idx] - vehicles.positionOverall[rvl_idx]
                 self.update_pgl(self.bars_pgl[idx], pos_diff, state)
             # Driver name
             if self.wcfg["show_driver_name"]:
-                self.update_drv(self.bars_drv[idx], veh_info.driverName, state)
+                if self.wcfg["driver_name_shorten"]:
+                    driver_name = vehicles.driverNameShort[rvl_idx]
+                else:
+                    driver_name = vehicles.driverName[rvl_idx]
+                self.update_drv(self.bars_drv[idx], driver_name, state)
             # Vehicle name
             if self.wcfg["show_vehicle_name"]:
-                self.update_veh(self.bars_veh[idx], veh_info.vehicleName, state)
+                if self.wcfg["show_vehicle_brand_as_name"]:
+                    vehicle_name = vehicles.brandName[rvl_idx]
+                else:
+                    vehicle_name = vehicles.vehicleName[rvl_idx]
+                self.update_veh(self.bars_veh[idx], vehicle_name, state)
             # Brand logo
             if self.wcfg["show_brand_logo"]:
-                self.update_brd(self.bars_brd[idx], veh_info.vehicleName, state)
+                self.update_brd(self.bars_brd[idx], vehicles.brandName[rvl_idx], state)
             # Time interval
             if self.wcfg["show_time_interval"]:
-                is_ahead = veh_info.positionOverall < plr_veh_info.positionOverall
+                is_ahead = vehicles.positionOverall[rvl_idx] < vehicles.positionOverall[player_idx]
                 if is_ahead:
-                    time_int = plr_veh_info.gapBehindNextInClass
+                    time_int = vehicles.gapBehindNextInClass[player_idx]
                 else:
-                    time_int = veh_info.gapBehindNextInClass
+                    time_int = vehicles.gapBehindNextInClass[rvl_idx]
                 self.update_int(self.bars_int[idx], time_int, is_ahead, state)
             # Vehicle laptime
             if self.wcfg["show_laptime"]:
                 if in_race or self.wcfg["show_best_laptime"]:
-                    if veh_info.pitTimer.pitting:
-                        laptime = self.set_pittime(veh_info.inPit, veh_info.pitTimer.elapsed)
+                    if vehicles.pitTimer[rvl_idx].pitting:
+                        laptime = self.set_pittime(vehicles.inPit[rvl_idx], vehicles.pitTimer[rvl_idx].elapsed)
                     else:
-                        laptime = self.set_laptime(veh_info.lastLapTime)
+                        laptime = self.set_laptime(vehicles.lastLapTime[rvl_idx])
                 else:
-                    laptime = self.set_laptime(veh_info.bestLapTime)
+                    laptime = self.set_laptime(vehicles.bestLapTime[rvl_idx])
                 self.update_lpt(self.bars_lpt[idx], laptime, state)
             # Vehicle best laptime
             if self.wcfg["show_best_laptime"]:
-                self.update_blp(self.bars_blp[idx], veh_info.bestLapTime, state)
+                self.update_blp(self.bars_blp[idx], vehicles.bestLapTime[rvl_idx], state)
             # Position in class
             if self.wcfg["show_position_in_class"]:
-                self.update_pic(self.bars_pic[idx], veh_info.positionInClass, state)
+                self.update_pic(self.bars_pic[idx], vehicles.positionInClass[rvl_idx], state)
             # Vehicle class
             if self.wcfg["show_class"]:
-                self.update_cls(self.bars_cls[idx], veh_info.vehicleClass, state)
+                self.update_cls(self.bars_cls[idx], *self.set_class_style(vehicles, rvl_idx), state)
             # Vehicle in pit
             if self.wcfg["show_pit_status"]:
-                self.update_pit(self.bars_pit[idx], veh_info.inPit, state)
+                self.update_pit(self.bars_pit[idx], vehicles.inPit[rvl_idx], state)
             # Tyre compound index
             if self.wcfg["show_tyre_compound"]:
-                self.update_tcp(self.bars_tcp[idx], veh_info.tireCompoundFront, veh_info.tireCompoundRear, state)
+                self.update_tcp(self.bars_tcp[idx], vehicles.tireCompoundSymbol[rvl_idx], state)
             # Pitstop count
             if self.wcfg["show_pitstop_count"]:
-                self.update_psc(self.bars_psc[idx], veh_info.numPitStops, veh_info.pitState, state)
+                self.update_psc(self.bars_psc[idx], vehicles.numPitStops[rvl_idx], vehicles.pitState[rvl_idx], state)
             # Delta laptime
             if self.wcfg["show_delta_laptime"]:
-                delta_laptime = tuple(veh_info.lapTimeHistory.delta(plr_veh_info.lapTimeHistory, self.max_delta))
+                delta_laptime = tuple(vehicles.lapTimeHistory[rvl_idx].delta(
+                    vehicles.lapTimeHistory[player_idx], self.max_delta))
                 self.update_dlt(self.bars_dlt[idx], delta_laptime, state)
             # Remaining energy
             if self.wcfg["show_energy_remaining"]:
-                self.update_nrg(self.bars_nrg[idx], veh_info.energyRemaining, state)
+                self.update_nrg(self.bars_nrg[idx], vehicles.energyRemaining[rvl_idx], state)
 
     # GUI update methods
     def update_pos(self, target, *data):
@@ -489,10 +494,7 @@ class Realtime(Overlay):
         """Driver name"""
         if target.last != data:
             target.last = data
-            if self.wcfg["driver_name_shorten"]:
-                text = shorten_driver_name(data[0])
-            else:
-                text = data[0]
+            text = data[0]
             if self.wcfg["driver_name_uppercase"]:
                 text = text.upper()
             if self.wcfg["driver_name_align_center"]:
@@ -506,10 +508,7 @@ class Realtime(Overlay):
         """Vehicle name"""
         if target.last != data:
             target.last = data
-            if self.wcfg["show_vehicle_brand_as_name"]:
-                text = self.cfg.user.brands.get(data[0], data[0])
-            else:
-                text = data[0]
+            text = data[0]
             if self.wcfg["vehicle_name_uppercase"]:
                 text = text.upper()
             if self.wcfg["vehicle_name_align_center"]:
@@ -523,7 +522,7 @@ class Realtime(Overlay):
         """Brand logo"""
         if target.last != data:
             target.last = data
-            target.setPixmap(self.set_brand_logo(self.cfg.user.brands.get(data[0], data[0])))
+            target.setPixmap(self.set_brand_logo(data[0]))
             self.toggle_visibility(target, data[-1])
 
     def update_int(self, target, *data):
@@ -584,9 +583,8 @@ class Realtime(Overlay):
         """Vehicle class"""
         if target.last != data:
             target.last = data
-            text, bg_color = self.set_class_style(data[0])
-            target.setText(text[:self.cls_width])
-            target.updateStyle(f"color:{self.wcfg['font_color_class']};background:{bg_color};")
+            target.setText(data[0][:self.cls_width])
+            target.updateStyle(f"color:{self.wcfg['font_color_class']};background:{data[1]};")
             self.toggle_visibility(target, data[-1])
 
     def update_pit(self, target, *data):
@@ -601,7 +599,7 @@ class Realtime(Overlay):
         """Tyre compound index"""
         if target.last != data:
             target.last = data
-            target.setText(f"{select_compound_symbol(data[0])}{select_compound_symbol(data[1])}")
+            target.setText(data[0])
             self.toggle_visibility(target, data[-1])
 
     def update_psc(self, target, *data):
@@ -660,14 +658,13 @@ class Realtime(Overlay):
             )
         return self.pixmap_brandlogo[brand_name]
 
-    def set_class_style(self, class_name: str):
-        """Compare vehicle class name with user defined dictionary"""
-        style = self.cfg.user.classes.get(class_name)
-        if style is not None:
-            return style["alias"], style["color"]
-        if class_name and self.wcfg["show_random_color_for_unknown_class"]:
-            return class_name, random_color_class(class_name)
-        return class_name, self.wcfg["bkg_color_class"]
+    def set_class_style(self, vehicles, index):
+        """Set vehicle class alias & color from vehicle display attribute"""
+        if vehicles.classColor[index] is not None:  # user defined class style
+            return vehicles.classAlias[index], vehicles.classColor[index]
+        if vehicles.vehicleClass[index] and self.wcfg["show_random_color_for_unknown_class"]:
+            return vehicles.classAlias[index], vehicles.classColorRandom[index]
+        return vehicles.classAlias[index], self.wcfg["bkg_color_class"]
 
     @staticmethod
     def set_laptime(laptime):
@@ -23,10 +23,8 @@ Standings Widget
 from .. import calculation as calc
 from ..api_control import api
 from ..const_common import TEXT_PLACEHOLDER
-from ..formatter import random_color_class, shorten_driver_name
 from ..module_info import minfo
 from ..userfile.brand_logo import load_brand_logo_file
-from ..userfile.heatmap import select_compound_symbol
 from ._base import Overlay
 from ._common import ExFrame
 
@@ -456,8 +454,8 @@ class Realtime(Overlay):
         """Update when vehicle on track"""
         standings_list = minfo.relative.standings
         total_std_idx = len(standings_list) - 1  # skip final -1 index
-        player_idx = minfo.vehicles.playerIndex
-        plr_veh_info = minfo.vehicles.dataSet[player_idx]
+        vehicles = minfo.vehicles
+        player_idx = vehicles.playerIndex
         in_race = api.read.session.in_race()
 
         # Standings update
@@ -478,87 +476,98 @@ class Realtime(Overlay):
                 self.row_visible[idx] = False
                 state = 2
 
-            # Get vehicle dataset
-            veh_info = minfo.vehicles.dataSet[std_idx]
             # Highlighted player
-            hi_player = self.wcfg["show_player_highlighted"] and veh_info.isPlayer
+            hi_player = self.wcfg["show_player_highlighted"] and vehicles.isPlayer[std_idx]
             # Driver position
             if self.wcfg["show_position"]:
-                self.update_pos(self.bars_pos[idx], veh_info.positionOverall, hi_player, state)
+                self.update_pos(self.bars_pos[idx], vehicles.positionOverall[std_idx], hi_player, state)
             # Driver position change
             if self.wcfg["show_position_change"]:
                 if self.wcfg["show_position_change_in_class"]:
-                    pos_diff = veh_info.qualifyInClass - veh_info.positionInClass
+                    pos_diff = vehicles.qualifyInClass[std_idx] - vehicles.positionInClass[std_idx]
                 else:
-                    pos_diff = veh_info.qualifyOverall - veh_info.positionOverall
+                    pos_diff = vehicles.qualifyOverall[std_idx] - vehicles.positionOverall[std_idx]
                 self.update_pgl(self.bars_pgl[idx], pos_diff, hi_player, state)
             # Driver name
             if self.wcfg["show_driver_name"]:
-                self.update_drv(self.bars_drv[idx], veh_info.driverName, hi_player, state)
+                if self.wcfg["driver_name_shorten"]:
+                    driver_name = vehicles.driverNameShort[std_idx]
+                else:
+                    driver_name = vehicles.driverName[std_idx]
+                self.update_drv(self.bars_drv[idx], driver_name, hi_player, state)
             # Vehicle name
             if self.wcfg["show_vehicle_name"]:
-                self.update_veh(self.bars_veh[idx], veh_info.vehicleName, hi_player, state)
+                if self.wcfg["show_vehicle_brand_as_name"]:
+                    vehicle_name = vehicles.brandName[std_idx]
+                else:
+                    vehicle_name = vehicles.vehicleName[std_idx]
+                self.update_veh(self.bars_veh[idx], vehicle_name, hi_player, state)
             # Brand logo
             if self.wcfg["show_brand_logo"]:
-                self.update_brd(self.bars_brd[idx], veh_info.vehicleName, hi_player, state)
+                self.update_brd(self.bars_brd[idx], vehicles.brandName[std_idx], hi_player, state)
             # Time gap
             if self.wcfg["show_time_gap"]:
                 if in_race:
                     if self.show_class_timegap:
-                        time_gap = self.gap_to_leader_race(veh_info.gapBehindLeaderInClass, veh_info.positionInClass)
+                        time_gap = self.gap_to_leader_race(
+                            vehicles.gapBehindLeaderInClass[std_idx], vehicles.positionInClass[std_idx])
                     else:
-                        time_gap = self.gap_to_leader_race(veh_info.gapBehindLeader, veh_info.positionOverall)
+                        time_gap = self.gap_to_leader_race(
+                            vehicles.gapBehindLeader[std_idx], vehicles.positionOverall[std_idx])
                 else:
                     if self.show_class_timegap:
-                        time_gap = self.gap_to_leader_best(veh_info.bestLapTime, veh_info.classBestLapTime)
+                        time_gap = self.gap_to_leader_best(
+                            vehicles.bestLapTime[std_idx], vehicles.classBestLapTime[std_idx])
                     else:
-                        time_gap = self.gap_to_leader_best(veh_info.bestLapTime, minfo.vehicles.leaderBestLapTime)
+                        time_gap = self.gap_to_leader_best(vehicles.bestLapTime[std_idx], vehicles.leaderBestLapTime)
                 self.update_gap(self.bars_gap[idx], time_gap, hi_player, state)
             # Time interval
             if self.wcfg["show_time_interval"]:
                 if self.show_class_interval:
-                    time_int = (veh_info.positionInClass, veh_info.gapBehindNextInClass)
+                    time_int = (vehicles.positionInClass[std_idx], vehicles.gapBehindNextInClass[std_idx])
                 else:
-                    time_int = (veh_info.positionOverall, veh_info.gapBehindNext)
+                    time_int = (vehicles.positionOverall[std_idx], vehicles.gapBehindNext[std_idx])
                 self.update_int(self.bars_int[idx], time_int, hi_player, state)
             # Vehicle laptime
             if self.wcfg["show_laptime"]:
                 if in_race or self.wcfg["show_best_laptime"]:
-                    if veh_info.pitTimer.pitting:
-                        laptime = self.set_pittime(veh_info.inPit, veh_info.pitTimer.elapsed)
+                    if vehicles.pitTimer[std_idx].pitting:
+                        laptime = self.set_pittime(vehicles.inPit[std_idx], vehicles.pitTimer[std_idx].elapsed)
                         is_class_best = False
                     else:
-                        laptime = self.set_laptime(veh_info.lastLapTime)
-                        is_class_best = veh_info.isClassFastestLastLap
+                        laptime = self.set_laptime(vehicles.lastLapTime[std_idx])
+                        is_class_best = vehicles.isClassFastestLastLap[std_idx]
                 else:
-                    laptime = self.set_laptime(veh_info.bestLapTime)
+                    laptime = self.set_laptime(vehicles.bestLapTime[std_idx])
                     is_class_best = False
                 self.update_lpt(self.bars_lpt[idx], laptime, is_class_best, hi_player, state)
             # Vehicle best laptime
             if self.wcfg["show_best_laptime"]:
-                self.update_blp(self.bars_blp[idx], veh_info.bestLapTime, hi_player, state)
+                self.update_blp(self.bars_blp[idx], vehicles.bestLapTime[std_idx], hi_player, state)
             # Position in class
             if self.wcfg["show_position_in_class"]:
-                self.update_pic(self.bars_pic[idx], veh_info.positionInClass, hi_player, state)
+                self.update_pic(self.bars_pic[idx], vehicles.positionInClass[std_idx], hi_player, state)
             # Vehicle class
             if self.wcfg["show_class"]:
-                self.update_cls(self.bars_cls[idx], veh_info.vehicleClass, state)
+                self.update_cls(self.bars_cls[idx], *self.set_class_style(vehicles, std_idx), state)
             # Vehicle in pit
             if self.wcfg["show_pit_status"]:
-                self.update_pit(self.bars_pit[idx], veh_info.inPit, state)
+                self.update_pit(self.bars_pit[idx], vehicles.inPit[std_idx], state)
             # Tyre compound index
             if self.wcfg["show_tyre_compound"]:
-                self.update_tcp(self.bars_tcp[idx], veh_info.tireCompoundFront, veh_info.tireCompoundRear, hi_player, state)
+                self.update_tcp(self.bars_tcp[idx], vehicles.tireCompoundSymbol[std_idx], hi_player, state)
             # Pitstop count
             if self.wcfg["show_pitstop_count"]:
-                self.update_psc(self.bars_psc[idx], veh_info.numPitStops, veh_info.pitState, hi_player, state)
+                self.update_psc(
+                    self.bars_psc[idx], vehicles.numPitStops[std_idx], vehicles.pitState[std_idx], hi_player, state)
             # Delta laptime
             if self.wcfg["show_delta_laptime"]:
-                delta_laptime = tuple(veh_info.lapTimeHistory.delta(plr_veh_info.lapTimeHistory, self.max_delta))
+                delta_laptime = tuple(vehicles.lapTimeHistory[std_idx].delta(
+                    vehicles.lapTimeHistory[player_idx], self.max_delta))
                 self.update_dlt(self.bars_dlt[idx], delta_laptime, hi_player, state)
             # Remaining energy
             if self.wcfg["show_energy_remaining"]:
-                self.update_nrg(self.bars_nrg[idx], veh_info.energyRemaining, hi_player, state)
+                self.update_nrg(self.bars_nrg[idx], vehicles.energyRemaining[std_idx], hi_player, state)
 
     # GUI update methods
     def update_pos(self, target, *data):
@@ -593,10 +602,7 @@ class Realtime(Overlay):
         """Driver name"""
         if target.last != data:
             target.last = data
-            if self.wcfg["driver_name_shorten"]:
-                text = shorten_driver_name(data[0])
-            else:
-                text = data[0]
+            text = data[0]
             if self.wcfg["driver_name_uppercase"]:
                 text = text.upper()
             if self.wcfg["driver_name_align_center"]:
@@ -611,10 +617,7 @@ class Realtime(Overlay):
         """Vehicle name"""
         if target.last != data:
             target.last = data
-            if self.wcfg["show_vehicle_brand_as_name"]:
-                text = self.cfg.user.brands.get(data[0], data[0])
-            else:
-                text = data[0]
+            text = data[0]
             if self.wcfg["vehicle_name_uppercase"]:
                 text = text.upper()
             if self.wcfg["vehicle_name_align_center"]:
@@ -629,7 +632,7 @@ class Realtime(Overlay):
         """Brand logo"""
         if target.last != data:
             target.last = data
-            target.setPixmap(self.set_brand_logo(self.cfg.user.brands.get(data[0], data[0])))
+            target.setPixmap(self.set_brand_logo(data[0]))
             target.updateStyle(self.bar_style_brd[data[1]])
             self.toggle_visibility(target, data[-1])
 
@@ -706,9 +709,8 @@ class Realtime(Overlay):
         """Vehicle class"""
         if target.last != data:
             target.last = data
-            text, bg_color = self.set_class_style(data[0])
-            target.setText(text[:self.cls_width])
-            target.updateStyle(f"color:{self.wcfg['font_color_class']};background:{bg_color};")
+            target.setText(data[0][:self.cls_width])
+            target.updateStyle(f"color:{self.wcfg['font_color_class']};background:{data[1]};")
             self.toggle_visibility(target, data[-1])
 
     def update_pit(self, target, *data):
@@ -723,8 +725,8 @@ class Realtime(Overlay):
         """Tyre compound index"""
         if target.last != data:
             target.last = data
-            target.setText(f"{select_compound_symbol(data[0])}{select_compound_symbol(data[1])}")
-            target.updateStyle(self.bar_style_tcp[data[2]])
+            target.setText(data[0])
+            target.updateStyle(self.bar_style_tcp[data[1]])
             self.toggle_visibility(target, data[-1])
 
     def update_psc(self, target, *data):
@@ -805,14 +807,13 @@ class Realtime(Overlay):
             )
         return self.pixmap_brandlogo[brand_name]
 
-    def set_class_style(self, class_name: str):
-        """Compare vehicle class name with user defined dictionary"""
-        style = self.cfg.user.classes.get(class_name)
-        if style is not None:
-            return style["alias"], style["color"]
-        if class_name and self.wcfg["show_random_color_for_unknown_class"]:
-            return class_name, random_color_class(class_name)
-        return class_name, self.wcfg["bkg_color_class"]
+    def set_class_style(self, vehicles, index):
+        """Set vehicle class alias & color from vehicle display attribute"""
+        if vehicles.classColor[index] is not None:  # user defined class style
+            return vehicles.classAlias[index], vehicles.classColor[index]
+        if vehicles.vehicleClass[index] and self.wcfg["show_random_color_for_unknown_class"]:
+            return vehicles.classAlias[index], vehicles.classColorRandom[index]
+        return vehicles.classAlias[index], self.wcfg["bkg_color_class"]
 
     @staticmethod
     def set_laptime(laptime):
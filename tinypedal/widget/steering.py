@@ -79,6 +79,10 @@ class Realtime(Overlay):
         # Last data
         self.raw_steering = 0
         self.rot_range = 0
+        self.steer_pos = self.quantize_pixel(
+            self.bar_edge + self.steer_position(0, self.bar_width * 2))
+        self.rect_steerpos.setLeft(self.steer_pos)
+        self.angle_reading = None
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
@@ -99,12 +103,29 @@ class Realtime(Overlay):
                 self.bar_width
             )
             self.draw_scale_mark(mark_gap, mark_num)
+            self.update()
 
-        # Steering
+        # Steering, repaint changed span & reading only
         temp_raw_steering = api.read.inputs.steering_raw()
         if self.raw_steering != temp_raw_steering:
             self.raw_steering = temp_raw_steering
-            self.update()
+            steer_pos = self.quantize_pixel(
+                self.bar_edge + self.steer_position(temp_raw_steering, self.bar_width * 2))
+            if self.wcfg["show_steering_angle"]:
+                angle = temp_raw_steering * self.rot_range * 0.5
+                angle_reading = (angle > 0) - (angle < 0), f"{abs(angle):.0f}"
+            else:
+                angle_reading = None
+            if self.angle_reading != angle_reading:
+                self.angle_reading = angle_reading
+                self.steer_pos = steer_pos
+                self.rect_steerpos.setLeft(steer_pos)
+                self.update(self.rect_steer.toAlignedRect())
+            elif self.steer_pos != steer_pos:
+                last_steer_pos = self.steer_pos
+                self.steer_pos = steer_pos
+                self.rect_steerpos.setLeft(steer_pos)
+                self.update_span(last_steer_pos, steer_pos, self.rect_steer)
 
     # GUI update methods
     def paintEvent(self, event):
@@ -113,8 +134,6 @@ class Realtime(Overlay):
         painter.fillRect(self.rect_steer, self.wcfg["bkg_color"])
 
         # Draw steering
-        steer_pos = self.steer_position(self.raw_steering, self.bar_width * 2)
-        self.rect_steerpos.setLeft(self.bar_edge + steer_pos)
         painter.fillRect(self.rect_steerpos, self.wcfg["steering_color"])
 
         # Draw edge & scale marks
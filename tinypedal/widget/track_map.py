@@ -21,13 +21,14 @@ Track map Widget
 """
 
 from PySide2.QtCore import QRectF, Qt
-from PySide2.QtGui import QBrush, QPainter, QPainterPath, QPen, QPixmap
+from PySide2.QtGui import QBrush, QPainter, QPainterPath, QPen
 
 from .. import calculation as calc
 from ..api_control import api
-from ..formatter import random_color_class
+from ..map_geometry import lod_indexes
 from ..module_info import minfo
 from ._base import Overlay
+from ._painter import ImageRenderer, create_image
 
 
 class Realtime(Overlay):
@@ -60,7 +61,7 @@ class Realtime(Overlay):
         self.temp_map_size = self.area_size - self.area_margin * 2
 
         self.resize(self.area_size, self.area_size)
-        self.pixmap_map = QPixmap(self.area_size, self.area_size)
+        self.renderer_map = ImageRenderer()
         self.pen_veh = (
             self.set_veh_pen_style(self.wcfg["vehicle_outline_color"], self.wcfg["vehicle_outline_width"]),
             self.set_veh_pen_style(self.wcfg["vehicle_outline_player_color"], self.wcfg["vehicle_outline_player_width"]),
@@ -87,51 +88,62 @@ class Realtime(Overlay):
             self.pit_text_shape = self.veh_shape.adjusted(-2, font_offset - veh_size - 3, 2, -veh_size - 3)
 
         # Last data
-        self.last_modified = 0
+        self.last_modified = -1
         self.last_veh_data_version = None
-        self.circular_map = True
+        self.image_map = None
         self.map_scaled = None
         self.map_range = (0, 10, 0, 10)
         self.map_scale = 1
         self.map_offset = (0, 0)
         self.map_orient = 0  # radians
 
-        self.update_map(-1)
+        # Temp(circular) map
+        self.swap_map(self.render_map(None, None, None))
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         # Map
         modified = minfo.mapping.lastModified
         self.update_map(modified)
+        map_updated = self.swap_map(self.renderer_map.take())
 
         # Vehicles
         veh_data_version = minfo.vehicles.dataSetVersion
-        if self.last_veh_data_version != veh_data_version:
+        if self.last_veh_data_version != veh_data_version or map_updated:
             self.last_veh_data_version = veh_data_version
             self.update()
 
     # GUI update methods
     def update_map(self, data):
-        """Map update"""
+        """Map update, render map image in worker thread"""
         if self.last_modified != data:
             self.last_modified = data
             raw_data = minfo.mapping.coordinates if data != -1 else None
-            map_path = self.create_map_path(raw_data)
-            self.draw_map_image(map_path, self.circular_map)
+            self.renderer_map.submit(
+                (data, self.area_size), self.render_map,
+                raw_data, minfo.mapping.sectors, minfo.mapping.coordinatesLod)
+
+    def swap_map(self, result):
+        """Swap in rendered map image & map data, output whether swapped"""
+        if result is None:
+            return False
+        (self.image_map, self.map_scaled, self.map_range, self.map_scale,
+         self.map_offset, self.map_orient) = result
+        return True
 
     def paintEvent(self, event):
         """Draw"""
         painter = QPainter(self)
-        painter.drawPixmap(0, 0, self.pixmap_map)
+        painter.drawImage(0, 0, self.image_map)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
         if self.map_scaled:
             self.draw_vehicle_on_map(
-                painter, minfo.vehicles.dataSet, minfo.relative.drawOrder
+                painter, minfo.vehicles, minfo.relative.drawOrder
             )
         else:
             self.draw_vehicle_on_circle(
-                painter, minfo.vehicles.dataSet, minfo.relative.drawOrder
+                painter, minfo.vehicles, minfo.relative.drawOrder
             )
 
         if self.wcfg["show_pitout_prediction"]:
@@ -141,57 +153,68 @@ class Realtime(Overlay):
                 minfo.vehicles.dataSet[minfo.vehicles.playerIndex],
             )
 
-    def create_map_path(self, raw_coords=None):
-        """Create map path"""
+    def render_map(self, raw_coords, sectors_index, map_lod):
+        """Render map image (worker thread)
+
+        Returns:
+            Map image, scaled map coordinates, map range, scale, offset, orientation.
+        """
+        map_path, circular_map, map_data = self.create_map_path(raw_coords, map_lod)
+        map_image = self.draw_map_image(map_path, circular_map, map_data[0], sectors_index)
+        return (map_image, *map_data)
+
+    def create_map_path(self, raw_coords=None, map_lod=None):
+        """Create map path from coarsest map LOD level that is accurate enough for map scale
+
+        Returns:
+            Map path, whether circular map, map data
+            (scaled map coordinates, map range, scale, offset, orientation).
+        """
         map_path = QPainterPath()
         if raw_coords:
             dist = calc.distance(raw_coords[0], raw_coords[-1])
             angle = max(int(self.wcfg["display_orientation"]), 0)
             angle = angle - angle // 360 * 360
-            self.map_orient = calc.deg2rad(angle)
-            (self.map_scaled, self.map_range, self.map_scale, self.map_offset
+            map_orient = calc.deg2rad(angle)
+            (map_scaled, map_range, map_scale, map_offset
              ) = calc.scale_map(raw_coords, self.area_size, self.area_margin, angle)
 
-            total_nodes = len(self.map_scaled) - 1
-            skip_node = calc.skip_map_nodes(total_nodes, self.temp_map_size * 3, self.display_detail_level)
-            last_skip = 0
-            for index, coords in enumerate(self.map_scaled):
-                if index == 0:
-                    map_path.moveTo(*coords)
-                elif index >= total_nodes:  # don't skip last node
-                    map_path.lineTo(*coords)
-                elif last_skip >= skip_node:
-                    map_path.lineTo(*coords)
-                    last_skip = 0
-                last_skip += 1
+            node_indexes = lod_indexes(
+                map_lod, len(map_scaled), map_scale, self.display_detail_level)
+            map_path.moveTo(*map_scaled[0])
+            for index in node_indexes[1:]:
+                map_path.lineTo(*map_scaled[index])
 
             # Close map loop if start & end distance less than 500 meters
             if dist < 500:
                 map_path.closeSubpath()
-                self.circular_map = True
+                circular_map = True
             else:
-                self.circular_map = False
+                circular_map = False
 
         # Temp(circular) map
         else:
-            self.map_scaled = None
-            self.circular_map = True
-            self.map_orient = 0
+            map_scaled = None
+            map_range = (0, 10, 0, 10)
+            map_scale = 1
+            map_offset = (0, 0)
+            map_orient = 0
+            circular_map = True
             map_path.addEllipse(
                 self.area_margin,
                 self.area_margin,
                 self.temp_map_size,
                 self.temp_map_size,
             )
-        return map_path
+        return map_path, circular_map, (map_scaled, map_range, map_scale, map_offset, map_orient)
 
-    def draw_map_image(self, map_path, circular_map=True):
+    def draw_map_image(self, map_path, circular_map, map_scaled, sectors_index):
         """Draw map image separately"""
         if self.wcfg["show_background"]:
-            self.pixmap_map.fill(self.wcfg["bkg_color"])
+            map_image = create_image(self.area_size, self.area_size, self.wcfg["bkg_color"])
         else:
-            self.pixmap_map.fill(Qt.transparent)
-        painter = QPainter(self.pixmap_map)
+            map_image = create_image(self.area_size, self.area_size)
+        painter = QPainter(map_image)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
         # Draw map inner background
@@ -221,22 +244,21 @@ class Realtime(Overlay):
         painter.drawPath(map_path)
 
         # Draw sector
-        if self.map_scaled:
+        if map_scaled:
             # SF line
             if self.wcfg["show_start_line"]:
                 pen.setWidth(self.wcfg["start_line_width"])
                 pen.setColor(self.wcfg["start_line_color"])
                 painter.setPen(pen)
                 pos_x1, pos_y1, pos_x2, pos_y2 = calc.line_intersect_coords(
-                    self.map_scaled[0],  # point a
-                    self.map_scaled[1],  # point b
+                    map_scaled[0],  # point a
+                    map_scaled[1],  # point b
                     1.57079633,  # 90 degree rotation
                     self.wcfg["start_line_length"]
                 )
                 painter.drawLine(pos_x1, pos_y1, pos_x2, pos_y2)
 
             # Sector lines
-            sectors_index = minfo.mapping.sectors
             if self.wcfg["show_sector_line"] and isinstance(sectors_index, tuple):
                 pen.setWidth(self.wcfg["sector_line_width"])
                 pen.setColor(self.wcfg["sector_line_color"])
@@ -244,8 +266,8 @@ class Realtime(Overlay):
 
                 for index in sectors_index:
                     pos_x1, pos_y1, pos_x2, pos_y2 = calc.line_intersect_coords(
-                        self.map_scaled[index],  # point a
-                        self.map_scaled[index + 1],  # point b
+                        map_scaled[index],  # point a
+                        map_scaled[index + 1],  # point b
                         1.57079633,  # 90 degree rotation
                         self.wcfg["sector_line_length"]
                     )
@@ -262,17 +284,21 @@ class Realtime(Overlay):
                     self.area_margin + self.wcfg["start_line_length"],
                     self.area_size * 0.5
                 )
+        painter.end()
+        return map_image
 
-    def draw_vehicle_on_circle(self, painter, veh_info, veh_draw_order):
+    def draw_vehicle_on_circle(self, painter, vehicles, veh_draw_order):
         """Draw vehicles on temporary circle map"""
         offset = self.area_size * 0.5
+        in_pit = vehicles.inPit
+        lap_progress = vehicles.currentLapProgress
 
         for index in veh_draw_order:
-            data = veh_info[index]
+            data = vehicles.dataSet[index]
 
-            inpit_offset = self.wcfg["font_size"] * data.inPit
+            inpit_offset = self.wcfg["font_size"] * in_pit[index]
             pos_x, pos_y = calc.rotate_coordinate(
-                6.2831853 * data.currentLapProgress,
+                6.2831853 * lap_progress[index],
                 self.temp_map_size / -2 + inpit_offset,  # x pos
                 0,  # y pos
             )
@@ -292,22 +318,24 @@ class Realtime(Overlay):
                 painter.drawText(self.veh_text_shape, Qt.AlignCenter, f"{place_veh}")
             painter.resetTransform()
 
-    def draw_vehicle_on_map(self, painter, veh_info, veh_draw_order):
+    def draw_vehicle_on_map(self, painter, vehicles, veh_draw_order):
         """Draw vehicles on track map"""
         # Position = coords * scale - (min_range * scale - offset)
         x_offset = self.map_range[0] * self.map_scale - self.map_offset[0]  # min range x, offset x
         y_offset = self.map_range[2] * self.map_scale - self.map_offset[1]  # min range y, offset y
+        world_pos_x = vehicles.worldPositionX
+        world_pos_y = vehicles.worldPositionY
 
         for index in veh_draw_order:
-            data = veh_info[index]
+            data = vehicles.dataSet[index]
 
             if self.map_orient:
-                rot_x, rot_y = calc.rotate_coordinate(self.map_orient, data.worldPositionX, data.worldPositionY)
+                rot_x, rot_y = calc.rotate_coordinate(self.map_orient, world_pos_x[index], world_pos_y[index])
                 pos_x = rot_x * self.map_scale - x_offset
                 pos_y = rot_y * self.map_scale - y_offset
             else:
-                pos_x = data.worldPositionX * self.map_scale - x_offset
-                pos_y = data.worldPositionY * self.map_scale - y_offset
+                pos_x = world_pos_x[index] * self.map_scale - x_offset
+                pos_y = world_pos_y[index] * self.map_scale - y_offset
             painter.translate(pos_x, pos_y)
 
             painter.setPen(self.outline_vehicle(data))
@@ -400,19 +428,14 @@ class Realtime(Overlay):
             target_pit_time += self.pit_time_increment
             painter.resetTransform()
 
-    def classes_style(self, class_name: str) -> str:
+    def classes_style(self, class_color: str) -> str:
         """Get vehicle class style from brush cache"""
-        if class_name in self.brush_classes:
-            return self.brush_classes[class_name]
-        # Get vehicle class style from user defined dictionary
+        if class_color in self.brush_classes:
+            return self.brush_classes[class_color]
         brush = QBrush(Qt.SolidPattern)
-        styles = self.cfg.user.classes.get(class_name)
-        if styles is not None:
-            brush.setColor(styles["color"])
-        else:
-            brush.setColor(random_color_class(class_name))
+        brush.setColor(class_color)
         # Add to brush cache
-        self.brush_classes[class_name] = brush
+        self.brush_classes[class_color] = brush
         return brush
 
     # Additional methods
@@ -435,7 +458,9 @@ class Realtime(Overlay):
         if veh_info.inPit:
             return self.brush_overall["in_pit"]
         if self.wcfg["enable_multi_class_styling"]:
-            return self.classes_style(veh_info.vehicleClass)
+            if veh_info.classColor is not None:  # user defined class style
+                return self.classes_style(veh_info.classColor)
+            return self.classes_style(veh_info.classColorRandom)
         if veh_info.isPlayer:
             return self.brush_overall["player"]
         if veh_info.positionOverall == 1:
@@ -40,8 +40,7 @@ class Realtime(Overlay):
         self.display_height = max(int(self.wcfg["display_height"]), 2)
         self.area_width = max(int(self.wcfg["display_width"]), 2)
         self.area_height = self.display_height + self.margin * 2
-        self.display_scale = max(int(
-            self.wcfg["update_interval"] / 20 * self.wcfg["display_scale"]), 1)
+        self.display_scale = max(int(self.wcfg["display_scale"]), 1)
 
         max_line_width = int(max(
             1,
@@ -83,75 +82,99 @@ class Realtime(Overlay):
         self.draw_background()
 
         # Last data
-        self.last_lap_etime = -1
-        self.update_plot = 1
+        self.last_total = minfo.sampler.total
+        self.last_lap_etime = -1.0
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
-        # Use elapsed time to determine whether data paused
-        # Add 1 extra update compensation
-        lap_etime = api.read.timing.elapsed()
-        if self.last_lap_etime != lap_etime:
+        if self.cfg.user.setting["module_sampler"]["enable"]:
+            # Draw all input samples since last update, no update if data paused
+            sampler = minfo.sampler
+            self.last_total, indexes = sampler.samples_since(self.last_total)
+            if not indexes:
+                return
+            for index in indexes:
+                self.update_plot(
+                    sampler.throttleRaw[index],
+                    sampler.throttle[index],
+                    sampler.brakeRaw[index],
+                    sampler.brake[index],
+                    sampler.clutchRaw[index],
+                    sampler.clutch[index],
+                    sampler.steering[index],
+                    sampler.forceFeedback[index],
+                    sampler.slipRatioMin[index],
+                    sampler.slipRatioMax[index],
+                )
+        else:
+            # Draw live inputs if sampler module disabled, no update if data paused
+            lap_etime = api.read.timing.elapsed()
+            if self.last_lap_etime == lap_etime:
+                return
             self.last_lap_etime = lap_etime
-            self.update_plot = 2
-        elif self.update_plot > 0:
-            self.update_plot -= 1
-
-        if self.update_plot:
-            throttle_raw = api.read.inputs.throttle_raw()
-            brake_raw = api.read.inputs.brake_raw()
-
-            if self.wcfg["show_throttle"]:
-                if self.wcfg["show_raw_throttle"]:
-                    throttle = throttle_raw
-                else:
-                    throttle = api.read.inputs.throttle()
-                self.update_sample(self.data_throttle, throttle)
+            slip_ratio = minfo.wheels.slipRatio
+            self.update_plot(
+                api.read.inputs.throttle_raw(),
+                api.read.inputs.throttle(),
+                api.read.inputs.brake_raw(),
+                api.read.inputs.brake(),
+                api.read.inputs.clutch_raw(),
+                api.read.inputs.clutch(),
+                api.read.inputs.steering(),
+                api.read.inputs.force_feedback(),
+                min(slip_ratio),
+                max(slip_ratio),
+            )
+        self.update()  # trigger paint event
 
-            if self.wcfg["show_brake"]:
-                if self.wcfg["show_raw_brake"]:
-                    brake = brake_raw
-                else:
-                    brake = api.read.inputs.brake()
-                self.update_sample(self.data_brake, brake)
+    def update_plot(
+        self, throttle_raw, throttle, brake_raw, brake, clutch_raw, clutch,
+        steering, ffb, slip_min, slip_max):
+        """Update plot with input sample"""
+        if self.wcfg["show_throttle"]:
+            if self.wcfg["show_raw_throttle"]:
+                throttle = throttle_raw
+            self.update_sample(self.data_throttle, throttle)
 
-            if self.wcfg["show_clutch"]:
-                if self.wcfg["show_raw_clutch"]:
-                    clutch = api.read.inputs.clutch_raw()
-                else:
-                    clutch = api.read.inputs.clutch()
-                self.update_sample(self.data_clutch, clutch)
+        if self.wcfg["show_brake"]:
+            if self.wcfg["show_raw_brake"]:
+                brake = brake_raw
+            self.update_sample(self.data_brake, brake)
 
-            if self.wcfg["show_steering"]:
-                if self.wcfg["show_inverted_steering"]:
-                    steering = 1 - (api.read.inputs.steering() + 1) / 2
-                else:
-                    steering = (api.read.inputs.steering() + 1) / 2
-                self.update_sample(self.data_steering, steering)
+        if self.wcfg["show_clutch"]:
+            if self.wcfg["show_raw_clutch"]:
+                clutch = clutch_raw
+            self.update_sample(self.data_clutch, clutch)
 
-            if self.wcfg["show_ffb"]:
-                if self.wcfg["show_absolute_ffb"]:
-                    ffb = abs(api.read.inputs.force_feedback())
-                else:
-                    ffb = (api.read.inputs.force_feedback() + 1) / 2
-                self.update_sample(self.data_ffb, ffb)
+        if self.wcfg["show_steering"]:
+            if self.wcfg["show_inverted_steering"]:
+                steering = 1 - (steering + 1) / 2
+            else:
+                steering = (steering + 1) / 2
+            self.update_sample(self.data_steering, steering)
 
-            if self.wcfg["show_wheel_lock"]:
-                wheel_lock = min(abs(min(minfo.wheels.slipRatio)), 1)
-                if wheel_lock < self.wcfg["wheel_lock_threshold"] or brake_raw <= 0.02:
-                    wheel_lock = -999
-                self.update_sample(self.data_wheel_lock, wheel_lock)
+        if self.wcfg["show_ffb"]:
+            if self.wcfg["show_absolute_ffb"]:
+                ffb = abs(ffb)
+            else:
+                ffb = (ffb + 1) / 2
+            self.update_sample(self.data_ffb, ffb)
 
-            if self.wcfg["show_wheel_slip"]:
-                wheel_slip = min(max(minfo.wheels.slipRatio), 1)
-                if wheel_slip < self.wcfg["wheel_slip_threshold"] or throttle_raw <= 0.02:
-                    wheel_slip = -999
-                self.update_sample(self.data_wheel_slip, wheel_slip)
+        if self.wcfg["show_wheel_lock"]:
+            wheel_lock = min(abs(slip_min), 1)
+            if wheel_lock < self.wcfg["wheel_lock_threshold"] or brake_raw <= 0.02:
+                wheel_lock = -999
+            self.update_sample(self.data_wheel_lock, wheel_lock)
 
-            # Update after all pedal data set
-            self.draw_plot_section()
-            self.draw_plot()
-            self.update()  # trigger paint event
+        if self.wcfg["show_wheel_slip"]:
+            wheel_slip = min(slip_max, 1)
+            if wheel_slip < self.wcfg["wheel_slip_threshold"] or throttle_raw <= 0.02:
+                wheel_slip = -999
+            self.update_sample(self.data_wheel_slip, wheel_slip)
+
+        # Update after all pedal data set
+        self.draw_plot_section()
+        self.draw_plot()
 
     # GUI update methods
     def paintEvent(self, event):